@@ -0,0 +1,173 @@
+"""
+    Synthetic CommandBlockScript corpus
+
+    Generates scripts and libraries that parse without errors and exercise most of
+    the grammar: selector defines with methods, clocks, functions, macros, nested
+    if/else, for and while blocks, arrays, JSON literals and Minecraft commands.
+    The same seed always gives the same files
+
+    Usage: python -m benchmarks.corpus <directory> [files] [sections]
+"""
+import os
+import random
+import sys
+
+INDENT = "    "
+
+class CorpusGenerator(object):
+    """
+        Writes one file at a time, sized by its number of sections
+    """
+
+    def __init__(self, seed: int = 0, depth: int = 3):
+        self.random = random.Random(seed)
+        self.depth = depth
+        self.counter = 0
+
+    def name(self, prefix: str) -> str:
+        self.counter += 1
+        return f"{prefix}{self.counter}"
+
+    def script(self, sections: int, imports: list[str] = ()) -> str:
+        lines = ['dir "out"', 'desc "Generated benchmark script"', "scale 1000", ""]
+        lines += [f"import {library}" for library in imports]
+
+        return self.body(lines, sections)
+
+    def library(self, sections: int) -> str:
+        return self.body([], sections)
+
+    def body(self, lines: list[str], sections: int) -> str:
+        lines += ["$max = 8", ""]
+
+        makers = [self.define, self.clock, self.function, self.macro, self.predicate, self.reset]
+        selectors = []
+
+        for i in range(sections):
+            maker = makers[i % len(makers)]
+
+            if maker == self.define:
+                selector = self.name("@Mob")
+                selectors.append(selector)
+                lines += self.define(selector)
+            else:
+                lines += maker(selectors)
+
+            lines.append("")
+
+        return "\n".join(lines) + "\n"
+
+    ### Sections
+    def define(self, selector: str) -> list[str]:
+        kind = self.random.choice(["pig", "cow", "zombie", "armor_stand"])
+
+        return [
+            f"define {selector} = @e[type={kind}, tag=tracked]",
+            f"{INDENT}create {{Tags: [\"tracked\"], NoAI: 1b, Health: 20.0f}}",
+            f"{INDENT}speed = motion double 100",
+            f"{INDENT}array scores[0 to 16]",
+            f"{INDENT}function {self.name('boost')}()",
+            f"{INDENT * 2}/effect give @s speed 1 1",
+            f"{INDENT * 2}@s.speed += 2",
+            f"{INDENT}end",
+            "end",
+        ]
+
+    def clock(self, selectors: list[str]) -> list[str]:
+        return [f"clock {self.name('tick')}"] + self.block(1, selectors, 6) + ["end"]
+
+    def function(self, selectors: list[str]) -> list[str]:
+        return [f"function {self.name('helper')}(a, b)"] + self.block(1, selectors, 5) + [f"{INDENT}return a + b", "end"]
+
+    def macro(self, selectors: list[str]) -> list[str]:
+        return [f"macro ${self.name('say')}($v, $w)", f"{INDENT}/say $v $w", f"{INDENT}tell @a \"value\"", "end"]
+
+    def predicate(self, selectors: list[str]) -> list[str]:
+        return [
+            f"predicate {self.name('daytime')} {{",
+            f"{INDENT}\"condition\": \"minecraft:time_check\",",
+            f"{INDENT}\"value\": {{\"min\": 0, \"max\": {self.random.randint(1000, 24000)}}},",
+            f"{INDENT}\"period\": 24000",
+            "}",
+        ]
+
+    def reset(self, selectors: list[str]) -> list[str]:
+        return ["reset"] + self.block(1, selectors, 3) + ["end"]
+
+    ### Statements
+    def block(self, level: int, selectors: list[str], statements: int) -> list[str]:
+        lines = []
+
+        for _ in range(statements):
+            lines += self.statement(level, selectors)
+
+        return lines
+
+    def statement(self, level: int, selectors: list[str]) -> list[str]:
+        indent = INDENT * level
+        var = self.random.choice(["x", "y", "count", "timer"])
+        value = self.random.randint(0, 100)
+        nested = level < self.depth
+        choice = self.random.randrange(10 if nested else 5)
+
+        if choice == 0:
+            return [f"{indent}{var} = {var} * 2 + {value} % 7"]
+        if choice == 1:
+            return [f"{indent}/say {var} is {value}"]
+        if choice == 2:
+            return [f"{indent}tell @a \"{var} reached {value}\""]
+        if choice == 3:
+            return [f"{indent}@s.scores[{value % 16}] = {var}"]
+        if choice == 4:
+            return [f"{indent}{var} += {value}"]
+
+        if choice == 5:
+            lines = [f"{indent}if {var} > {value}"] + self.block(level + 1, selectors, 2)
+            return lines + [f"{indent}else"] + self.block(level + 1, selectors, 1) + [f"{indent}end"]
+        if choice == 6:
+            return [f"{indent}for i = 0 to $max by 1"] + self.block(level + 1, selectors, 2) + [f"{indent}end"]
+        if choice == 7:
+            return [f"{indent}while {var} < {value}"] + self.block(level + 1, selectors, 2) + [f"{indent}{INDENT}{var} += 1", f"{indent}end"]
+        if choice == 8 and selectors:
+            selector = self.random.choice(selectors)
+            return [f"{indent}as {selector}"] + self.block(level + 1, selectors, 2) + [f"{indent}end"]
+
+        return [f"{indent}as @a[tag=player] at @s"] + self.block(level + 1, selectors, 2) + [f"{indent}end"]
+
+def corpus(files: int = 50, sections: int = 30, seed: int = 0) -> list[tuple[str, str]]:
+    """
+        (file name, text) of files scripts and libraries of sections sections each, one library per four scripts
+    """
+
+    generator = CorpusGenerator(seed)
+    sources = []
+
+    for i in range(files):
+        if i % 5 == 4:
+            sources.append((f"lib{i}.cblib", generator.library(sections)))
+        else:
+            sources.append((f"script{i}.cbscript", generator.script(sections, [f"lib{i + 4 - i % 5}"])))
+
+    return sources
+
+def generate(directory: str, files: int = 50, sections: int = 30, seed: int = 0) -> list[str]:
+    """
+        Write a corpus to directory, returns the paths written
+    """
+
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+
+    for name, text in corpus(files, sections, seed):
+        path = os.path.join(directory, name)
+
+        with open(path, "w") as file:
+            file.write(text)
+
+        paths.append(path)
+
+    return paths
+
+if __name__ == "__main__":
+    directory, *sizes = sys.argv[1:]
+    print(f"Wrote {len(generate(directory, *[int(size) for size in sizes]))} files to {directory}")
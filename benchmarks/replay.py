@@ -0,0 +1,274 @@
+"""
+    Session replay
+
+    Replays a session recorded with `python cbls.py --record <file>` against a fresh
+    server process over stdio, keeping the recorded pace between messages, and
+    reports the latency of every request method along with the CPU time the server
+    used. Edits are also timed until the diagnostics of their version are published,
+    for clients that do not pull diagnostics
+
+    Requests the server sends are answered with null, the answers of the recorded
+    client are dropped. The server reads files the session refers to from disk where
+    they exist, as it did in the editor. It starts with an empty cache unless given
+    one, so runs do not depend on what was parsed before
+
+    Usage: python -m benchmarks.replay <session> [--speed F] [--max-gap S] [--server PATH] [--json]
+"""
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import IO, Iterable, Optional, Tuple
+from modules.CommandBlockRecorder import load_session
+
+try:
+    import resource
+except ImportError:
+    # Windows, the CPU time of the server is not reported
+    resource = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Edits timed until the diagnostics of their version are published
+EDIT_DIAGNOSTICS = "textDocument/didChange -> publishDiagnostics"
+
+def read_message(stream: IO[bytes]) -> Optional[dict]:
+    length = 0
+
+    while True:
+        header = stream.readline()
+
+        if not header:
+            return None
+        if not header.strip():
+            break
+
+        name, _, value = header.partition(b":")
+        if name.strip().lower() == b"content-length":
+            length = int(value)
+
+    return json.loads(stream.read(length))
+
+def write_message(stream: IO[bytes], message: dict):
+    body = json.dumps(message).encode("utf-8")
+    stream.write(b"Content-Length: %d\r\n\r\n" % len(body) + body)
+    stream.flush()
+
+def percentile(values: list[float], fraction: float) -> float:
+    """
+        Nearest-rank percentile, always one of the values
+    """
+
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+class ReplayClient(object):
+    """
+        Stands in for the editor, sends the recorded messages and times the replies
+    """
+
+    def __init__(self, process: subprocess.Popen):
+        self.process = process
+
+        # Requests in flight by id as (method, sent), and the last edit of each document as (version, sent)
+        self.requests: dict = {}
+        self.edits: dict[str, Tuple[int, float]] = {}
+        self.latencies: dict[str, list[float]] = {}
+        self.closed = False
+
+        self.lock = threading.Lock()
+        self.idle = threading.Condition(self.lock)
+
+        # Both the replay and the answers to server requests write to the server
+        self.writing = threading.Lock()
+
+        self.reader = threading.Thread(target=self.read, daemon=True)
+        self.reader.start()
+
+    def send(self, message: dict):
+        sent = time.perf_counter()
+        method = message.get("method")
+
+        with self.lock:
+            if "id" in message:
+                self.requests[message["id"]] = (method, sent)
+            elif method == "textDocument/didChange":
+                document = message["params"]["textDocument"]
+                self.edits[document["uri"]] = (document.get("version"), sent)
+
+        self.write(message)
+
+    def write(self, message: dict):
+        with self.writing:
+            write_message(self.process.stdin, message)
+
+    def wait(self, timeout: float) -> bool:
+        """
+            Wait until every request was answered, False on timeout
+        """
+
+        with self.idle:
+            return self.idle.wait_for(lambda: not self.requests or self.closed, timeout)
+
+    def time(self, key: str, sent: float):
+        self.latencies.setdefault(key, []).append((time.perf_counter() - sent) * 1000)
+
+    def read(self):
+        while (message := read_message(self.process.stdout)) is not None:
+            method = message.get("method")
+
+            if method is None:
+                with self.lock:
+                    request = self.requests.pop(message.get("id"), None)
+
+                    if request is not None:
+                        self.time(request[0], request[1])
+                        self.idle.notify_all()
+
+            elif "id" in message:
+                self.write({"jsonrpc": "2.0", "id": message["id"], "result": None})
+
+            elif method == "textDocument/publishDiagnostics":
+                params = message["params"]
+
+                with self.lock:
+                    version, sent = self.edits.get(params["uri"], (None, 0.0))
+
+                    if version is not None and version == params.get("version"):
+                        del self.edits[params["uri"]]
+                        self.time(EDIT_DIAGNOSTICS, sent)
+
+        with self.idle:
+            self.closed = True
+            self.idle.notify_all()
+
+def replay(session: Iterable[Tuple[float, dict]], command: list[str], speed: float = 1.0, max_gap: float = 1.0,
+           timeout: float = 30.0, cwd: Optional[str] = None, env: Optional[dict] = None) -> dict:
+    """
+        Replay a session against a server started with command
+
+        Messages are sent as far apart as they were recorded divided by speed, idle
+        time is cut to max_gap seconds and a speed of 0 sends them back to back.
+        Returns the latencies in milliseconds by method, the wall time and the CPU
+        time of the server, None where it cannot be measured
+    """
+
+    before = resource.getrusage(resource.RUSAGE_CHILDREN) if resource else None
+    began = start = time.perf_counter()
+
+    process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, cwd=cwd, env=env)
+    client = ReplayClient(process)
+
+    previous = None
+    due = 0.0
+    exited = False
+
+    try:
+        for recorded, message in session:
+            # Answers of the recorded client to requests of the old server
+            if "method" not in message:
+                continue
+
+            if speed > 0 and previous is not None:
+                due += min(recorded - previous, max_gap) / speed
+                time.sleep(max(0.0, start + due - time.perf_counter()))
+
+            previous = recorded
+
+            # Requests would go unanswered once the server exits
+            if message["method"] == "exit":
+                client.wait(timeout)
+                exited = True
+
+            client.send(message)
+
+            # Clients wait for the server to initialize before anything else, which
+            # also keeps its startup out of the pace and the other latencies
+            if message["method"] == "initialize":
+                client.wait(timeout)
+                start = time.perf_counter()
+
+        if not exited:
+            client.wait(timeout)
+            client.send({"jsonrpc": "2.0", "id": "replay-shutdown", "method": "shutdown"})
+            client.wait(timeout)
+            client.send({"jsonrpc": "2.0", "method": "exit"})
+    except BrokenPipeError:
+        # The server is gone, report what was answered until then
+        pass
+
+    try:
+        process.wait(timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+    wall = time.perf_counter() - began
+    client.reader.join(timeout)
+
+    cpu = None
+    if before is not None:
+        after = resource.getrusage(resource.RUSAGE_CHILDREN)
+        cpu = {"user_s": after.ru_utime - before.ru_utime, "system_s": after.ru_stime - before.ru_stime}
+
+    return {"latencies": client.latencies, "unanswered": len(client.requests), "wall_s": wall, "cpu": cpu}
+
+def summarize(latencies: dict[str, list[float]]) -> dict:
+    return {
+        method: {
+            "count": len(times),
+            "p50_ms": percentile(times, 0.5),
+            "p95_ms": percentile(times, 0.95),
+            "p99_ms": percentile(times, 0.99),
+            "max_ms": max(times),
+        }
+        for method, times in sorted(latencies.items())
+    }
+
+def main(argv=None) -> int:
+    arguments = argparse.ArgumentParser(prog="python -m benchmarks.replay", description="Replay a recorded session against a fresh server")
+    arguments.add_argument("session", help="session recorded with 'python cbls.py --record <file>'")
+    arguments.add_argument("--speed", type=float, default=1.0, help="pace relative to the recording, 0 sends messages back to back (default: 1)")
+    arguments.add_argument("--max-gap", type=float, default=1.0, help="longest pause between two messages in seconds (default: 1)")
+    arguments.add_argument("--server", default=os.path.join(ROOT, "cbls.py"), help="cbls.py of the server to replay against")
+    arguments.add_argument("--cache-dir", help="cache directory of the server (default: a new empty one)")
+    arguments.add_argument("--timeout", type=float, default=30.0, help="seconds to wait for outstanding replies (default: 30)")
+    arguments.add_argument("--json", action="store_true", help="print the results as JSON")
+    options = arguments.parse_args(argv)
+
+    session = list(load_session(options.session))
+    server = os.path.abspath(options.server)
+
+    with tempfile.TemporaryDirectory() as directory:
+        env = dict(os.environ, CBLS_CACHE_DIR=options.cache_dir or directory)
+        results = replay(session, [sys.executable, server], options.speed, options.max_gap, options.timeout, os.path.dirname(server), env)
+
+    summary = summarize(results["latencies"])
+
+    if options.json:
+        print(json.dumps({"methods": summary, "unanswered": results["unanswered"], "wall_s": results["wall_s"], "cpu": results["cpu"]}, indent=4))
+    else:
+        print(f"{'method':<48} {'count':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+
+        for method, row in summary.items():
+            print(f"{method:<48} {row['count']:>6} {row['p50_ms']:>9.2f} {row['p95_ms']:>9.2f} {row['p99_ms']:>9.2f} {row['max_ms']:>9.2f}")
+
+        print(f"\n{len(session)} messages replayed in {results['wall_s']:.2f} s")
+
+        if results["cpu"] is not None:
+            cpu = results["cpu"]
+            print(f"Server CPU time: {cpu['user_s'] + cpu['system_s']:.2f} s ({cpu['user_s']:.2f} s user, {cpu['system_s']:.2f} s system)")
+
+    if results["unanswered"]:
+        print(f"{results['unanswered']} requests were never answered", file=sys.stderr)
+        return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+"""
+    Startup time benchmark
+
+    Times building the lexer and parser in fresh interpreters, once loading the
+    shipped tables and once regenerating them from the grammar
+
+    Usage: python -m benchmarks.startup [runs]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Run in a fresh interpreter so nothing is cached between runs
+SNIPPET = """
+import json, sys, time
+start = time.perf_counter()
+import modules.CommandBlockTables as tables
+if sys.argv[1] == "regenerate":
+    tables.TABLES_DIR = tables.GENERATED_DIR = sys.argv[2]
+from modules.CommandBlockLexer import CBLex
+from modules.CommandBlockParser import CBParse
+CBParse(CBLex())
+print(json.dumps(time.perf_counter() - start))
+"""
+
+def run(mode: str) -> float:
+    with tempfile.TemporaryDirectory() as directory:
+        result = subprocess.run([sys.executable, "-c", SNIPPET, mode, directory], cwd=ROOT, capture_output=True, text=True, check=True)
+
+    return json.loads(result.stdout)
+
+def main(runs: int = 5):
+    for mode in ("tables", "regenerate"):
+        times = [run(mode) for _ in range(runs)]
+        print(f"{mode:>10}: median {statistics.median(times) * 1000:8.1f} ms  min {min(times) * 1000:8.1f} ms  ({runs} runs)")
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
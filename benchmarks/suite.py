@@ -0,0 +1,243 @@
+"""
+    Benchmark suite
+
+    Times the server's hot paths over a generated corpus (see benchmarks.corpus):
+    lexing, parsing, semantic token encoding, publishing diagnostics and the
+    latency of a single edit from didChange to published diagnostics. Results are
+    compared against a stored baseline, and the run fails when any of them is
+    slower than the baseline by more than the threshold
+
+    Baselines depend on the machine and none is shipped, record one with --save
+    before comparing. Without a baseline the results are only reported
+
+    Usage: python -m benchmarks.suite [--files N] [--sections N] [--repeat N] [--threshold F] [--save]
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Callable
+from lsprotocol.types import (
+    Position, Range, TextDocumentContentChangeEvent_Type1, TextDocumentItem, VersionedTextDocumentIdentifier
+    )
+from pygls.workspace import Workspace
+from benchmarks.corpus import corpus
+from modules.CommandBlockCache import CBIndexCache
+from modules.CommandBlockLanguageServer import CommandBlockLanguageServer
+from modules.CommandBlockLexer import CBLex
+from modules.CommandBlockParser import CBParse
+from modules.CommandBlockTokenStore import CBTokenEncoder, CBTokenStore
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Edits timed from didChange to published diagnostics
+EDITS = 50
+
+class Sink(object):
+    """
+        Transport swallowing what the server sends, after it was serialized
+    """
+
+    def __init__(self):
+        self.written = 0
+
+    def write(self, data):
+        self.written += len(data)
+
+    def close(self):
+        pass
+
+def best(function: Callable[[], object], repeat: int) -> float:
+    """
+        Fastest of repeat runs of function, in milliseconds
+    """
+
+    times = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+
+    return min(times) * 1000
+
+def broken(text: str) -> str:
+    """
+        The text with every tenth increment left unfinished, so it has diagnostics to publish
+    """
+
+    lines = text.split("\n")
+    increments = [i for i, line in enumerate(lines) if "+=" in line]
+
+    for i in increments[::10]:
+        lines[i] += " +"
+
+    return "\n".join(lines)
+
+def server() -> CommandBlockLanguageServer:
+    lexer = CBLex()
+    instance = CommandBlockLanguageServer(lexer, CBParse(lexer), "cbls-benchmark", "v0")
+    instance.lsp._workspace = Workspace(None)
+    instance.lsp.transport = Sink()
+    instance.cache = CBIndexCache("benchmark", ":memory:")
+
+    return instance
+
+### Benchmarks
+def bench_lex(sources: list[tuple[str, str]], repeat: int) -> dict:
+    ply = CBLex().lexer
+
+    def run():
+        for _, text in sources:
+            ply.input(text)
+            ply.lineno = 1
+
+            while ply.token():
+                pass
+
+    elapsed = best(run, repeat)
+    size = sum(len(text) for _, text in sources)
+
+    return {"lex_ms": elapsed, "lex_mb_per_s": size / 1e6 / (elapsed / 1000)}
+
+def bench_parse(sources: list[tuple[str, str]], repeat: int) -> dict:
+    parser = CBParse(CBLex())
+
+    return {"parse_ms": best(lambda: [parser.parse_result(text) for _, text in sources], repeat)}
+
+def bench_encode(sources: list[tuple[str, str]], repeat: int) -> dict:
+    encoder = CBTokenEncoder(CBLex())
+
+    return {"encode_ms": best(lambda: [CBTokenStore().lex(encoder, text) for _, text in sources], repeat)}
+
+def bench_publish(sources: list[tuple[str, str]], repeat: int) -> dict:
+    instance = server()
+    analyses = [instance.analyse(f"file:///corpus/{name}", broken(text), name) for name, text in sources]
+
+    def run():
+        # Unchanged diagnostics would not be sent again
+        instance.diagnostics.results.clear()
+
+        for analysis in analyses:
+            instance.publish_analysis(analysis)
+
+    return {"publish_ms": best(run, repeat), "diagnostics": sum(len(analysis.diagnostics) for analysis in analyses)}
+
+def bench_did_change(sources: list[tuple[str, str]], repeat: int) -> dict:
+    """
+        Typing a character on random lines of the largest script, as did_change and the scheduler handle it minus the debounce delay
+    """
+
+    instance = server()
+    name, text = max((source for source in sources if source[0].endswith(".cbscript")), key=lambda source: len(source[1]))
+    uri = f"file:///corpus/{name}"
+
+    instance.workspace.put_text_document(TextDocumentItem(uri=uri, language_id="cbscript", version=0, text=text))
+    document = instance.workspace.get_text_document(uri)
+    instance.lex(document)
+    instance.publish_analysis(instance.analyse(uri, document.source, name))
+
+    generator = random.Random(0)
+    lex_times, total_times = [], []
+
+    for version in range(1, EDITS * repeat + 1):
+        line = generator.randrange(len(document.lines))
+        column = len(document.lines[line].rstrip("\n"))
+        change = TextDocumentContentChangeEvent_Type1(range=Range(start=Position(line, column), end=Position(line, column)), text=" ")
+
+        start = time.perf_counter()
+        instance.workspace.update_text_document(VersionedTextDocumentIdentifier(uri=uri, version=version), change)
+        instance.lex(document, [change])
+        instance.edit_references(uri, [change])
+        lexed = time.perf_counter()
+
+        source = document.source
+        instance.publish_analysis(instance.analyse(uri, source, name, instance.lexed(uri, source)), version=version)
+        end = time.perf_counter()
+
+        lex_times.append((lexed - start) * 1000)
+        total_times.append((end - start) * 1000)
+
+    return {
+        "did_change_lex_ms": statistics.median(lex_times),
+        "did_change_ms": statistics.median(total_times),
+        "did_change_p95_ms": statistics.quantiles(total_times, n=20)[-1],
+    }
+
+BENCHMARKS = [bench_lex, bench_parse, bench_encode, bench_publish, bench_did_change]
+
+# Results compared with the baseline, lower is better for all of them
+TIMED = ["lex_ms", "parse_ms", "encode_ms", "publish_ms", "did_change_lex_ms", "did_change_ms", "did_change_p95_ms"]
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+        Results slower than the baseline by more than threshold, as messages
+    """
+
+    regressions = []
+
+    for key in TIMED:
+        if key not in baseline or key not in results:
+            continue
+
+        if results[key] > baseline[key] * (1 + threshold):
+            regressions.append(f"{key}: {results[key]:.2f} ms vs {baseline[key]:.2f} ms baseline ({results[key] / baseline[key] - 1:+.0%})")
+
+    return regressions
+
+def main(argv=None) -> int:
+    arguments = argparse.ArgumentParser(prog="python -m benchmarks.suite", description="Benchmark the language server against a baseline")
+    arguments.add_argument("--files", type=int, default=20, help="files in the generated corpus (default: 20)")
+    arguments.add_argument("--sections", type=int, default=60, help="sections per file (default: 60)")
+    arguments.add_argument("--repeat", type=int, default=5, help="runs of each benchmark, the fastest counts (default: 5)")
+    arguments.add_argument("--threshold", type=float, default=0.3, help="slowdown over the baseline failing the run (default: 0.3)")
+    arguments.add_argument("--baseline", default=BASELINE, help="baseline file")
+    arguments.add_argument("--save", action="store_true", help="store the results as the new baseline")
+    options = arguments.parse_args(argv)
+
+    config = {"files": options.files, "sections": options.sections, "seed": 0}
+    sources = corpus(options.files, options.sections)
+
+    size = sum(len(text) for _, text in sources)
+    print(f"Corpus: {len(sources)} files, {sum(text.count(chr(10)) for _, text in sources)} lines, {size / 1e6:.2f} MB")
+
+    results = {}
+    for benchmark in BENCHMARKS:
+        results.update(benchmark(sources, options.repeat))
+
+    for key, value in results.items():
+        print(f"{key:>20}: {value:10.2f}")
+
+    if options.save:
+        with open(options.baseline, "w") as file:
+            json.dump({"config": config, "results": results}, file, indent=4)
+            file.write("\n")
+
+        print(f"Saved baseline to {options.baseline}")
+        return 0
+
+    if not os.path.exists(options.baseline):
+        print(f"No baseline at {options.baseline} to compare with, record one with --save")
+        return 0
+
+    with open(options.baseline) as file:
+        baseline = json.load(file)
+
+    if baseline.get("config") != config:
+        print(f"Baseline was recorded for {baseline.get('config')}, not compared")
+        return 0
+
+    if regressions := compare(results, baseline["results"], options.threshold):
+        print(f"Slower than the baseline by more than {options.threshold:.0%}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+
+    print(f"Within {options.threshold:.0%} of the baseline")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
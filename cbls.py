@@ -1,48 +1,151 @@
 from lsprotocol.types import (
-    CompletionItem, CompletionParams, CompletionOptions,
-    DidChangeTextDocumentParams, DidOpenTextDocumentParams,
-    SemanticTokensRegistrationOptions, SemanticTokens,
-    SemanticTokensLegend, SemanticTokensParams, 
-    TEXT_DOCUMENT_COMPLETION, TEXT_DOCUMENT_DID_OPEN, 
-    TEXT_DOCUMENT_DID_CHANGE, TEXT_DOCUMENT_SEMANTIC_TOKENS_FULL
+    CompletionItem, CompletionList, CompletionParams, CompletionOptions,
+    DefinitionParams, DiagnosticOptions, DidChangeTextDocumentParams, DidCloseTextDocumentParams, DidOpenTextDocumentParams,
+    DocumentDiagnosticParams, DocumentDiagnosticReport, DocumentSymbol, DocumentSymbolParams, Hover, HoverParams, InitializedParams, Location,
+    PrepareRenameParams, Range, ReferenceParams, RenameOptions, RenameParams,
+    SemanticTokensRegistrationOptions, SemanticTokens, SemanticTokensDelta,
+    SemanticTokensDeltaParams, SemanticTokensLegend, SemanticTokensOptionsFullType1,
+    SemanticTokensParams, SemanticTokensRangeParams, SymbolInformation, TextDocumentSyncKind,
+    WorkspaceDiagnosticParams, WorkspaceDiagnosticReport, WorkspaceEdit, WorkspaceSymbolParams,
+    TEXT_DOCUMENT_COMPLETION, TEXT_DOCUMENT_DEFINITION, TEXT_DOCUMENT_DIAGNOSTIC, TEXT_DOCUMENT_DOCUMENT_SYMBOL, TEXT_DOCUMENT_HOVER,
+    TEXT_DOCUMENT_PREPARE_RENAME, TEXT_DOCUMENT_REFERENCES, TEXT_DOCUMENT_RENAME,
+    TEXT_DOCUMENT_DID_OPEN, TEXT_DOCUMENT_DID_CHANGE, TEXT_DOCUMENT_DID_CLOSE,
+    TEXT_DOCUMENT_SEMANTIC_TOKENS_FULL, TEXT_DOCUMENT_SEMANTIC_TOKENS_FULL_DELTA,
+    TEXT_DOCUMENT_SEMANTIC_TOKENS_RANGE, COMPLETION_ITEM_RESOLVE, INITIALIZED, WORKSPACE_DIAGNOSTIC, WORKSPACE_SYMBOL
     )
+import sys
+from typing import Optional, Union
+from modules import CommandBlockCheck, CommandBlockLogging
 from modules.CommandBlockLanguageServer import CommandBlockLanguageServer
 from modules.CommandBlockLexer import CBLex
 from modules.CommandBlockParser import CBParse
+from modules.CommandBlockRecorder import CBSessionRecorder
+from modules.CommandBlockStats import CBLS_STATS
 from modules.TokenUtils import TokenModifier, TOKEN_TYPES
 
 lexer = CBLex()
 parser = CBParse(lexer)
-server = CommandBlockLanguageServer(lexer, parser, "cbls", "v0.1.2")
+server = CommandBlockLanguageServer(lexer, parser, "cbls", "v0.1.2", text_document_sync_kind=TextDocumentSyncKind.Incremental)
 
 legend = SemanticTokensLegend(token_types=TOKEN_TYPES, token_modifiers=[m.name for m in TokenModifier if m.name is not None])
+semantic_tokens_options = SemanticTokensRegistrationOptions(legend=legend, full=SemanticTokensOptionsFullType1(delta=True), range=True)
 
-@server.feature(TEXT_DOCUMENT_SEMANTIC_TOKENS_FULL, SemanticTokensRegistrationOptions(legend=legend, full=True))
+@server.feature(TEXT_DOCUMENT_SEMANTIC_TOKENS_FULL, semantic_tokens_options)
 async def semantic_tokens(s: CommandBlockLanguageServer, p: SemanticTokensParams) -> SemanticTokens:
     """
         Provides semantic token coloring for syntax highlighting
     """
-    return SemanticTokens(data=s.tokens.get(p.text_document.uri, []))
+    return s.semantic_tokens_full(p.text_document.uri)
+
+@server.feature(TEXT_DOCUMENT_SEMANTIC_TOKENS_FULL_DELTA, semantic_tokens_options)
+async def semantic_tokens_delta(s: CommandBlockLanguageServer, p: SemanticTokensDeltaParams) -> Union[SemanticTokens, SemanticTokensDelta]:
+    """
+        Provides only the semantic token edits since the client's last result
+    """
+    return s.semantic_tokens_delta(p.text_document.uri, p.previous_result_id)
+
+@server.feature(TEXT_DOCUMENT_SEMANTIC_TOKENS_RANGE, semantic_tokens_options)
+async def semantic_tokens_range(s: CommandBlockLanguageServer, p: SemanticTokensRangeParams) -> SemanticTokens:
+    """
+        Provides semantic token coloring for a range of the document, such as the visible viewport
+    """
+    return s.semantic_tokens_range(p.text_document.uri, p.range)
 
 @server.feature(
     TEXT_DOCUMENT_COMPLETION,
-    CompletionOptions(trigger_characters=["."]),
+    CompletionOptions(trigger_characters=[".", "@", "$", "[", ","], resolve_provider=True),
 )
-def completion(p: CompletionParams) -> list[CompletionItem]:
+async def completion(s: CommandBlockLanguageServer, p: CompletionParams) -> CompletionList:
     """
         Handles autocomplete suggestions
     """
-    document = server.workspace.get_text_document(p.text_document.uri)
-    current_line = document.lines[p.position.line].strip()
+    document = s.workspace.get_text_document(p.text_document.uri)
 
-    if not current_line.endswith("hello."):
-        return []
+    return s.completion.complete(document, p.position)
 
-    return [
-        CompletionItem(label="world"),
-        CompletionItem(label="friend"),
-        CompletionItem(label="mate"),
-    ]
+@server.feature(COMPLETION_ITEM_RESOLVE)
+async def completion_resolve(s: CommandBlockLanguageServer, p: CompletionItem) -> CompletionItem:
+    """
+        Adds the signature and definition of the suggestion the editor shows
+    """
+    return s.completion.resolve(p)
+
+@server.feature(TEXT_DOCUMENT_HOVER)
+async def hover(s: CommandBlockLanguageServer, p: HoverParams) -> Optional[Hover]:
+    """
+        Shows the signature, selector or value of the name under the cursor
+    """
+    return s.hover.hover(p.text_document.uri, p.position)
+
+@server.feature(TEXT_DOCUMENT_DEFINITION)
+async def definition(s: CommandBlockLanguageServer, p: DefinitionParams) -> Optional[Location]:
+    """
+        Jumps to where the name under the cursor is defined
+    """
+    return s.navigation.definition(p.text_document.uri, p.position)
+
+@server.feature(TEXT_DOCUMENT_REFERENCES)
+async def references(s: CommandBlockLanguageServer, p: ReferenceParams) -> list[Location]:
+    """
+        Lists every use of the name under the cursor across the workspace
+    """
+    return s.navigation.references(p.text_document.uri, p.position, p.context.include_declaration)
+
+@server.feature(TEXT_DOCUMENT_PREPARE_RENAME)
+async def prepare_rename(s: CommandBlockLanguageServer, p: PrepareRenameParams) -> Optional[Range]:
+    """
+        Checks the name under the cursor can be renamed
+    """
+    return s.navigation.prepare_rename(p.text_document.uri, p.position)
+
+@server.feature(TEXT_DOCUMENT_RENAME, RenameOptions(prepare_provider=True))
+async def rename(s: CommandBlockLanguageServer, p: RenameParams) -> Optional[WorkspaceEdit]:
+    """
+        Renames the name under the cursor in every file using it
+    """
+    return s.navigation.rename(p.text_document.uri, p.position, p.new_name)
+
+@server.feature(TEXT_DOCUMENT_DOCUMENT_SYMBOL)
+async def document_symbols(s: CommandBlockLanguageServer, p: DocumentSymbolParams) -> list[DocumentSymbol]:
+    """
+        Provides the outline of a document
+    """
+    return s.symbols.document_symbols(p.text_document.uri)
+
+@server.feature(WORKSPACE_SYMBOL)
+async def workspace_symbols(s: CommandBlockLanguageServer, p: WorkspaceSymbolParams) -> list[SymbolInformation]:
+    """
+        Searches the functions, macros, clocks and selectors of the whole workspace
+    """
+    return s.symbols.workspace_symbols(p.query)
+
+@server.feature(TEXT_DOCUMENT_DIAGNOSTIC, DiagnosticOptions(identifier="cbls", inter_file_dependencies=True, workspace_diagnostics=True))
+async def diagnostic(s: CommandBlockLanguageServer, p: DocumentDiagnosticParams) -> DocumentDiagnosticReport:
+    """
+        Provides the diagnostics of a document once it is parsed, or that the client's are still current
+    """
+    return await s.diagnostics.document(p.text_document.uri, p.previous_result_id)
+
+@server.feature(WORKSPACE_DIAGNOSTIC)
+async def workspace_diagnostic(s: CommandBlockLanguageServer, p: WorkspaceDiagnosticParams) -> WorkspaceDiagnosticReport:
+    """
+        Provides the diagnostics of every file indexed in the workspace
+    """
+    return s.diagnostics.workspace(p.previous_result_ids)
+
+@server.feature(CBLS_STATS)
+async def stats(s: CommandBlockLanguageServer, p) -> dict:
+    """
+        Reports latency histograms of every request method and document phase since the server started
+    """
+    return s.stats.snapshot()
+
+@server.feature(INITIALIZED)
+async def initialized(s: CommandBlockLanguageServer, p: InitializedParams):
+    """
+        Indexes the whole workspace in the background once the client is ready
+    """
+    s.indexer.start()
 
 @server.feature(TEXT_DOCUMENT_DID_OPEN)
 async def did_open(s: CommandBlockLanguageServer, p: DidOpenTextDocumentParams):
@@ -50,8 +153,10 @@ async def did_open(s: CommandBlockLanguageServer, p: DidOpenTextDocumentParams):
         Handles text when document is opened in the editor
     """
     document = s.workspace.get_text_document(p.text_document.uri)
-    s.lex(document)
-    s.parse(document)
+
+    # Unchanged since it was last analysed, nothing to parse
+    if not s.open(document):
+        s.scheduler.schedule(document.uri, delay=0)
 
 @server.feature(TEXT_DOCUMENT_DID_CHANGE)
 async def did_change(s: CommandBlockLanguageServer, p: DidChangeTextDocumentParams):
@@ -63,12 +168,29 @@ async def did_change(s: CommandBlockLanguageServer, p: DidChangeTextDocumentPara
 
     uri = p.text_document.uri
     document = s.workspace.get_text_document(uri)
-    text = document.source # To retrieve full document
-    #text = p.content_changes[0].text # To retireve what was changed
-    #lines = text.split('\n')
 
-    s.lex(document)
-    s.parse(document)
+    # Only the edited lines are re-lexed, parsing waits for a pause in typing
+    s.lex(document, p.content_changes)
+    s.edit_references(uri, p.content_changes)
+    s.scheduler.schedule(uri)
+
+@server.feature(TEXT_DOCUMENT_DID_CLOSE)
+async def did_close(s: CommandBlockLanguageServer, p: DidCloseTextDocumentParams):
+    """
+        Handles documents being closed in the editor
+    """
+    s.close(p.text_document.uri)
 
 if __name__ == "__main__":
+    # 'cbls check <paths...>' lints files without an editor
+    if sys.argv[1:2] == ["check"]:
+        sys.exit(CommandBlockCheck.main(sys.argv[2:], server.version))
+
+    # Log records go to the editor, stdout carries the JSON-RPC stream
+    CommandBlockLogging.install(server)
+
+    # 'cbls --record <file>' records what the editor sends, for benchmarks.replay
+    if sys.argv[1:2] == ["--record"] and len(sys.argv) > 2:
+        CBSessionRecorder(sys.argv[2]).attach(server)
+
     server.start_io()
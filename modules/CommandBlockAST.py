@@ -0,0 +1,224 @@
+from bisect import bisect_right
+from typing import Iterator, Optional
+
+### AST nodes
+# Every node covers the source offsets [start, end) and lists its fields in __slots__,
+# keeping nodes small and letting the generic helpers below walk any of them
+class Node(object):
+    __slots__ = ("start", "end")
+
+    # Field names in constructor order, collected from the __slots__ of each subclass
+    _fields = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fields = cls._fields + cls.__dict__.get("__slots__", ())
+
+    def __init__(self, start: int, end: int, *values):
+        self.start = start
+        self.end = end
+
+        for i, field in enumerate(self._fields):
+            setattr(self, field, values[i] if i < len(values) else None)
+
+    def children(self) -> Iterator["Node"]:
+        """
+            Direct child nodes, in source order
+        """
+
+        for field in self._fields:
+            value = getattr(self, field, None)
+
+            if isinstance(value, Node):
+                yield value
+            elif isinstance(value, list):
+                yield from (v for v in value if isinstance(v, Node))
+
+    def walk(self) -> Iterator["Node"]:
+        """
+            This node and all of its descendants, depth first in source order
+        """
+
+        stack = [self]
+
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(list(node.children())))
+
+    def __repr__(self):
+        values = ", ".join(f"{field}={getattr(self, field, None)!r}" for field in self._fields)
+        return f"{type(self).__name__}({self.start}:{self.end}{', ' if values else ''}{values})"
+
+## Files
+class File(Node):
+    __slots__ = ("kind", "dir", "desc", "params", "blocks")
+
+class FileParam(Node):
+    __slots__ = ("name", "value")
+
+class Import(Node):
+    __slots__ = ("name",)
+
+## Sections
+class Reset(Node):
+    __slots__ = ("body",)
+
+class Clock(Node):
+    __slots__ = ("name", "body")
+
+class Function(Node):
+    __slots__ = ("name", "params", "body")
+
+class Macro(Node):
+    __slots__ = ("name", "params", "body")
+
+## Top level definitions
+class Array(Node):
+    __slots__ = ("name", "first", "last")
+
+class ConstAssign(Node):
+    __slots__ = ("name", "value")
+
+class Resource(Node):
+    # advancement, item_modifier, loot_table or predicate
+    __slots__ = ("kind", "name", "data")
+
+class SelectorAssign(Node):
+    __slots__ = ("name", "selector")
+
+class SelectorDefine(Node):
+    __slots__ = ("name", "selector", "items")
+
+class SelectorItem(Node):
+    # Pointers to other selectors, data paths and vector paths
+    __slots__ = ("name", "value")
+
+## Code blocks
+class Command(Node):
+    __slots__ = ("text",)
+
+class Assign(Node):
+    __slots__ = ("target", "op", "value")
+
+class Return(Node):
+    __slots__ = ("value",)
+
+class Statement(Node):
+    # Keyword led code blocks (create, define name, move, remove, tell, title, ...)
+    __slots__ = ("keyword", "args")
+
+class Execute(Node):
+    # if/unless/as/at/... chains, both block and inline ('do'/'then') forms
+    __slots__ = ("items", "body", "else_blocks")
+
+class ExecuteItem(Node):
+    __slots__ = ("keyword", "args")
+
+class Else(Node):
+    __slots__ = ("items", "body")
+
+class For(Node):
+    __slots__ = ("target", "args", "body")
+
+class While(Node):
+    __slots__ = ("conditions", "items", "body")
+
+class With(Node):
+    __slots__ = ("items", "body")
+
+class WithItem(Node):
+    __slots__ = ("name", "value")
+
+## Expressions
+class Identifier(Node):
+    __slots__ = ("value",)
+
+class Number(Node):
+    __slots__ = ("value",)
+
+class String(Node):
+    __slots__ = ("value",)
+
+class Constant(Node):
+    # $name references
+    __slots__ = ("name",)
+
+class Variable(Node):
+    __slots__ = ("owner", "name", "index")
+
+class BinaryOp(Node):
+    __slots__ = ("op", "left", "right")
+
+class UnaryOp(Node):
+    __slots__ = ("op", "operand")
+
+class Call(Node):
+    # Function, method ('owner' is the selector) and macro calls
+    __slots__ = ("kind", "owner", "name", "args")
+
+class Selector(Node):
+    __slots__ = ("name", "qualifiers")
+
+class Qualifier(Node):
+    __slots__ = ("name", "op", "value")
+
+class Condition(Node):
+    # block, predicate, nbt and other non-expression conditions
+    __slots__ = ("kind", "args")
+
+class Vector(Node):
+    __slots__ = ("components",)
+
+class ArrayLiteral(Node):
+    # [a, b, ...] and (a, b, ...) constant lists
+    __slots__ = ("items",)
+
+class Coordinates(Node):
+    __slots__ = ("components",)
+
+class Json(Node):
+    # JSON/NBT literals, only the span is kept, the text is in the source
+    __slots__ = ()
+
+class DataPath(Node):
+    __slots__ = ()
+
+def find(node: Node, offset: int) -> Optional[Node]:
+    """
+        The innermost node covering offset, None if node does not cover it
+    """
+
+    if not node.start <= offset < node.end:
+        return None
+
+    while True:
+        for child in node.children():
+            if child.start <= offset < child.end:
+                node = child
+                break
+        else:
+            return node
+
+def line_starts(source: str) -> list[int]:
+    """
+        Offset of the first character of every line of source
+    """
+
+    starts = [0]
+    find = source.find
+    i = find('\n')
+
+    while i != -1:
+        starts.append(i + 1)
+        i = find('\n', i + 1)
+
+    return starts
+
+def position(starts: list[int], offset: int) -> tuple[int, int]:
+    """
+        (line, column) of an offset, given the line starts of its source
+    """
+
+    line = bisect_right(starts, offset) - 1
+    return line, offset - starts[line]
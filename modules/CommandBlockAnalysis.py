@@ -0,0 +1,102 @@
+import os
+from typing import Optional, Tuple
+from lsprotocol.types import Diagnostic, DiagnosticSeverity, Position, Range
+from pygls.uris import to_fs_path
+from modules.CommandBlockIndex import CBReference, CBSymbol, collect_imports, collect_references, collect_symbols
+from modules.CommandBlockParser import CBParse, CBParseResult
+from modules.CommandBlockTokenStore import CBTokenBuffer
+
+class CBAnalysis(object):
+    """
+        Everything extracted from one parse of a document
+    """
+
+    def __init__(self, uri: str, diagnostics: list[Diagnostic], symbols: list[CBSymbol], imports: Optional[list[CBSymbol]] = None,
+                 references: Optional[list[CBReference]] = None):
+        self.uri = uri
+        self.diagnostics = diagnostics
+        self.symbols = symbols
+        self.imports = [] if imports is None else imports
+        self.references = [] if references is None else references
+
+def analyse(parser: CBParse, uri: str, source: str, filename: str, tokens: Optional[CBTokenBuffer] = None) -> CBAnalysis:
+    """
+        Parse source in a fresh session and collect its diagnostics, symbols, imports and references
+
+        The tokens already lexed for the document are replayed when given
+    """
+
+    if not source.strip():
+        return CBAnalysis(uri, [], [])
+
+    result = parser.parse_result(source, tokens)
+
+    if result.tree is None:
+        return CBAnalysis(uri, parse_diagnostics(result, filename), [])
+
+    tree = result.tree
+
+    return CBAnalysis(uri, parse_diagnostics(result, filename), collect_symbols(tree, source, uri), collect_imports(tree, source, uri),
+                      collect_references(tree, source))
+
+def read_source(uri: str) -> Optional[Tuple[str, str]]:
+    """
+        The text and file name of a document on disk, None if it cannot be read
+    """
+
+    path = to_fs_path(uri)
+
+    try:
+        with open(path, encoding="utf-8", errors="replace") as file:
+            return file.read(), os.path.basename(path)
+    except (OSError, TypeError):
+        return None
+
+def unresolved_import(symbol: CBSymbol) -> Diagnostic:
+    """
+        Warning for an import of a library that does not exist
+    """
+
+    line, column, end_line, end_column = symbol.selection
+
+    return Diagnostic(
+            range=Range(start=Position(line, column), end=Position(end_line, end_column)),
+            message=f"Cannot resolve import '{symbol.name}', no '{symbol.name}.cblib' next to this file",
+            code="CBLS_UNRESOLVED_IMPORT",
+            severity=DiagnosticSeverity.Warning,
+            source="cbls")
+
+def parse_diagnostics(result: CBParseResult, filename: str) -> list[Diagnostic]:
+    """
+        LSP diagnostics for a parse result
+    """
+
+    file_ext = filename.split('.')[1]
+
+    diagnostics: list[Diagnostic] = []
+
+    if result.value:
+        ext = result.ext
+        if file_ext == "cbscript" and ext == "cblib":
+            diagnostics.append(Diagnostic(
+                    range=Range(start=Position(0, 0), end=Position(0, 0)), 
+                    message="Compiler error in file. Script files should contain directory for output ('DIR' keyword)", 
+                    code="CBLS_ERROR_START",
+                    severity=DiagnosticSeverity.Error, 
+                    source="cbls"))
+        elif file_ext == "cblib" and ext == "cbscript":
+            diagnostics.append(Diagnostic(
+                    range=Range(start=Position(0, 0), end=Position(0, 0)), 
+                    message="Compiler error in file. Libraries should not contain directory for output ('DIR' keyword)", 
+                    code="CBLS_ERROR_START",
+                    severity=DiagnosticSeverity.Error, 
+                    source="cbls"))
+
+    for d in result.diagnostics:
+        diagnostics.append(Diagnostic(
+                range=Range(start=Position(d.lineno, d.col), end=Position(d.lineno, d.col + len(d.token.value))), 
+                message=d.message, 
+                severity=DiagnosticSeverity.Error, 
+                source="cbls"))
+
+    return diagnostics
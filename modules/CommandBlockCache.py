@@ -0,0 +1,129 @@
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+from array import array
+from typing import Iterable, Optional, Tuple
+from modules.CommandBlockAnalysis import CBAnalysis
+from modules.CommandBlockTables import CACHE_DIR, rules_hash
+
+# Bump whenever what an analysis holds changes, older entries are then ignored
+CACHE_FORMAT = 4
+
+def grammar_version(lexer, parser) -> str:
+    """
+        Version of everything a cached entry depends on: the lexer rules, the grammar and the entry format
+    """
+
+    return f"{rules_hash(lexer, 't_')}-{rules_hash(parser, 'p_')}-{CACHE_FORMAT}"
+
+def content_hash(source: str, filename: str) -> str:
+    """
+        Cache key of a document, its diagnostics depend on the file extension too
+    """
+
+    return hashlib.sha1(f"{os.path.splitext(filename)[1]}\0{source}".encode("utf-8", "surrogatepass")).hexdigest()
+
+class CBIndexCache(object):
+    """
+        On-disk cache of analyses and semantic tokens, keyed by content hash
+
+        A single SQLite file under the cache directory, only opened on first use and
+        read one entry at a time, so an unchanged workspace is restored without
+        parsing anything. Entries written by another grammar version are never read.
+        Every method may be called from any thread, failures only disable the cache
+    """
+
+    def __init__(self, version: str, path: Optional[str] = None):
+        self.version = version
+        self.path = path if path is not None else os.path.join(CACHE_DIR, "index.sqlite3")
+
+        self.lock = threading.Lock()
+        self.connection: Optional[sqlite3.Connection] = None
+        self.disabled = False
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self.connection is None and not self.disabled:
+            try:
+                if self.path != ":memory:":
+                    os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+                connection = sqlite3.connect(self.path, check_same_thread=False)
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("CREATE TABLE IF NOT EXISTS entries (hash TEXT PRIMARY KEY, version TEXT, analysis BLOB, tokens BLOB)")
+
+                # Entries of other versions can never be hit again
+                connection.execute("DELETE FROM entries WHERE version != ?", (self.version,))
+                connection.commit()
+
+                self.connection = connection
+            except (OSError, sqlite3.Error):
+                self.disabled = True
+
+        return self.connection
+
+    def get(self, key: str, uri: str) -> Tuple[Optional[CBAnalysis], Optional[Tuple[array, array, array]]]:
+        """
+            The cached analysis and token arrays (data, counts, boundaries) of a document, None when missing
+        """
+
+        with self.lock:
+            if (connection := self._connect()) is None:
+                return None, None
+
+            try:
+                row = connection.execute("SELECT analysis, tokens FROM entries WHERE hash = ? AND version = ?", (key, self.version)).fetchone()
+            except sqlite3.Error:
+                return None, None
+
+        if row is None:
+            return None, None
+
+        analysis = None if row[0] is None else pickle.loads(row[0])
+        tokens = None if row[1] is None else pickle.loads(row[1])
+
+        # Entries are shared between identical files, point them at this one
+        if analysis is not None:
+            analysis.uri = uri
+
+            for symbol in analysis.symbols + analysis.imports:
+                symbol.uri = uri
+
+        return analysis, tokens
+
+    def put(self, key: str, analysis: Optional[CBAnalysis] = None, tokens: Optional[Tuple[array, array, array]] = None):
+        """
+            Store the analysis and/or tokens of a document, keeping whichever of them is not given
+        """
+
+        self.put_many([(key, analysis, tokens)])
+
+    def put_many(self, entries: Iterable[Tuple[str, Optional[CBAnalysis], Optional[Tuple[array, array, array]]]]):
+        """
+            Store several entries in one transaction
+        """
+
+        rows = [(key, self.version,
+                 None if analysis is None else pickle.dumps(analysis, pickle.HIGHEST_PROTOCOL),
+                 None if tokens is None else pickle.dumps(tokens, pickle.HIGHEST_PROTOCOL))
+                for key, analysis, tokens in entries]
+
+        with self.lock:
+            if (connection := self._connect()) is None:
+                return
+
+            try:
+                connection.executemany(
+                    "INSERT INTO entries (hash, version, analysis, tokens) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(hash) DO UPDATE SET version = excluded.version, "
+                    "analysis = coalesce(excluded.analysis, analysis), tokens = coalesce(excluded.tokens, tokens)", rows)
+                connection.commit()
+            except sqlite3.Error:
+                pass
+
+    def close(self):
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
@@ -0,0 +1,234 @@
+import argparse
+import json
+import os
+import sys
+import urllib.parse
+from concurrent.futures import Future, as_completed
+from typing import Iterable, Iterator, Optional, TextIO, Tuple
+from lsprotocol.types import Diagnostic, DiagnosticSeverity
+from pygls.uris import from_fs_path, to_fs_path
+from modules import CommandBlockWorkers
+from modules.CommandBlockAnalysis import parse_diagnostics, read_source, unresolved_import
+from modules.CommandBlockImports import resolve_import
+from modules.CommandBlockIndex import collect_imports
+from modules.CommandBlockLexer import CBLex
+from modules.CommandBlockParser import CBParse
+from modules.CommandBlockWorkspace import discover
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+SEVERITIES = {
+    DiagnosticSeverity.Error: "error",
+    DiagnosticSeverity.Warning: "warning",
+    DiagnosticSeverity.Information: "information",
+    DiagnosticSeverity.Hint: "hint",
+}
+
+# SARIF only knows these levels
+SARIF_LEVELS = {"error": "error", "warning": "warning", "information": "note", "hint": "note"}
+
+# Syntax errors carry no code of their own
+SYNTAX_ERROR = "CBLS_SYNTAX_ERROR"
+
+def record(path: str, diagnostic: Diagnostic) -> dict:
+    """
+        A diagnostic as plain data, with 1-based lines and columns as editors and CI tools show them
+    """
+
+    start, end = diagnostic.range.start, diagnostic.range.end
+
+    return {
+        "path": path,
+        "line": start.line + 1,
+        "column": start.character + 1,
+        "end_line": end.line + 1,
+        "end_column": end.character + 1,
+        "severity": SEVERITIES.get(diagnostic.severity, "error"),
+        "code": diagnostic.code or SYNTAX_ERROR,
+        "message": diagnostic.message,
+    }
+
+def check_source(parser: CBParse, path: str, source: str) -> list[dict]:
+    """
+        Diagnostics of a file's text, syntax errors first then imports of missing libraries
+    """
+
+    if not source.strip():
+        return []
+
+    uri = from_fs_path(os.path.abspath(path))
+    result = parser.parse_result(source)
+    diagnostics = parse_diagnostics(result, os.path.basename(path))
+
+    if result.tree is not None:
+        for symbol in collect_imports(result.tree, source, uri):
+            target = resolve_import(uri, symbol.name)
+
+            if target is not None and not os.path.exists(to_fs_path(target)):
+                diagnostics.append(unresolved_import(symbol))
+
+    return [record(path, diagnostic) for diagnostic in diagnostics]
+
+def check_file(parser: CBParse, path: str) -> list[dict]:
+    if (read := read_source(from_fs_path(os.path.abspath(path)))) is None:
+        return [{"path": path, "line": 1, "column": 1, "end_line": 1, "end_column": 1, "severity": "error",
+                 "code": "CBLS_UNREADABLE", "message": "Cannot read file"}]
+
+    return check_source(parser, path, read[0])
+
+def collect(paths: Iterable[str]) -> list[str]:
+    """
+        Every source to check, files given by name are checked whatever their extension
+    """
+
+    files = []
+
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(found for found, _ in discover([path])))
+        else:
+            files.append(path)
+
+    return files
+
+def _check(path: str) -> Tuple[str, list[dict]]:
+    return path, check_file(CommandBlockWorkers.parser(), path)
+
+def check(files: list[str], jobs: int, threshold: int = 16) -> Iterator[Tuple[str, list[dict]]]:
+    """
+        (path, records) for every file, in the order they finish
+
+        Files are spread over a pool of processes, only workers send back the records
+        of a file so nothing else crosses between processes. Too few files to pay for
+        starting the processes are checked here
+    """
+
+    if jobs <= 1 or len(files) < threshold:
+        parser = CBParse(CBLex())
+
+        for path in files:
+            yield path, check_file(parser, path)
+
+        return
+
+    with CommandBlockWorkers.spawn_pool(jobs) as executor:
+        futures: list[Future] = [executor.submit(_check, path) for path in files]
+
+    with executor:
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+class CBJsonLinesWriter(object):
+    """
+        One JSON object per diagnostic and line
+    """
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+
+    def write(self, records: list[dict]):
+        for item in records:
+            self.stream.write(json.dumps(item) + "\n")
+
+        self.stream.flush()
+
+    def close(self):
+        pass
+
+class CBSarifWriter(object):
+    """
+        A SARIF 2.1.0 log, written out result by result so nothing is held back until the end
+
+        Files are given relative to the root as %SRCROOT%, the way code scanning tools
+        match them to the repository, files outside it by their file:// URI
+    """
+
+    def __init__(self, stream: TextIO, version: str, root: str = "."):
+        self.stream = stream
+        self.first = True
+        self.root = os.path.abspath(root)
+
+        driver = {"name": "cbls", "version": version, "informationUri": "https://github.com/SethBling/cbscript"}
+        bases = {"%SRCROOT%": {"uri": from_fs_path(self.root).rstrip("/") + "/"}}
+        header = json.dumps({"version": "2.1.0", "$schema": SARIF_SCHEMA, "runs": [{"tool": {"driver": driver}, "originalUriBaseIds": bases, "results": []}]})
+
+        # Everything up to the opening of the results array
+        self.stream.write(header[:header.rindex("[]") + 1])
+
+    def artifact(self, path: str) -> dict:
+        path = os.path.abspath(path)
+
+        try:
+            relative = os.path.relpath(path, self.root)
+        except ValueError:
+            # Another drive
+            relative = os.pardir
+
+        if relative == os.pardir or relative.startswith(os.pardir + os.sep):
+            return {"uri": from_fs_path(path)}
+
+        return {"uri": urllib.parse.quote(relative.replace(os.sep, "/")), "uriBaseId": "%SRCROOT%"}
+
+    def write(self, records: list[dict]):
+        for item in records:
+            result = {
+                "ruleId": item["code"],
+                "level": SARIF_LEVELS[item["severity"]],
+                "message": {"text": item["message"]},
+                "locations": [{"physicalLocation": {
+                    "artifactLocation": self.artifact(item["path"]),
+                    "region": {"startLine": item["line"], "startColumn": item["column"],
+                               "endLine": item["end_line"], "endColumn": item["end_column"]}}}],
+            }
+
+            self.stream.write(("" if self.first else ",") + json.dumps(result))
+            self.first = False
+
+        self.stream.flush()
+
+    def close(self):
+        self.stream.write("]}]}\n")
+        self.stream.flush()
+
+def main(argv: Optional[list[str]] = None, version: str = "") -> int:
+    """
+        cbls check <paths...>, returns the exit code: 1 when any file has errors
+    """
+
+    arguments = argparse.ArgumentParser(prog="cbls check", description="Check CommandBlockScript files for errors")
+    arguments.add_argument("paths", nargs="+", help="files and directories to check, directories are searched for .cbscript and .cblib files")
+    arguments.add_argument("--format", choices=("jsonl", "sarif"), default="jsonl", help="output format (default: jsonl)")
+    arguments.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="processes to check files with (default: one per core)")
+    arguments.add_argument("-o", "--output", help="file to write to instead of stdout")
+    arguments.add_argument("--root", default=".", help="directory SARIF paths are relative to (default: the current directory)")
+    options = arguments.parse_args(argv)
+
+    if missing := [path for path in options.paths if not os.path.exists(path)]:
+        arguments.error(f"no such file or directory: {', '.join(missing)}")
+
+    stream = sys.stdout if options.output is None else open(options.output, "w", encoding="utf-8")
+    writer = CBSarifWriter(stream, version, options.root) if options.format == "sarif" else CBJsonLinesWriter(stream)
+
+    files = collect(options.paths)
+    counts = {"error": 0, "warning": 0}
+
+    try:
+        for _, records in check(files, options.jobs):
+            writer.write(records)
+
+            for item in records:
+                if item["severity"] in counts:
+                    counts[item["severity"]] += 1
+    finally:
+        writer.close()
+
+        if stream is not sys.stdout:
+            stream.close()
+
+    print(f"{len(files)} files checked, {counts['error']} errors, {counts['warning']} warnings", file=sys.stderr)
+
+    return 1 if counts["error"] else 0
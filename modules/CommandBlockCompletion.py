@@ -0,0 +1,302 @@
+import os
+from bisect import bisect_left
+from itertools import islice
+from typing import Dict, Iterable, Iterator, Optional, Set
+from lsprotocol.types import CompletionItem, CompletionItemKind, CompletionList, MarkupContent, MarkupKind, Position
+from pygls.uris import to_fs_path
+from pygls.workspace import TextDocument
+from modules.CommandBlockAnalysis import read_source
+from modules.CommandBlockIndex import CBSymbol
+
+# Selector arguments understood by Minecraft
+QUALIFIERS = sorted([
+    "advancements", "distance", "dx", "dy", "dz", "gamemode", "level", "limit", "name", "nbt",
+    "predicate", "scores", "sort", "tag", "team", "type", "x", "x_rotation", "y", "y_rotation", "z"
+])
+
+SELECTORS = ["@a", "@e", "@p", "@r", "@s"]
+
+# Items sent per response, the client asks again as the prefix grows
+PAGE_SIZE = 100
+
+# Lines of a definition shown when an item is resolved
+SNIPPET_LINES = 8
+
+SYMBOL_KINDS = {
+    "array": CompletionItemKind.Variable,
+    "clock": CompletionItemKind.Event,
+    "constant": CompletionItemKind.Constant,
+    "function": CompletionItemKind.Function,
+    "macro": CompletionItemKind.Snippet,
+    "method": CompletionItemKind.Method,
+    "selector": CompletionItemKind.Class,
+}
+
+def prefixed(names: list[str], prefix: str) -> Iterator[str]:
+    """
+        Names of a sorted list starting with prefix
+    """
+
+    for i in range(bisect_left(names, prefix), len(names)):
+        if not names[i].startswith(prefix):
+            break
+
+        yield names[i]
+
+class CBCompletionContext(object):
+    """
+        What surrounds the cursor, worked out from the tokens of its line only
+    """
+
+    def __init__(self, prefix: str, previous: list, in_brackets: bool):
+        # Partial word under the cursor, including a leading '@' or '$'
+        self.prefix = prefix
+
+        # Tokens on the line before the partial word
+        self.previous = previous
+
+        # Inside the [...] of a selector
+        self.in_brackets = in_brackets
+
+    def previous_type(self, back: int = 1) -> str:
+        return self.previous[-back].type if len(self.previous) >= back else "NEWLINE"
+
+class CBCompletionProvider(object):
+    """
+        Context-aware completion
+
+        The document is never parsed for a request. The line up to the cursor is
+        lexed, and the token before the cursor selects what can follow it using the
+        same LR action table p_error reports expected tokens from: for every token
+        the union of the lookaheads of all states reached by shifting it is computed
+        once. Keywords, selector qualifiers, executee and axis values are kept as
+        sorted lists and the workspace symbols come from the index, all of them
+        matched by prefix with a binary search
+
+        Items are sent bare, a label, a kind and a sort text, and at most a page of
+        them at a time. Signatures and definitions are only looked up once the
+        client resolves the item it shows
+    """
+
+    def __init__(self, server):
+        self.server = server
+        self.lexer = server.lexer.lexer.clone()
+
+        self.keywords = sorted(server.lexer.reserved)
+        self.executee = sorted(server.parser.executee)
+        self.axis = sorted(server.parser.axis)
+
+        self._follows: Optional[Dict[str, Set[str]]] = None
+
+    @property
+    def follows(self) -> Dict[str, Set[str]]:
+        """
+            Tokens that may follow each token type, from the parser's action table
+        """
+
+        if self._follows is None:
+            action = self.server.parser.parser.action
+            follows: Dict[str, Set[str]] = {}
+
+            for state in action.values():
+                for token, target in state.items():
+                    if target > 0:
+                        follows.setdefault(token, set()).update(action[target].keys())
+
+            self._follows = follows
+
+        return self._follows
+
+    def context(self, document: TextDocument, position: Position) -> Optional[CBCompletionContext]:
+        """
+            Lex the line of the cursor up to it, None where nothing should be completed
+        """
+
+        lines = document.lines
+
+        if position.line >= len(lines):
+            return None
+
+        text = lines[position.line][:position.character]
+
+        # Minecraft commands and comments are passed through as is
+        stripped = text.lstrip()
+        if stripped.startswith(('/', '#')):
+            return None
+
+        # A lone '@' is no token yet
+        prefix = ""
+        if text.endswith('@'):
+            text = text[:-1]
+            prefix = "@"
+
+        ply = self.lexer
+        ply.input(text)
+        tokens = []
+
+        while (token := ply.token()) is not None:
+            tokens.append(token)
+
+        # The word being typed is the last token if it runs right up to the cursor
+        if not prefix and tokens and tokens[-1].lexpos + len(str(tokens[-1].value)) == len(text):
+            if tokens[-1].type in ("ID", "ATID") or tokens[-1].type.lower() in self.server.lexer.reserved:
+                prefix = tokens.pop().value
+
+        if tokens and tokens[-1].type == "DOLLAR" and tokens[-1].lexpos + 1 + len(prefix) == len(text):
+            prefix = "$" + prefix
+            tokens.pop()
+
+        # Strings and comments hide the cursor
+        if tokens and tokens[-1].type in ("STRING", "COMMAND"):
+            return None
+
+        depth = 0
+        for token in tokens:
+            if token.type == "LBRACKET":
+                depth += 1
+            elif token.type == "RBRACKET":
+                depth = max(0, depth - 1)
+
+        in_brackets = depth > 0 and any(t.type == "ATID" for t in tokens)
+
+        return CBCompletionContext(prefix, tokens, in_brackets)
+
+    def complete(self, document: TextDocument, position: Position, limit: int = PAGE_SIZE) -> CompletionList:
+        """
+            Completion items for the cursor position, incomplete when there are more than limit
+        """
+
+        context = self.context(document, position)
+
+        if context is None:
+            return CompletionList(is_incomplete=False, items=[])
+
+        items = list(islice(self.candidates(document.uri, context), limit + 1))
+
+        # Candidates come out best first, keep that order in the client
+        for i, item in enumerate(items):
+            item.sort_text = f"{i:04}"
+
+        return CompletionList(is_incomplete=len(items) > limit, items=items[:limit])
+
+    def resolve(self, item: CompletionItem) -> CompletionItem:
+        """
+            Fill in the signature and definition of a symbol's item
+        """
+
+        if not isinstance(item.data, dict) or (symbol := self.find(item.data)) is None:
+            return item
+
+        item.detail = symbol.detail or symbol.kind
+
+        if (snippet := self.snippet(symbol)) is not None:
+            path = to_fs_path(symbol.uri) or symbol.uri
+            location = f"{os.path.basename(path)}:{symbol.selection[0] + 1}"
+            item.documentation = MarkupContent(kind=MarkupKind.Markdown, value=f"```cbscript\n{snippet}\n```\n{location}")
+
+        return item
+
+    def find(self, data: dict) -> Optional[CBSymbol]:
+        """
+            The indexed symbol an item was made for
+        """
+
+        for symbol in self.server.index.lookup(data.get("name"), data.get("kind")):
+            if symbol.uri == data.get("uri") and symbol.container == data.get("container"):
+                return symbol
+
+        return None
+
+    def snippet(self, symbol: CBSymbol) -> Optional[str]:
+        """
+            The first lines of a symbol's definition, from the editor if the document is open
+        """
+
+        if symbol.uri in self.server.workspace.text_documents:
+            lines = self.server.workspace.get_text_document(symbol.uri).lines
+        elif (read := read_source(symbol.uri)) is not None:
+            lines = read[0].splitlines()
+        else:
+            return None
+
+        first, last = symbol.range[0], min(symbol.range[2], symbol.range[0] + SNIPPET_LINES - 1)
+
+        return "\n".join(line.rstrip("\r\n") for line in lines[first:last + 1]) or None
+
+    def candidates(self, uri: str, context: CBCompletionContext) -> Iterator[CompletionItem]:
+        prefix = context.prefix
+        previous = context.previous_type()
+
+        # Selector arguments
+        if context.in_brackets:
+            if previous in ("LBRACKET", "COMMA", "AND"):
+                yield from self.items(prefixed(QUALIFIERS, prefix), CompletionItemKind.Property)
+            return
+
+        # 'on <executee>' and 'align <axis>'
+        if previous == "ON":
+            yield from self.items(prefixed(self.executee, prefix), CompletionItemKind.EnumMember)
+            return
+
+        if previous == "ALIGN":
+            yield from self.items(prefixed(self.axis, prefix), CompletionItemKind.EnumMember)
+            return
+
+        # Methods of a selector, '@Pig.'
+        if previous == "DOT" and context.previous_type(2) == "ATID":
+            owner = context.previous[-2].value
+            yield from self.symbols(uri, prefix, ("method",), lambda s: s.container == owner or owner in SELECTORS)
+            return
+
+        # Constants and macros, '$name'
+        if prefix.startswith("$"):
+            yield from self.symbols(uri, prefix[1:], ("constant", "macro"))
+            return
+
+        # Selectors
+        if prefix.startswith("@"):
+            yield from self.items(prefixed(SELECTORS, prefix), CompletionItemKind.Class)
+            yield from self.symbols(uri, prefix, ("selector",))
+            return
+
+        expected = self.follows.get(previous, set())
+
+        yield from self.items((k for k in prefixed(self.keywords, prefix) if k.upper() in expected), CompletionItemKind.Keyword)
+
+        if "FUNCTION_ID" in expected:
+            yield from self.symbols(uri, prefix, ("function",))
+
+        if "ID" in expected:
+            yield from self.symbols(uri, prefix, ("array",))
+
+        if "ATID" in expected and not prefix:
+            yield from self.items(SELECTORS, CompletionItemKind.Class)
+            yield from self.symbols(uri, "@", ("selector",))
+
+    def symbols(self, uri: str, prefix: str, kinds: Iterable[str], accept=None) -> Iterator[CompletionItem]:
+        """
+            Items for the symbols visible from a document, matching prefix and one of kinds
+        """
+
+        visible = self.server.imports.visible(uri)
+        seen = set()
+
+        # Sorted so the symbol kept among several of the same name does not depend on set order
+        for symbol in self.server.index.visible_prefix(sorted(visible), prefix):
+            if symbol.kind not in kinds or (accept is not None and not accept(symbol)):
+                continue
+
+            if (symbol.name, symbol.kind) in seen:
+                continue
+
+            seen.add((symbol.name, symbol.kind))
+            yield self.item(symbol)
+
+    def item(self, symbol: CBSymbol) -> CompletionItem:
+        data = {"uri": symbol.uri, "name": symbol.name, "kind": symbol.kind, "container": symbol.container}
+        return CompletionItem(label=symbol.name, kind=SYMBOL_KINDS.get(symbol.kind), data=data)
+
+    @staticmethod
+    def items(labels: Iterable[str], kind: CompletionItemKind) -> Iterator[CompletionItem]:
+        for label in labels:
+            yield CompletionItem(label=label, kind=kind)
@@ -0,0 +1,149 @@
+import asyncio
+import itertools
+from typing import Dict, Optional, Tuple
+from lsprotocol.types import (
+    Diagnostic, DocumentDiagnosticReport, PreviousResultId, RelatedFullDocumentDiagnosticReport, RelatedUnchangedDocumentDiagnosticReport,
+    WorkspaceDiagnosticReport, WorkspaceFullDocumentDiagnosticReport, WorkspaceUnchangedDocumentDiagnosticReport,
+    WORKSPACE_DIAGNOSTIC_REFRESH
+    )
+
+class CBDiagnosticProvider(object):
+    """
+        Diagnostics of every analysed document, for both the push and the pull model
+
+        Each document's latest diagnostics are kept under a result id that only changes
+        when the diagnostics themselves do, so a client asking again with the id it
+        already has gets an 'unchanged' report and nothing is serialized. Clients
+        without pull support get the diagnostics of open documents pushed whenever they
+        differ from what was last pushed, and always once a document is opened. A pull
+        for a document waiting to be parsed answers once the parse is done, and when
+        the diagnostics the client pulled for a document not open in the editor change,
+        such as a missing import showing up, it is asked to pull again
+    """
+
+    _ids = itertools.count(1)
+
+    def __init__(self, server):
+        self.server = server
+
+        # Result id and diagnostics per document
+        self.results: Dict[str, Tuple[str, list[Diagnostic]]] = {}
+
+        # Result id last reported to the client per document
+        self.sent: Dict[str, str] = {}
+
+        # Diagnostics last pushed to the client per open document
+        self.pushed: Dict[str, list[Diagnostic]] = {}
+
+        # Pulls waiting on a parse, per document
+        self.waiting: Dict[str, int] = {}
+
+    @property
+    def pull(self) -> bool:
+        """
+            Whether the client pulls diagnostics itself
+        """
+
+        capabilities = getattr(self.server.lsp, "client_capabilities", None)
+        text_document = capabilities.text_document if capabilities is not None else None
+
+        return text_document is not None and text_document.diagnostic is not None
+
+    @property
+    def refresh_support(self) -> bool:
+        capabilities = getattr(self.server.lsp, "client_capabilities", None)
+        workspace = capabilities.workspace if capabilities is not None else None
+
+        return workspace is not None and workspace.diagnostics is not None and bool(workspace.diagnostics.refresh_support)
+
+    def update(self, uri: str, diagnostics: list[Diagnostic]) -> bool:
+        """
+            Record the diagnostics of a document, returns whether they changed
+        """
+
+        result = self.results.get(uri)
+
+        if result is not None and result[1] == diagnostics:
+            return False
+
+        self.results[uri] = (str(next(self._ids)), diagnostics)
+
+        # The client holds outdated diagnostics and is not about to ask for new ones,
+        # it pulls open documents again as they are edited
+        if uri in self.sent and self.pull and self.refresh_support and not self.waiting.get(uri) \
+                and uri not in self.server.workspace.text_documents and uri not in self.server.scheduler.pending:
+            self.server.lsp.send_request(WORKSPACE_DIAGNOSTIC_REFRESH)
+
+        return True
+
+    def publish(self, uri: str, diagnostics: list[Diagnostic], version: Optional[int] = None):
+        """
+            Record the diagnostics of an open document, pushed to clients not pulling them
+        """
+
+        self.update(uri, diagnostics)
+
+        # The stored result may come from before the document was opened, compare with what the client has
+        if not self.pull and self.pushed.get(uri) != diagnostics:
+            self.server.publish_diagnostics(uri, diagnostics, version=version)
+            self.pushed[uri] = diagnostics
+
+    def forget(self, uri: str):
+        """
+            Forget what the client was sent for a document, it drops them once the document is closed
+        """
+
+        self.sent.pop(uri, None)
+        self.pushed.pop(uri, None)
+
+    async def settled(self, uri: str):
+        """
+            Wait for the parses pending for a document
+        """
+
+        self.waiting[uri] = self.waiting.get(uri, 0) + 1
+
+        try:
+            # A parse cancelled by a newer edit is replaced by the one scheduled for it
+            while (task := self.server.scheduler.pending.get(uri)) is not None:
+                await asyncio.wait([task])
+        finally:
+            self.waiting[uri] -= 1
+
+            if not self.waiting[uri]:
+                del self.waiting[uri]
+
+    async def document(self, uri: str, previous_result_id: Optional[str] = None) -> DocumentDiagnosticReport:
+        """
+            The diagnostics of a document, or an unchanged report for the result id the client has
+        """
+
+        await self.settled(uri)
+
+        result_id, diagnostics = self.results.get(uri, ("", []))
+        self.sent[uri] = result_id
+
+        if previous_result_id is not None and previous_result_id == result_id:
+            return RelatedUnchangedDocumentDiagnosticReport(result_id=result_id)
+
+        return RelatedFullDocumentDiagnosticReport(items=diagnostics, result_id=result_id)
+
+    def workspace(self, previous_result_ids: list[PreviousResultId]) -> WorkspaceDiagnosticReport:
+        """
+            The diagnostics of every analysed document, unchanged reports for those the client is up to date with
+        """
+
+        previous = {p.uri: p.value for p in previous_result_ids}
+        documents = self.server.workspace.text_documents
+        items = []
+
+        for uri, (result_id, diagnostics) in self.results.items():
+            version = documents[uri].version if uri in documents else None
+            self.sent[uri] = result_id
+
+            if previous.get(uri) == result_id:
+                items.append(WorkspaceUnchangedDocumentDiagnosticReport(uri=uri, result_id=result_id, version=version))
+            else:
+                items.append(WorkspaceFullDocumentDiagnosticReport(uri=uri, items=diagnostics, result_id=result_id, version=version))
+
+        return WorkspaceDiagnosticReport(items=items)
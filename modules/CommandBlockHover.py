@@ -0,0 +1,67 @@
+import os
+from typing import Optional
+from lsprotocol.types import Hover, MarkupContent, MarkupKind, Position, Range
+from pygls.uris import to_fs_path
+from modules.CommandBlockIndex import CBReference
+
+class CBHoverProvider(object):
+    """
+        Hover information for the names of a document
+
+        The name under the cursor comes from the document's range index, a binary
+        search over the names collected at its last parse, and its definition from the
+        symbol index, so a hover neither walks the tree nor re-lexes the line
+    """
+
+    def __init__(self, server):
+        self.server = server
+
+    def hover(self, uri: str, position: Position) -> Optional[Hover]:
+        """
+            Hover for the name at a position, None when there is nothing to show
+        """
+
+        if (reference := self.server.navigation.at(uri, position)) is None:
+            return None
+
+        if (text := self.describe(uri, reference)) is None:
+            return None
+
+        return Hover(
+            contents=MarkupContent(kind=MarkupKind.Markdown, value=text),
+            range=Range(start=Position(line=reference.line, character=reference.start), end=Position(line=reference.line, character=reference.end))
+        )
+
+    def describe(self, uri: str, reference: CBReference) -> Optional[str]:
+        """
+            Markdown for a name: its signature, selector or value, and where it is defined if not in uri
+        """
+
+        # Macro parameters are described by their macro
+        if reference.kind == "parameter":
+            macro = self.server.navigation.symbol(uri, reference.container, "macro")
+            code = f"(parameter) ${reference.name}" + ("" if macro is None else f" of {macro.detail}")
+
+            return f"```cbscript\n{code}\n```"
+
+        if (symbol := self.server.navigation.symbol(uri, reference.name, reference.kind, reference.container)) is None:
+            return None
+
+        if symbol.kind == "method":
+            code = f"{symbol.container}.{symbol.detail}"
+        elif symbol.kind == "selector":
+            code = f"{symbol.name} = {symbol.detail}"
+        elif symbol.kind == "constant":
+            code = f"${symbol.name} = {symbol.detail}"
+        elif symbol.kind in ("clock", "array"):
+            code = f"{symbol.kind} {symbol.name}{symbol.detail}"
+        else:
+            code = symbol.detail
+
+        text = f"```cbscript\n{code}\n```"
+
+        if symbol.uri != uri:
+            path = to_fs_path(symbol.uri) or symbol.uri
+            text += f"\n\nDefined in `{os.path.basename(path)}`"
+
+        return text
@@ -0,0 +1,117 @@
+import os
+from typing import Dict, Iterable, Optional, Set
+from pygls.uris import from_fs_path, to_fs_path
+
+LIBRARY_EXT = ".cblib"
+
+def resolve_import(uri: str, name: str) -> Optional[str]:
+    """
+        The uri of the library 'import name' refers to from a document
+
+        Libraries are looked up next to the importing document, as the compiler does
+    """
+
+    path = to_fs_path(uri)
+
+    if path is None:
+        return None
+
+    return from_fs_path(os.path.join(os.path.dirname(path), name + LIBRARY_EXT))
+
+class CBImportGraph(object):
+    """
+        Dependency graph between documents and the libraries they import
+
+        Edges point from a document to the uris of its imports, whether or not those
+        exist yet, so a library appearing later can find the documents waiting on it.
+        The set of documents visible from each document is cached, and a change to a
+        document's imports only drops the cached sets of the documents depending on it
+    """
+
+    def __init__(self):
+        self.imports: Dict[str, list[str]] = {}
+        self.dependents: Dict[str, Set[str]] = {}
+        self.closures: Dict[str, frozenset] = {}
+
+    def update(self, uri: str, names: Iterable[str]) -> list[str]:
+        """
+            Set the imports of a document, returns the uris they resolve to
+        """
+
+        resolved = [target for name in names if (target := resolve_import(uri, name)) is not None]
+
+        if self.imports.get(uri) == resolved:
+            return resolved
+
+        self.remove(uri)
+        self.imports[uri] = resolved
+
+        for target in resolved:
+            self.dependents.setdefault(target, set()).add(uri)
+
+        return resolved
+
+    def remove(self, uri: str):
+        """
+            Drop the imports of a document
+        """
+
+        self.invalidate(uri)
+
+        for target in self.imports.pop(uri, ()):
+            if (dependents := self.dependents.get(target)) is not None:
+                dependents.discard(uri)
+
+                if not dependents:
+                    del self.dependents[target]
+
+    def invalidate(self, uri: str) -> Set[str]:
+        """
+            Forget the cached visible sets of a document and everything depending on it
+
+            Returns the documents depending on uri, directly or not
+        """
+
+        affected = self.dependents_of(uri)
+
+        for dependent in affected | {uri}:
+            self.closures.pop(dependent, None)
+
+        return affected
+
+    def dependents_of(self, uri: str) -> Set[str]:
+        """
+            Every document importing uri, directly or through other libraries
+        """
+
+        seen: Set[str] = set()
+        stack = [uri]
+
+        while stack:
+            for dependent in self.dependents.get(stack.pop(), ()):
+                if dependent not in seen and dependent != uri:
+                    seen.add(dependent)
+                    stack.append(dependent)
+
+        return seen
+
+    def visible(self, uri: str) -> frozenset:
+        """
+            The document itself and every library it imports, directly or not
+        """
+
+        if (closure := self.closures.get(uri)) is not None:
+            return closure
+
+        seen = {uri}
+        stack = [uri]
+
+        while stack:
+            for target in self.imports.get(stack.pop(), ()):
+                if target not in seen:
+                    seen.add(target)
+                    stack.append(target)
+
+        closure = self.closures[uri] = frozenset(seen)
+
+        return closure
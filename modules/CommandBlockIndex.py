@@ -0,0 +1,390 @@
+import heapq
+from bisect import bisect_left, bisect_right, insort
+from operator import attrgetter
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+from modules import CommandBlockAST as ast
+
+class CBSymbol(object):
+    """
+        A named definition in a document
+
+        Ranges are (line, column, end line, end column) tuples, 'range' covers the whole
+        definition and 'selection' just its name
+    """
+
+    __slots__ = ("name", "kind", "uri", "range", "selection", "detail", "container")
+
+    def __init__(self, name: str, kind: str, uri: str, range: tuple, selection: tuple, detail: str = "", container: Optional[str] = None):
+        self.name = name
+        self.kind = kind
+        self.uri = uri
+        self.range = range
+        self.selection = selection
+        self.detail = detail
+        self.container = container
+
+    def __repr__(self):
+        return f"CBSymbol({self.kind} {self.name!r} {self.uri}:{self.selection[0]})"
+
+def collect_symbols(tree: ast.File, source: str, uri: str) -> list[CBSymbol]:
+    """
+        Every definition in a parsed document, in source order
+    """
+
+    starts = ast.line_starts(source)
+    symbols: list[CBSymbol] = []
+
+    def span(node: ast.Node) -> tuple:
+        return ast.position(starts, node.start) + ast.position(starts, node.end)
+
+    def add(node: ast.Node, name: Optional[ast.Identifier], kind: str, detail: str, container: Optional[str]):
+        if name is not None:
+            symbols.append(CBSymbol(name.value, kind, uri, span(node), span(name), detail, container))
+
+    def text(node: Optional[ast.Node]) -> str:
+        return "" if node is None else source[node.start:node.end]
+
+    def visit(node: ast.Node, container: Optional[str]):
+        if isinstance(node, ast.Function):
+            params = ", ".join(param.value for param in node.params)
+            add(node, node.name, "function" if container is None else "method", f"{text(node.name)}({params})", container)
+        elif isinstance(node, ast.Macro):
+            params = ", ".join(text(param) for param in node.params)
+            add(node, node.name, "macro", f"${text(node.name)}({params})", container)
+        elif isinstance(node, ast.Clock):
+            add(node, node.name, "clock", "", container)
+        elif isinstance(node, (ast.SelectorDefine, ast.SelectorAssign)):
+            add(node, node.name, "selector", text(node.selector), container)
+
+            if isinstance(node, ast.SelectorDefine) and node.name is not None:
+                container = node.name.value
+        elif isinstance(node, ast.ConstAssign):
+            add(node, node.name, "constant", text(node.value), container)
+        elif isinstance(node, ast.Array):
+            size = text(node.first) if node.last is None else f"{text(node.first)} to {text(node.last)}"
+            add(node, node.name, "array", f"[{size}]", container)
+        elif isinstance(node, ast.Resource):
+            add(node, node.name, node.kind, "", container)
+        elif isinstance(node, ast.Reset):
+            # Named after its keyword
+            add(node, ast.Identifier(node.start, node.start + len("reset"), "reset"), "reset", "", container)
+
+        for child in node.children():
+            visit(child, container)
+
+    visit(tree, None)
+
+    return symbols
+
+def collect_imports(tree: ast.File, source: str, uri: str) -> list[CBSymbol]:
+    """
+        The import statements of a parsed document, as symbols of kind 'import'
+    """
+
+    starts = ast.line_starts(source)
+    imports: list[CBSymbol] = []
+
+    for block in tree.blocks:
+        if isinstance(block, ast.Import) and block.name is not None:
+            span = ast.position(starts, block.start) + ast.position(starts, block.end)
+            selection = ast.position(starts, block.name.start) + ast.position(starts, block.name.end)
+            imports.append(CBSymbol(block.name.value, "import", uri, span, selection))
+
+    return imports
+
+class CBReference(object):
+    """
+        A name written in a document, where it is defined or used
+
+        Names never span lines, so a position is a line and the columns [start, end)
+    """
+
+    __slots__ = ("name", "kind", "line", "start", "end", "container")
+
+    def __init__(self, name: str, kind: str, line: int, start: int, end: int, container: Optional[str] = None):
+        self.name = name
+        self.kind = kind
+        self.line = line
+        self.start = start
+        self.end = end
+        self.container = container
+
+    def __repr__(self):
+        return f"CBReference({self.kind} {self.name!r} {self.line}:{self.start})"
+
+def collect_references(tree: ast.File, source: str) -> list[CBReference]:
+    """
+        Every function, method, macro, clock, selector, constant, array and variable name in a parsed document, in source order
+
+        Constants inside a macro named after one of its parameters are of kind 'parameter',
+        with the macro as their container
+    """
+
+    starts = ast.line_starts(source)
+    references: list[CBReference] = []
+
+    def add(name: Optional[ast.Identifier], kind: str, container: Optional[str] = None):
+        if name is not None:
+            line, column = ast.position(starts, name.start)
+            references.append(CBReference(name.value, kind, line, column, column + name.end - name.start, container))
+
+    def visit(node: ast.Node, selector: Optional[str], params: frozenset, macro: Optional[str]):
+        if isinstance(node, ast.Function):
+            add(node.name, "function" if selector is None else "method", selector)
+        elif isinstance(node, ast.Macro) and node.name is not None:
+            add(node.name, "macro")
+            macro = node.name.value
+            params = frozenset(param.name.value for param in node.params if param.name is not None)
+        elif isinstance(node, ast.Call):
+            if node.kind == "method" and isinstance(node.owner, ast.Selector) and node.owner.name is not None:
+                add(node.name, "method", node.owner.name.value)
+            elif node.kind in ("function", "macro"):
+                add(node.name, node.kind)
+        elif isinstance(node, ast.Clock):
+            add(node.name, "clock")
+        elif isinstance(node, (ast.Selector, ast.SelectorAssign, ast.SelectorDefine)):
+            add(node.name, "selector")
+
+            # Functions in a selector's block are its methods
+            if isinstance(node, ast.SelectorDefine) and node.name is not None:
+                selector = node.name.value
+        elif isinstance(node, (ast.Constant, ast.ConstAssign)) and node.name is not None:
+            if node.name.value in params:
+                add(node.name, "parameter", macro)
+            else:
+                add(node.name, "constant")
+        elif isinstance(node, ast.Array):
+            add(node.name, "array")
+        elif isinstance(node, ast.Variable) and isinstance(node.name, ast.Identifier):
+            add(node.name, "variable" if node.index is None else "array")
+
+        for child in node.children():
+            visit(child, selector, params, macro)
+
+    visit(tree, None, frozenset(), None)
+
+    # A method call visits its name before its selector
+    references.sort(key=lambda r: (r.line, r.start))
+
+    return references
+
+class CBOccurrenceIndex(object):
+    """
+        Inverted index from names to where they are written, across the workspace
+
+        Occurrences are grouped by kind and name, then by document, so finding every
+        use of a name is a dictionary hit and a re-parsed document only swaps out its
+        own entries
+    """
+
+    def __init__(self):
+        self.documents: Dict[str, list[CBReference]] = {}
+        self.names: Dict[tuple, Dict[str, list[CBReference]]] = {}
+
+    def update(self, uri: str, references: list[CBReference]):
+        """
+            Replace the occurrences of a document
+        """
+
+        self.remove(uri)
+        self.documents[uri] = references
+
+        for reference in references:
+            self.names.setdefault((reference.kind, reference.name), {}).setdefault(uri, []).append(reference)
+
+    def remove(self, uri: str):
+        """
+            Forget the occurrences of a document
+        """
+
+        for reference in self.documents.pop(uri, ()):
+            key = (reference.kind, reference.name)
+
+            if (documents := self.names.get(key)) is not None and documents.pop(uri, None) is not None and not documents:
+                del self.names[key]
+
+    def occurrences(self, name: str, kind: str) -> Dict[str, list[CBReference]]:
+        """
+            Occurrences of a name used as kind, by document
+        """
+
+        return self.names.get((kind, name), {})
+
+class CBSymbolIndex(object):
+    """
+        Workspace wide symbol table
+
+        Symbols are held per document, so a re-parsed document only swaps out its own
+        entries, and per name for constant time lookups. A sorted list of the distinct
+        names serves prefix searches with a binary search, and each document's symbols
+        sorted by name serve searches limited to a few documents
+    """
+
+    def __init__(self):
+        self.documents: Dict[str, list[CBSymbol]] = {}
+        self.names: Dict[str, list[CBSymbol]] = {}
+        self.sorted_names: list[str] = []
+
+        # Names and symbols of each document, in name order
+        self.ordered: Dict[str, Tuple[list[str], list[CBSymbol]]] = {}
+
+        # Bumped on every change, for tables derived from the index
+        self.version = 0
+
+    def update(self, uri: str, symbols: list[CBSymbol]):
+        """
+            Replace the symbols of a document
+        """
+
+        self.remove(uri)
+        self.documents[uri] = symbols
+
+        ordered = sorted(symbols, key=attrgetter("name"))
+        self.ordered[uri] = ([symbol.name for symbol in ordered], ordered)
+
+        for symbol in symbols:
+            if (entries := self.names.get(symbol.name)) is None:
+                entries = self.names[symbol.name] = []
+                insort(self.sorted_names, symbol.name)
+
+            entries.append(symbol)
+
+    def remove(self, uri: str):
+        """
+            Forget the symbols of a document
+        """
+
+        self.version += 1
+        self.ordered.pop(uri, None)
+
+        for symbol in self.documents.pop(uri, ()):
+            entries = self.names[symbol.name]
+            entries.remove(symbol)
+
+            if not entries:
+                del self.names[symbol.name]
+                del self.sorted_names[bisect_left(self.sorted_names, symbol.name)]
+
+    def lookup(self, name: str, kind: Optional[str] = None) -> list[CBSymbol]:
+        """
+            Symbols defined under exactly name, optionally of one kind only
+        """
+
+        entries = self.names.get(name, [])
+        return entries if kind is None else [s for s in entries if s.kind == kind]
+
+    def prefix(self, prefix: str, kind: Optional[str] = None) -> Iterator[CBSymbol]:
+        """
+            Symbols whose name starts with prefix, in name order
+        """
+
+        names = self.sorted_names
+
+        for i in range(bisect_left(names, prefix), len(names)):
+            if not names[i].startswith(prefix):
+                break
+
+            for symbol in self.names[names[i]]:
+                if kind is None or symbol.kind == kind:
+                    yield symbol
+
+    def visible_prefix(self, uris: Iterable[str], prefix: str) -> Iterator[CBSymbol]:
+        """
+            Symbols of the given documents whose name starts with prefix, in name order
+
+            The documents' sorted runs are merged lazily, so symbols of other documents
+            are never looked at and only as many are read as the caller takes
+        """
+
+        runs = []
+
+        for uri in uris:
+            if (entry := self.ordered.get(uri)) is None:
+                continue
+
+            names, symbols = entry
+            end = len(names) if not prefix else bisect_left(names, prefix[:-1] + chr(ord(prefix[-1]) + 1))
+            runs.append(map(symbols.__getitem__, range(bisect_left(names, prefix), end)))
+
+        return heapq.merge(*runs, key=attrgetter("name"))
+
+    def symbols(self, uri: str) -> list[CBSymbol]:
+        """
+            Symbols of a single document, in source order
+        """
+
+        return self.documents.get(uri, [])
+
+    def __len__(self):
+        return sum(map(len, self.names.values()))
+
+class CBRangeIndex(object):
+    """
+        The names of a document by position
+
+        Names never overlap, so sorted by where they start the one under a position is
+        found with a single binary search. Edits made since the parse are only recorded,
+        positions are mapped through them when looked up, so typing costs the same
+        however many names the document has
+    """
+
+    __slots__ = ("starts", "references", "edits")
+
+    def __init__(self, references: list[CBReference]):
+        # In source order, as collected
+        self.references = references
+        self.starts = [(r.line, r.start) for r in self.references]
+
+        # Lines replaced since the parse as (first, last, new_last), oldest first
+        self.edits: list[Tuple[int, int, int]] = []
+
+    def at(self, line: int, character: int) -> Optional[CBReference]:
+        """
+            The name at a position, the cursor may also sit right after it
+        """
+
+        # Back to the line of the parse, lines written since hold no names
+        for first, last, new_last in reversed(self.edits):
+            if line > new_last:
+                line -= new_last - last
+            elif line >= first:
+                return None
+
+        i = bisect_right(self.starts, (line, character)) - 1
+
+        if i >= 0 and (reference := self.references[i]).line == line and character <= reference.end:
+            return self.moved(reference)
+
+        return None
+
+    def edit(self, first: int, last: int, new_last: int):
+        """
+            Lines first to last were replaced by lines first to new_last
+
+            Names on the replaced lines are dropped until the document is parsed again,
+            names below them move by the number of lines added or removed
+        """
+
+        self.edits.append((first, last, new_last))
+
+    def moved(self, reference: CBReference) -> Optional[CBReference]:
+        """
+            A name of the parse where it is now, None if its line was edited
+        """
+
+        line = reference.line
+
+        for first, last, new_last in self.edits:
+            if line > last:
+                line += new_last - last
+            elif line >= first:
+                return None
+
+        if line == reference.line:
+            return reference
+
+        # References may still be waiting to be cached, never move them in place
+        return CBReference(reference.name, reference.kind, line, reference.start, reference.end, reference.container)
+
+    def __len__(self):
+        return len(self.references)
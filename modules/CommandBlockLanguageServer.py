@@ -1,14 +1,35 @@
-from typing import Dict, List
-from lsprotocol.types import Diagnostic, DiagnosticSeverity, Position, Range
+import os
+from array import array
+from typing import Dict, Optional, Sequence, Set, Tuple, Union
+from lsprotocol.types import (
+    Diagnostic, Range,
+    SemanticTokens, SemanticTokensDelta, SemanticTokensEdit
+    )
 from pygls.server import LanguageServer
+from pygls.uris import to_fs_path
 from pygls.workspace import TextDocument
-from modules.TokenUtils import TOKEN_MAPPING, TOKEN_TYPES
+from modules.CommandBlockAnalysis import CBAnalysis, analyse, read_source, unresolved_import
+from modules.CommandBlockCache import CBIndexCache, content_hash, grammar_version
+from modules.CommandBlockCompletion import CBCompletionProvider
+from modules.CommandBlockDiagnostics import CBDiagnosticProvider
+from modules.CommandBlockHover import CBHoverProvider
+from modules.CommandBlockImports import CBImportGraph, resolve_import
+from modules.CommandBlockIndex import CBOccurrenceIndex, CBRangeIndex, CBSymbolIndex
+from modules.CommandBlockNavigation import CBNavigationProvider
+from modules.CommandBlockScheduler import CBParseScheduler
+from modules.CommandBlockStats import CBStats
+from modules.CommandBlockSymbols import CBSymbolProvider
+from modules.CommandBlockTokenStore import CBTokenBuffer, CBTokenEncoder, CBTokenStore, changed_line_range, diff_tokens
+from modules.CommandBlockWorkspace import CBWorkspaceIndexer
 
 class CommandBlockLanguageServer(LanguageServer):
     """
         CommandBlockScript Language Server
 
-        Currently able to highlight keywords and detect '#' tokens
+        Highlights documents with semantic tokens, reports syntax errors and unresolved
+        imports, and offers completion, hover, go to definition, find references,
+        rename, document outlines and workspace symbols over an index of the whole
+        workspace
     """
 
     def __init__(self, lexer, parser, *args, **kwargs):
@@ -17,47 +38,193 @@ class CommandBlockLanguageServer(LanguageServer):
         self.lexer = lexer
         self.parser = parser
 
-        self.tokens: Dict[str, List[int]] = {}
+        # Latencies of requests and of the phases of handling a document
+        self.stats = CBStats()
 
+        self.encoder = CBTokenEncoder(lexer)
+        self.scheduler = CBParseScheduler(self)
+        self.tokens: Dict[str, array] = {}
+        self.token_stores: Dict[str, CBTokenStore] = {}
 
-    def lex(self, document: TextDocument):
+        # Last semantic token data sent to the client per document, keyed by result id
+        self.sent_tokens: Dict[str, Tuple[str, array]] = {}
+        self.result_id = 0
+
+        # Definitions of every document parsed so far, kept after a document is closed
+        self.index = CBSymbolIndex()
+
+        # Names of every document parsed so far, by position and by name
+        self.ranges: Dict[str, CBRangeIndex] = {}
+        self.occurrences = CBOccurrenceIndex()
+
+        # Imports between documents, and the modification time of libraries read from disk
+        self.imports = CBImportGraph()
+        self.libraries: Dict[str, float] = {}
+
+        # Imported libraries reported missing, their dependents are re-checked once they show up
+        self.missing: Set[str] = set()
+
+        self.indexer = CBWorkspaceIndexer(self)
+
+        # Analyses and tokens from earlier runs, by content hash
+        self.cache = CBIndexCache(grammar_version(lexer, parser))
+
+        self.completion = CBCompletionProvider(self)
+        self.diagnostics = CBDiagnosticProvider(self)
+        self.hover = CBHoverProvider(self)
+        self.navigation = CBNavigationProvider(self)
+        self.symbols = CBSymbolProvider(self)
+
+    def feature(self, feature_name: str, options=None):
+        """
+            Register a handler for an LSP method, its calls are timed in the stats
+        """
+
+        register = super().feature(feature_name, options)
+
+        return lambda handler: register(self.stats.timed(feature_name, handler))
+
+    def lex(self, document: TextDocument, changes: Optional[Sequence] = None):
         """
             Extract tokens from a given document
+
+            When the content changes of an edit are given only the affected lines are re-lexed
+        """
+
+        store = self.token_stores.get(document.uri)
+        line_range = changed_line_range(changes) if changes else None
+
+        with self.stats.phase("lex"):
+            if store is None or line_range is None:
+                store = self.token_stores[document.uri] = CBTokenStore()
+                store.lex(self.encoder, document.source)
+            else:
+                store.update(self.encoder, document.source, *line_range)
+
+        self.tokens[document.uri] = store.encode()
+
+    def edit_references(self, uri: str, changes: Sequence):
         """
+            Keep the names of an edited document at their new positions until it is parsed again
+        """
+
+        if (ranges := self.ranges.get(uri)) is None:
+            return
 
-        data = []
+        for change in changes:
+            change_range = getattr(change, "range", None)
 
-        prev_line = 0
-        prev_column = 0
+            # The whole text was replaced, none of its names are left
+            if change_range is None:
+                self.ranges[uri] = CBRangeIndex([])
+                self.occurrences.remove(uri)
+                return
 
-        self.lexer.lexer.input(document.source)
+            start, end = change_range.start.line, change_range.end.line
+            ranges.edit(start, end, start + change.text.count('\n'))
 
-        while True:
-            token = self.lexer.lexer.token()
+    def open(self, document: TextDocument) -> bool:
+        """
+            Restore a document opened in the editor from the cache
+
+            Returns whether its analysis was found, otherwise it still has to be parsed
+        """
 
-            if not token:
-                 break
+        # Whatever the client was sent before, a document just opened gets its diagnostics pushed
+        self.diagnostics.forget(document.uri)
 
-            if (token_type := TOKEN_MAPPING.get(token.type, None)) is None:
-                if token.value not in self.lexer.reserved:
-                     continue
-                else:
-                    token_type = "keyword"
+        analysis, tokens = self.cache.get(content_hash(document.source, document.filename or ""), document.uri)
+
+        if tokens is None:
+            self.lex(document)
+        else:
+            store = self.token_stores[document.uri] = CBTokenStore()
+            store.data, store.counts, store.boundaries = tokens
+            store.lines = None
+            self.tokens[document.uri] = store.encode()
+
+        if analysis is None or not document.filename:
+            return False
+
+        self.publish_analysis(analysis, version=document.version)
+
+        return True
+
+    def remember(self, source: str, filename: str, analysis: CBAnalysis):
+        """
+            Cache the analysis and current tokens of a document, off the event loop
+        """
+
+        store = self.token_stores.get(analysis.uri)
+        tokens = None if store is None else (store.data, store.counts, store.boundaries)
+
+        self.scheduler.executor.submit(lambda: self.cache.put(content_hash(source, filename), analysis, tokens))
+
+    def close(self, uri: str):
+        """
+            Forget everything held for a document closed in the editor
+        """
+
+        self.scheduler.cancel(uri)
+        self.tokens.pop(uri, None)
+        self.token_stores.pop(uri, None)
+        self.sent_tokens.pop(uri, None)
+        self.symbols.outlines.pop(uri, None)
+        self.diagnostics.forget(uri)
+
+        # The index holds the editor's version of a library, reload what is on disk
+        if uri in self.imports.dependents:
+            self.libraries.pop(uri, None)
+            self.load_libraries([uri])
+
+    def semantic_tokens_full(self, uri: str) -> SemanticTokens:
+        """
+            Semantic tokens for a whole document, remembered for later delta requests
+        """
+
+        data = self.tokens.get(uri, array('I'))
+
+        self.result_id += 1
+        self.sent_tokens[uri] = (str(self.result_id), data)
+
+        with self.stats.phase("encode"):
+            return SemanticTokens(data=data.tolist(), result_id=str(self.result_id))
+
+    def semantic_tokens_delta(self, uri: str, previous_result_id: str) -> Union[SemanticTokens, SemanticTokensDelta]:
+        """
+            Semantic token edits since the data sent under previous_result_id
+
+            Falls back to the full data if the client's result is no longer known
+        """
 
-            line = token.lineno - 1
-            column = self.lexer.find_column(document.source, token) - 1
+        sent = self.sent_tokens.get(uri)
 
-            # LSP uses relative positioning
-            delta_line = line - prev_line
-            delta_column = column - prev_column if delta_line == 0 else column
+        if sent is None or sent[0] != previous_result_id:
+            return self.semantic_tokens_full(uri)
 
-            data.extend([delta_line, delta_column, len(token.value), TOKEN_TYPES.index(token_type), 0])
+        data = self.tokens.get(uri, array('I'))
 
-            prev_line = line
-            prev_column = column
+        with self.stats.phase("encode"):
+            start, delete_count, inserted = diff_tokens(sent[1], data)
+            edits = [] if not delete_count and not inserted else [SemanticTokensEdit(start=start, delete_count=delete_count, data=list(inserted))]
 
-        self.tokens[document.uri] = data
-        self.lexer.reset()
+        self.result_id += 1
+        self.sent_tokens[uri] = (str(self.result_id), data)
+
+        return SemanticTokensDelta(edits=edits, result_id=str(self.result_id))
+
+    def semantic_tokens_range(self, uri: str, range: Range) -> SemanticTokens:
+        """
+            Semantic tokens for the lines covered by range, such as the visible viewport
+        """
+
+        store = self.token_stores.get(uri)
+
+        if store is None:
+            return SemanticTokens(data=[])
+
+        with self.stats.phase("encode"):
+            return SemanticTokens(data=store.encode(range.start.line, range.end.line + 1).tolist())
 
     def parse(self, document: TextDocument):
         """
@@ -65,43 +232,117 @@ class CommandBlockLanguageServer(LanguageServer):
         """
 
         if not document.source.strip():
-            self.publish_diagnostics(document.uri, [])
-            self.parser.reset()
+            self.publish_analysis(CBAnalysis(document.uri, [], []))
             return
 
         if not document.filename:
             self.show_message("Error with filename")
             return
 
-        file_ext = document.filename.split('.')[1]
+        self.publish_analysis(self.analyse(document.uri, document.source, document.filename))
+
+    def publish_analysis(self, analysis: CBAnalysis, version: Optional[int] = None):
+        """
+            Index the symbols of a parsed document and publish its diagnostics
+        """
+
+        with self.stats.phase("publish"):
+            self.apply_analysis(analysis)
+            self.diagnostics.publish(analysis.uri, analysis.diagnostics + self.import_diagnostics(analysis), version=version)
+
+    def apply_analysis(self, analysis: CBAnalysis):
+        """
+            Index the symbols and imports of a parsed document, loading the libraries it imports
+
+            The diagnostics of documents not open in the editor are kept for workspace diagnostic pulls
+        """
+
+        self.index.update(analysis.uri, analysis.symbols)
+        self.ranges[analysis.uri] = CBRangeIndex(analysis.references)
+        self.occurrences.update(analysis.uri, analysis.references)
+        self.load_libraries(self.imports.update(analysis.uri, [i.name for i in analysis.imports]))
+
+        # Documents importing a library that did not exist until now lose their warning
+        if analysis.uri in self.missing:
+            self.missing.discard(analysis.uri)
+
+            for dependent in self.imports.dependents.get(analysis.uri, ()):
+                if dependent in self.workspace.text_documents:
+                    self.scheduler.schedule(dependent)
+
+        if analysis.uri not in self.workspace.text_documents:
+            self.diagnostics.update(analysis.uri, analysis.diagnostics + self.import_diagnostics(analysis))
+
+    def load_libraries(self, uris: Sequence[str]):
+        """
+            Index imported libraries not open in the editor, unless unchanged on disk since last time
+        """
+
+        for uri in uris:
+            if uri in self.workspace.text_documents:
+                continue
+
+            try:
+                mtime = os.stat(to_fs_path(uri)).st_mtime
+            except (OSError, TypeError):
+                continue
 
-        parsed = self.parser.parse(document.source)
+            if self.libraries.get(uri) == mtime:
+                continue
+
+            self.libraries[uri] = mtime
+            self.scheduler.load(uri)
+
+    def import_diagnostics(self, analysis: CBAnalysis) -> list[Diagnostic]:
+        """
+            Warnings for imports of libraries that do not exist
+        """
 
         diagnostics: list[Diagnostic] = []
 
-        if parsed:
-            ext, _ = parsed
-            if file_ext == "cbscript" and ext == "cblib":
-                diagnostics.append(Diagnostic(
-                        range=Range(start=Position(0, 0), end=Position(0, 0)), 
-                        message="Compiler error in file. Script files should contain directory for output ('DIR' keyword)", 
-                        code="CBLS_ERROR_START",
-                        severity=DiagnosticSeverity.Error, 
-                        source="cbls"))
-            elif file_ext == "cblib" and ext == "cbscript":
-                diagnostics.append(Diagnostic(
-                        range=Range(start=Position(0, 0), end=Position(0, 0)), 
-                        message="Compiler error in file. Libraries should not contain directory for output ('DIR' keyword)", 
-                        code="CBLS_ERROR_START",
-                        severity=DiagnosticSeverity.Error, 
-                        source="cbls"))
-
-        for d in self.parser.diagnostics:
-            diagnostics.append(Diagnostic(
-                    range=Range(start=Position(d.lineno, d.col), end=Position(d.lineno, d.col + len(d.token.value))), 
-                    message=d.message, 
-                    severity=DiagnosticSeverity.Error, 
-                    source="cbls"))
-
-        self.publish_diagnostics(document.uri, diagnostics)
-        self.parser.reset()
+        for symbol in analysis.imports:
+            target = resolve_import(analysis.uri, symbol.name)
+
+            if target is None or target in self.workspace.text_documents or os.path.exists(to_fs_path(target)):
+                continue
+
+            self.missing.add(target)
+            diagnostics.append(unresolved_import(symbol))
+
+        return diagnostics
+
+    def analyse(self, uri: str, source: str, filename: str, tokens: Optional[CBTokenBuffer] = None) -> CBAnalysis:
+        """
+            Parse source and collect its diagnostics and symbols
+
+            Parses in its own session, so several documents can be analysed at once off the event loop
+        """
+
+        with self.stats.phase("parse"):
+            return analyse(self.parser, uri, source, filename, tokens)
+
+    def lexed(self, uri: str, source: str) -> Optional[CBTokenBuffer]:
+        """
+            The tokens already lexed for an open document's semantic tokens, for its parse to reuse
+        """
+
+        store = self.token_stores.get(uri)
+
+        return None if store is None else store.buffer(source)
+
+    def analyse_file(self, uri: str) -> CBAnalysis:
+        """
+            Analyse a document straight from disk, or take its analysis from the cache
+        """
+
+        if (read := read_source(uri)) is None:
+            return CBAnalysis(uri, [], [])
+
+        key = content_hash(*read)
+        analysis, _ = self.cache.get(key, uri)
+
+        if analysis is None:
+            analysis = self.analyse(uri, *read)
+            self.cache.put(key, analysis)
+
+        return analysis
@@ -1,4 +1,7 @@
-from ply.lex import lex
+import logging
+from modules.CommandBlockTables import build_lexer
+
+logger = logging.getLogger(__name__)
 
 class CBLex(object):
     # Build the lexer - Build once!
@@ -52,8 +55,8 @@ class CBLex(object):
             # Comparison tokens
             "EQUALS_EQUALS", "GREATER", "GREATER_EQUALS", "LESS", "LESS_EQUALS"]
 
-        # Add CAPS Keywords to our token list
-        self.tokens = self.tokens + [r.upper() for r in self.reserved]
+        # Add CAPS Keywords to our token list, sorted so the grammar signature is stable
+        self.tokens = self.tokens + sorted(r.upper() for r in self.reserved)
 
         ### Ignored Tokens
         self.t_ignore = '\r'
@@ -104,8 +107,8 @@ class CBLex(object):
         self.t_DECIMAL = r"\d+"
         self.t_FLOAT = r"\d+\.\d+"
 
-        # Uses reflections to interpret this file
-        self.lexer = lex(module=self, **kwargs)
+        # Uses reflections to interpret this file, or the pre-built table when it matches
+        self.lexer = build_lexer(self, **kwargs)
 
     ### Complex tokens with action code
     ## Standard tokens
@@ -129,7 +132,12 @@ class CBLex(object):
     
     def t_COMMAND(self, t):
         r"(?m:^\s*\/.+)"
-        t.lexer.lineno += t.value.count('\n')
+        # The match starts with any blank lines and indentation before the '/',
+        # point the token at the command itself
+        indent = len(t.value) - len(t.value.lstrip())
+        t.lineno += t.value.count('\n', 0, indent)
+        t.lexpos += indent
+        t.lexer.lineno = t.lineno
         t.value = t.value.strip()
         return t
 
@@ -181,7 +189,7 @@ class CBLex(object):
     
     # Unknown tokens
     def t_error(self, t):
-        print(f"Illegal character '{t.value[0]}' was skipped at {t.lexer.lineno}")
+        logger.debug("Illegal character %r was skipped at line %d", t.value[0], t.lexer.lineno)
         t.lexer.skip(1)
     
     ### Lexer functions
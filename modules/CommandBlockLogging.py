@@ -0,0 +1,57 @@
+import logging
+import os
+from lsprotocol.types import MessageType
+
+# Level of the server's own log records sent to the editor
+LOG_LEVEL = os.environ.get("CBLS_LOG_LEVEL", "INFO").upper()
+
+class CBLogHandler(logging.Handler):
+    """
+        Sends log records to the editor's output as window/logMessage notifications
+
+        stdout carries the JSON-RPC stream, so nothing may be printed there. Records
+        may come from parse threads, they are sent from the event loop, which owns
+        the connection to the client
+    """
+
+    def __init__(self, server, level: int = logging.NOTSET):
+        super().__init__(level)
+        self.server = server
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            message = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        if record.levelno >= logging.ERROR:
+            message_type = MessageType.Error
+        elif record.levelno >= logging.WARNING:
+            message_type = MessageType.Warning
+        elif record.levelno >= logging.INFO:
+            message_type = MessageType.Info
+        else:
+            message_type = MessageType.Log
+
+        try:
+            self.server.loop.call_soon_threadsafe(self.server.show_message_log, message, message_type)
+        except RuntimeError:
+            # The event loop is closed, the client is gone
+            pass
+
+def install(server, level: str = LOG_LEVEL):
+    """
+        Route the log records of the server's modules to the editor, at INFO if level is not a known level name
+    """
+
+    logger = logging.getLogger("modules")
+    logger.addHandler(CBLogHandler(server))
+    logger.propagate = False
+
+    # getLevelName maps known names to their number and anything else to a string
+    if isinstance(logging.getLevelName(level.upper()), int):
+        logger.setLevel(level.upper())
+    else:
+        logger.setLevel(logging.INFO)
+        logger.warning("Ignoring CBLS_LOG_LEVEL=%r, not a logging level, using INFO", level)
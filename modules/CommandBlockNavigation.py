@@ -0,0 +1,182 @@
+import re
+from typing import Dict, Iterator, Optional, Tuple
+from lsprotocol.types import Location, MessageType, Position, Range, TextEdit, WorkspaceEdit
+from modules.CommandBlockIndex import CBReference, CBSymbol
+
+# Kinds of names defined in the sources, and so safe to rename
+RENAMEABLE = {"function", "method", "macro", "clock", "selector", "constant", "parameter"}
+
+NAME = re.compile(r"[a-zA-Z_][a-zA-Z0-9_]*")
+SELECTOR_NAME = re.compile(r"@[a-zA-Z_][a-zA-Z0-9_]*")
+
+def name_range(reference: CBReference) -> Range:
+    return Range(start=Position(line=reference.line, character=reference.start), end=Position(line=reference.line, character=reference.end))
+
+def location(uri: str, reference: CBReference) -> Location:
+    return Location(uri=uri, range=name_range(reference))
+
+class CBNavigationProvider(object):
+    """
+        Go to definition, find references and rename
+
+        The name under the cursor comes from the document's range index, its definition
+        from the symbol index and its uses from the occurrence index, each of them a
+        lookup rather than a scan of the workspace. A definition is searched for in the
+        document and its imports, its uses in the document defining it and every
+        document importing that one. Renames are built from the same occurrences, no
+        document is parsed for them
+    """
+
+    def __init__(self, server):
+        self.server = server
+
+    def at(self, uri: str, position: Position) -> Optional[CBReference]:
+        """
+            The name at a position of a document
+        """
+
+        ranges = self.server.ranges.get(uri)
+        return None if ranges is None else ranges.at(position.line, position.character)
+
+    def symbol(self, uri: str, name: Optional[str], kind: str, container: Optional[str] = None) -> Optional[CBSymbol]:
+        """
+            The definition of a name visible from uri, preferring one in uri itself
+        """
+
+        visible = self.server.imports.visible(uri)
+        best = None
+
+        for symbol in self.server.index.lookup(name, kind):
+            if symbol.uri not in visible or (kind == "method" and symbol.container != container):
+                continue
+
+            if symbol.uri == uri:
+                return symbol
+
+            best = best or symbol
+
+        return best
+
+    def definition(self, uri: str, position: Position) -> Optional[Location]:
+        """
+            Where the name at a position is defined
+        """
+
+        if (reference := self.at(uri, position)) is None:
+            return None
+
+        # Macro parameters are defined by the first mention, in the macro's header
+        if reference.kind == "parameter":
+            return next((location(uri, r) for _, r in self.occurrences(uri, reference)), None)
+
+        if (symbol := self.symbol(uri, reference.name, reference.kind, reference.container)) is None:
+            return None
+
+        line, start, _, end = symbol.selection
+        return Location(uri=symbol.uri, range=Range(start=Position(line=line, character=start), end=Position(line=line, character=end)))
+
+    def references(self, uri: str, position: Position, include_declaration: bool = True) -> list[Location]:
+        """
+            Every use of the name at a position, across the workspace
+        """
+
+        if (reference := self.at(uri, position)) is None:
+            return []
+
+        occurrences = list(self.occurrences(uri, reference))
+
+        if not include_declaration:
+            declarations = self.declarations(reference, occurrences)
+            occurrences = [(u, r) for u, r in occurrences if (u, r.line, r.start) not in declarations]
+
+        return [location(u, r) for u, r in occurrences]
+
+    def occurrences(self, uri: str, reference: CBReference) -> Iterator[Tuple[str, CBReference]]:
+        """
+            Every occurrence of what a reference in uri refers to, as (document, occurrence) pairs
+        """
+
+        documents = self.server.occurrences.occurrences(reference.name, reference.kind)
+
+        # Variables are scoreboard objectives, shared by the whole project
+        if reference.kind == "variable":
+            scope = None
+        elif reference.kind == "parameter":
+            scope = {uri}
+        elif (symbol := self.symbol(uri, reference.name, reference.kind, reference.container)) is not None:
+            scope = {symbol.uri} | self.server.imports.dependents_of(symbol.uri)
+        else:
+            scope = {uri}
+
+        for document, references in documents.items():
+            if scope is not None and document not in scope:
+                continue
+
+            # The index holds names where they were parsed, edits since then are applied here
+            ranges = self.server.ranges.get(document)
+            edited = ranges is not None and ranges.edits
+
+            for occurrence in references:
+                if reference.kind in ("method", "parameter") and occurrence.container != reference.container:
+                    continue
+
+                if edited and (occurrence := ranges.moved(occurrence)) is None:
+                    continue
+
+                yield document, occurrence
+
+    def declarations(self, reference: CBReference, occurrences: list[Tuple[str, CBReference]]) -> set:
+        """
+            (document, line, column) of the occurrences defining a name
+        """
+
+        if reference.kind == "parameter":
+            return {(u, r.line, r.start) for u, r in occurrences[:1]}
+
+        return {(s.uri, s.selection[0], s.selection[1]) for s in self.server.index.lookup(reference.name, reference.kind)}
+
+    def renameable(self, uri: str, position: Position) -> Optional[CBReference]:
+        """
+            The name at a position if it can be renamed, that is if it is defined in the workspace
+        """
+
+        if (reference := self.at(uri, position)) is None or reference.kind not in RENAMEABLE:
+            return None
+
+        if reference.kind != "parameter" and self.symbol(uri, reference.name, reference.kind, reference.container) is None:
+            return None
+
+        return reference
+
+    def prepare_rename(self, uri: str, position: Position) -> Optional[Range]:
+        """
+            The range of the name to rename at a position, None if it cannot be renamed
+        """
+
+        reference = self.renameable(uri, position)
+        return None if reference is None else name_range(reference)
+
+    def rename(self, uri: str, position: Position, new_name: str) -> Optional[WorkspaceEdit]:
+        """
+            Edits renaming the name at a position everywhere it occurs
+        """
+
+        if (reference := self.renameable(uri, position)) is None:
+            return None
+
+        # Constants and macros may be given with their '$'
+        if reference.kind in ("constant", "macro", "parameter"):
+            new_name = new_name.removeprefix("$")
+
+        pattern = SELECTOR_NAME if reference.kind == "selector" else NAME
+
+        if not pattern.fullmatch(new_name) or new_name in self.server.lexer.reserved:
+            self.server.show_message(f"'{new_name}' is not a valid {reference.kind} name", MessageType.Error)
+            return None
+
+        changes: Dict[str, list[TextEdit]] = {}
+
+        for document, occurrence in self.occurrences(uri, reference):
+            changes.setdefault(document, []).append(TextEdit(range=name_range(occurrence), new_text=new_name))
+
+        return WorkspaceEdit(changes=changes)
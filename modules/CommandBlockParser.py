@@ -1,4 +1,26 @@
-import ply.yacc as yacc
+import copy
+import logging
+from typing import Optional
+from ply.lex import LexToken
+from modules import CommandBlockAST as ast
+from modules.CommandBlockTables import build_parser
+
+logger = logging.getLogger(__name__)
+
+# Most syntax errors recorded for one parse
+MAX_DIAGNOSTICS = 100
+
+# Statements opening a block closed by 'end', unless the line goes on with 'do' or 'then'
+BLOCK_OPENERS = {
+    "ALIGN", "AS", "AT", "CLOCK", "FACING", "FOR", "FUNCTION", "IF", "IN",
+    "MACRO", "ON", "RESET", "ROTATED", "UNLESS", "WHILE"
+}
+
+# Openers with an error production recovering on their 'end'
+SECTION_OPENERS = {"CLOCK", "FUNCTION", "RESET"}
+
+# Brackets closed for a line that ends inside them, with the closing token
+CLOSERS = {"LPAREN": ("RPAREN", ")"), "LBRACKET": ("RBRACKET", "]")}
 
 class CBDiagnostic(object):
     def __init__(self, token, col, state, expected, message=None):
@@ -12,16 +34,37 @@ class CBDiagnostic(object):
     def __str__(self):
         return self.message + "\n" + self.label
 
+class CBParseResult(object):
+    """
+        Outcome of parsing one document in its own session
+    """
+
+    def __init__(self, data, value, diagnostics):
+        self.data = data
+        self.value = value
+        self.ext = value[0] if value else None
+        self.tree: ast.File = value[1] if value else None
+        self.diagnostics: list[CBDiagnostic] = diagnostics
+
 class CBParse(object):
     def __init__(self, lexer):
         self.lexer = lexer
         self.tokens = lexer.tokens
-        self.parser = yacc.yacc(module=self)
+        self.parser = build_parser(self)
         self.file_params = ["scale"]
 
         self.data = None
         self.diagnostics: list[CBDiagnostic] = []
 
+        # Tokens handed back to the parser by error recovery, last one first
+        self.pending = []
+
+        # Diagnostic of the last syntax error, for the error production recovering from it to word
+        self.last_error: Optional[CBDiagnostic] = None
+
+        # Next token during a parse, tokens handed back by error recovery first, then the lexer or a token buffer
+        self.token = None
+
         self.executee = {
             "attacker",
             "controller",
@@ -41,59 +84,52 @@ class CBParse(object):
     def p_parsed(self, p):
         """parsed : cbscript
                     | cblib"""
-        p[0] = p[1]
+        p[0] = (p[1].kind, p[1])
 
     def p_parsed_bad_cblib(self, p):
         """parsed : optnewlines cblib"""
-        p[0] = ("cblib", p[2])
+        p[0] = (p[2].kind, p[2])
 
         p.slice[1].value = '\n'
 
         expected = [token for token in self.parser.action[0].keys() if not token == "error"]
 
-        self.diagnostics.append(CBDiagnostic(p.slice[1], self.lexer.find_column(self.data, p.slice[1]), self.parser.state, expected))
-        self.diagnostics[-1].message = f"Syntax error at line {p.slice[1].lineno - 1}. Unexpected start of file token, expected {expected}"
+        self.report(p.slice[1], expected, f"Syntax error at line {p.slice[1].lineno - 1}. Unexpected start of file token, expected {expected}")
 
     # .cbscript files
     def p_cbscript(self, p):
         """cbscript : script"""
-        p[0] = ("cbscript", p[1])
+        p[0] = p[1]
 
     def p_cbscript_bad_start(self, p):
         """cbscript : optnewlines script"""
-        p[0] = ("cbscript", p[2])
+        p[0] = p[2]
 
         p.slice[1].value = '\n'
-        self.diagnostics.append(CBDiagnostic(p.slice[1], self.lexer.find_column(self.data, p.slice[1]), self.parser.state, ["DIR"]))
-        self.diagnostics[-1].message = f"Syntax error at line {p.slice[1].lineno - 1}. Unexpected start of file token, please ensure 'DIR' is at the top"
+        self.report(p.slice[1], ["DIR"], f"Syntax error at line {p.slice[1].lineno - 1}. Unexpected start of file token, please ensure 'DIR' is at the top")
 
     def p_cbscript_error(self, p):
         """cbscript : optnewlines error script"""
-        p[0] = ("cbscript", p[3])
+        p[0] = p[3]
 
-        self.diagnostics[-1].message = f"Syntax error at line {p.slice[2].lineno - 1}. Unexpected {p.slice[2].value.type} type of {repr(p.slice[2].value.value)} start of file token, please ensure 'DIR' is at the top"
+        if self.last_error is not None:
+            self.last_error.message = f"Syntax error at line {p.slice[2].lineno - 1}. Unexpected {p.slice[2].value.type} type of {repr(p.slice[2].value.value)} start of file token, please ensure 'DIR' is at the top"
         self.parser.errok()
 
     def p_cblib(self, p):
         """cblib : top_level_blocks"""
-        p[0] = ("cblib", p[1])
+        p[0] = ast.File(*self.span(p), "cblib", None, None, [], p[1][::-1])
 
     ## Program type rules
     # Script rules
     def p_script(self, p):
         """script : dir optdesc file_params top_level_blocks"""
-        p[0] = {
-            "DIR": p[1],
-            "DESC": p[2]
-        }
+        p[0] = ast.File(*self.span(p), "cbscript", p[1], p[2], p[3][::-1], p[4][::-1])
 
     # Stand alone dir
     def p_script_only_dir(self, p):
         """script : DIR string"""
-        p[0] = {
-            "DIR": p[2],
-            "DESC": "No output directory"
-        }
+        p[0] = ast.File(*self.span(p), "cbscript", p[2], None, [], [])
 
     # Dir rules
     def p_dir(self, p):
@@ -102,8 +138,9 @@ class CBParse(object):
 
     def p_dir_error(self, p):
         """dir : DIR error newlines"""
-        p[0] = "No output directroy"
-        self.diagnostics[-1].label = "Expected a string for dir"
+        p[0] = None
+        if self.last_error is not None:
+            self.last_error.label = "Expected a string for dir"
         self.parser.errok()
 
     # Desc rules
@@ -111,14 +148,15 @@ class CBParse(object):
         """optdesc : DESC string newlines
                     | empty"""
         if len(p) < 4:
-            p[0] = "No Description"
+            p[0] = None
         else:
             p[0] = p[2]
 
     def p_optdesc_error(self, p):
         """optdesc : DESC error newlines"""
-        p[0] = "No Description"
-        self.diagnostics[-1].label = "Expected a string for desc"
+        p[0] = None
+        if self.last_error is not None:
+            self.last_error.label = "Expected a string for desc"
         self.parser.errok()
 
     # File param rules
@@ -126,23 +164,22 @@ class CBParse(object):
         """file_params : file_param file_params optnewlines
                         | empty"""
         if len(p) > 2:
-            n, v = p[1]
-            p[2][n] = v
             p[0] = p[2]
+            p[0].append(p[1])
         else:
-            p[0] = {}
+            p[0] = []
 
     def p_file_param(self, p):
         """file_param : ID int newlines"""
         if p[1] not in self.file_params:
-            print(f"File param error: Unknown parameter '{p[1]}' at line {p.lineno(1)}")
-        p[0] = (p[1], int(p[2]))
+            logger.debug("File param error: Unknown parameter '%s' at line %d", p[1], p.lineno(1))
+        p[0] = ast.FileParam(*self.span(p), self.identifier(p, 1), p[2])
 
     def p_file_param_error(self, p):
         """file_param : ID error newlines"""
         if p[1] not in self.file_params:
-            print(f"File param error: Unknown parameter '{p[1]}' at line {p.lineno(1)}")
-        p[0] = (p[1], int(1000))
+            logger.debug("File param error: Unknown parameter '%s' at line %d", p[1], p.lineno(1))
+        p[0] = ast.FileParam(*self.span(p, 1, 1), self.identifier(p, 1), None)
         self.parser.errok()
 
     ## Top level rules
@@ -158,18 +195,40 @@ class CBParse(object):
                             | selector_define_block
                             | sections
                             | predicate"""
+        p[0] = p[1]
+
+    def p_top_level_block_error(self, p):
+        """top_level_block : error newlines"""
+        self.parser.errok()
 
     def p_top_level_blocks(self, p):
         """top_level_blocks : top_level_block top_level_blocks optnewlines
                             | empty"""
+        if len(p) > 2:
+            p[0] = p[2]
+
+            # 'sections' hands over a (reversed) list of its own
+            if isinstance(p[1], list):
+                p[0].extend(p[1])
+            elif p[1] is not None:
+                p[0].append(p[1])
+        else:
+            p[0] = []
 
     def p_import(self, p):
         """import : IMPORT ID optnewlines"""
+        p[0] = ast.Import(*self.span(p), self.identifier(p, 2))
 
     ## Section rules
     def p_sections(self, p):
         """sections : section sections optnewlines
                     | empty"""
+        if len(p) > 2:
+            p[0] = p[2]
+            if p[1] is not None:
+                p[0].append(p[1])
+        else:
+            p[0] = []
 
     # Section rule
     def p_section(self, p):
@@ -182,74 +241,117 @@ class CBParse(object):
     # Reset rule - Entry point
     def p_reset_section(self, p):
         """reset_section : RESET newlines code_blocks END newlines"""
-        pass
+        p[0] = ast.Reset(*self.span(p), p[3][::-1])
 
     def p_reset_section_error(self, p):
         """reset_section : RESET error END newlines"""
         self.parser.errok()
-        pass
+        p[0] = ast.Reset(*self.span(p), [])
 
     # Clock rule - Update point
     def p_clock_section(self, p):
         """clock_section : CLOCK ID newlines code_blocks END newlines"""
+        p[0] = ast.Clock(*self.span(p), self.identifier(p, 2), p[4][::-1])
 
     def p_clock_section_error(self, p):
         """clock_section : CLOCK error END newlines"""
         self.parser.errok()
+        p[0] = ast.Clock(*self.span(p), None, [])
 
     # Function rule
     def p_function_section(self, p):
         """function_section : FUNCTION FUNCTION_ID id_list RPAREN newlines code_blocks END"""
+        p[0] = ast.Function(*self.span(p), self.identifier(p, 2), p[3], p[6][::-1])
 
     def p_function_section_error(self, p):
         """function_section : FUNCTION error END"""
         self.parser.errok()
+        p[0] = ast.Function(*self.span(p), None, [], [])
 
     def p_id_list(self, p):
         """id_list : ID COMMA id_list
                     | ID
                     | empty"""
+        if len(p) > 2:
+            p[0] = [self.identifier(p, 1)] + p[3]
+        elif p.slice[1].type == "ID":
+            p[0] = [self.identifier(p, 1)]
+        else:
+            p[0] = []
 
     def p_function_call(self, p):
         """function_call : ID COLON FUNCTION_ID expr_list RPAREN opt_with_macro
                             | FUNCTION_ID expr_list RPAREN opt_with_macro"""
+        if len(p) > 6:
+            p[0] = ast.Call(*self.span(p), "function", self.identifier(p, 1), self.identifier(p, 3), p[4])
+        else:
+            p[0] = ast.Call(*self.span(p), "function", None, self.identifier(p, 1), p[2])
 
     def p_function_call_block(self, p):
         """function_call_block : with function_call
                                 | function_call"""
+        if len(p) > 2:
+            p[0] = ast.With(*self.span(p), p[1], [p[2]])
+        else:
+            p[0] = p[1]
 
     def p_method_call(self, p):
         """method_call : full_selector DOT FUNCTION_ID expr_list RPAREN opt_with_macro"""
+        p[0] = ast.Call(*self.span(p), "method", p[1], self.identifier(p, 3), p[4])
 
     def p_method_call_block(self, p):
         """method_call_block : with method_call
                                 | method_call"""
+        if len(p) > 2:
+            p[0] = ast.With(*self.span(p), p[1], [p[2]])
+        else:
+            p[0] = p[1]
 
     ## Code block rules
     def p_code_blocks(self, p):
         """code_blocks : code_block code_blocks optnewlines
                         | empty"""
+        if len(p) > 2:
+            p[0] = p[2]
+            if p[1] is not None:
+                p[0].append(p[1])
+        else:
+            p[0] = []
+
+    # Statement level recovery, a bad line is skipped up to its end and parsing carries on
+    def p_code_block_error(self, p):
+        """code_block : error newlines"""
+        self.parser.errok()
 
     # Command code block rule
     def p_command_code_block(self, p):
         """code_block : COMMAND optnewlines"""
         # TODO: Validate command
+        p[0] = ast.Command(*self.span(p), p[1])
 
     def p_move_code_block(self, p):
         """code_block : MOVE full_selector rel_coords optnewlines"""
+        p[0] = ast.Statement(*self.span(p), "move", [p[2], p[3]])
 
     def p_assignment_code_block(self, p):
         """code_block : assign optnewlines"""
+        p[0] = p[1]
 
     def p_constant_assignment_code_block(self, p):
         """code_block : const_assign optnewlines"""
+        p[0] = p[1]
 
     def p_create_code_block(self, p):
         """code_block : variable EQUALS create_block optnewlines
                         | create_block optnewlines"""
+        if len(p) > 3:
+            p[0] = ast.Assign(*self.span(p), p[1], p[2], p[3])
+        else:
+            p[0] = p[1]
 
     def p_define_name_code_block(self, p):
         """code_block : DEFINE NAME ID EQUALS string optnewlines"""
+        p[0] = ast.Statement(*self.span(p), "define name", [self.identifier(p, 3), p[5]])
 
     def p_define_name_code_block_error(self, p):
         """code_block : DEFINE error optnewlines"""
@@ -258,18 +360,24 @@ class CBParse(object):
     def p_selector_block_code_block(self, p):
         """code_block : selector_assign optnewlines
                         | selector_define_block optnewlines"""
+        p[0] = p[1]
 
     def p_function_call_code_block(self, p):
         """code_block : function_call_block optnewlines
                         | method_call_block optnewlines
                         | macro_call optnewlines
                         | with_anon optnewlines"""
+        p[0] = p[1]
 
     ## Execute rules
     # Execute items
     def p_execute_items(self, p):
         """execute_items : execute_item execute_items
                             | empty"""
+        if len(p) > 2:
+            p[0] = [p[1]] + p[2]
+        else:
+            p[0] = []
 
     # Execute item
     def p_execute_item(self, p):
@@ -284,40 +392,52 @@ class CBParse(object):
                         | IN OVERWORLD
                         | IN THE_NETHER
                         | IN THE_END"""
+        if p.slice[2].type in ("OVERWORLD", "THE_NETHER", "THE_END"):
+            p[0] = ast.ExecuteItem(*self.span(p), p[1], [self.identifier(p, 2)])
+        else:
+            p[0] = ast.ExecuteItem(*self.span(p), p[1], self.nodes(p, 2))
 
     def p_execute_on(self, p):
         """execute_item : ON ID"""
+        p[0] = ast.ExecuteItem(*self.span(p), p[1], [self.identifier(p, 2)])
 
         if p[2] not in self.executee:
-            self.diagnostics.append(CBDiagnostic(p.slice[2], self.lexer.find_column(self.data, p.slice[2]), self.parser.state, self.executee))
+            self.report(p.slice[2], self.executee)
 
     def p_execute_rotated(self, p):
         """execute_item : ROTATED full_selector"""
+        p[0] = ast.ExecuteItem(*self.span(p), p[1], [p[2]])
 
     def p_execute_facing_entity(self, p):
         """execute_item : FACING full_selector"""
+        p[0] = ast.ExecuteItem(*self.span(p), p[1], [p[2]])
 
     def p_execute_facing_relative_coordinates(self, p):
         """execute_item : FACING rel_coords"""
+        p[0] = ast.ExecuteItem(*self.span(p), p[1], [p[2]])
 
     def p_execute_align(self, p):
         """execute_item : ALIGN ID"""
+        p[0] = ast.ExecuteItem(*self.span(p), p[1], [self.identifier(p, 2)])
 
         if p[2] not in self.axis:
-            self.diagnostics.append(CBDiagnostic(p.slice[2], self.lexer.find_column(self.data, p.slice[2]), self.parser.state, self.executee))
+            self.report(p.slice[2], self.executee)
 
     # Anchor rule
     def p_anchor(self, p):
         """opt_anchor : EYES
                         | FEET
                         | empty"""
+        p[0] = self.identifier(p, 1) if p.slice[1].type != "empty" else None
 
     def p_optional_constant_value(self, p):
         """opt_const_value : const_value
                             | empty"""
+        p[0] = p[1]
 
     def p_local_coordinates(self, p):
         """local_coord : POWER opt_const_value"""
+        p[0] = ast.UnaryOp(*self.span(p), p[1], p[2])
 
     def p_relative_coordinate(self, p):
         """rel_coord : const_value
@@ -325,49 +445,87 @@ class CBParse(object):
                         | TILDE const_value
                         | TILDE
                         | TILDE_EMPTY"""
+        if len(p) > 2:
+            p[0] = ast.UnaryOp(*self.span(p), p[1], p[2])
+        elif p.slice[1].type in ("TILDE", "TILDE_EMPTY"):
+            p[0] = ast.UnaryOp(*self.span(p), p[1], None)
+        else:
+            p[0] = p[1]
 
     def p_relative_coordinates(self, p):
         """rel_coords : rel_coord rel_coord rel_coord
                         | local_coord local_coord local_coord"""
+        p[0] = ast.Coordinates(*self.span(p), [p[1], p[2], p[3]])
 
     def p_optional_coordinates(self, p):
         """opt_coords : AT rel_coords
                         | empty"""
+        p[0] = p[2] if len(p) > 2 else None
 
     def p_execute_else_list(self, p):
         """else_list : else_item else_list
                         | empty"""
+        if len(p) > 2:
+            p[0] = [p[1]] + p[2]
+        else:
+            p[0] = []
 
     # Execute else rule
     def p_execute_else_item(self, p):
         """else_item : ELSE execute_items newlines code_blocks
                         | ELSE newlines code_blocks"""
+        if len(p) > 4:
+            p[0] = ast.Else(*self.span(p), p[2], p[4][::-1])
+        else:
+            p[0] = ast.Else(*self.span(p), [], p[3][::-1])
 
     def p_execute_chain(self, p):
         """code_block : execute_items newlines code_blocks else_list END optnewlines"""
+        p[0] = ast.Execute(*self.span(p), p[1], p[3][::-1], p[4])
 
     def p_execute_inline(self, p):
         """code_block : execute_items DO code_block
                         | execute_items THEN code_block"""
+        p[0] = ast.Execute(*self.span(p), p[1], [p[3]] if p[3] is not None else [], [])
 
     # Execute if rule
     def p_executre_if(self, p):
         """code_block : IF const_value newlines code_blocks else_list END optnewlines"""
+        p[0] = ast.Execute(*self.span(p), [ast.ExecuteItem(*self.span(p, 1, 2), p[1], [p[2]])], p[4][::-1], p[5])
 
     # Execute as rule
     def p_execute_as(self, p):
         """code_block : AS variable newlines code_blocks else_list END optnewlines
                         | AS variable LPAREN ATID RPAREN newlines code_blocks else_list END optnewlines"""
+        if len(p) > 8:
+            item = ast.ExecuteItem(*self.span(p, 1, 5), p[1], [p[2], self.identifier(p, 4)])
+            p[0] = ast.Execute(*self.span(p), [item], p[7][::-1], p[8])
+        else:
+            item = ast.ExecuteItem(*self.span(p, 1, 2), p[1], [p[2]])
+            p[0] = ast.Execute(*self.span(p), [item], p[4][::-1], p[5])
 
     # Execute as do rule
     def p_execute_as_do(self, p):
         """code_block : AS variable DO code_block else_list optnewlines
                         | AS variable LPAREN ATID RPAREN DO code_block optnewlines"""
+        if len(p) > 7:
+            item = ast.ExecuteItem(*self.span(p, 1, 5), p[1], [p[2], self.identifier(p, 4)])
+            p[0] = ast.Execute(*self.span(p), [item], [p[7]], [])
+        else:
+            item = ast.ExecuteItem(*self.span(p, 1, 2), p[1], [p[2]])
+            p[0] = ast.Execute(*self.span(p), [item], [p[4]], p[5])
 
     # Execute as inline create
     def p_execute_as_create(self, p):
         """code_block : AS create_block newlines code_blocks else_list END optnewlines
                         | AS create_block DO code_block optnewlines"""
+        item = ast.ExecuteItem(*self.span(p, 1, 2), p[1], [p[2]])
+
+        if len(p) > 6:
+            p[0] = ast.Execute(*self.span(p), [item], p[4][::-1], p[5])
+        else:
+            p[0] = ast.Execute(*self.span(p), [item], [p[4]], [])
+
     ## Conditional rules
     # Conditional rule
     def p_conditional(self, p):
@@ -383,20 +541,34 @@ class CBParse(object):
                         | expr
                         | nbt_object
                         | nbt_list"""
+        if len(p) > 3:
+            p[0] = ast.BinaryOp(*self.span(p), p[2], p[1], p[3])
+        elif p.slice[1].type == "PREDICATE":
+            p[0] = ast.Condition(*self.span(p), "predicate", [self.identifier(p, 2)])
+        elif len(p) > 2:
+            p[0] = ast.UnaryOp(*self.span(p), p[1], p[2])
+        else:
+            p[0] = p[1]
 
     def p_conditionals(self, p):
         """conditionals : conditional AND conditionals
                         | conditional"""
-    
+        if len(p) > 2:
+            p[0] = [p[1]] + p[3]
+        else:
+            p[0] = [p[1]]
+
     def p_conditional_block(self, p):
         """conditional : BLOCK rel_coords const_ID opt_block_state opt_tile_data
                         | BLOCK rel_coords ID opt_block_state opt_tile_data
                         | BLOCK const_ID opt_block_state opt_tile_data
                         | BLOCK ID opt_block_state opt_tile_data"""
+        p[0] = ast.Condition(*self.span(p), "block", self.nodes(p, 2))
 
     def p_optional_block_state(self, p):
         """opt_block_state : LBRACKET block_states RBRACKET
                             | empty"""
+        p[0] = ast.Json(*self.span(p)) if len(p) > 2 else None
 
     def p_block_states(self, p):
         """block_states : ID EQUALS ID COMMA block_states
@@ -411,9 +583,12 @@ class CBParse(object):
     def p_optional_tile_data(self, p):
         """opt_tile_data : json_object
                             | empty"""
+        p[0] = p[1]
 
     def p_if_else(self, p):
         """code_block : IF const_value newlines code_blocks ELSE newlines code_blocks END optnewlines"""
+        item = ast.ExecuteItem(*self.span(p, 1, 2), p[1], [p[2]])
+        p[0] = ast.Execute(*self.span(p), [item], p[4][::-1], [ast.Else(*self.span(p, 5, 7), [], p[7][::-1])])
 
     ## Loop rules
     # For loop rule
@@ -422,105 +597,167 @@ class CBParse(object):
                         | FOR variable EQUALS expr TO expr newlines code_blocks END optnewlines
                         | FOR const_ID IN const_value newlines code_blocks END optnewlines
                         | FOR ATID IN full_selector newlines code_blocks END optnewlines"""
+        if p.slice[2].type == "ATID":
+            p[0] = ast.For(*self.span(p), self.identifier(p, 2), [p[4]], p[6][::-1])
+        elif p.slice[3].type == "IN":
+            p[0] = ast.For(*self.span(p), p[2], [p[4]], p[6][::-1])
+        elif len(p) > 11:
+            p[0] = ast.For(*self.span(p), p[2], [p[4], p[6], p[8]], p[10][::-1])
+        else:
+            p[0] = ast.For(*self.span(p), p[2], [p[4], p[6]], p[8][::-1])
 
     # While loop rule
     def p_while(self, p):
         """code_block : WHILE conditionals newlines code_blocks END optnewlines
                         | WHILE conditionals execute_items newlines code_blocks END optnewlines"""
+        if len(p) > 7:
+            p[0] = ast.While(*self.span(p), p[2], p[3], p[5][::-1])
+        else:
+            p[0] = ast.While(*self.span(p), p[2], [], p[4][::-1])
 
     ## Create rules
     # Create ATID
     def p_ATID_create(self, p):
         """create_block : CREATE ATID rel_coords
                         | CREATE ATID"""
+        p[0] = ast.Statement(*self.span(p), p[1], self.nodes(p, 2))
 
     def p_ATID_index_create(self, p):
         """create_block : CREATE ATID LBRACKET const_value RBRACKET rel_coords
                         | CREATE ATID LBRACKET const_value RBRACKET"""
+        p[0] = ast.Statement(*self.span(p), p[1], self.nodes(p, 2))
 
     ## Macros 
     # Macro section
     def p_macro_section(self, p):
         """macro_section : MACRO DOLLAR FUNCTION_ID macro_args newlines code_blocks END optnewlines"""
+        p[0] = ast.Macro(*self.span(p), self.identifier(p, 3), p[4], p[6][::-1])
 
     def p_macro_args(self, p):
         """macro_args : macro_params RPAREN
                         | empty"""
+        p[0] = p[1] if len(p) > 2 else []
 
     def p_macro_params(self, p):
         """macro_params : const_ID COMMA macro_params
                         | const_ID
                         | empty"""
+        if len(p) > 2:
+            p[0] = [p[1]] + p[3]
+        elif p[1] is not None:
+            p[0] = [p[1]]
+        else:
+            p[0] = []
 
     # With rule
     def p_with(self, p):
         """with : WITH newlines with_items"""
+        p[0] = p[3]
 
     def p_with_items(self, p):
         """with_items : with_item with_items
                         | with_item"""
+        if len(p) > 2:
+            p[0] = [p[1]] + p[2]
+        else:
+            p[0] = [p[1]]
 
     def p_with_item(self, p):
         """with_item : DOLLAR LPAREN ID RPAREN EQUALS expr newlines
                         | DOLLAR LPAREN ID RPAREN EQUALS string newlines"""
+        p[0] = ast.WithItem(*self.span(p), self.identifier(p, 3), p[6])
 
     def p_with_macro(self, p):
         """opt_with_macro : WITH MACROS
                             | empty"""
+        p[0] = None
 
     def p_with_anon(self, p):
         """with_anon : with DO newlines code_blocks END optnewlines"""
+        p[0] = ast.With(*self.span(p), p[1], p[4][::-1])
 
     # Macro call rule
     def p_macro_call(self, p):
         """macro_call : DOLLAR FUNCTION_ID macro_call_args"""
+        p[0] = ast.Call(*self.span(p), "macro", None, self.identifier(p, 2), p[3])
 
     def p_macro_call_args(self, p):
         """macro_call_args : macro_call_params RPAREN
                             | empty"""
+        p[0] = p[1] if len(p) > 2 else []
 
     def p_macro_call_params(self, p):
         """macro_call_params : macro_call_params COMMA macro_call_params
                                 | macro_call_params
                                 | const_value
                                 | empty"""
+        if len(p) > 2:
+            p[0] = p[1] + p[3]
+        elif p.slice[1].type == "macro_call_params":
+            p[0] = p[1]
+        elif p.slice[1].type == "const_value":
+            p[0] = [p[1]]
+        else:
+            p[0] = []
 
     ## Full Selector
     # Full Selector
     def p_full_selector(self, p):
         """full_selector : ATID"""
+        p[0] = ast.Selector(*self.span(p), self.identifier(p, 1), [])
 
     def p_full_selector_qualifiers(self, p):
         """full_selector : ATID LBRACKET const_int RBRACKET
                         | ATID LBRACKET qualifiers RBRACKET"""
+        p[0] = ast.Selector(*self.span(p), self.identifier(p, 1), p[3] if isinstance(p[3], list) else [p[3]])
 
     def p_full_selector_error(self, p):
         """full_selector : ATID LBRACKET error RBRACKET"""
         self.parser.errok()
+        p[0] = ast.Selector(*self.span(p), self.identifier(p, 1), [])
 
     ## Qualifiers
     def p_qualifier_single(self, p):
         """qualifiers : qualifier
                         | empty"""
+        p[0] = [p[1]] if p[1] is not None else []
 
     def p_qualifier_list(self, p):
         """qualifiers : qualifiers COMMA qualifier
                         | qualifiers AND qualifier"""
+        p[0] = p[1]
+        p[0].append(p[3])
 
     def p_qualifier_empty(self, p):
         """qualifier : ID EQUALS"""
+        p[0] = ast.Qualifier(*self.span(p), self.identifier(p, 1), p[2], None)
 
     def p_qualifier_not(self, p):
         """qualifier : ID EQUALS NEGATION ID
                         | NOT ID"""
+        if len(p) > 3:
+            p[0] = ast.Qualifier(*self.span(p), self.identifier(p, 1), p[2] + p[3], self.identifier(p, 4))
+        else:
+            p[0] = ast.Qualifier(*self.span(p), self.identifier(p, 2), p[1], None)
 
     def p_qualifier_id(self, p):
         """qualifier : ID"""
+        p[0] = ast.Qualifier(*self.span(p), self.identifier(p, 1), None, None)
 
     def p_qualifier_builtin(self, p):
         """qualifier : ID EQUALS const_int DOT DOT const_int
                     | ID EQUALS DOT DOT const_int
                     | ID EQUALS const_int DOT DOT"""
+        values = self.nodes(p, 3)
+
+        if len(p) > 6:
+            low, high = values
+        elif p.slice[3].type == "DOT":
+            low, high = None, values[0]
+        else:
+            low, high = values[0], None
+
+        p[0] = ast.Qualifier(*self.span(p), self.identifier(p, 1), p[2], ast.BinaryOp(*self.span(p, 3), "..", low, high))
 
     def p_qualifier_binop(self, p):
         """qualifier : ID EQUALS const_int
@@ -532,98 +769,132 @@ class CBParse(object):
                      | ID GREATER const_int
                      | ID LESS const_int
                      | ID EQUALS json_object"""
+        value = self.identifier(p, 3) if p.slice[3].type == "ID" else p[3]
+        p[0] = ast.Qualifier(*self.span(p), self.identifier(p, 1), p[2], value)
 
     ## Selector rules
     def p_selector_define(self, p):
         """selector_define_block : DEFINE ATID EQUALS full_selector newlines selector_definition END optnewlines
                                 | DEFINE ATID COLON full_selector newlines selector_definition END optnewlines
                                 | DEFINE ATID COLON uuid LPAREN full_selector RPAREN newlines selector_definition END optnewlines"""
+        if len(p) > 9:
+            p[0] = ast.SelectorDefine(*self.span(p), self.identifier(p, 2), p[6], p[9][::-1])
+        else:
+            p[0] = ast.SelectorDefine(*self.span(p), self.identifier(p, 2), p[4], p[6][::-1])
 
     def p_selector_define_error(self, p):
         """selector_definition : DEFINE error END optnewlines"""
         self.parser.errok()
+        p[0] = []
 
     def p_selector_definition(self, p):
         """selector_definition : selector_item newlines selector_definition
                                 | empty"""
+        if len(p) > 2:
+            p[0] = p[3]
+            if p[1] is not None:
+                p[0].append(p[1])
+        else:
+            p[0] = []
 
     def p_selector_pointer(self, p):
         """selector_item : ID EQUALS full_selector
                             | ID COLON full_selector"""
+        p[0] = ast.SelectorItem(*self.span(p), self.identifier(p, 1), p[3])
 
     def p_selector_item_path(self, p):
         """selector_item : ID EQUALS data_path data_type const_value
                             | ID COLON data_path data_type const_value
                             | ID EQUALS data_path data_type
                             | ID COLON data_path data_type"""
+        p[0] = ast.SelectorItem(*self.span(p), self.identifier(p, 1), p[3])
 
     def p_selector_item_vector_path(self, p):
         """selector_item : LESS ID GREATER EQUALS data_path data_type const_value
                             | LESS ID GREATER COLON data_path data_type const_value
                             | LESS ID GREATER EQUALS data_path data_type
                             | LESS ID GREATER COLON data_path data_type"""
+        p[0] = ast.SelectorItem(*self.span(p), self.identifier(p, 2), p[5])
 
     def p_selector_item_tag(self, p):
         """selector_item : CREATE json_object"""
+        p[0] = ast.Statement(*self.span(p), p[1], [p[2]])
 
     def p_selector_item_method(self, p):
         """selector_item : function_section"""
-    
+        p[0] = p[1]
+
     def p_selector_item_array(self, p):
         """selector_item : array"""
+        p[0] = p[1]
 
     def p_selector_item_predicate(self, p):
         """selector_item : predicate"""
+        p[0] = p[1]
 
     def p_selector_assignment(self, p):
         """selector_assign : ATID EQUALS full_selector optnewlines"""
+        p[0] = ast.SelectorAssign(*self.span(p), self.identifier(p, 1), p[3])
 
     ## Array rules
     # Array rule
     def p_array(self, p):
         """array : ARRAY ID LBRACKET const_value TO const_value RBRACKET
                     | ARRAY ID LBRACKET const_value RBRACKET"""
+        p[0] = ast.Array(*self.span(p), self.identifier(p, 2), p[4], p[6] if len(p) > 6 else None)
 
     ## Advancement rules
     # Advancement rule
     def p_advancement(self, p):
         """advancement : ADVANCEMENT ID json_object optnewlines"""
+        p[0] = ast.Resource(*self.span(p), p[1], self.identifier(p, 2), p[3])
 
     ## Loot Table rules
     def p_loot_table_type(self, p):
         """loot_table_type : BLOCK
                             | ENTITY"""
+        p[0] = p[1]
 
     # Loot table rule
     def p_loot_table(self, p):
         """loot_table : LOOT_TABLE loot_table_type ID COLON ID json_object optnewlines
                         | LOOT_TABLE loot_table_type ID json_object optnewlines"""
+        if len(p) > 6:
+            name = ast.Identifier(*self.span(p, 3, 5), f"{p[3]}:{p[5]}")
+            p[0] = ast.Resource(*self.span(p), p[1], name, p[6])
+        else:
+            p[0] = ast.Resource(*self.span(p), p[1], self.identifier(p, 3), p[4])
 
     ## Predicate rules
     # Predicate rule
     def p_predicate(self, p):
         """predicate : PREDICATE ID json_object optnewlines"""
+        p[0] = ast.Resource(*self.span(p), p[1], self.identifier(p, 2), p[3])
 
     ## Item Modifier rules
     # Item Modifier rule
     def p_item_modifier(self, p):
         """item_modifier : ITEM_MODIFIER ID json_object optnewlines"""
+        p[0] = ast.Resource(*self.span(p), p[1], self.identifier(p, 2), p[3])
 
     ## Tell / Title rules
     # Tell rule
     def p_tell(self, p):
         """code_block : TELL full_selector string optnewlines"""
+        p[0] = ast.Statement(*self.span(p), p[1], [p[2], p[3]])
 
     # Title rule
     def p_title(self, p):
         """code_block : TITLE full_selector string optnewlines
                         | SUBTITLE full_selector string optnewlines
                         | ACTIONBAR full_selector string optnewlines"""
+        p[0] = ast.Statement(*self.span(p), p[1], [p[2], p[3]])
 
     def p_title_times(self, p):
         """code_block : TITLE full_selector const_value const_value const_value string optnewlines
                         | SUBTITLE full_selector const_value const_value const_value string optnewlines
                         | ACTIONBAR full_selector const_value const_value const_value string optnewlines"""
+        p[0] = ast.Statement(*self.span(p), p[1], [p[2], p[3], p[4], p[5], p[6]])
 
     ## Assignment rules
     # Assignment rule
@@ -635,19 +906,23 @@ class CBParse(object):
                     | variable DIVIDE_EQUALS expr
                     | variable MODULO_EQUALS expr"""
         # TODO: Assignment stuffs
+        p[0] = ast.Assign(*self.span(p), p[1], p[2], p[3])
 
     def p_xcrement(self, p):
         """assign : variable PLUS_PLUS
                     | variable MINUS_MINUS"""
         # TODO: Increment/Decrement stuffs
+        p[0] = ast.Assign(*self.span(p), p[1], p[2], None)
 
     def p_return(self, p):
         """assign : RETURN expr"""
+        p[0] = ast.Return(*self.span(p), p[2])
 
     # Constant assignment rule
     def p_constant_assignment(self, p):
         """const_assign : DOLLAR ID EQUALS const_value"""
         # TODO: Constant assignment stuffs
+        p[0] = ast.ConstAssign(*self.span(p), self.identifier(p, 2), p[4])
 
     ## Variable rules
     # Variable rule
@@ -655,41 +930,56 @@ class CBParse(object):
         """variable : ID DOT ID
                     | full_selector DOT ID"""
         # TODO: Variable assignment
+        owner = self.identifier(p, 1) if p.slice[1].type == "ID" else p[1]
+        p[0] = ast.Variable(*self.span(p), owner, self.identifier(p, 3), None)
 
     def p_variable_id(self, p):
         """variable : ID"""
         # TODO: Variable assignment
+        p[0] = ast.Variable(*self.span(p), None, self.identifier(p, 1), None)
 
     def p_variable_constant_integer(self, p):
         """variable : const_int"""
+        p[0] = p[1]
 
     def p_variable_array(self, p):
         """variable : ID LBRACKET virtual_int RBRACKET
                     | ID LBRACKET expr RBRACKET"""
+        p[0] = ast.Variable(*self.span(p), None, self.identifier(p, 1), p[3])
 
     def p_variable_array_selector(self, p):
         """variable : full_selector DOT ID LBRACKET virtual_int RBRACKET
                     | full_selector DOT ID LBRACKET expr RBRACKET"""
+        p[0] = ast.Variable(*self.span(p), p[1], self.identifier(p, 3), p[5])
 
     def p_variable_path(self, p):
         """variable : LBRACKET ID AT rel_coords RBRACKET DOT ID LBRACKET macro_call_params RBRACKET
                     | LBRACKET ID RBRACKET DOT ID LBRACKET macro_call_params RBRACKET
                     | LBRACKET ID AT rel_coords RBRACKET DOT ID
                     | LBRACKET ID RBRACKET DOT ID"""
+        name = 7 if p.slice[3].type == "AT" else 5
+        p[0] = ast.Variable(*self.span(p), self.identifier(p, 2), self.identifier(p, name), p[name + 2] if len(p) > name + 2 else None)
 
     def p_variable_ref(self, p):
         """variable : REF full_selector"""
+        p[0] = ast.UnaryOp(*self.span(p), p[1], p[2])
 
     def p_variable_storage(self, p):
         """variable : ID COLON data_path
                     | COLON data_path"""
+        if len(p) > 3:
+            p[0] = ast.Variable(*self.span(p), self.identifier(p, 1), p[3], None)
+        else:
+            p[0] = ast.Variable(*self.span(p), None, p[2], None)
 
     def p_variable_command(self, p):
         """variable : SUCCESS NEWLINE COMMAND
                     | RESULT NEWLINE COMMAND"""
+        p[0] = ast.UnaryOp(*self.span(p), p[1], ast.Command(*self.span(p, 3), p[3]))
 
     def p_variable_virtual_integer(self, p):
         """variable : virtual_int"""
+        p[0] = p[1]
 
     ## Vector rules
     # Vector rule
@@ -698,6 +988,14 @@ class CBParse(object):
                             | full_selector DOT LESS ID GREATER
                             | LESS variable COMMA variable COMMA variable GREATER
                             | const_vector"""
+        if len(p) == 4:
+            p[0] = ast.Variable(*self.span(p), None, self.identifier(p, 2), None)
+        elif len(p) == 6:
+            p[0] = ast.Variable(*self.span(p), p[1], self.identifier(p, 4), None)
+        elif len(p) > 6:
+            p[0] = ast.Vector(*self.span(p), [p[2], p[4], p[6]])
+        else:
+            p[0] = p[1]
 
     # Vector expression rule
     def p_vector_expression(self, p):
@@ -708,10 +1006,23 @@ class CBParse(object):
                         | HERE LPAREN const_value RPAREN
                         | HERE
                         | const_vector"""
-    
+        if p.slice[1].type == "LPAREN":
+            p[0] = p[2]
+        elif len(p) > 6:
+            p[0] = ast.Vector(*self.span(p), [p[2], p[4], p[6]])
+        elif p.slice[1].type == "HERE":
+            p[0] = ast.Call(*self.span(p), "builtin", None, self.identifier(p, 1), [p[3]] if len(p) > 2 else [])
+        elif len(p) == 6:
+            p[0] = ast.Variable(*self.span(p), p[1], self.identifier(p, 4), None)
+        elif len(p) == 4:
+            p[0] = ast.Variable(*self.span(p), None, self.identifier(p, 2), None)
+        else:
+            p[0] = p[1]
+
     def p_vector_arithmetic(self, p):
         """vector_expr : vector_expr PLUS vector_expr
                         | vector_expr MINUS vector_expr"""
+        p[0] = ast.BinaryOp(*self.span(p), p[2], p[1], p[3])
 
     def p_vector_scalar(self, p):
         """vector_expr : vector_expr PLUS expr
@@ -721,15 +1032,18 @@ class CBParse(object):
                         | vector_expr TIMES expr
                         | vector_expr DIVIDE expr
                         | vector_expr MODULO expr"""
+        p[0] = ast.BinaryOp(*self.span(p), p[2], p[1], p[3])
 
     def p_vector_negative(self, p):
         """vector_expr : MINUS vector_expr"""
+        p[0] = ast.UnaryOp(*self.span(p), p[1], p[2])
 
     # Vector assignment rule
     def p_vector_assignment(self, p):
         """assign : vector_variable EQUALS vector_expr
                     | vector_variable PLUS_EQUALS vector_expr
                     | vector_variable MINUS_EQUALS vector_expr"""
+        p[0] = ast.Assign(*self.span(p), p[1], p[2], p[3])
 
     def p_vector_scalar_assignment(self, p):
         """assign : vector_variable EQUALS expr
@@ -739,12 +1053,18 @@ class CBParse(object):
                     | vector_variable DIVIDE_EQUALS expr
                     | vector_variable MODULO_EQUALS expr"""
         # TODO: Assignment stuffs
+        p[0] = ast.Assign(*self.span(p), p[1], p[2], p[3])
 
     ## Arithmetic rules
     def p_expression_list(self, p):
         """expr_list : expr_list COMMA expr
                         | expr
                         | empty"""
+        if len(p) > 2:
+            p[0] = p[1]
+            p[0].append(p[3])
+        else:
+            p[0] = [p[1]] if p[1] is not None else []
 
     def p_expression_variable(self, p):
         """expr : variable"""
@@ -757,23 +1077,29 @@ class CBParse(object):
                 | expr DIVIDE expr
                 | expr MODULO expr"""
         # TODO: Do such arithmetics
+        p[0] = ast.BinaryOp(*self.span(p), p[2], p[1], p[3])
 
     def p_expression_negative(self, p):
         """expr : MINUS expr"""
+        p[0] = ast.UnaryOp(*self.span(p), p[1], p[2])
 
     def p_expression_power(self, p):
         """expr : expr POWER int"""
         # TODO: Apply such powers
+        p[0] = ast.BinaryOp(*self.span(p), p[2], p[1], p[3])
 
     def p_expression_dot(self, p):
         """expr : vector_expr TIMES vector_expr"""
+        p[0] = ast.BinaryOp(*self.span(p), p[2], p[1], p[3])
 
     def p_expression_function_call(self, p):
         """expr : function_call
                     | method_call"""
+        p[0] = p[1]
 
     def p_expression_group(self, p):
         """expr : LPAREN expr RPAREN"""
+        p[0] = p[2]
 
     ## Data rules
     # Data path rule
@@ -781,30 +1107,36 @@ class CBParse(object):
         """data_path : ID json_object
                         | ID
                         | FACING"""
+        p[0] = ast.DataPath(*self.span(p))
 
     def p_data_path_array(self, p):
         """data_path : ID LBRACKET json_object RBRACKET
                         | ID LBRACKET const_int RBRACKET"""
+        p[0] = ast.DataPath(*self.span(p))
 
     def p_data_path_multi(self, p):
         """data_path : data_path DOT data_path"""
+        p[0] = ast.DataPath(*self.span(p))
 
     def p_data_type(self, p):
         """data_type : ID"""
+        p[0] = self.identifier(p, 1)
 
         expected = ["byte", "double", "float", "int", "long", "short"]
 
         if p[1] not in expected:
-            self.diagnostics.append(CBDiagnostic(p.slice[1], self.lexer.find_column(self.data, p.slice[1]), self.parser.state, expected))
+            self.report(p.slice[1], expected)
 
     ## JSON rules
     # JSON Object rule
     def p_json_object(self, p):
         """json_object : LCURLY optnewlines json_members optnewlines RCURLY"""
+        p[0] = ast.Json(*self.span(p))
 
     def p_json_object_error(self, p):
         """json_object : LCURLY error RCURLY"""
         self.parser.errok()
+        p[0] = ast.Json(*self.span(p))
 
     def p_json_members(self, p):
         """json_members : json_pair COMMA optnewlines json_members
@@ -843,7 +1175,7 @@ class CBParse(object):
         expected = ['b', 'i', 'l']
 
         if p[3].lower() not in expected:
-            self.diagnostics.append(CBDiagnostic(p.slice[3], self.lexer.find_column(self.data, p.slice[3]), self.parser.state, expected))
+            self.report(p.slice[3], expected)
 
     def p_json_literal_elements(self, p):
         """json_literal_elements : json_literal_value COMMA optnewlines json_literal_elements
@@ -860,51 +1192,72 @@ class CBParse(object):
     def p_nbt_assignment(self, p):
         """assign : nbt_list EQUALS nbt
                     | nbt_object EQUALS nbt"""
+        p[0] = ast.Assign(*self.span(p), p[1], p[2], p[3])
 
     def p_nbt_append(self, p):
         """assign : nbt_list PLUS_EQUALS nbt"""
+        p[0] = ast.Assign(*self.span(p), p[1], p[2], p[3])
 
     def p_nbt_merge(self, p):
         """assign : nbt_object PLUS_EQUALS nbt"""
+        p[0] = ast.Assign(*self.span(p), p[1], p[2], p[3])
 
     def p_nbt_remove(self, p):
         """code_block : REMOVE nbt_path"""
+        p[0] = ast.Statement(*self.span(p), p[1], [p[2]])
 
     def p_nbt_list_entity(self, p):
         """nbt_list : full_selector DOT LBRACKET data_path RBRACKET"""
+        p[0] = ast.Variable(*self.span(p), p[1], p[4], None)
 
     def p_nbt_list_storage(self, p):
         """nbt_list : ID COLON LBRACKET data_path RBRACKET
                     | COLON LBRACKET data_path RBRACKET"""
+        if len(p) > 5:
+            p[0] = ast.Variable(*self.span(p), self.identifier(p, 1), p[4], None)
+        else:
+            p[0] = ast.Variable(*self.span(p), None, p[3], None)
 
     def p_nbt_object_entity(self, p):
         """nbt_list : full_selector DOT LCURLY data_path RCURLY"""
+        p[0] = ast.Variable(*self.span(p), p[1], p[4], None)
 
     def p_nbt_object_storage(self, p):
         """nbt_list : ID COLON LCURLY data_path RCURLY
                     | COLON LCURLY data_path RCURLY"""
+        if len(p) > 5:
+            p[0] = ast.Variable(*self.span(p), self.identifier(p, 1), p[4], None)
+        else:
+            p[0] = ast.Variable(*self.span(p), None, p[3], None)
 
     def p_nbt_path_entity(self, p):
         """nbt_path : full_selector DOT data_path"""
+        p[0] = ast.Variable(*self.span(p), p[1], p[3], None)
 
     def p_nbt_path_storage(self, p):
         """nbt_object : ID COLON data_path
                     | COLON data_path"""
+        if len(p) > 3:
+            p[0] = ast.Variable(*self.span(p), self.identifier(p, 1), p[3], None)
+        else:
+            p[0] = ast.Variable(*self.span(p), None, p[2], None)
 
     def p_nbt_path(self, p):
         """nbt_path : nbt_object
                     | nbt_list"""
+        p[0] = p[1]
 
     def p_nbt(self, p):
         """nbt : nbt_path
                 | json_object
                 | string"""
+        p[0] = p[1]
 
     ## String rules
     # String rule
     def p_string(self, p):
         """string : STRING"""
-        p[0] = p[1][1:-1]
+        p[0] = ast.String(*self.span(p), p[1][1:-1])
 
     ## Number rules
     # Number rule
@@ -919,11 +1272,13 @@ class CBParse(object):
                 | DECIMAL
                 | HEX"""
         if p.slice[1].type == "BINARY":
-            p[0] = str(int(p[1], 2))
+            value = str(int(p[1], 2))
         elif p.slice[1].type == "HEX":
-            p[0] = str(int(p[1], 16))
+            value = str(int(p[1], 16))
         else:
-            p[0] = p[1]
+            value = p[1]
+
+        p[0] = ast.Number(*self.span(p), value)
 
     # Negative Integer rules
     def p_int_negative(self, p):
@@ -931,41 +1286,48 @@ class CBParse(object):
                 | MINUS DECIMAL
                 | MINUS HEX"""
         if p.slice[2].type == "BINARY":
-            p[0] = str(int(p[2], 2))
+            value = str(int(p[2], 2))
         elif p.slice[2].type == "HEX":
-            p[0] = str(int(p[2], 16))
+            value = str(int(p[2], 16))
         else:
-            p[0] = str(-int(p[2]))
+            value = str(-int(p[2]))
+
+        p[0] = ast.Number(*self.span(p), value)
 
     # Float rules
     def p_float(self, p):
         """float : FLOAT"""
-        p[0] = p[1]
+        p[0] = ast.Number(*self.span(p), p[1])
 
     # Negative Float rules
     def p_float_negative(self, p):
         """float : MINUS FLOAT"""
-        p[0] = str(-float(p[2]))
+        p[0] = ast.Number(*self.span(p), str(-float(p[2])))
 
     ## Constant rules
     def p_constant_value(self, p):
         """const_value : const_expr
                         | const_string
                         | const_int"""
+        p[0] = p[1]
 
     def p_constant_ID(self, p):
         """const_ID : DOLLAR ID"""
+        p[0] = ast.Constant(*self.span(p), self.identifier(p, 2))
 
     def p_constant_string(self, p):
         """const_string : DOLLAR string"""
+        p[0] = ast.UnaryOp(*self.span(p), p[1], p[2])
 
     def p_constant_integer(self, p):
         """const_int : int"""
+        p[0] = p[1]
 
     def p_constant_expression(self, p):
         """const_expr : number
                         | string
                         | const_ID"""
+        p[0] = p[1]
 
     def p_constant_expression_arithmetic(self, p):
         """const_expr : const_expr PLUS const_expr
@@ -974,6 +1336,7 @@ class CBParse(object):
                         | const_expr DIVIDE const_expr
                         | const_expr MODULO const_expr"""
         # TODO: Do such arithmetics
+        p[0] = ast.BinaryOp(*self.span(p), p[2], p[1], p[3])
 
     def p_constant_expression_compare(self, p):
         """const_expr : const_expr EQUALS_EQUALS const_expr
@@ -981,49 +1344,64 @@ class CBParse(object):
                         | const_expr LESS_EQUALS const_expr
                         | const_expr GREATER const_expr
                         | const_expr GREATER_EQUALS const_expr"""
+        p[0] = ast.BinaryOp(*self.span(p), p[2], p[1], p[3])
 
     def p_constant_expression_double(self, p):
         """const_expr : const_expr NOT EQUALS const_expr
                         | const_expr TIMES TIMES const_expr"""
+        p[0] = ast.BinaryOp(*self.span(p), "!=" if p.slice[2].type == "NOT" else "**", p[1], p[4])
 
     def p_constant_expression_spaced(self, p):
         """const_expr : const_expr OR const_expr
                         | const_expr AND const_expr"""
+        p[0] = ast.BinaryOp(*self.span(p), p[2], p[1], p[3])
 
     def p_constant_expression_negative(self, p):
         """const_expr : MINUS const_expr"""
+        p[0] = ast.UnaryOp(*self.span(p), p[1], p[2])
 
     def p_constant_expression_list(self, p):
         """const_expr_list : const_expr COMMA optnewlines const_expr_list
                             | const_expr
                             | empty"""
+        if len(p) > 2:
+            p[0] = [p[1]] + p[4]
+        else:
+            p[0] = [p[1]] if p[1] is not None else []
 
     def p_constant_array(self, p):
         """const_expr : LBRACKET optnewlines const_expr_list optnewlines RBRACKET
                         | LPAREN optnewlines const_expr_list optnewlines RPAREN"""
+        p[0] = ast.ArrayLiteral(*self.span(p), p[3])
 
     def p_constant_array_element(self, p):
         """const_expr : const_expr LBRACKET const_expr RBRACKET"""
+        p[0] = ast.BinaryOp(*self.span(p), "[]", p[1], p[3])
 
     def p_constant_vector(self, p):
         """const_vector : LESS const_expr GREATER"""
+        p[0] = ast.Vector(*self.span(p), [p[2]])
 
     def p_constant_expression_variable(self, p):
         """const_expr : const_expr DOT const_expr"""
+        p[0] = ast.BinaryOp(*self.span(p), p[2], p[1], p[3])
 
     def p_constant_function_call(self, p):
         """const_expr : DOLLAR FUNCTION_ID optnewlines const_expr_list optnewlines RPAREN"""
+        p[0] = ast.Call(*self.span(p), "macro", None, self.identifier(p, 2), p[4])
 
     ## Virtual Number rules
     # Virtual Number rule
     def p_virtual_number(self, p):
         """virtual_number : number
                             | const_ID"""
+        p[0] = p[1]
 
     # Virtual Integer rule
     def p_virtual_integer(self, p):
         """virtual_int : int
                         | const_ID"""
+        p[0] = p[1]
 
     ## MISC rules
     # UUID rule
@@ -1049,28 +1427,288 @@ class CBParse(object):
     # Error catch-all
     def p_error(self, p):
         if p is None:
-            print("Syntax error: unexpected End of File")
+            logger.debug("Syntax error: unexpected End of File")
         else:
             state = self.parser.state
 
             expected = [token for token in self.parser.action[state].keys() if not token == "error"]
 
-            self.diagnostics.append(CBDiagnostic(p, self.lexer.find_column(self.data, p), self.parser.state, expected))
+            self.last_error = self.report(p, expected)
+
+            start = self.data.rfind('\n', 0, p.lexpos) + 1
+            line = self.line_tokens(start)
+            unclosed = self.unclosed([token for token in line if token.lexpos < p.lexpos - start])
+
+            # A line ending inside brackets gets them closed and parsing goes on
+            if p.type == "NEWLINE" and unclosed and all(bracket in CLOSERS for bracket in unclosed):
+                return self.close_brackets(p, unclosed)
+
+            # Recovery resumes after the bad line, the body of a block it opened has to go
+            # with it or its 'end' would close the enclosing block. Errors inside [...] and
+            # {...} recover on their closing bracket instead
+            if p.type != "END" and not unclosed and self.opens_block(line):
+                self.skip_block(p, line[0].type in SECTION_OPENERS)
+
+    ### Error recovery helpers
+    def line_tokens(self, start: int) -> list:
+        """
+            Tokens of the source line starting at an offset, lexed on their own
+        """
+
+        end = self.data.find('\n', start)
+
+        lexer = self.lexer.lexer.clone()
+        lexer.input(self.data[start:] if end == -1 else self.data[start:end])
+
+        return list(iter(lexer.token, None))
+
+    @staticmethod
+    def unclosed(tokens: list) -> list[str]:
+        """
+            Brackets opened and not closed by a line of tokens, innermost last
+        """
+
+        stack = []
+
+        for token in tokens:
+            if token.type in ("LPAREN", "LBRACKET", "LCURLY"):
+                stack.append(token.type)
+            elif token.type in ("RPAREN", "RBRACKET", "RCURLY") and stack:
+                stack.pop()
+
+        return stack
+
+    def close_brackets(self, newline, unclosed: list[str]):
+        """
+            Hand the parser the brackets missing before a line break, then the line break
+        """
+
+        closers = []
+
+        for bracket in reversed(unclosed):
+            token = LexToken()
+            token.type, token.value = CLOSERS[bracket]
+            token.lineno, token.lexpos = newline.lineno, newline.lexpos
+            closers.append(token)
+
+        self.pending.append(newline)
+        self.pending.extend(reversed(closers[1:]))
+        self.parser.errok()
+
+        return closers[0]
+
+    @staticmethod
+    def opens_block(tokens: list) -> bool:
+        """
+            Whether a line of tokens starts a block closed by a later 'end'
+        """
+
+        types = [token.type for token in tokens]
+
+        if not types:
+            return False
+
+        # 'with ... do' and friends, the block starts on the next line
+        if types[-1] == "DO":
+            return True
+
+        if "DO" in types or "THEN" in types:
+            return False
+
+        return types[0] in BLOCK_OPENERS or types[:2] == ["DEFINE", "ATID"]
+
+    def skip_block(self, error, keep_end: bool):
+        """
+            Discard the tokens of a block whose opening line failed to parse
+
+            Sections recover on the 'end' closing them, so for those it is handed back to
+            the parser, statements recover on the line break after it
+        """
+
+        # Rest of the opening line
+        token = error
+        while token is not None and token.type != "NEWLINE":
+            token = self.token()
+
+        depth = 1
+
+        while token is not None:
+            line = []
+
+            while (token := self.token()) is not None and token.type != "NEWLINE":
+                line.append(token)
+
+            if not line:
+                continue
+
+            if line[0].type == "END":
+                depth -= 1
+
+                if depth == 0:
+                    rest = (line if keep_end else line[1:]) + ([token] if token is not None else [])
+                    self.pending.extend(reversed(rest))
+                    return
+            elif self.opens_block(line):
+                depth += 1
+
+    ### Node helpers
+    def span(self, p, first=1, last=None):
+        """
+            Source offsets [start, end) covered by the symbols first..last of a production
+
+            Symbols without a position (empty rules, newlines) are skipped
+        """
+
+        last = len(p) - 1 if last is None else last
+        start = end = None
+
+        for i in range(first, last + 1):
+            if (bounds := self._bounds(p.slice[i])) is not None:
+                start = bounds[0]
+                break
+
+        for i in range(last, first - 1, -1):
+            if (bounds := self._bounds(p.slice[i])) is not None:
+                end = bounds[1]
+                break
+
+        if start is None:
+            start = end = p.lexer.lexpos
+
+        return start, end
+
+    @staticmethod
+    def _bounds(symbol):
+        """
+            Source offsets of one symbol of a production, None if it has none
+        """
+
+        if isinstance(symbol, LexToken):
+            # The 'error' symbol carries the offending token
+            token = symbol.value if isinstance(symbol.value, LexToken) else symbol
+
+            if not isinstance(token.lexpos, int):
+                return None
+
+            return token.lexpos, token.lexpos + len(str(token.value))
+
+        value = symbol.value
+
+        if isinstance(value, ast.Node):
+            return value.start, value.end
+
+        if isinstance(value, list):
+            nodes = [v for v in value if isinstance(v, ast.Node)]
+
+            if nodes:
+                return min(n.start for n in nodes), max(n.end for n in nodes)
+
+        return None
+
+    def identifier(self, p, i) -> ast.Identifier:
+        """
+            Identifier node for the terminal at position i
+        """
+
+        return ast.Identifier(p.lexpos(i), p.lexpos(i) + len(p[i]), p[i])
+
+    def nodes(self, p, first=1):
+        """
+            Child nodes of the symbols from first onwards, names become identifiers
+        """
+
+        nodes = []
+
+        for i in range(first, len(p)):
+            if isinstance(p[i], ast.Node):
+                nodes.append(p[i])
+            elif isinstance(p[i], list):
+                nodes.extend(v for v in p[i] if isinstance(v, ast.Node))
+            elif p.slice[i].type in ("ID", "ATID"):
+                nodes.append(self.identifier(p, i))
+
+        return nodes
+
+    def report(self, token, expected, message=None) -> Optional[CBDiagnostic]:
+        """
+            Record a diagnostic at token, None once MAX_DIAGNOSTICS are recorded
+        """
+
+        if len(self.diagnostics) >= MAX_DIAGNOSTICS:
+            return None
+
+        diagnostic = CBDiagnostic(token, self.lexer.find_column(self.data, token), self.parser.state, expected, message)
+        self.diagnostics.append(diagnostic)
+
+        return diagnostic
 
     ### Parser Functions
-    def parse(self, data, debug=0):
+    def parse(self, data, debug=0, tokens=None):
+        """
+            Parse data, replaying the tokens of a CBTokenBuffer for it when given instead of lexing it
+        """
+
         self.data = data
-        ret =  self.parser.parse(data, debug=debug, tracking=True)
+
+        # Called once per token, so kept to bound locals. Error recovery takes its tokens from the same function
+        pending, lex = self.pending, self.lexer.lexer.token if tokens is None else tokens.replay(self.lexer.lexer)
+
+        def token():
+            return pending.pop() if pending else lex()
+
+        self.token = token
+        ret =  self.parser.parse(data, lexer=self.lexer.lexer, debug=debug, tracking=True, tokenfunc=token)
 
         if debug:
             for i, d in enumerate(self.diagnostics):
-                print(f"[{i}]: {d}\n")
+                logger.debug("[%d]: %s", i, d)
 
         return ret
 
+    def session(self):
+        """
+            An isolated copy of this parser, safe to use alongside it on another thread
+
+            The LR tables and lexer rules are shared, the PLY lexer is cloned and the
+            parser gets its own stacks, productions bound to the copy and results
+        """
+
+        session = copy.copy(self)
+
+        session.lexer = copy.copy(self.lexer)
+        session.lexer.lexer = self.lexer.lexer.clone()
+
+        session.parser = copy.copy(self.parser)
+        session.parser.errorfunc = session.p_error
+        session.parser.productions = []
+
+        for production in self.parser.productions:
+            production = copy.copy(production)
+            production.callable = getattr(session, production.func) if production.func else None
+            session.parser.productions.append(production)
+
+        session.lexer.reset()
+        session.data = None
+        session.diagnostics = []
+        session.pending = []
+        session.last_error = None
+
+        return session
+
+    def parse_result(self, data, tokens=None) -> CBParseResult:
+        """
+            Parse data in a fresh session and collect the outcome, reentrant
+        """
+
+        session = self.session()
+        value = session.parse(data, tokens=tokens)
+
+        return CBParseResult(data, value, session.diagnostics)
+
     def reset(self):
         self.lexer.reset()
         self.parser.errok()
         self.parser.restart()
         self.data = []
         self.diagnostics = []
+        self.last_error = None
@@ -0,0 +1,61 @@
+import json
+import threading
+import time
+from typing import Iterator, Tuple
+
+class CBSessionRecorder(object):
+    """
+        Records the JSON-RPC messages a client sends to the server, for benchmarks.replay
+
+        One JSON object per line holding the message and the seconds since recording
+        started. Lines are flushed as they are written, so a session is kept up to the
+        last message even if the editor kills the server
+    """
+
+    def __init__(self, path: str):
+        self.file = open(path, "w", encoding="utf-8")
+        self.start = time.perf_counter()
+        self.lock = threading.Lock()
+
+    def attach(self, server):
+        """
+            Record everything the server reads from now on, must be called before start_io
+        """
+
+        data_received = server.lsp.data_received
+
+        def received(data: bytes):
+            self.record(data)
+            data_received(data)
+
+        server.lsp.data_received = received
+
+    def record(self, data: bytes):
+        elapsed = time.perf_counter() - self.start
+
+        # Messages arrive whole, headers then body
+        _, _, body = data.partition(b"\r\n\r\n")
+
+        try:
+            message = json.loads(body)
+        except ValueError:
+            return
+
+        with self.lock:
+            self.file.write(json.dumps({"time": round(elapsed, 6), "message": message}) + "\n")
+            self.file.flush()
+
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+def load_session(path: str) -> Iterator[Tuple[float, dict]]:
+    """
+        (seconds since the start, message) of every message of a recorded session
+    """
+
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                entry = json.loads(line)
+                yield entry["time"], entry["message"]
@@ -0,0 +1,95 @@
+import asyncio
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Dict, Optional
+
+class CBParseScheduler(object):
+    """
+        Debounced background parsing for open documents
+
+        Each edit restarts a short per-document timer, once it runs out the document is
+        parsed on a worker thread. Results for a version the document has moved past are
+        dropped, so diagnostics and symbols only ever come from the latest version
+    """
+
+    def __init__(self, server, delay: float = 0.25, executor: Optional[Executor] = None):
+        self.server = server
+        self.delay = delay
+
+        # Every parse runs in its own parser session, so documents can be parsed side by side
+        self.executor = executor if executor is not None else ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="cbls-parse")
+
+        self.pending: Dict[str, asyncio.Task] = {}
+        self.loading: Dict[str, asyncio.Task] = {}
+
+    def schedule(self, uri: str, delay: Optional[float] = None) -> asyncio.Task:
+        """
+            (Re)start the timer for a document, cancelling any parse still pending for it
+        """
+
+        self.cancel(uri)
+
+        task = asyncio.ensure_future(self._run(uri, self.delay if delay is None else delay))
+        self.pending[uri] = task
+
+        return task
+
+    def cancel(self, uri: str):
+        """
+            Drop any pending or running parse of a document
+        """
+
+        if (task := self.pending.pop(uri, None)) is not None:
+            task.cancel()
+
+    def load(self, uri: str) -> asyncio.Task:
+        """
+            Index a document that is not open in the editor from disk
+        """
+
+        if (task := self.loading.get(uri)) is not None:
+            return task
+
+        task = self.loading[uri] = asyncio.ensure_future(self._load(uri))
+
+        return task
+
+    async def _load(self, uri: str):
+        try:
+            analysis = await asyncio.get_running_loop().run_in_executor(self.executor, self.server.analyse_file, uri)
+        finally:
+            del self.loading[uri]
+
+        # Opened in the meantime, the editor's version wins
+        if uri in self.server.workspace.text_documents:
+            return
+
+        self.server.apply_analysis(analysis)
+
+    async def _run(self, uri: str, delay: float):
+        try:
+            await asyncio.sleep(delay)
+
+            document = self.server.workspace.get_text_document(uri)
+            version = document.version
+
+            if not document.source.strip() or not document.filename:
+                self.server.parse(document)
+                return
+
+            # Snapshot the text and its tokens, the document keeps changing on the event loop while we parse
+            source = document.source
+            tokens = self.server.lexed(uri, source)
+            analysis = await asyncio.get_running_loop().run_in_executor(
+                self.executor, self.server.analyse, uri, source, document.filename, tokens)
+        except asyncio.CancelledError:
+            return
+        finally:
+            if self.pending.get(uri) is asyncio.current_task():
+                del self.pending[uri]
+
+        if self.server.workspace.get_text_document(uri).version != version:
+            return
+
+        self.server.publish_analysis(analysis, version=version)
+        self.server.remember(source, document.filename, analysis)
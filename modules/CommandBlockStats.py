@@ -0,0 +1,201 @@
+import asyncio
+import cProfile
+import functools
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Custom request returning the stats
+CBLS_STATS = "cbls/stats"
+
+# Upper bounds of the latency buckets in milliseconds, slower times fall in a last open bucket
+BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+# Requests at least this slow are logged, and profiled when a profile directory is set
+SLOW_MS = 500.0
+PROFILE_DIR = os.environ.get("CBLS_PROFILE_DIR")
+
+def slow_threshold() -> float:
+    """
+        The slow request threshold from $CBLS_SLOW_MS, the default if it is not a number
+    """
+
+    value = os.environ.get("CBLS_SLOW_MS")
+
+    if value is None:
+        return SLOW_MS
+
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning("Ignoring CBLS_SLOW_MS=%r, not a number of milliseconds, using %g", value, SLOW_MS)
+        return SLOW_MS
+
+class CBHistogram(object):
+    """
+        Counts of durations per latency bucket, with their total and maximum
+    """
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, ms: float):
+        self.counts[bisect_left(BUCKETS, ms)] += 1
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+
+    def percentile(self, fraction: float) -> float:
+        """
+            Upper bound of the bucket holding the percentile, the maximum past the last bound
+        """
+
+        rank = fraction * self.count
+        seen = 0
+
+        for bound, count in zip(BUCKETS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+
+        return self.max
+
+    def to_json(self) -> dict:
+        return {
+            "count": self.count,
+            "total_ms": round(self.total, 3),
+            "max_ms": round(self.max, 3),
+            "p50_ms": round(self.percentile(0.5), 3),
+            "p95_ms": round(self.percentile(0.95), 3),
+            "p99_ms": round(self.percentile(0.99), 3),
+            "buckets": {str(bound): count for bound, count in zip(BUCKETS + ("+Inf",), self.counts)},
+        }
+
+class CBStats(object):
+    """
+        Where the server's time goes, for the cbls/stats request
+
+        Keeps a latency histogram per request method and per phase of handling a
+        document (lex, parse, encode and publish). Phases are recorded from parse
+        threads too. With a profile directory, requests run under cProfile one at a
+        time and the profile of any slow one is dumped there; work a request hands
+        to parse threads is not part of its profile
+    """
+
+    def __init__(self, slow_ms: Optional[float] = None, profile_dir: Optional[str] = PROFILE_DIR):
+        self.slow_ms = slow_ms if slow_ms is not None else slow_threshold()
+        self.profile_dir = profile_dir
+
+        self.phases: Dict[str, CBHistogram] = {}
+        self.methods: Dict[str, CBHistogram] = {}
+        self.lock = threading.Lock()
+
+        self.started = time.monotonic()
+        self.profiling = False
+        self.profiles = 0
+
+    def record(self, table: Dict[str, CBHistogram], key: str, ms: float):
+        with self.lock:
+            if (histogram := table.get(key)) is None:
+                histogram = table[key] = CBHistogram()
+
+            histogram.add(ms)
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+            Time the block as one run of a phase
+        """
+
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.record(self.phases, name, (time.perf_counter() - start) * 1000)
+
+    def timed(self, method: str, handler: Callable) -> Callable:
+        """
+            Wrap a feature handler, timing every call under the method's name
+        """
+
+        if not asyncio.iscoroutinefunction(handler):
+            @functools.wraps(handler)
+            def timed_handler(*args, **kwargs):
+                profile, start = self._start()
+
+                try:
+                    return handler(*args, **kwargs)
+                finally:
+                    self._stop(method, profile, start)
+
+            return timed_handler
+
+        @functools.wraps(handler)
+        async def timed_async_handler(*args, **kwargs):
+            profile, start = self._start()
+
+            try:
+                return await handler(*args, **kwargs)
+            finally:
+                self._stop(method, profile, start)
+
+        return timed_async_handler
+
+    def _start(self):
+        profile = None
+
+        # A single profiler may run at once, requests awaiting others are left out
+        if self.profile_dir is not None and not self.profiling:
+            self.profiling = True
+            profile = cProfile.Profile()
+            profile.enable()
+
+        return profile, time.perf_counter()
+
+    def _stop(self, method: str, profile: Optional[cProfile.Profile], start: float):
+        elapsed = (time.perf_counter() - start) * 1000
+
+        if profile is not None:
+            profile.disable()
+            self.profiling = False
+
+        self.record(self.methods, method, elapsed)
+
+        if elapsed < self.slow_ms:
+            return
+
+        if profile is None:
+            logger.info("%s took %.0f ms", method, elapsed)
+            return
+
+        path = os.path.join(self.profile_dir, f"{method.replace('/', '_').replace('$', '')}-{time.time_ns() // 1000000}.prof")
+
+        try:
+            os.makedirs(self.profile_dir, exist_ok=True)
+            profile.dump_stats(path)
+        except OSError as e:
+            logger.warning("Could not write the profile of %s: %s", method, e)
+            return
+
+        self.profiles += 1
+        logger.info("%s took %.0f ms, profile written to %s", method, elapsed, path)
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {
+                "uptime_s": round(time.monotonic() - self.started, 3),
+                "slow_ms": self.slow_ms,
+                "profiles": self.profiles,
+                "phases": {name: histogram.to_json() for name, histogram in sorted(self.phases.items())},
+                "methods": {name: histogram.to_json() for name, histogram in sorted(self.methods.items())},
+            }
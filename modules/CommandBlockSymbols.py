@@ -0,0 +1,195 @@
+import heapq
+from typing import Dict, Optional, Tuple
+from lsprotocol.types import DocumentSymbol, Location, Position, Range, SymbolInformation, SymbolKind
+from modules.CommandBlockIndex import CBSymbol, CBSymbolIndex
+
+# LSP kinds of the symbols collected from a parse
+SYMBOL_KINDS = {
+    "advancement": SymbolKind.Object,
+    "array": SymbolKind.Array,
+    "clock": SymbolKind.Event,
+    "constant": SymbolKind.Constant,
+    "function": SymbolKind.Function,
+    "item_modifier": SymbolKind.Object,
+    "loot_table": SymbolKind.Object,
+    "macro": SymbolKind.Function,
+    "method": SymbolKind.Method,
+    "predicate": SymbolKind.Object,
+    "reset": SymbolKind.Constructor,
+    "selector": SymbolKind.Class,
+}
+
+# Kinds searched by workspace symbol queries
+WORKSPACE_KINDS = {"function", "method", "macro", "clock", "selector"}
+
+# Most results sent for a workspace symbol query
+MAX_RESULTS = 100
+
+def to_range(span: tuple) -> Range:
+    return Range(start=Position(line=span[0], character=span[1]), end=Position(line=span[2], character=span[3]))
+
+def char_mask(text: str) -> int:
+    """
+        One bit per distinct character of text, lowercased
+    """
+
+    mask = 0
+    for char in text.lower():
+        mask |= 1 << (ord(char) & 63)
+
+    return mask
+
+def fuzzy_score(name: str, query: str) -> Optional[int]:
+    """
+        How well name matches the characters of query in order, None if it does not
+
+        Matches at the start of a word or right after the previous match score higher,
+        skipped characters and a longer name score lower
+    """
+
+    lower = name.lower()
+    score = 0
+    last = -1
+
+    for char in query.lower():
+        i = lower.find(char, last + 1)
+
+        if i < 0:
+            return None
+
+        if i == 0 or name[i - 1] in "_@$" or (name[i].isupper() and name[i - 1].islower()):
+            score += 10
+        elif i == last + 1:
+            score += 5
+        else:
+            score -= i - last - 1
+
+        last = i
+
+    return score - (len(name) - len(query))
+
+class CBNameTable(object):
+    """
+        Distinct names of the symbol index, each with a mask of its characters
+
+        Built from the index's sorted names when they changed since the last query. A
+        name can only match a query if its mask covers the query's, a single integer
+        test that discards most names before any scoring
+    """
+
+    def __init__(self, index: CBSymbolIndex):
+        self.index = index
+        self.version = -1
+        self.names: list[str] = []
+        self.masks: list[int] = []
+
+    def refresh(self):
+        if self.version != self.index.version:
+            self.names = list(self.index.sorted_names)
+            self.masks = [char_mask(name) for name in self.names]
+            self.version = self.index.version
+
+    def search(self, query: str, limit: int) -> list[str]:
+        """
+            The best limit names for a query, best first
+        """
+
+        self.refresh()
+
+        if not query:
+            return self.names[:limit]
+
+        wanted = char_mask(query)
+        scored = ((score, name) for name, mask in zip(self.names, self.masks)
+                  if mask & wanted == wanted and (score := fuzzy_score(name, query)) is not None)
+
+        return [name for _, name in heapq.nlargest(limit, scored, key=lambda entry: entry[0])]
+
+class CBSymbolProvider(object):
+    """
+        Document outlines and workspace symbol search
+
+        An outline is built from the symbols of a document's last parse, nesting every
+        symbol in the closest one whose range covers it. It is kept until the document
+        is parsed again, so outline and breadcrumb requests between edits are answered
+        from memory. Workspace queries are fuzzy matched against a table of the
+        distinct names in the index
+    """
+
+    def __init__(self, server):
+        self.server = server
+
+        # The symbols each outline was built from, with the outline
+        self.outlines: Dict[str, Tuple[list[CBSymbol], list[DocumentSymbol]]] = {}
+
+        self.table = CBNameTable(server.index)
+
+    def workspace_symbols(self, query: str, limit: int = MAX_RESULTS) -> list[SymbolInformation]:
+        """
+            Functions, methods, macros, clocks and selectors of the workspace best matching query
+        """
+
+        results: list[SymbolInformation] = []
+
+        # Names also used by other kinds of symbols may not yield any, look a little further
+        for name in self.table.search(query, 2 * limit):
+            for symbol in self.server.index.lookup(name):
+                if symbol.kind not in WORKSPACE_KINDS:
+                    continue
+
+                results.append(SymbolInformation(
+                    name=symbol.name,
+                    kind=SYMBOL_KINDS[symbol.kind],
+                    location=Location(uri=symbol.uri, range=to_range(symbol.selection)),
+                    container_name=symbol.container
+                ))
+
+                if len(results) == limit:
+                    return results
+
+        return results
+
+    def document_symbols(self, uri: str) -> list[DocumentSymbol]:
+        """
+            The outline of a document
+        """
+
+        symbols = self.server.index.symbols(uri)
+
+        # A new parse replaces the list of symbols of the document
+        if (cached := self.outlines.get(uri)) is not None and cached[0] is symbols:
+            return cached[1]
+
+        outline = self.outline(symbols)
+        self.outlines[uri] = (symbols, outline)
+
+        return outline
+
+    @staticmethod
+    def outline(symbols: list[CBSymbol]) -> list[DocumentSymbol]:
+        """
+            Nest symbols, given in source order, by their ranges
+        """
+
+        roots: list[DocumentSymbol] = []
+        stack: list[Tuple[tuple, DocumentSymbol]] = []
+
+        for symbol in symbols:
+            start, end = symbol.range[:2], symbol.range[2:]
+
+            while stack and not (stack[-1][0][:2] <= start and end <= stack[-1][0][2:]):
+                stack.pop()
+
+            node = DocumentSymbol(
+                name=symbol.name,
+                kind=SYMBOL_KINDS.get(symbol.kind, SymbolKind.Variable),
+                range=to_range(symbol.range),
+                selection_range=to_range(symbol.selection),
+                detail=symbol.detail or None,
+                children=[]
+            )
+
+            (stack[-1][1].children if stack else roots).append(node)
+            stack.append((symbol.range, node))
+
+        return roots
@@ -0,0 +1,129 @@
+import hashlib
+import importlib.util
+import os
+import sys
+import types
+from typing import Optional
+import ply
+import ply.lex as lex
+import ply.yacc as yacc
+
+# Tables shipped alongside the server, regenerate with `python -m modules.CommandBlockTables`
+TABLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tables")
+
+# Per-user cache, tables generated at runtime when the grammar no longer matches the shipped ones go here
+CACHE_DIR = os.environ.get("CBLS_CACHE_DIR", os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")), "cbls"))
+GENERATED_DIR = os.path.join(CACHE_DIR, "tables")
+
+# Attributes besides the rules that PLY reflects off a module and that shape its tables
+TABLE_ATTRIBUTES = ("precedence", "start", "literals", "states")
+
+def rules_hash(module, prefix: str) -> str:
+    """
+        Hash the tokens, the other table attributes and every rule PLY reflects off module for a prefix ('t_' or 'p_')
+
+        Table files are named after this hash, so any grammar change selects a new table
+    """
+
+    parts = [ply.__version__, " ".join(sorted(module.tokens))]
+    parts.extend(f"{name}={getattr(module, name, None)!r}" for name in TABLE_ATTRIBUTES)
+
+    for name in sorted(dir(module)):
+        if not name.startswith(prefix):
+            continue
+
+        value = getattr(module, name)
+        parts.append(name)
+        parts.append(value if isinstance(value, str) else (value.__doc__ or ""))
+
+    return hashlib.sha1("\n".join(parts).encode()).hexdigest()[:16]
+
+def table_dirs():
+    """
+        Directories searched for table files, shipped tables first
+    """
+
+    return [TABLES_DIR, GENERATED_DIR]
+
+def load_table(name: str) -> Optional[types.ModuleType]:
+    """
+        Load a table module by file name, None if no such table has been generated
+    """
+
+    for directory in table_dirs():
+        path = os.path.join(directory, name + ".py")
+
+        if not os.path.exists(path):
+            continue
+
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+        return module
+
+    return None
+
+def output_dir() -> Optional[str]:
+    """
+        Writable directory for regenerated tables, None if there is none
+    """
+
+    try:
+        os.makedirs(GENERATED_DIR, exist_ok=True)
+    except OSError:
+        return None
+
+    return GENERATED_DIR if os.access(GENERATED_DIR, os.W_OK) else None
+
+def build_lexer(module, **kwargs) -> lex.Lexer:
+    """
+        Build a PLY lexer, loading a pre-built table with the optimize path when one matches
+    """
+
+    name = "lextab_" + rules_hash(module, "t_")
+
+    if (table := load_table(name)) is not None:
+        return lex.lex(module=module, optimize=1, lextab=table, **kwargs)
+
+    # Validate the rules on a full build, then keep the result for next time
+    lexer = lex.lex(module=module, **kwargs)
+
+    if (directory := output_dir()) is not None:
+        try:
+            lexer.writetab(name, directory)
+        except IOError:
+            pass
+
+    return lexer
+
+def build_parser(module, **kwargs) -> yacc.LRParser:
+    """
+        Build a PLY parser, loading a pre-built table with the optimize path when one matches
+    """
+
+    name = "parsetab_" + rules_hash(module, "p_")
+
+    if (table := load_table(name)) is not None:
+        return yacc.yacc(module=module, tabmodule=table, optimize=True, write_tables=False, debug=False, **kwargs)
+
+    directory = output_dir()
+
+    return yacc.yacc(module=module, tabmodule=name, outputdir=directory, write_tables=directory is not None, debug=False, **kwargs)
+
+if __name__ == "__main__":
+    # Regenerate the shipped tables by generating straight into them
+    import modules.CommandBlockTables as tables
+    from modules.CommandBlockLexer import CBLex
+    from modules.CommandBlockParser import CBParse
+
+    os.makedirs(TABLES_DIR, exist_ok=True)
+
+    for file in os.listdir(TABLES_DIR):
+        if file.startswith(("lextab_", "parsetab_")):
+            os.remove(os.path.join(TABLES_DIR, file))
+
+    tables.GENERATED_DIR = TABLES_DIR
+    CBParse(CBLex())
+
+    print("\n".join(sorted(os.listdir(TABLES_DIR))), file=sys.stderr)
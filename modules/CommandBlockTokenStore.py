@@ -0,0 +1,356 @@
+from array import array
+from functools import partial
+from typing import Callable, Dict, Iterator, Optional, Sequence, Tuple
+from ply.lex import LexToken
+from modules.TokenUtils import TOKEN_INDEX, TOKEN_MAPPING
+
+def changed_line_range(changes: Sequence) -> Optional[Tuple[int, int]]:
+    """
+        Compute the (first, last) lines touched by a list of content changes
+
+        Lines are given in the coordinates of the final document, None is returned
+        when a change replaces the full document
+    """
+
+    lo = hi = None
+
+    for change in changes:
+        change_range = getattr(change, "range", None)
+
+        if change_range is None:
+            return None
+
+        start = change_range.start.line
+        end = change_range.end.line
+        new_end = start + change.text.count('\n')
+
+        if lo is None:
+            lo, hi = start, new_end
+            continue
+
+        # Lines after this change shift by however many lines it added or removed
+        if hi > end:
+            hi += new_end - end
+
+        lo = min(lo, start)
+        hi = max(hi, new_end)
+
+    return None if lo is None else (lo, hi)
+
+def diff_tokens(previous: Sequence[int], current: Sequence[int]) -> Tuple[int, int, Sequence[int]]:
+    """
+        Compute the single edit (start, delete count, data) turning previous into current
+
+        Semantic token data is relative, so an edit only disturbs the tokens it touched
+        and the first token after them; everything else falls into the common prefix/suffix
+    """
+
+    limit = min(len(previous), len(current))
+
+    # Compare in chunks so the bulk of the work stays in C
+    prefix = 0
+    chunk = 1024
+    while prefix < limit:
+        step = min(chunk, limit - prefix)
+        if previous[prefix:prefix + step] == current[prefix:prefix + step]:
+            prefix += step
+        elif step == 1:
+            break
+        else:
+            chunk = max(1, step // 2)
+
+    suffix = 0
+    chunk = 1024
+    limit -= prefix
+    while suffix < limit:
+        step = min(chunk, limit - suffix)
+        if previous[len(previous) - suffix - step:len(previous) - suffix] == current[len(current) - suffix - step:len(current) - suffix]:
+            suffix += step
+        elif step == 1:
+            break
+        else:
+            chunk = max(1, step // 2)
+
+    return prefix, len(previous) - prefix - suffix, current[prefix:len(current) - suffix]
+
+class CBTokenEncoder(object):
+    """
+        Lexes source straight into packed LSP semantic token data
+
+        PLY token types are mapped to legend indices once up front, and line starts
+        are tracked as NEWLINE tokens go by instead of searching back for each token
+    """
+
+    def __init__(self, lexer):
+        self.lexer = lexer
+
+        # A clone of the PLY lexer, so encoding never moves the parser's lexer
+        self.ply = lexer.lexer.clone()
+
+        self.types: Dict[str, int] = {token_type: TOKEN_INDEX[name] for token_type, name in TOKEN_MAPPING.items()}
+        self.types.update({r.upper(): TOKEN_INDEX["keyword"] for r in lexer.reserved})
+
+    def encode(self, source: str, line: int, offset: int, prev_line: int = 0,
+               resync: Optional[Callable[[int], bool]] = None) -> Tuple[array, array, array, list, Optional[int]]:
+        """
+            Lex source from the start of a line
+
+            Returns the token data (relative to a token on prev_line), the token count,
+            boundary flag and raw tokens of every scanned line and the line the scan
+            stopped at when resync reported the old token stream can be reused from there
+        """
+
+        data = array('I')
+        counts = array('I', [0])
+        boundaries = array('B', [1])
+
+        # Every token the lexer produced per line as (type, value, column, end column), for the parser
+        lines = []
+        line_tokens = []
+
+        types = self.types
+        append = data.extend
+
+        line_start = offset
+        prev_column = 0
+        count = 0
+
+        ply = self.ply
+        ply.input(source)
+        ply.lexpos = offset
+        ply.lineno = line + 1
+
+        while True:
+            token = ply.token()
+
+            if not token:
+                break
+
+            if token.type == "NEWLINE":
+                line_tokens.append(("NEWLINE", token.value, token.lexpos - line_start, ply.lexpos - line_start))
+                lines.append(tuple(line_tokens))
+                line_tokens = []
+
+                line_start = token.lexpos + 1
+                counts[-1] = count
+                count = 0
+
+                if resync is not None and resync(line + len(counts)):
+                    return data, counts, boundaries, lines, line + len(counts)
+
+                counts.append(0)
+                boundaries.append(1)
+                continue
+
+            if token.type == "COMMAND":
+                # Commands swallow any blank lines before the '/', the token
+                # itself already points past them
+                for _ in range(token.lineno - line - len(counts)):
+                    counts[-1] = count
+                    count = 0
+                    counts.append(0)
+                    boundaries.append(0)
+                    lines.append(tuple(line_tokens))
+                    line_tokens = []
+                    line_start = source.rfind('\n', 0, token.lexpos) + 1
+
+            column = token.lexpos - line_start
+            line_tokens.append((token.type, token.value, column, ply.lexpos - line_start))
+
+            if (token_type := types.get(token.type, None)) is None:
+                continue
+
+            current_line = line + len(counts) - 1
+
+            if current_line != prev_line:
+                prev_column = 0
+
+            append((current_line - prev_line, column - prev_column, len(token.value), token_type, 0))
+
+            prev_line = current_line
+            prev_column = column
+            count += 1
+
+        counts[-1] = count
+        lines.append(tuple(line_tokens))
+
+        return data, counts, boundaries, lines, None
+
+class CBTokenBuffer(object):
+    """
+        The tokens of a document as its token store lexed them, replayed to the parser
+
+        Tokens are kept per line with columns rather than offsets, so the lines an edit
+        did not touch are reused as they are, and only turned back into PLY tokens
+        when the parser asks for them
+    """
+
+    def __init__(self, source: str, lines: list):
+        self.source = source
+        self.lines = lines
+
+    def replay(self, ply) -> Callable[[], Optional[LexToken]]:
+        """
+            A token function for yacc handing out the tokens in order, then None
+
+            The PLY lexer is moved along as if it had lexed them itself, yacc reads its
+            position for empty productions
+        """
+
+        return partial(next, self._tokens(ply), None)
+
+    def _tokens(self, ply) -> Iterator[LexToken]:
+        offset = 0
+
+        for lineno, (text, line_tokens) in enumerate(zip(self.source.split('\n'), self.lines), 1):
+            for token_type, value, column, end in line_tokens:
+                token = LexToken()
+                token.type = token_type
+                token.value = value
+                token.lineno = lineno
+                token.lexpos = offset + column
+
+                ply.lexpos = offset + end
+                ply.lineno = lineno + 1 if token_type == "NEWLINE" else lineno
+
+                yield token
+
+            offset += len(text) + 1
+
+        ply.lexpos = len(self.source)
+
+class CBTokenStore(object):
+    """
+        Line-indexed semantic token storage for a single document
+
+        The document's tokens are kept as one packed array of LSP semantic token data
+        alongside a per-line token count, so an edit only has to re-lex from the first
+        changed line until the lexer lines back up with the previous token stream
+    """
+
+    def __init__(self):
+        self.data = array('I')
+        self.counts = array('I', [0])
+
+        # Whether the lexer passes through the start of each line, lines swallowed by
+        # the leading whitespace of a COMMAND token are not safe to restart from
+        self.boundaries = array('B', [1])
+
+        # Raw tokens of each line, None when the token data came from the cache
+        self.lines: Optional[list] = [()]
+
+    def lex(self, encoder: CBTokenEncoder, source: str):
+        """
+            Re-lex the whole document
+        """
+
+        self.data, self.counts, self.boundaries, self.lines, _ = encoder.encode(source, 0, 0)
+
+    def buffer(self, source: str) -> Optional[CBTokenBuffer]:
+        """
+            The raw tokens of the document for the parser, None if they are not known
+        """
+
+        if self.lines is None or len(self.lines) != source.count('\n') + 1:
+            return None
+
+        return CBTokenBuffer(source, self.lines)
+
+    def update(self, encoder: CBTokenEncoder, source: str, first: int, last: int):
+        """
+            Re-lex the document after lines first..last (new coordinates) were edited
+        """
+
+        old_counts = self.counts
+        old_boundaries = self.boundaries
+
+        source_lines = source.split('\n')
+        delta = len(source_lines) - len(old_counts)
+
+        if first >= len(source_lines) or first > len(old_counts) or self.lines is None:
+            return self.lex(encoder, source)
+
+        # A COMMAND may begin on any whitespace-only line above it, so start
+        # from the first line of the blank run preceding the edit
+        start = first
+        while start > 0 and not source_lines[start - 1].strip():
+            start -= 1
+
+        offset = sum(map(len, source_lines[:start])) + start
+        prev_line = self._last_line(start)
+
+        def resync(line: int) -> bool:
+            old = line - delta
+            return line > last and 0 <= old < len(old_counts) and old_boundaries[old]
+
+        data, counts, boundaries, lines, stop = encoder.encode(source, start, offset, max(prev_line, 0), resync)
+
+        begin = 5 * sum(old_counts[:start])
+
+        # Build new arrays rather than splicing in place, data already handed out stays intact
+        if stop is None:
+            self.data = self.data[:begin] + data
+            self.counts = old_counts[:start] + counts
+            self.boundaries = old_boundaries[:start] + boundaries
+            self.lines = self.lines[:start] + lines
+            return
+
+        end = 5 * sum(old_counts[:stop - delta])
+        following = self._next_line(stop - delta)
+
+        self.data = self.data[:begin] + data + self.data[end:]
+        self.counts = old_counts[:start] + counts + old_counts[stop - delta:]
+        self.boundaries = old_boundaries[:start] + boundaries + old_boundaries[stop - delta:]
+        self.lines = self.lines[:start] + lines + self.lines[stop - delta:]
+
+        # The first token after the splice is now relative to a different line
+        if following is not None:
+            new_prev = self._last_line(stop)
+            self.data[begin + len(data)] = following + delta - max(new_prev, 0)
+
+    def encode(self, start: int = 0, end: Optional[int] = None) -> array:
+        """
+            LSP semantic token data of lines start..end
+        """
+
+        if start == 0 and end is None:
+            return self.data
+
+        first = self._next_line(start)
+
+        if first is None or (end is not None and first >= end):
+            return array('I')
+
+        data = self.data[5 * sum(self.counts[:start]):5 * sum(self.counts[:end])]
+        data[0] = first
+
+        return data
+
+    def _last_line(self, line: int) -> int:
+        """
+            The last line before line holding a token, or -1
+        """
+
+        counts = self.counts
+        line = min(line, len(counts))
+
+        while line > 0:
+            line -= 1
+            if counts[line]:
+                return line
+
+        return -1
+
+    def _next_line(self, line: int) -> Optional[int]:
+        """
+            The first line from line onwards holding a token
+        """
+
+        counts = self.counts
+
+        while line < len(counts):
+            if counts[line]:
+                return line
+            line += 1
+
+        return None
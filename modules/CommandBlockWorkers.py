@@ -0,0 +1,40 @@
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Iterator, Optional
+from modules.CommandBlockLexer import CBLex
+from modules.CommandBlockParser import CBParse
+
+### Process pool workers
+# Each worker process builds its own parser once, then parses files sent to it
+_parser: Optional[CBParse] = None
+
+def _init_worker():
+    global _parser
+    _parser = CBParse(CBLex())
+
+def parser() -> CBParse:
+    """
+        The parser of this worker process
+    """
+    return _parser
+
+@contextmanager
+def spawn_pool(workers: int) -> Iterator[ProcessPoolExecutor]:
+    """
+        A pool of parser processes, work must be submitted within the block
+
+        Spawned processes import the main module first, under cbls.py that builds a
+        whole language server. This module stands in for it while the block runs, and
+        as processes are only started when work is submitted, all of them are started
+        then. The caller shuts the pool down
+    """
+
+    main = sys.modules["__main__"]
+    sys.modules["__main__"] = sys.modules[__name__]
+
+    try:
+        yield ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"), initializer=_init_worker)
+    finally:
+        sys.modules["__main__"] = main
@@ -0,0 +1,199 @@
+import asyncio
+import itertools
+import os
+from concurrent.futures import Executor
+from typing import Optional
+from lsprotocol.types import WorkDoneProgressBegin, WorkDoneProgressEnd, WorkDoneProgressReport
+from pygls.uris import from_fs_path, to_fs_path
+from modules import CommandBlockWorkers
+from modules.CommandBlockAnalysis import CBAnalysis, analyse, read_source
+from modules.CommandBlockCache import content_hash
+
+EXTENSIONS = (".cbscript", ".cblib")
+
+# Directories never holding sources worth indexing
+SKIPPED_DIRS = {"node_modules", "__pycache__"}
+
+def discover(folders: list[str]) -> list[tuple[str, float]]:
+    """
+        Every CommandBlockScript source under folders, with its modification time
+    """
+
+    files = []
+
+    for folder in folders:
+        for root, dirs, names in os.walk(folder):
+            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in SKIPPED_DIRS]
+
+            for name in names:
+                if not name.endswith(EXTENSIONS):
+                    continue
+
+                path = os.path.join(root, name)
+
+                try:
+                    files.append((path, os.stat(path).st_mtime))
+                except OSError:
+                    pass
+
+    return files
+
+def _analyse(uri: str, source: str, filename: str) -> CBAnalysis:
+    return analyse(CommandBlockWorkers.parser(), uri, source, filename)
+
+class CBWorkspaceIndexer(object):
+    """
+        Cold start indexing of every source in the workspace
+
+        Files are parsed across a pool of processes, each analysis is indexed as soon
+        as it comes back and progress is reported to the client with '$/progress'.
+        Workspaces with too few files left to parse to pay for starting the processes
+        use the parse threads
+    """
+
+    _tokens = itertools.count(1)
+
+    def __init__(self, server, workers: Optional[int] = None, threshold: int = 16):
+        self.server = server
+        self.workers = workers if workers is not None else max(1, (os.cpu_count() or 1) - 1)
+        self.threshold = threshold
+        self.task: Optional[asyncio.Task] = None
+
+    def folders(self) -> list[str]:
+        """
+            Paths of the workspace folders, or of the root when the client sent no folders
+        """
+
+        workspace = self.server.workspace
+        folders = [to_fs_path(folder.uri) for folder in workspace.folders.values()]
+
+        if not folders and workspace.root_path:
+            folders = [workspace.root_path]
+
+        return [folder for folder in folders if folder]
+
+    def start(self, folders: Optional[list[str]] = None) -> asyncio.Task:
+        """
+            Index the workspace in the background
+        """
+
+        if self.task is not None:
+            self.task.cancel()
+
+        self.task = asyncio.ensure_future(self.index(self.folders() if folders is None else folders))
+
+        return self.task
+
+    async def index(self, folders: list[str]) -> int:
+        """
+            Discover and index every source under folders, returns the number of files indexed
+
+            Files unchanged since an earlier run are restored from the cache, only the rest is parsed
+        """
+
+        loop = asyncio.get_running_loop()
+        files = await loop.run_in_executor(None, discover, folders)
+
+        if not files:
+            return 0
+
+        # Claim the libraries up front so imports met along the way are not loaded a second time
+        uris = []
+        for path, mtime in files:
+            uri = from_fs_path(path)
+            uris.append(uri)
+
+            if path.endswith(".cblib"):
+                self.server.libraries[uri] = mtime
+
+        token = await self.begin(len(uris))
+        entries = await loop.run_in_executor(None, self.load, uris)
+
+        done = reported = 0
+
+        def apply(analysis: CBAnalysis):
+            nonlocal done, reported
+
+            # Open documents are kept up to date by the scheduler
+            if analysis.uri not in self.server.workspace.text_documents:
+                self.server.apply_analysis(analysis)
+
+            done += 1
+
+            if token is not None and (percentage := 100 * done // len(uris)) > reported:
+                reported = percentage
+                self.server.progress.report(token, WorkDoneProgressReport(message=f"{done}/{len(uris)} files", percentage=percentage))
+
+        misses = []
+        for uri, source, filename, key, analysis in entries:
+            if analysis is not None:
+                apply(analysis)
+            else:
+                misses.append((uri, source, filename, key))
+
+        keys = {uri: key for uri, _, _, key in misses}
+        analysed = []
+        executor: Executor = self.server.scheduler.executor
+
+        try:
+            # run_in_executor submits right away, so the pool's processes are all started within the block
+            if len(misses) >= self.threshold and self.workers > 1:
+                with CommandBlockWorkers.spawn_pool(self.workers) as executor:
+                    futures = [loop.run_in_executor(executor, _analyse, uri, source, filename) for uri, source, filename, _ in misses]
+            else:
+                futures = [loop.run_in_executor(executor, self.server.analyse, uri, source, filename) for uri, source, filename, _ in misses]
+
+            for future in asyncio.as_completed(futures):
+                analysis = await future
+                analysed.append((keys[analysis.uri], analysis, None))
+                apply(analysis)
+        finally:
+            if executor is not self.server.scheduler.executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+            if token is not None:
+                self.server.progress.end(token, WorkDoneProgressEnd(message=f"Indexed {len(uris)} files"))
+
+        await loop.run_in_executor(None, self.server.cache.put_many, analysed)
+
+        return done
+
+    def load(self, uris: list[str]) -> list[tuple]:
+        """
+            Read every file and look it up in the cache, (uri, source, filename, key, cached analysis) per readable file
+        """
+
+        entries = []
+
+        for uri in uris:
+            if (read := read_source(uri)) is None:
+                continue
+
+            key = content_hash(*read)
+            analysis, _ = self.server.cache.get(key, uri)
+            entries.append((uri, *read, key, analysis))
+
+        return entries
+
+    async def begin(self, total: int) -> Optional[str]:
+        """
+            Start a progress report with the client, None if it does not support them
+        """
+
+        # Set once the client has initialized the server
+        capabilities = getattr(self.server.lsp, "client_capabilities", None)
+        window = capabilities.window if capabilities is not None else None
+
+        if window is None or not window.work_done_progress:
+            return None
+
+        token = f"cbls-index-{next(self._tokens)}"
+
+        try:
+            await self.server.progress.create_async(token)
+        except Exception:
+            return None
+
+        self.server.progress.begin(token, WorkDoneProgressBegin(title="Indexing workspace", message=f"0/{total} files", percentage=0, cancellable=False))
+
+        return token
@@ -19,10 +19,13 @@ TOKEN_TYPES = [
     "variable"
 ]
 
+# Legend index of each token type
+TOKEN_INDEX = {token_type: i for i, token_type in enumerate(TOKEN_TYPES)}
+
 TOKEN_MAPPING = {
     # Variables and Identifiers
     "ID": "variable",
-    "FUNCTIONID": "function",
+    "FUNCTION_ID": "function",
 
     # String Literals
     "STRING": "string",
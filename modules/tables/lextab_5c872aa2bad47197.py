@@ -0,0 +1,10 @@
+# lextab_5c872aa2bad47197.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ACTIONBAR', 'ADVANCEMENT', 'ALIGN', 'AND', 'ARRAY', 'AS', 'AT', 'ATID', 'BINARY', 'BLOCK', 'BLOCK_DATA', 'BLOCK_TAG', 'BY', 'CASE', 'CLOCK', 'COLON', 'COMMA', 'COMMAND', 'COMMENT', 'CREATE', 'DECIMAL', 'DEFAULT', 'DEFINE', 'DESC', 'DIR', 'DIVIDE', 'DIVIDE_EQUALS', 'DO', 'DOLLAR', 'DOT', 'ELSE', 'END', 'ENTITY', 'ENTITY_TAG', 'EQUALS', 'EQUALS_EQUALS', 'EYES', 'FACING', 'FALSE', 'FEET', 'FLOAT', 'FOR', 'FUNCTION', 'FUNCTION_ID', 'GREATER', 'GREATER_EQUALS', 'HERE', 'HEX', 'ID', 'IF', 'IMPORT', 'IN', 'ITEM_MODIFIER', 'ITEM_TAG', 'JSON', 'KEYS', 'LBRACKET', 'LCURLY', 'LESS', 'LESS_EQUALS', 'LOOT_TABLE', 'LPAREN', 'MACRO', 'MACROS', 'MINUS', 'MINUS_EQUALS', 'MINUS_MINUS', 'MODULO', 'MODULO_EQUALS', 'MOVE', 'NAME', 'NEGATION', 'NEWLINE', 'NOT', 'ON', 'OR', 'OVERWORLD', 'PLUS', 'PLUS_EQUALS', 'PLUS_PLUS', 'POP', 'POWER', 'PREDICATE', 'PUSH', 'RBRACKET', 'RCURLY', 'RECIPE', 'REF', 'REMOVE', 'RESET', 'RESULT', 'RETURN', 'ROTATED', 'RPAREN', 'SEMICOLON', 'SHAPED', 'STRING', 'SUBTITLE', 'SUCCESS', 'SWITCH', 'TELL', 'THEN', 'THE_END', 'THE_NETHER', 'TILDE', 'TILDE_EMPTY', 'TIMES', 'TIMES_EQUALS', 'TITLE', 'TO', 'TRUE', 'UNLESS', 'WHILE', 'WHITESPACE', 'WITH'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_FUNCTION_ID>[a-zA-Z_][a-zA-Z0-9_]*\\()|(?P<t_ID>[a-zA-Z_][a-zA-Z0-9_]*)|(?P<t_ATID>@[a-zA-Z_][a-zA-Z0-9_]*)|(?P<t_COMMAND>(?m:^\\s*\\/.+))|(?P<t_TILDE_EMPTY>~[ \\t])|(?P<t_STRING>(\\"((\\\\.)|[^\\"\\n])*\\")|(\'((\\\\.)|[^\'\\n])*\'))|(?P<t_BINARY>0b[01]+)|(?P<t_HEX>0x[a-fA-F0-9]+)|(?P<t_JSON>-?(?:0|[1-9]\\d*)(?:\\.\\d+)?(?:[eE][+-]?\\d+)?[fFdD] | -?(?:0|[1-9]\\d*)[bBsSlL])|(?P<t_COMMENT>\\#.+)|(?P<t_NEWLINE>\\n)|(?P<t_WHITESPACE>[ \\t])|(?P<t_FLOAT>\\d+\\.\\d+)|(?P<t_PLUS_PLUS>\\+\\+)|(?P<t_DECIMAL>\\d+)|(?P<t_MODULO_EQUALS>\\%=)|(?P<t_PLUS_EQUALS>\\+=)|(?P<t_TIMES_EQUALS>\\*=)|(?P<t_COLON>\\:)|(?P<t_COMMA>\\,)|(?P<t_DIVIDE_EQUALS>/=)|(?P<t_DOLLAR>\\$)|(?P<t_DOT>\\.)|(?P<t_EQUALS_EQUALS>==)|(?P<t_GREATER_EQUALS>>=)|(?P<t_LBRACKET>\\[)|(?P<t_LCURLY>\\{)|(?P<t_LESS_EQUALS><=)|(?P<t_LPAREN>\\()|(?P<t_MINUS_EQUALS>-=)|(?P<t_MINUS_MINUS>--)|(?P<t_PLUS>\\+)|(?P<t_POWER>\\^)|(?P<t_RBRACKET>\\])|(?P<t_RCURLY>\\})|(?P<t_RPAREN>\\))|(?P<t_TIMES>\\*)|(?P<t_DIVIDE>/)|(?P<t_EQUALS>=)|(?P<t_GREATER>>)|(?P<t_LESS><)|(?P<t_MINUS>-)|(?P<t_MODULO>%)|(?P<t_NEGATION>!)|(?P<t_REF>&)|(?P<t_SEMICOLON>;)|(?P<t_TILDE>~)', [None, ('t_FUNCTION_ID', 'FUNCTION_ID'), ('t_ID', 'ID'), ('t_ATID', 'ATID'), ('t_COMMAND', 'COMMAND'), ('t_TILDE_EMPTY', 'TILDE_EMPTY'), ('t_STRING', 'STRING'), None, None, None, None, None, None, ('t_BINARY', 'BINARY'), ('t_HEX', 'HEX'), ('t_JSON', 'JSON'), ('t_COMMENT', 'COMMENT'), ('t_NEWLINE', 'NEWLINE'), ('t_WHITESPACE', 'WHITESPACE'), (None, 'FLOAT'), (None, 'PLUS_PLUS'), (None, 'DECIMAL'), (None, 'MODULO_EQUALS'), (None, 'PLUS_EQUALS'), (None, 'TIMES_EQUALS'), (None, 'COLON'), (None, 'COMMA'), (None, 'DIVIDE_EQUALS'), (None, 'DOLLAR'), (None, 'DOT'), (None, 'EQUALS_EQUALS'), (None, 'GREATER_EQUALS'), (None, 'LBRACKET'), (None, 'LCURLY'), (None, 'LESS_EQUALS'), (None, 'LPAREN'), (None, 'MINUS_EQUALS'), (None, 'MINUS_MINUS'), (None, 'PLUS'), (None, 'POWER'), (None, 'RBRACKET'), (None, 'RCURLY'), (None, 'RPAREN'), (None, 'TIMES'), (None, 'DIVIDE'), (None, 'EQUALS'), (None, 'GREATER'), (None, 'LESS'), (None, 'MINUS'), (None, 'MODULO'), (None, 'NEGATION'), (None, 'REF'), (None, 'SEMICOLON'), (None, 'TILDE')])]}
+_lexstateignore = {'INITIAL': '\r'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
@@ -0,0 +1,454 @@
+
+# parsetab_7d554cc3d5edeee7.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'ACTIONBAR ADVANCEMENT ALIGN AND ARRAY AS AT ATID BINARY BLOCK BLOCK_DATA BLOCK_TAG BY CASE CLOCK COLON COMMA COMMAND COMMENT CREATE DECIMAL DEFAULT DEFINE DESC DIR DIVIDE DIVIDE_EQUALS DO DOLLAR DOT ELSE END ENTITY ENTITY_TAG EQUALS EQUALS_EQUALS EYES FACING FALSE FEET FLOAT FOR FUNCTION FUNCTION_ID GREATER GREATER_EQUALS HERE HEX ID IF IMPORT IN ITEM_MODIFIER ITEM_TAG JSON KEYS LBRACKET LCURLY LESS LESS_EQUALS LOOT_TABLE LPAREN MACRO MACROS MINUS MINUS_EQUALS MINUS_MINUS MODULO MODULO_EQUALS MOVE NAME NEGATION NEWLINE NOT ON OR OVERWORLD PLUS PLUS_EQUALS PLUS_PLUS POP POWER PREDICATE PUSH RBRACKET RCURLY RECIPE REF REMOVE RESET RESULT RETURN ROTATED RPAREN SEMICOLON SHAPED STRING SUBTITLE SUCCESS SWITCH TELL THEN THE_END THE_NETHER TILDE TILDE_EMPTY TIMES TIMES_EQUALS TITLE TO TRUE UNLESS WHILE WHITESPACE WITHparsed : cbscript\n                    | cblibparsed : optnewlines cblibcbscript : scriptcbscript : optnewlines scriptcbscript : optnewlines error scriptcblib : top_level_blocksscript : dir optdesc file_params top_level_blocksscript : DIR stringdir : DIR string newlinesdir : DIR error newlinesoptdesc : DESC string newlines\n                    | emptyoptdesc : DESC error newlinesfile_params : file_param file_params optnewlines\n                        | emptyfile_param : ID int newlinesfile_param : ID error newlinestop_level_block : advancement\n                            | array\n                            | const_assign optnewlines\n                            | import\n                            | item_modifier\n                            | loot_table\n                            | selector_assign\n                            | selector_define_block\n                            | sections\n                            | predicatetop_level_block : error newlinestop_level_blocks : top_level_block top_level_blocks optnewlines\n                            | emptyimport : IMPORT ID optnewlinessections : section sections optnewlines\n                    | emptysection : reset_section\n                    | clock_section\n                    | function_section optnewlines\n                    | macro_sectionreset_section : RESET newlines code_blocks END newlinesreset_section : RESET error END newlinesclock_section : CLOCK ID newlines code_blocks END newlinesclock_section : CLOCK error END newlinesfunction_section : FUNCTION FUNCTION_ID id_list RPAREN newlines code_blocks ENDfunction_section : FUNCTION error ENDid_list : ID COMMA id_list\n                    | ID\n                    | emptyfunction_call : ID COLON FUNCTION_ID expr_list RPAREN opt_with_macro\n                            | FUNCTION_ID expr_list RPAREN opt_with_macrofunction_call_block : with function_call\n                                | function_callmethod_call : full_selector DOT FUNCTION_ID expr_list RPAREN opt_with_macromethod_call_block : with method_call\n                                | method_callcode_blocks : code_block code_blocks optnewlines\n                        | emptycode_block : error newlinescode_block : COMMAND optnewlinescode_block : MOVE full_selector rel_coords optnewlinescode_block : assign optnewlinescode_block : const_assign optnewlinescode_block : variable EQUALS create_block optnewlines\n                        | create_block optnewlinescode_block : DEFINE NAME ID EQUALS string optnewlinescode_block : DEFINE error optnewlinescode_block : selector_assign optnewlines\n                        | selector_define_block optnewlinescode_block : function_call_block optnewlines\n                        | method_call_block optnewlines\n                        | macro_call optnewlines\n                        | with_anon optnewlinesexecute_items : execute_item execute_items\n                            | emptyexecute_item : IF conditionals\n                        | UNLESS conditionals\n                        | AS full_selector\n                        | AT full_selector opt_anchor\n                        | AT full_selector opt_anchor rel_coords\n                        | AT opt_anchor rel_coords\n                        | AT vector_expr\n                        | AT LPAREN const_value RPAREN vector_expr\n                        | IN OVERWORLD\n                        | IN THE_NETHER\n                        | IN THE_ENDexecute_item : ON IDexecute_item : ROTATED full_selectorexecute_item : FACING full_selectorexecute_item : FACING rel_coordsexecute_item : ALIGN IDopt_anchor : EYES\n                        | FEET\n                        | emptyopt_const_value : const_value\n                            | emptylocal_coord : POWER opt_const_valuerel_coord : const_value\n                        | POWER const_value\n                        | TILDE const_value\n                        | TILDE\n                        | TILDE_EMPTYrel_coords : rel_coord rel_coord rel_coord\n                        | local_coord local_coord local_coordopt_coords : AT rel_coords\n                        | emptyelse_list : else_item else_list\n                        | emptyelse_item : ELSE execute_items newlines code_blocks\n                        | ELSE newlines code_blockscode_block : execute_items newlines code_blocks else_list END optnewlinescode_block : execute_items DO code_block\n                        | execute_items THEN code_blockcode_block : IF const_value newlines code_blocks else_list END optnewlinescode_block : AS variable newlines code_blocks else_list END optnewlines\n                        | AS variable LPAREN ATID RPAREN newlines code_blocks else_list END optnewlinescode_block : AS variable DO code_block else_list optnewlines\n                        | AS variable LPAREN ATID RPAREN DO code_block optnewlinescode_block : AS create_block newlines code_blocks else_list END optnewlines\n                        | AS create_block DO code_block optnewlinesconditional : full_selector\n                        | PREDICATE ID\n                        | expr EQUALS_EQUALS expr\n                        | expr LESS expr\n                        | expr LESS_EQUALS expr\n                        | expr GREATER expr\n                        | expr GREATER_EQUALS expr\n                        | vector_variable EQUALS_EQUALS vector_variable\n                        | NOT expr\n                        | expr\n                        | nbt_object\n                        | nbt_listconditionals : conditional AND conditionals\n                        | conditionalconditional : BLOCK rel_coords const_ID opt_block_state opt_tile_data\n                        | BLOCK rel_coords ID opt_block_state opt_tile_data\n                        | BLOCK const_ID opt_block_state opt_tile_data\n                        | BLOCK ID opt_block_state opt_tile_dataopt_block_state : LBRACKET block_states RBRACKET\n                            | emptyblock_states : ID EQUALS ID COMMA block_states\n                        | ID EQUALS virtual_int COMMA block_states\n                        | FACING EQUALS ID COMMA block_states\n                        | FACING EQUALS virtual_int COMMA block_states\n                        | ID EQUALS ID\n                        | ID EQUALS virtual_int\n                        | FACING EQUALS ID\n                        | FACING EQUALS virtual_intopt_tile_data : json_object\n                            | emptycode_block : IF const_value newlines code_blocks ELSE newlines code_blocks END optnewlinescode_block : FOR variable EQUALS expr TO expr BY expr newlines code_blocks END optnewlines\n                        | FOR variable EQUALS expr TO expr newlines code_blocks END optnewlines\n                        | FOR const_ID IN const_value newlines code_blocks END optnewlines\n                        | FOR ATID IN full_selector newlines code_blocks END optnewlinescode_block : WHILE conditionals newlines code_blocks END optnewlines\n                        | WHILE conditionals execute_items newlines code_blocks END optnewlinescreate_block : CREATE ATID rel_coords\n                        | CREATE ATIDcreate_block : CREATE ATID LBRACKET const_value RBRACKET rel_coords\n                        | CREATE ATID LBRACKET const_value RBRACKETmacro_section : MACRO DOLLAR FUNCTION_ID macro_args newlines code_blocks END optnewlinesmacro_args : macro_params RPAREN\n                        | emptymacro_params : const_ID COMMA macro_params\n                        | const_ID\n                        | emptywith : WITH newlines with_itemswith_items : with_item with_items\n                        | with_itemwith_item : DOLLAR LPAREN ID RPAREN EQUALS expr newlines\n                        | DOLLAR LPAREN ID RPAREN EQUALS string newlinesopt_with_macro : WITH MACROS\n                            | emptywith_anon : with DO newlines code_blocks END optnewlinesmacro_call : DOLLAR FUNCTION_ID macro_call_argsmacro_call_args : macro_call_params RPAREN\n                            | emptymacro_call_params : macro_call_params COMMA macro_call_params\n                                | macro_call_params\n                                | const_value\n                                | emptyfull_selector : ATIDfull_selector : ATID LBRACKET const_int RBRACKET\n                        | ATID LBRACKET qualifiers RBRACKETfull_selector : ATID LBRACKET error RBRACKETqualifiers : qualifier\n                        | emptyqualifiers : qualifiers COMMA qualifier\n                        | qualifiers AND qualifierqualifier : ID EQUALSqualifier : ID EQUALS NEGATION ID\n                        | NOT IDqualifier : IDqualifier : ID EQUALS const_int DOT DOT const_int\n                    | ID EQUALS DOT DOT const_int\n                    | ID EQUALS const_int DOT DOTqualifier : ID EQUALS const_int\n                     | ID EQUALS ID\n                     | NAME EQUALS ID\n                     | ID EQUALS_EQUALS const_int\n                     | ID GREATER_EQUALS const_int\n                     | ID LESS_EQUALS const_int\n                     | ID GREATER const_int\n                     | ID LESS const_int\n                     | ID EQUALS json_objectselector_define_block : DEFINE ATID EQUALS full_selector newlines selector_definition END optnewlines\n                                | DEFINE ATID COLON full_selector newlines selector_definition END optnewlines\n                                | DEFINE ATID COLON uuid LPAREN full_selector RPAREN newlines selector_definition END optnewlinesselector_definition : DEFINE error END optnewlinesselector_definition : selector_item newlines selector_definition\n                                | emptyselector_item : ID EQUALS full_selector\n                            | ID COLON full_selectorselector_item : ID EQUALS data_path data_type const_value\n                            | ID COLON data_path data_type const_value\n                            | ID EQUALS data_path data_type\n                            | ID COLON data_path data_typeselector_item : LESS ID GREATER EQUALS data_path data_type const_value\n                            | LESS ID GREATER COLON data_path data_type const_value\n                            | LESS ID GREATER EQUALS data_path data_type\n                            | LESS ID GREATER COLON data_path data_typeselector_item : CREATE json_objectselector_item : function_sectionselector_item : arrayselector_item : predicateselector_assign : ATID EQUALS full_selector optnewlinesarray : ARRAY ID LBRACKET const_value TO const_value RBRACKET\n                    | ARRAY ID LBRACKET const_value RBRACKETadvancement : ADVANCEMENT ID json_object optnewlinesloot_table_type : BLOCK\n                            | ENTITYloot_table : LOOT_TABLE loot_table_type ID COLON ID json_object optnewlines\n                        | LOOT_TABLE loot_table_type ID json_object optnewlinespredicate : PREDICATE ID json_object optnewlinesitem_modifier : ITEM_MODIFIER ID json_object optnewlinescode_block : TELL full_selector string optnewlinescode_block : TITLE full_selector string optnewlines\n                        | SUBTITLE full_selector string optnewlines\n                        | ACTIONBAR full_selector string optnewlinescode_block : TITLE full_selector const_value const_value const_value string optnewlines\n                        | SUBTITLE full_selector const_value const_value const_value string optnewlines\n                        | ACTIONBAR full_selector const_value const_value const_value string optnewlinesassign : variable EQUALS expr\n                    | variable PLUS_EQUALS expr\n                    | variable MINUS_EQUALS expr\n                    | variable TIMES_EQUALS expr\n                    | variable DIVIDE_EQUALS expr\n                    | variable MODULO_EQUALS exprassign : variable PLUS_PLUS\n                    | variable MINUS_MINUSassign : RETURN exprconst_assign : DOLLAR ID EQUALS const_valuevariable : ID DOT ID\n                    | full_selector DOT IDvariable : IDvariable : const_intvariable : ID LBRACKET virtual_int RBRACKET\n                    | ID LBRACKET expr RBRACKETvariable : full_selector DOT ID LBRACKET virtual_int RBRACKET\n                    | full_selector DOT ID LBRACKET expr RBRACKETvariable : LBRACKET ID AT rel_coords RBRACKET DOT ID LBRACKET macro_call_params RBRACKET\n                    | LBRACKET ID RBRACKET DOT ID LBRACKET macro_call_params RBRACKET\n                    | LBRACKET ID AT rel_coords RBRACKET DOT ID\n                    | LBRACKET ID RBRACKET DOT IDvariable : REF full_selectorvariable : ID COLON data_path\n                    | COLON data_pathvariable : SUCCESS NEWLINE COMMAND\n                    | RESULT NEWLINE COMMANDvariable : virtual_intvector_variable : LESS ID GREATER\n                            | full_selector DOT LESS ID GREATER\n                            | LESS variable COMMA variable COMMA variable GREATER\n                            | const_vectorvector_expr : LPAREN vector_expr RPAREN\n                        | LESS expr COMMA expr COMMA expr GREATER\n                        | full_selector DOT LESS ID GREATER\n                        | LESS ID GREATER\n                        | HERE LPAREN const_value RPAREN\n                        | HERE\n                        | const_vectorvector_expr : vector_expr PLUS vector_expr\n                        | vector_expr MINUS vector_exprvector_expr : vector_expr PLUS expr\n                        | expr PLUS vector_expr\n                        | vector_expr MINUS expr\n                        | expr TIMES vector_expr\n                        | vector_expr TIMES expr\n                        | vector_expr DIVIDE expr\n                        | vector_expr MODULO exprvector_expr : MINUS vector_exprassign : vector_variable EQUALS vector_expr\n                    | vector_variable PLUS_EQUALS vector_expr\n                    | vector_variable MINUS_EQUALS vector_exprassign : vector_variable EQUALS expr\n                    | vector_variable PLUS_EQUALS expr\n                    | vector_variable MINUS_EQUALS expr\n                    | vector_variable TIMES_EQUALS expr\n                    | vector_variable DIVIDE_EQUALS expr\n                    | vector_variable MODULO_EQUALS exprexpr_list : expr_list COMMA expr\n                        | expr\n                        | emptyexpr : variableexpr : expr PLUS expr\n                | expr MINUS expr\n                | expr TIMES expr\n                | expr DIVIDE expr\n                | expr MODULO exprexpr : MINUS exprexpr : expr POWER intexpr : vector_expr TIMES vector_exprexpr : function_call\n                    | method_callexpr : LPAREN expr RPARENdata_path : ID json_object\n                        | ID\n                        | FACINGdata_path : ID LBRACKET json_object RBRACKET\n                        | ID LBRACKET const_int RBRACKETdata_path : data_path DOT data_pathdata_type : IDjson_object : LCURLY optnewlines json_members optnewlines RCURLYjson_object : LCURLY error RCURLYjson_members : json_pair COMMA optnewlines json_members\n                        | json_pair\n                        | emptyjson_pair : ID COLON optnewlines json_value\n                        | string COLON optnewlines json_value\n                        | FACING COLON optnewlines json_value\n                        | BLOCK COLON optnewlines json_value\n                        | PREDICATE COLON optnewlines json_valuejson_value : DOLLAR ID\n                        | JSON\n                        | number\n                        | string\n                        | json_object\n                        | json_array\n                        | json_literal_array\n                        | TRUE\n                        | FALSEjson_array : LBRACKET optnewlines json_elements optnewlines RBRACKETjson_elements : json_value COMMA optnewlines json_elements\n                            | json_value\n                            | emptyjson_literal_array : LBRACKET optnewlines ID SEMICOLON optnewlines json_literal_elements optnewlines RBRACKETjson_literal_elements : json_literal_value COMMA optnewlines json_literal_elements\n                                    | json_literal_value\n                                    | emptyjson_literal_value : DOLLAR ID\n                                | number\n                                | emptyassign : nbt_list EQUALS nbt\n                    | nbt_object EQUALS nbtassign : nbt_list PLUS_EQUALS nbtassign : nbt_object PLUS_EQUALS nbtcode_block : REMOVE nbt_pathnbt_list : full_selector DOT LBRACKET data_path RBRACKETnbt_list : ID COLON LBRACKET data_path RBRACKET\n                    | COLON LBRACKET data_path RBRACKETnbt_list : full_selector DOT LCURLY data_path RCURLYnbt_list : ID COLON LCURLY data_path RCURLY\n                    | COLON LCURLY data_path RCURLYnbt_path : full_selector DOT data_pathnbt_object : ID COLON data_path\n                    | COLON data_pathnbt_path : nbt_object\n                    | nbt_listnbt : nbt_path\n                | json_object\n                | stringstring : STRINGnumber : int\n                    | floatint : BINARY\n                | DECIMAL\n                | HEXint : MINUS BINARY\n                | MINUS DECIMAL\n                | MINUS HEXfloat : FLOATfloat : MINUS FLOATconst_value : const_expr\n                        | const_string\n                        | const_intconst_ID : DOLLAR IDconst_string : DOLLAR stringconst_int : intconst_expr : number\n                        | string\n                        | const_IDconst_expr : const_expr PLUS const_expr\n                        | const_expr MINUS const_expr\n                        | const_expr TIMES const_expr\n                        | const_expr DIVIDE const_expr\n                        | const_expr MODULO const_exprconst_expr : const_expr EQUALS_EQUALS const_expr\n                        | const_expr LESS const_expr\n                        | const_expr LESS_EQUALS const_expr\n                        | const_expr GREATER const_expr\n                        | const_expr GREATER_EQUALS const_exprconst_expr : const_expr NOT EQUALS const_expr\n                        | const_expr TIMES TIMES const_exprconst_expr : const_expr OR const_expr\n                        | const_expr AND const_exprconst_expr : MINUS const_exprconst_expr_list : const_expr COMMA optnewlines const_expr_list\n                            | const_expr\n                            | emptyconst_expr : LBRACKET optnewlines const_expr_list optnewlines RBRACKET\n                        | LPAREN optnewlines const_expr_list optnewlines RPARENconst_expr : const_expr LBRACKET const_expr RBRACKETconst_vector : LESS const_expr GREATERconst_expr : const_expr DOT const_exprconst_expr : DOLLAR FUNCTION_ID optnewlines const_expr_list optnewlines RPARENvirtual_number : number\n                            | const_IDvirtual_int : int\n                        | const_IDuuid : int MINUS int MINUS int MINUS int MINUS intnewlines : newlines NEWLINE\n                    | NEWLINEoptnewlines : newlines\n                        | emptyempty :'
+    
+_lr_action_items = {'DIR':([0,4,8,9,13,44,47,],[11,11,-422,-423,-421,11,-420,]),'NEWLINE':([0,4,6,8,9,10,12,13,14,15,16,17,18,19,20,21,22,23,32,34,35,36,37,38,44,45,46,47,48,50,51,52,53,54,55,56,60,67,68,70,71,73,79,80,81,83,84,85,86,87,88,89,92,93,95,96,99,100,102,103,104,105,108,109,111,114,115,116,117,118,119,120,125,138,140,144,145,148,149,151,153,154,155,161,162,163,165,166,167,171,172,174,175,176,177,178,179,180,182,184,185,186,187,188,189,191,193,194,195,196,197,199,201,202,203,206,207,208,209,210,213,214,221,222,223,225,229,230,231,232,233,234,235,236,237,238,239,240,241,242,246,247,248,249,251,252,254,255,257,259,260,263,264,265,266,267,274,275,276,277,284,286,287,290,291,294,306,308,310,312,313,314,317,321,322,325,326,327,328,334,335,341,344,345,346,347,348,349,352,354,355,356,357,358,359,360,362,363,365,367,369,370,371,372,373,374,380,381,383,399,400,401,402,403,404,405,406,407,408,410,420,421,424,425,426,427,432,433,434,435,436,437,438,440,441,451,452,453,456,457,458,464,465,469,484,485,492,494,496,497,498,501,505,506,507,508,510,512,516,520,521,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,543,545,547,554,555,559,561,562,563,564,565,568,570,571,573,580,582,583,584,585,586,588,589,592,593,594,595,596,597,598,599,600,602,603,604,606,607,608,609,610,611,612,614,615,617,618,619,620,621,622,625,636,641,642,643,647,653,655,656,661,662,663,665,668,669,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,687,688,689,691,692,693,694,695,696,697,698,699,700,704,706,707,709,710,712,713,714,716,718,720,721,723,724,728,729,730,732,733,734,735,736,737,738,743,745,750,751,752,753,754,759,760,767,768,769,770,771,773,774,789,790,794,795,796,800,801,802,803,804,805,806,807,808,809,810,811,813,817,818,819,820,821,825,826,828,829,831,833,834,835,844,845,846,847,848,849,850,853,854,855,856,858,859,860,861,862,863,864,865,866,868,869,870,871,872,873,874,879,880,882,884,887,888,890,891,892,893,894,895,896,897,898,899,902,903,904,907,908,909,910,911,912,915,916,917,918,919,920,923,924,927,928,929,930,931,932,936,937,938,943,944,952,954,955,957,958,959,960,961,962,963,964,966,968,970,971,973,974,977,979,980,986,987,989,990,992,993,994,996,997,998,999,1000,1002,1007,1008,1009,1011,1012,1013,1014,1015,1016,1017,1019,1021,1022,1023,1024,1025,1027,1028,1029,1031,1032,1033,1034,1035,1036,],[13,-424,13,47,-34,-424,-424,-421,-19,-20,13,-22,-23,-24,-25,-26,-27,-28,-424,-35,-36,13,-38,13,13,-31,47,-420,-424,-13,13,13,-371,13,-21,-423,13,13,-34,-37,47,13,-424,-424,-16,13,13,47,47,-30,13,13,-32,13,-181,13,-33,13,-424,-56,13,13,13,13,13,13,13,13,13,13,13,13,-418,-255,-269,323,324,-51,-54,-424,-273,-387,13,-374,-375,-376,13,47,13,-44,-424,13,13,13,47,47,-228,-424,13,-382,-383,-384,-388,-389,-390,13,-372,-373,-380,-251,-234,13,-225,13,13,-233,13,13,47,-58,-60,-61,-248,-249,-63,13,-66,-67,-68,-69,-70,-71,47,-424,-424,13,-74,-255,-132,-390,13,13,-372,-119,-254,-128,-129,-130,-303,-312,-313,-279,13,13,-76,-254,-82,-83,-84,13,-356,-366,-367,-250,-254,-280,-424,-424,-80,-90,-91,-92,-264,-316,-317,-157,-50,-53,13,-72,-73,13,47,-75,-85,-86,-87,-88,-96,-99,-100,-89,-377,-378,-379,47,47,13,13,-162,-15,47,47,13,-325,-326,-323,-424,-227,-405,-374,-375,-376,-380,-372,-424,13,-386,-385,-232,47,47,47,-55,13,-253,13,-242,-243,-244,-245,-246,-247,-65,-252,-110,-111,47,-309,-290,-372,13,-127,-120,-424,-424,-266,47,-424,47,-424,-266,47,13,13,13,13,13,-365,-291,-294,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,-77,-79,13,-290,-309,-315,-267,-268,-156,13,47,-424,-76,-270,-412,-424,-95,-94,-98,13,47,47,-161,13,13,13,13,13,13,13,-407,-408,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,13,-424,13,-182,-183,-184,13,-222,-223,-224,-59,-62,-256,-257,-424,-106,13,-131,-314,-274,-265,-121,-122,-123,-124,-125,-304,-284,-305,-306,-286,-307,-308,-310,-126,-424,-424,-424,-138,-424,-311,-287,-281,-283,-282,-285,-288,-289,-424,13,-265,13,13,47,-235,-236,-237,-238,-363,-364,-277,-175,-78,-311,-287,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,47,-322,-424,13,-226,-402,-401,-411,13,-231,13,47,-221,13,13,-357,-271,-360,-424,13,-358,-361,-424,13,-105,13,47,13,-424,-424,-135,-147,-148,-136,-278,13,13,-118,47,47,13,-263,-81,-318,-319,-159,13,-171,-43,13,-324,-327,-333,-334,-335,-336,-337,-338,-339,-340,13,-328,-329,-330,-331,-409,-424,-410,13,-205,-211,-212,-206,47,-258,-259,-52,-64,-48,-109,47,-108,13,47,-133,-134,-137,13,47,-424,-115,13,13,-154,13,13,13,13,-276,-158,-173,-160,-332,-424,-381,-406,-414,-321,-215,-216,-107,-112,-113,13,-117,47,13,13,-155,-239,-240,-241,-262,-272,13,-343,-344,-213,-214,13,13,-275,-116,13,-152,-153,-261,13,13,13,13,-219,-220,-207,-149,13,47,13,47,47,-341,-424,-424,-217,-218,-114,-151,-260,13,-347,-348,-350,-342,13,13,-349,-150,-345,-424,-346,]),'error':([0,4,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,32,34,35,36,37,38,39,40,45,46,47,48,49,50,53,55,56,60,67,68,70,71,79,80,81,82,85,86,88,89,92,93,95,96,99,100,102,103,105,108,109,111,112,114,115,116,117,118,119,125,138,140,148,149,154,161,162,163,166,171,174,177,178,179,184,185,186,187,188,189,193,194,195,196,197,199,200,201,206,208,209,210,213,214,221,222,223,225,229,230,231,232,233,234,235,236,237,257,259,260,263,284,286,287,290,291,294,306,317,321,322,325,326,327,352,354,355,357,358,359,360,362,369,370,371,380,383,399,400,401,402,403,404,407,408,410,424,425,426,427,432,433,434,435,436,437,438,440,441,451,452,453,456,457,494,496,497,498,501,505,507,508,510,512,516,520,521,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,554,555,559,561,562,563,565,568,573,580,582,583,584,586,588,602,603,604,606,607,608,609,610,611,612,614,615,617,620,621,622,625,634,647,653,655,656,661,662,668,669,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,729,730,732,733,734,735,736,737,738,743,745,750,751,752,753,754,759,768,769,770,771,774,789,795,800,802,803,804,805,806,807,808,809,811,826,829,831,833,834,835,844,846,847,848,849,850,853,854,872,874,880,887,890,891,892,893,894,895,896,897,898,899,907,908,909,910,911,915,916,917,918,919,920,923,924,927,932,943,944,952,954,955,957,958,959,960,961,962,963,964,977,979,980,986,989,990,992,1000,1002,1007,1008,1009,1019,1021,1022,1029,1033,],[6,44,-422,-34,-424,52,6,-421,-19,-20,-424,-22,-23,-24,-25,-26,-27,-28,-424,-35,-36,-424,-38,72,74,76,-34,-29,-420,-424,84,-13,-371,-21,-423,-424,-424,-34,-37,104,6,-424,-16,176,-10,-11,-424,181,-32,-424,-181,-424,-33,-424,104,-56,-424,-424,-424,-424,225,-424,-424,-424,-424,-424,-424,-418,-255,-269,-51,-54,-387,-374,-375,-376,104,-44,-424,-12,-14,-228,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-234,-424,413,-225,-233,-424,-57,-58,-60,-61,-248,-249,-63,-424,-66,-67,-68,-69,-70,-71,104,104,104,-303,-312,-313,-279,-356,-366,-367,-250,-254,-280,-424,-264,-316,-317,-157,-50,-53,-96,-99,-100,-377,-378,-379,-40,-42,-15,-17,-18,-323,-227,-405,-374,-375,-376,-380,-372,-386,-385,-232,-39,-55,-424,-253,-424,-242,-243,-244,-245,-246,-247,-65,-252,-110,-111,104,-309,-290,104,104,104,104,-266,104,-424,-424,-424,-424,-365,-291,-294,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,-290,-309,-315,-267,-268,-156,104,-424,-412,-424,-95,-94,-98,104,104,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-424,-182,-183,-184,788,-59,-62,-256,-257,-424,-106,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,104,-235,-236,-237,-238,-363,-364,-277,-175,-311,-287,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-41,-322,-226,-402,-401,-411,-231,-424,-424,-357,-360,-424,-424,-358,-361,-424,-424,-105,104,-278,-424,-118,104,104,-424,-263,-318,-319,-159,-424,-171,-43,-424,-409,-410,-205,-206,-258,-259,-52,-64,-48,-109,104,-108,-424,104,-424,104,104,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-160,-414,-107,-112,-113,-424,-117,104,-424,-424,-155,-239,-240,-241,-262,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,104,-424,-114,-151,-260,-424,-150,]),'ADVANCEMENT':([0,4,8,9,10,12,13,14,15,16,17,18,19,20,21,22,23,32,34,35,36,37,45,46,47,48,50,53,55,56,60,67,68,70,79,80,81,85,86,88,92,93,95,96,99,100,161,162,163,171,174,177,178,179,184,185,186,187,188,189,193,194,195,196,197,199,201,206,360,362,369,370,371,380,383,399,400,401,402,403,404,407,408,410,424,602,603,604,606,607,608,609,610,611,612,614,615,617,620,621,622,625,754,759,768,769,770,771,774,789,795,853,854,872,874,880,887,927,932,977,1000,],[24,24,-422,-34,-424,24,-421,-19,-20,-424,-22,-23,-24,-25,-26,-27,-28,-424,-35,-36,-424,-38,-34,-29,-420,-424,-13,-371,-21,-423,-424,-424,-34,-37,24,-424,-16,-10,-11,-424,-32,-424,-181,-424,-33,-424,-374,-375,-376,-44,-424,-12,-14,-228,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-234,-424,-225,-233,-40,-42,-15,-17,-18,-323,-227,-405,-374,-375,-376,-380,-372,-386,-385,-232,-39,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-424,-182,-183,-184,-41,-322,-226,-402,-401,-411,-231,-424,-424,-43,-424,-409,-410,-205,-206,-160,-414,-424,-207,]),'ARRAY':([0,4,8,9,10,12,13,14,15,16,17,18,19,20,21,22,23,32,34,35,36,37,45,46,47,48,50,53,55,56,60,67,68,70,79,80,81,85,86,88,92,93,95,96,99,100,161,162,163,171,174,177,178,179,184,185,186,187,188,189,193,194,195,196,197,199,201,206,360,362,369,370,371,380,383,399,400,401,402,403,404,407,408,410,420,421,424,602,603,604,606,607,608,609,610,611,612,614,615,617,620,621,622,625,754,759,768,769,770,771,774,789,790,795,853,854,872,874,880,887,888,927,932,977,1000,],[25,25,-422,-34,-424,25,-421,-19,-20,-424,-22,-23,-24,-25,-26,-27,-28,-424,-35,-36,-424,-38,-34,-29,-420,-424,-13,-371,-21,-423,-424,-424,-34,-37,25,-424,-16,-10,-11,-424,-32,-424,-181,-424,-33,-424,-374,-375,-376,-44,-424,-12,-14,-228,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-234,-424,-225,-233,-40,-42,-15,-17,-18,-323,-227,-405,-374,-375,-376,-380,-372,-386,-385,-232,25,25,-39,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-424,-182,-183,-184,-41,-322,-226,-402,-401,-411,-231,-424,25,-424,-43,-424,-409,-410,-205,-206,25,-160,-414,-424,-207,]),'DOLLAR':([0,4,8,9,10,12,13,14,15,16,17,18,19,20,21,22,23,32,34,35,36,37,41,45,46,47,48,50,53,55,56,60,67,68,70,71,79,80,81,85,86,88,90,91,92,93,95,96,99,100,102,103,105,108,109,111,114,115,116,117,118,119,121,122,124,125,127,133,138,140,141,148,149,150,152,154,156,159,161,162,163,166,171,172,174,177,178,179,182,184,185,186,187,188,189,190,191,193,194,195,196,197,199,201,206,208,209,210,211,213,214,215,216,217,218,219,220,221,222,223,225,227,229,230,231,232,233,234,235,236,237,243,244,245,246,247,256,257,259,260,263,278,279,281,282,283,284,286,287,290,291,293,294,295,296,297,298,299,300,306,308,309,311,312,313,314,316,317,321,322,325,326,327,336,341,344,350,352,353,354,355,357,358,359,360,362,369,370,371,380,381,382,383,384,385,386,387,388,389,390,391,392,393,395,396,397,398,399,400,401,402,403,404,405,406,407,408,410,424,425,426,427,431,432,433,434,435,436,437,438,440,441,445,449,451,452,453,454,455,456,457,463,464,471,472,473,474,475,476,477,478,479,480,483,484,487,488,489,490,491,493,494,496,497,498,501,502,503,505,507,508,509,510,511,512,513,516,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,541,543,546,547,551,552,553,554,555,559,561,562,563,564,565,568,569,572,573,575,577,578,580,581,582,583,584,586,588,590,593,594,595,596,597,602,603,604,605,606,607,608,609,610,611,612,613,614,615,617,619,620,621,622,625,647,648,653,655,656,661,662,667,668,669,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,704,706,707,712,713,714,715,716,717,718,719,720,721,723,724,725,729,730,731,732,733,734,735,736,737,738,743,745,750,751,752,753,754,759,761,762,763,764,765,767,768,769,770,771,774,789,795,800,802,803,804,805,806,807,808,809,811,826,829,831,832,833,834,835,844,846,847,848,849,850,851,853,854,866,872,873,874,880,887,890,891,892,893,894,895,896,897,898,899,900,905,906,907,908,909,910,911,915,916,917,918,919,920,922,923,924,927,929,932,936,937,938,943,944,952,954,955,956,957,958,959,960,961,962,963,964,967,977,979,980,986,989,990,991,992,996,997,998,999,1000,1002,1007,1008,1009,1011,1012,1014,1015,1019,1021,1022,1029,1031,1033,1035,],[26,26,-422,-34,-424,26,-421,-19,-20,-424,-22,-23,-24,-25,-26,-27,-28,-424,-35,-36,-424,-38,77,-34,-29,-420,-424,-13,-371,-21,-423,-424,-424,-34,-37,137,26,-424,-16,-10,-11,-424,192,192,-32,-424,-181,-424,-33,-424,137,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,192,269,269,-418,269,269,-255,-269,269,-51,-54,269,342,-387,269,192,-374,-375,-376,137,-44,269,-424,-12,-14,-228,-424,-382,-383,-384,-388,-389,-390,342,-424,-372,-373,-380,-251,-234,-424,-225,-233,-424,-57,-58,192,-60,-61,269,269,269,269,269,269,-248,-249,-63,-424,269,-66,-67,-68,-69,-70,-71,137,137,137,342,342,269,-424,269,486,-303,-312,-313,-279,269,269,192,192,192,-356,-366,-367,-250,-254,342,-280,269,269,269,269,269,269,192,-424,192,192,-90,-91,-92,269,-264,-316,-317,192,-50,-53,269,-424,576,192,-96,192,192,-100,-377,-378,-379,-40,-42,-15,-17,-18,-323,342,192,-227,342,342,342,342,342,342,342,342,342,342,342,342,342,342,-405,-374,-375,-376,-380,-372,342,-424,-386,-385,-232,-39,-55,-424,-253,269,-424,-242,-243,-244,-245,-246,-247,-65,-252,269,269,-110,-111,137,269,342,-309,-290,342,269,269,269,269,269,269,269,269,269,269,269,269,-390,269,269,269,269,269,192,137,137,137,137,-266,269,192,137,-424,-389,192,-389,192,-389,192,-365,-291,-294,269,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,192,192,269,269,342,269,269,-290,-309,-315,-267,-268,-156,192,137,-424,269,269,342,576,192,192,192,-97,-95,-94,-98,137,137,269,-424,-424,-424,-424,-424,-391,-392,-393,342,-394,-395,-396,-397,-398,-399,-400,342,-403,-404,-413,342,-424,-182,-183,-184,-59,269,-62,-256,-257,-424,-106,269,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,137,-235,-236,192,-237,192,-238,192,-363,-364,-277,-175,192,-311,-287,269,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-41,-322,857,857,857,857,857,-424,-226,-402,-401,-411,-231,-424,-424,-357,-360,-424,-424,-358,-361,-424,-424,-105,137,-278,-424,-118,269,137,137,-424,-263,-318,-319,192,-424,-171,269,-43,-424,-424,-409,342,-410,-205,-206,-258,-259,-52,-64,-48,-109,137,-108,-424,137,269,269,269,-424,137,137,-115,-424,-154,-424,-424,-424,-424,-276,192,-158,-173,-160,857,-414,-321,192,192,-107,-112,-113,-424,-117,269,137,-424,-424,-155,-239,-240,-241,-262,269,-424,-424,-275,-116,-152,-153,192,-261,-424,-424,192,192,-207,-149,-424,137,-424,-169,-170,1026,857,-114,-151,-260,-424,-424,-150,1026,]),'IMPORT':([0,4,8,9,10,12,13,14,15,16,17,18,19,20,21,22,23,32,34,35,36,37,45,46,47,48,50,53,55,56,60,67,68,70,79,80,81,85,86,88,92,93,95,96,99,100,161,162,163,171,174,177,178,179,184,185,186,187,188,189,193,194,195,196,197,199,201,206,360,362,369,370,371,380,383,399,400,401,402,403,404,407,408,410,424,602,603,604,606,607,608,609,610,611,612,614,615,617,620,621,622,625,754,759,768,769,770,771,774,789,795,853,854,872,874,880,887,927,932,977,1000,],[27,27,-422,-34,-424,27,-421,-19,-20,-424,-22,-23,-24,-25,-26,-27,-28,-424,-35,-36,-424,-38,-34,-29,-420,-424,-13,-371,-21,-423,-424,-424,-34,-37,27,-424,-16,-10,-11,-424,-32,-424,-181,-424,-33,-424,-374,-375,-376,-44,-424,-12,-14,-228,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-234,-424,-225,-233,-40,-42,-15,-17,-18,-323,-227,-405,-374,-375,-376,-380,-372,-386,-385,-232,-39,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-424,-182,-183,-184,-41,-322,-226,-402,-401,-411,-231,-424,-424,-43,-424,-409,-410,-205,-206,-160,-414,-424,-207,]),'ITEM_MODIFIER':([0,4,8,9,10,12,13,14,15,16,17,18,19,20,21,22,23,32,34,35,36,37,45,46,47,48,50,53,55,56,60,67,68,70,79,80,81,85,86,88,92,93,95,96,99,100,161,162,163,171,174,177,178,179,184,185,186,187,188,189,193,194,195,196,197,199,201,206,360,362,369,370,371,380,383,399,400,401,402,403,404,407,408,410,424,602,603,604,606,607,608,609,610,611,612,614,615,617,620,621,622,625,754,759,768,769,770,771,774,789,795,853,854,872,874,880,887,927,932,977,1000,],[28,28,-422,-34,-424,28,-421,-19,-20,-424,-22,-23,-24,-25,-26,-27,-28,-424,-35,-36,-424,-38,-34,-29,-420,-424,-13,-371,-21,-423,-424,-424,-34,-37,28,-424,-16,-10,-11,-424,-32,-424,-181,-424,-33,-424,-374,-375,-376,-44,-424,-12,-14,-228,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-234,-424,-225,-233,-40,-42,-15,-17,-18,-323,-227,-405,-374,-375,-376,-380,-372,-386,-385,-232,-39,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-424,-182,-183,-184,-41,-322,-226,-402,-401,-411,-231,-424,-424,-43,-424,-409,-410,-205,-206,-160,-414,-424,-207,]),'LOOT_TABLE':([0,4,8,9,10,12,13,14,15,16,17,18,19,20,21,22,23,32,34,35,36,37,45,46,47,48,50,53,55,56,60,67,68,70,79,80,81,85,86,88,92,93,95,96,99,100,161,162,163,171,174,177,178,179,184,185,186,187,188,189,193,194,195,196,197,199,201,206,360,362,369,370,371,380,383,399,400,401,402,403,404,407,408,410,424,602,603,604,606,607,608,609,610,611,612,614,615,617,620,621,622,625,754,759,768,769,770,771,774,789,795,853,854,872,874,880,887,927,932,977,1000,],[29,29,-422,-34,-424,29,-421,-19,-20,-424,-22,-23,-24,-25,-26,-27,-28,-424,-35,-36,-424,-38,-34,-29,-420,-424,-13,-371,-21,-423,-424,-424,-34,-37,29,-424,-16,-10,-11,-424,-32,-424,-181,-424,-33,-424,-374,-375,-376,-44,-424,-12,-14,-228,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-234,-424,-225,-233,-40,-42,-15,-17,-18,-323,-227,-405,-374,-375,-376,-380,-372,-386,-385,-232,-39,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-424,-182,-183,-184,-41,-322,-226,-402,-401,-411,-231,-424,-424,-43,-424,-409,-410,-205,-206,-160,-414,-424,-207,]),'ATID':([0,4,8,9,10,12,13,14,15,16,17,18,19,20,21,22,23,31,32,34,35,36,37,45,46,47,48,50,53,55,56,60,65,67,68,70,71,79,80,81,85,86,88,92,93,95,96,97,98,99,100,102,103,105,106,108,109,111,112,114,115,116,117,118,119,121,122,124,125,127,128,129,130,131,132,133,138,140,141,142,146,147,148,149,150,152,154,156,158,159,161,162,163,166,171,174,177,178,179,184,185,186,187,188,189,193,194,195,196,197,199,201,206,208,209,210,213,214,215,216,217,218,219,220,221,222,223,225,227,229,230,231,232,233,234,235,236,237,243,244,245,247,257,259,260,263,278,279,284,286,287,290,291,293,294,295,296,297,298,299,300,301,302,303,304,306,311,316,317,321,322,325,326,327,336,337,352,354,355,357,358,359,360,362,369,370,371,380,383,399,400,401,402,403,404,407,408,410,422,424,425,426,427,431,432,433,434,435,436,437,438,440,441,445,449,451,452,453,454,455,456,457,463,464,471,472,473,474,475,476,477,478,479,480,482,487,488,489,490,491,494,495,496,497,498,501,502,504,505,507,508,510,512,516,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,546,547,551,552,553,554,555,559,561,562,563,565,568,569,572,573,574,575,580,582,583,584,586,588,602,603,604,606,607,608,609,610,611,612,614,615,617,620,621,622,625,647,648,653,655,656,661,662,667,668,669,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,729,730,731,732,733,734,735,736,737,738,743,745,748,750,751,752,753,754,759,768,769,770,771,774,789,791,792,795,800,802,803,804,805,806,807,808,809,811,826,829,831,832,833,834,835,844,846,847,848,849,850,851,853,854,872,874,880,887,890,891,892,893,894,895,896,897,898,899,900,907,908,909,910,911,915,916,917,918,919,920,923,924,927,932,943,944,952,954,955,956,957,958,959,960,961,962,963,964,967,977,979,980,986,989,990,992,1000,1002,1007,1008,1009,1011,1012,1019,1021,1022,1029,1033,],[30,30,-422,-34,-424,30,-421,-19,-20,-424,-22,-23,-24,-25,-26,-27,-28,66,-424,-35,-36,-424,-38,-34,-29,-420,-424,-13,-371,-21,-423,-424,95,-424,-34,-37,123,30,-424,-16,-10,-11,-424,-32,-424,-181,-424,95,95,-33,-424,123,-56,-424,95,-424,-424,-424,66,-424,-424,-424,-424,-424,-424,95,95,272,-418,95,95,95,95,95,95,95,-255,-269,95,95,325,95,-51,-54,95,95,-387,95,95,95,-374,-375,-376,123,-44,-424,-12,-14,-228,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-234,-424,-225,-233,-424,-57,-58,-60,-61,95,95,95,95,95,95,-248,-249,-63,-424,95,-66,-67,-68,-69,-70,-71,123,123,123,95,95,95,95,-303,-312,-313,-279,95,95,-356,-366,-367,-250,-254,95,-280,95,95,95,95,95,95,95,95,95,95,-424,95,95,-264,-316,-317,-157,-50,-53,95,95,-96,-99,-100,-377,-378,-379,-40,-42,-15,-17,-18,-323,-227,-405,-374,-375,-376,-380,-372,-386,-385,-232,95,-39,-55,-424,-253,95,-424,-242,-243,-244,-245,-246,-247,-65,-252,95,95,-110,-111,123,95,95,-309,-290,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,123,703,123,123,123,-266,95,95,123,-424,-424,-424,-424,-365,-291,-294,95,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,95,95,95,95,95,-290,-309,-315,-267,-268,-156,123,-424,95,95,-412,-166,-168,-424,-95,-94,-98,123,123,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-424,-182,-183,-184,-59,95,-62,-256,-257,-424,-106,95,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,123,-235,-236,-237,-238,-363,-364,-277,-175,-311,-287,95,-304,-284,-306,-286,-320,-359,-362,-49,-172,-167,-101,-97,-102,-93,-41,-322,-226,-402,-401,-411,-231,-424,95,95,-424,-357,-360,-424,-424,-358,-361,-424,-424,-105,123,-278,-424,-118,95,123,123,-424,-263,-318,-319,-159,-424,-171,95,-43,-424,-409,-410,-205,-206,-258,-259,-52,-64,-48,-109,123,-108,-424,123,95,-424,123,123,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-160,-414,-107,-112,-113,-424,-117,95,123,-424,-424,-155,-239,-240,-241,-262,95,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,123,-424,-169,-170,-114,-151,-260,-424,-150,]),'DEFINE':([0,4,8,9,10,12,13,14,15,16,17,18,19,20,21,22,23,32,34,35,36,37,45,46,47,48,50,53,55,56,60,67,68,70,71,79,80,81,85,86,88,92,93,95,96,99,100,102,103,105,108,109,111,114,115,116,117,118,119,125,138,140,148,149,154,161,162,163,166,171,174,177,178,179,184,185,186,187,188,189,193,194,195,196,197,199,201,206,208,209,210,213,214,221,222,223,225,229,230,231,232,233,234,235,236,237,257,259,260,263,284,286,287,290,291,294,306,317,321,322,325,326,327,352,354,355,357,358,359,360,362,369,370,371,380,383,399,400,401,402,403,404,407,408,410,420,421,424,425,426,427,432,433,434,435,436,437,438,440,441,451,452,453,456,457,494,496,497,498,501,505,507,508,510,512,516,520,521,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,554,555,559,561,562,563,565,568,573,580,582,583,584,586,588,602,603,604,606,607,608,609,610,611,612,614,615,617,620,621,622,625,647,653,655,656,661,662,668,669,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,729,730,732,733,734,735,736,737,738,743,745,750,751,752,753,754,759,768,769,770,771,774,789,790,795,800,802,803,804,805,806,807,808,809,811,826,829,831,833,834,835,844,846,847,848,849,850,853,854,872,874,880,887,888,890,891,892,893,894,895,896,897,898,899,907,908,909,910,911,915,916,917,918,919,920,923,924,927,932,943,944,952,954,955,957,958,959,960,961,962,963,964,977,979,980,986,989,990,992,1000,1002,1007,1008,1009,1019,1021,1022,1029,1033,],[31,31,-422,-34,-424,31,-421,-19,-20,-424,-22,-23,-24,-25,-26,-27,-28,-424,-35,-36,-424,-38,-34,-29,-420,-424,-13,-371,-21,-423,-424,-424,-34,-37,112,31,-424,-16,-10,-11,-424,-32,-424,-181,-424,-33,-424,112,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,-418,-255,-269,-51,-54,-387,-374,-375,-376,112,-44,-424,-12,-14,-228,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-234,-424,-225,-233,-424,-57,-58,-60,-61,-248,-249,-63,-424,-66,-67,-68,-69,-70,-71,112,112,112,-303,-312,-313,-279,-356,-366,-367,-250,-254,-280,-424,-264,-316,-317,-157,-50,-53,-96,-99,-100,-377,-378,-379,-40,-42,-15,-17,-18,-323,-227,-405,-374,-375,-376,-380,-372,-386,-385,-232,634,634,-39,-55,-424,-253,-424,-242,-243,-244,-245,-246,-247,-65,-252,-110,-111,112,-309,-290,112,112,112,112,-266,112,-424,-424,-424,-424,-365,-291,-294,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,-290,-309,-315,-267,-268,-156,112,-424,-412,-424,-95,-94,-98,112,112,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-424,-182,-183,-184,-59,-62,-256,-257,-424,-106,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,112,-235,-236,-237,-238,-363,-364,-277,-175,-311,-287,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-41,-322,-226,-402,-401,-411,-231,-424,634,-424,-357,-360,-424,-424,-358,-361,-424,-424,-105,112,-278,-424,-118,112,112,-424,-263,-318,-319,-159,-424,-171,-43,-424,-409,-410,-205,-206,634,-258,-259,-52,-64,-48,-109,112,-108,-424,112,-424,112,112,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-160,-414,-107,-112,-113,-424,-117,112,-424,-424,-155,-239,-240,-241,-262,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,112,-424,-114,-151,-260,-424,-150,]),'PREDICATE':([0,4,8,9,10,12,13,14,15,16,17,18,19,20,21,22,23,32,34,35,36,37,45,46,47,48,50,53,55,56,60,67,68,70,79,80,81,85,86,88,89,92,93,95,96,99,100,121,127,156,161,162,163,171,174,177,178,179,180,184,185,186,187,188,189,193,194,195,196,197,199,201,206,336,360,362,369,370,371,380,383,399,400,401,402,403,404,407,408,410,420,421,424,454,592,602,603,604,606,607,608,609,610,611,612,614,615,617,620,621,622,625,754,759,760,768,769,770,771,774,789,790,795,853,854,872,874,880,887,888,927,932,977,1000,],[33,33,-422,-34,-424,33,-421,-19,-20,-424,-22,-23,-24,-25,-26,-27,-28,-424,-35,-36,-424,-38,-34,-29,-420,-424,-13,-371,-21,-423,-424,-424,-34,-37,33,-424,-16,-10,-11,-424,-424,-32,-424,-181,-424,-33,-424,250,250,250,-374,-375,-376,-44,-424,-12,-14,-228,379,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-234,-424,-225,-233,250,-40,-42,-15,-17,-18,-323,-227,-405,-374,-375,-376,-380,-372,-386,-385,-232,33,33,-39,250,-424,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-424,-182,-183,-184,-41,-322,379,-226,-402,-401,-411,-231,-424,33,-424,-43,-424,-409,-410,-205,-206,33,-160,-414,-424,-207,]),'RESET':([0,4,8,9,10,12,13,14,15,16,17,18,19,20,21,22,23,32,34,35,36,37,45,46,47,48,50,53,55,56,60,67,68,70,79,80,81,85,86,88,92,93,95,96,99,100,161,162,163,171,174,177,178,179,184,185,186,187,188,189,193,194,195,196,197,199,201,206,360,362,369,370,371,380,383,399,400,401,402,403,404,407,408,410,424,602,603,604,606,607,608,609,610,611,612,614,615,617,620,621,622,625,754,759,768,769,770,771,774,789,795,853,854,872,874,880,887,927,932,977,1000,],[38,38,-422,-34,-424,38,-421,-19,-20,-424,-22,-23,-24,-25,-26,-27,-28,38,-35,-36,-424,-38,-34,-29,-420,-424,-13,-371,-21,-423,-424,-424,-34,-37,38,-424,-16,-10,-11,-424,-32,-424,-181,-424,-33,-424,-374,-375,-376,-44,-424,-12,-14,-228,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-234,-424,-225,-233,-40,-42,-15,-17,-18,-323,-227,-405,-374,-375,-376,-380,-372,-386,-385,-232,-39,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-424,-182,-183,-184,-41,-322,-226,-402,-401,-411,-231,-424,-424,-43,-424,-409,-410,-205,-206,-160,-414,-424,-207,]),'CLOCK':([0,4,8,9,10,12,13,14,15,16,17,18,19,20,21,22,23,32,34,35,36,37,45,46,47,48,50,53,55,56,60,67,68,70,79,80,81,85,86,88,92,93,95,96,99,100,161,162,163,171,174,177,178,179,184,185,186,187,188,189,193,194,195,196,197,199,201,206,360,362,369,370,371,380,383,399,400,401,402,403,404,407,408,410,424,602,603,604,606,607,608,609,610,611,612,614,615,617,620,621,622,625,754,759,768,769,770,771,774,789,795,853,854,872,874,880,887,927,932,977,1000,],[39,39,-422,-34,-424,39,-421,-19,-20,-424,-22,-23,-24,-25,-26,-27,-28,39,-35,-36,-424,-38,-34,-29,-420,-424,-13,-371,-21,-423,-424,-424,-34,-37,39,-424,-16,-10,-11,-424,-32,-424,-181,-424,-33,-424,-374,-375,-376,-44,-424,-12,-14,-228,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-234,-424,-225,-233,-40,-42,-15,-17,-18,-323,-227,-405,-374,-375,-376,-380,-372,-386,-385,-232,-39,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-424,-182,-183,-184,-41,-322,-226,-402,-401,-411,-231,-424,-424,-43,-424,-409,-410,-205,-206,-160,-414,-424,-207,]),'FUNCTION':([0,4,8,9,10,12,13,14,15,16,17,18,19,20,21,22,23,32,34,35,36,37,45,46,47,48,50,53,55,56,60,67,68,70,79,80,81,85,86,88,92,93,95,96,99,100,161,162,163,171,174,177,178,179,184,185,186,187,188,189,193,194,195,196,197,199,201,206,360,362,369,370,371,380,383,399,400,401,402,403,404,407,408,410,420,421,424,602,603,604,606,607,608,609,610,611,612,614,615,617,620,621,622,625,754,759,768,769,770,771,774,789,790,795,853,854,872,874,880,887,888,927,932,977,1000,],[40,40,-422,-34,-424,40,-421,-19,-20,-424,-22,-23,-24,-25,-26,-27,-28,40,-35,-36,-424,-38,-34,-29,-420,-424,-13,-371,-21,-423,-424,-424,-34,-37,40,-424,-16,-10,-11,-424,-32,-424,-181,-424,-33,-424,-374,-375,-376,-44,-424,-12,-14,-228,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-234,-424,-225,-233,-40,-42,-15,-17,-18,-323,-227,-405,-374,-375,-376,-380,-372,-386,-385,-232,40,40,-39,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-424,-182,-183,-184,-41,-322,-226,-402,-401,-411,-231,-424,40,-424,-43,-424,-409,-410,-205,-206,40,-160,-414,-424,-207,]),'MACRO':([0,4,8,9,10,12,13,14,15,16,17,18,19,20,21,22,23,32,34,35,36,37,45,46,47,48,50,53,55,56,60,67,68,70,79,80,81,85,86,88,92,93,95,96,99,100,161,162,163,171,174,177,178,179,184,185,186,187,188,189,193,194,195,196,197,199,201,206,360,362,369,370,371,380,383,399,400,401,402,403,404,407,408,410,424,602,603,604,606,607,608,609,610,611,612,614,615,617,620,621,622,625,754,759,768,769,770,771,774,789,795,853,854,872,874,880,887,927,932,977,1000,],[41,41,-422,-34,-424,41,-421,-19,-20,-424,-22,-23,-24,-25,-26,-27,-28,41,-35,-36,-424,-38,-34,-29,-420,-424,-13,-371,-21,-423,-424,-424,-34,-37,41,-424,-16,-10,-11,-424,-32,-424,-181,-424,-33,-424,-374,-375,-376,-44,-424,-12,-14,-228,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-234,-424,-225,-233,-40,-42,-15,-17,-18,-323,-227,-405,-374,-375,-376,-380,-372,-386,-385,-232,-39,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-424,-182,-183,-184,-41,-322,-226,-402,-401,-411,-231,-424,-424,-43,-424,-409,-410,-205,-206,-160,-414,-424,-207,]),'$end':([0,1,2,3,4,5,7,8,9,10,12,13,14,15,16,17,18,19,20,21,22,23,32,34,35,36,37,42,43,45,46,47,48,50,51,53,54,55,56,60,67,68,70,78,79,80,81,85,86,87,88,92,93,95,96,99,100,161,162,163,171,173,174,177,178,179,184,185,186,187,188,189,193,194,195,196,197,199,201,206,360,362,369,370,371,380,383,399,400,401,402,403,404,407,408,410,424,602,603,604,606,607,608,609,610,611,612,614,615,617,620,621,622,625,754,759,768,769,770,771,774,789,795,853,854,872,874,880,887,927,932,977,1000,],[-424,0,-1,-2,-424,-4,-7,-422,-31,-424,-424,-421,-19,-20,-424,-22,-23,-24,-25,-26,-27,-28,-424,-35,-36,-424,-38,-3,-5,-31,-29,-420,-424,-13,-9,-371,-424,-21,-423,-424,-424,-34,-37,-6,-424,-424,-16,-10,-11,-30,-424,-32,-424,-181,-424,-33,-424,-374,-375,-376,-44,-8,-424,-12,-14,-228,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-234,-424,-225,-233,-40,-42,-15,-17,-18,-323,-227,-405,-374,-375,-376,-380,-372,-386,-385,-232,-39,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-424,-182,-183,-184,-41,-322,-226,-402,-401,-411,-231,-424,-424,-43,-424,-409,-410,-205,-206,-160,-414,-424,-207,]),'ID':([8,10,13,24,25,26,27,28,33,39,47,48,50,53,56,62,63,64,71,75,80,85,86,89,95,96,102,103,105,108,109,111,114,115,116,117,118,119,121,122,124,125,127,132,133,137,138,139,140,141,143,147,148,149,150,152,154,156,157,160,161,162,163,166,177,178,180,184,185,186,187,188,189,192,193,194,195,196,198,200,201,208,209,210,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,243,244,245,246,247,250,256,257,259,260,262,263,268,269,278,279,284,286,287,289,290,291,293,294,295,296,297,298,299,300,301,302,303,304,306,311,316,317,319,320,321,322,325,326,327,336,341,342,352,354,355,357,358,359,364,370,371,380,399,400,401,402,403,404,407,408,418,420,421,425,426,427,428,429,430,431,432,433,434,435,436,437,438,440,441,445,447,448,449,451,452,453,454,455,456,457,463,464,468,470,471,472,473,474,475,476,477,478,479,480,483,486,487,488,489,490,491,494,496,497,498,499,500,501,502,505,507,508,510,512,514,515,516,517,518,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,544,546,547,551,552,553,554,555,556,559,561,562,563,565,568,569,572,573,574,575,580,582,583,584,586,588,592,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,623,624,625,626,633,639,647,648,653,655,656,661,662,667,668,669,670,677,678,679,680,681,682,683,684,690,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,722,723,724,727,729,730,731,732,733,734,735,736,737,738,743,745,748,749,750,751,752,753,759,760,769,770,771,778,789,790,791,792,795,800,802,803,804,805,806,807,808,809,811,826,829,831,832,833,834,835,844,846,847,848,849,850,851,857,866,872,874,880,883,885,887,888,890,891,892,893,894,895,896,897,898,899,900,905,906,907,908,909,910,911,915,916,917,918,919,920,921,923,924,929,932,939,940,943,944,952,954,955,956,957,958,959,960,961,962,963,964,967,975,976,977,979,980,981,982,983,984,986,989,990,992,1000,1002,1007,1008,1009,1011,1012,1019,1021,1022,1026,1029,1033,],[-422,-424,-421,57,58,59,60,61,69,73,-420,82,-13,-371,-423,94,-229,-230,113,169,82,-10,-11,-424,-181,-424,113,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,251,267,267,-418,251,288,291,305,-255,307,-269,291,321,329,-51,-54,291,338,-387,251,346,356,-374,-375,-376,113,-12,-14,375,-382,-383,-384,-388,-389,-390,408,-372,-373,-380,-251,409,417,-225,-424,-57,-58,427,-60,-61,291,291,291,291,291,291,-248,-249,-63,439,-424,441,291,321,-66,-67,-68,-69,-70,-71,113,113,113,291,460,291,307,291,469,485,-303,-312,-313,321,-279,321,408,291,291,-356,-366,-367,321,-250,-254,519,-280,291,291,291,291,291,291,288,288,288,288,-424,291,291,-264,321,321,-316,-317,-157,-50,-53,251,307,408,-96,-99,-100,-377,-378,-379,169,-17,-18,-323,-405,-374,-375,-376,-380,-372,-386,-385,632,638,638,-55,-424,-253,321,650,321,291,-424,-242,-243,-244,-245,-246,-247,-65,-252,291,321,321,291,-110,-111,113,251,291,-309,-290,291,291,427,321,291,291,291,291,291,291,291,291,291,291,688,408,291,291,291,291,291,113,113,113,113,427,321,-266,291,113,-424,-424,-424,-424,321,321,-365,321,427,-291,-294,291,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,427,291,291,291,291,291,-290,-309,321,-315,-267,-268,-156,113,-424,291,267,-412,-166,-168,-424,-95,-94,-98,113,113,-424,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,417,417,-184,777,787,793,-59,291,-62,-256,-257,-424,-106,291,-314,-274,815,-304,-284,-305,-306,-286,-307,-308,-310,823,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,113,-235,-236,-237,-238,-363,-364,840,-277,-175,844,-311,-287,291,-304,-284,-306,-286,-320,-359,-362,-49,-172,-167,852,-101,-97,-102,-93,-322,375,-402,-401,-411,876,-424,638,321,321,-424,-357,-360,-424,-424,-358,-361,-424,-424,-105,113,-278,-424,-118,291,113,113,-424,-263,-318,-319,-159,-424,-171,267,928,-424,-409,-410,-205,936,936,-206,638,-258,-259,-52,-64,-48,-109,113,-108,-424,113,291,947,950,-424,113,113,-115,-424,-154,-424,-424,-424,-424,-276,964,-158,-173,969,-414,321,321,-107,-112,-113,-424,-117,291,113,-424,-424,-155,-239,-240,-241,-262,291,936,936,-424,-424,-275,823,823,823,823,-116,-152,-153,-261,-207,-149,-424,113,-424,-169,-170,-114,-151,-260,1032,-424,-150,]),'FACING':([8,13,47,53,56,71,89,95,96,102,103,105,108,109,111,114,115,116,117,118,119,125,138,140,143,148,149,151,153,154,161,162,163,166,180,184,185,186,187,188,189,193,194,195,196,201,208,209,210,213,214,221,222,223,225,228,229,230,231,232,233,234,235,236,237,239,240,241,242,248,249,251,252,254,255,257,259,260,262,263,266,268,274,275,276,277,284,286,287,289,290,291,294,306,308,310,312,313,314,317,319,320,321,322,325,326,327,345,346,347,348,349,352,354,355,356,357,358,359,380,399,400,401,402,403,404,407,408,425,426,427,428,430,432,433,434,435,436,437,438,440,441,447,448,451,452,453,456,457,458,465,469,470,484,485,492,494,496,497,498,500,501,505,507,508,510,512,514,515,516,517,520,521,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,543,545,554,555,556,559,561,562,563,565,568,570,571,573,580,582,583,584,586,588,592,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,647,653,655,656,661,662,663,665,668,669,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,687,688,689,690,691,692,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,728,729,730,732,733,734,735,736,737,738,743,745,750,751,752,753,759,760,769,770,771,789,791,792,795,800,801,802,803,804,805,806,807,808,809,811,813,817,818,819,820,821,825,826,829,831,833,834,835,844,845,846,847,848,849,850,872,874,880,887,890,891,892,893,894,895,896,897,898,899,902,903,904,907,908,909,910,911,915,916,917,918,919,920,923,924,932,939,940,943,944,952,954,955,957,958,959,960,961,962,963,964,966,977,979,980,981,982,983,984,986,989,990,992,1000,1002,1007,1008,1009,1019,1021,1022,1029,1033,],[-422,-421,-420,-371,-423,159,-424,-181,-424,159,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,-418,-255,-269,322,-51,-54,159,-273,-387,-374,-375,-376,159,377,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-225,-424,-57,-58,-60,-61,-248,-249,-63,-424,322,-66,-67,-68,-69,-70,-71,159,159,159,-74,-255,-132,-418,-387,-119,-254,-128,-129,-130,-303,-312,-313,322,-279,-76,322,-82,-83,-84,159,-356,-366,-367,322,-250,-254,-280,-424,-424,-80,-90,-91,-92,-264,322,322,-316,-317,-157,-50,-53,-75,-85,-86,-87,-88,-96,-99,-100,-89,-377,-378,-379,-323,-405,-374,-375,-376,-380,-372,-386,-385,-55,-424,-253,322,322,-424,-242,-243,-244,-245,-246,-247,-65,-252,322,322,-110,-111,159,-309,-290,-387,-127,-120,322,-424,-424,-266,159,159,159,159,322,-266,159,-424,-424,-424,-424,322,322,-365,322,-291,-294,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,-77,-79,-290,-309,322,-315,-267,-268,-156,159,-424,-76,-270,-412,-424,-95,-94,-98,159,159,-424,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-59,-62,-256,-257,-424,-106,159,-131,-314,-274,-265,-121,-122,-123,-124,-125,-304,-284,-305,-306,-286,-307,-308,-310,-126,-424,-424,-424,824,-138,-424,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,159,-235,-236,-237,-238,-363,-364,-277,-175,-78,-311,-287,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,377,-402,-401,-411,-424,322,322,-424,-357,-271,-360,-424,-424,-358,-361,-424,-424,-105,159,159,-424,-424,-135,-147,-148,-136,-278,-424,-118,159,159,-424,-263,-81,-318,-319,-159,-424,-171,-409,-410,-205,-206,-258,-259,-52,-64,-48,-109,159,-108,-424,159,-133,-134,-137,-424,159,159,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-414,322,322,-107,-112,-113,-424,-117,159,-424,-424,-155,-239,-240,-241,-262,-272,-424,-424,-275,824,824,824,824,-116,-152,-153,-261,-207,-149,-424,159,-424,-114,-151,-260,-424,-150,]),'BLOCK':([8,13,29,47,56,89,121,127,156,180,336,454,592,760,],[-422,-421,63,-420,-423,-424,256,256,256,378,256,256,-424,378,]),'STRING':([8,11,13,47,49,53,56,89,90,91,95,121,141,152,159,161,162,163,180,182,184,185,186,187,188,189,190,191,192,193,194,195,211,243,244,246,247,256,280,281,282,283,293,301,302,303,304,306,308,309,311,312,313,314,325,341,350,352,353,354,355,381,382,384,385,386,387,388,389,390,391,392,393,395,396,397,398,399,400,401,402,403,404,405,406,407,408,455,463,464,484,486,493,503,508,509,510,511,512,513,541,543,547,551,564,573,577,578,580,581,584,592,593,594,595,596,597,602,603,604,605,606,607,608,609,610,611,612,613,614,615,617,619,621,622,625,654,715,717,719,725,751,760,761,762,763,764,765,767,769,770,771,837,838,839,848,866,872,873,874,922,929,932,936,937,938,967,991,997,998,999,1015,],[-422,53,-421,-420,53,-371,-423,-424,53,53,-181,53,-424,53,53,-374,-375,-376,53,-424,-382,-383,-384,-388,-389,-390,53,-424,53,-372,-373,-380,53,53,53,-424,-424,53,53,53,53,53,53,53,53,53,53,53,-424,53,53,-90,-91,-92,53,-424,53,-96,53,53,-100,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,-405,-374,-375,-376,-380,-372,53,-424,-386,-385,53,53,-424,-390,53,53,53,-389,53,-389,53,-389,53,53,53,-424,53,53,53,53,53,53,-97,-98,-424,-424,-424,-424,-424,-424,-391,-392,-393,53,-394,-395,-396,-397,-398,-399,-400,53,-403,-404,-413,53,-182,-183,-184,53,53,53,53,53,-97,53,53,53,53,53,53,-424,-402,-401,-411,53,53,53,53,-424,-409,53,-410,53,53,-414,-321,53,53,53,53,-424,53,53,53,]),'RCURLY':([8,13,47,53,56,89,161,162,163,180,181,194,195,321,322,357,358,359,372,373,374,380,404,558,559,591,592,651,658,736,759,760,846,847,855,856,858,859,860,861,862,863,864,865,868,869,870,871,928,930,1013,1034,],[-422,-421,-420,-371,-423,-424,-374,-375,-376,-424,380,-373,-380,-316,-317,-377,-378,-379,-424,-325,-326,-323,-372,738,-315,759,-424,802,806,-320,-322,-424,-318,-319,-324,-327,-333,-334,-335,-336,-337,-338,-339,-340,-328,-329,-330,-331,-332,-381,-341,-345,]),'COMMAND':([8,13,47,53,56,71,95,96,102,103,105,108,109,111,114,115,116,117,118,119,125,138,140,148,149,154,161,162,163,166,184,185,186,187,188,189,193,194,195,196,201,208,209,210,213,214,221,222,223,225,229,230,231,232,233,234,235,236,237,257,259,260,263,284,286,287,290,291,294,306,317,321,322,323,324,325,326,327,352,354,355,357,358,359,380,399,400,401,402,403,404,407,408,425,426,427,432,433,434,435,436,437,438,440,441,451,452,453,456,457,494,496,497,498,501,505,507,508,510,512,516,520,521,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,554,555,559,561,562,563,565,568,573,580,582,583,584,586,588,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,647,653,655,656,661,662,668,669,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,729,730,732,733,734,735,736,737,738,743,745,750,751,752,753,759,769,770,771,789,795,800,802,803,804,805,806,807,808,809,811,826,829,831,833,834,835,844,846,847,848,849,850,872,874,880,887,890,891,892,893,894,895,896,897,898,899,907,908,909,910,911,915,916,917,918,919,920,923,924,932,943,944,952,954,955,957,958,959,960,961,962,963,964,977,979,980,986,989,990,992,1000,1002,1007,1008,1009,1019,1021,1022,1029,1033,],[-422,-421,-420,-371,-423,105,-181,-424,105,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,-418,-255,-269,-51,-54,-387,-374,-375,-376,105,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-225,-424,-57,-58,-60,-61,-248,-249,-63,-424,-66,-67,-68,-69,-70,-71,105,105,105,-303,-312,-313,-279,-356,-366,-367,-250,-254,-280,-424,-264,-316,-317,561,562,-157,-50,-53,-96,-99,-100,-377,-378,-379,-323,-405,-374,-375,-376,-380,-372,-386,-385,-55,-424,-253,-424,-242,-243,-244,-245,-246,-247,-65,-252,-110,-111,105,-309,-290,105,105,105,105,-266,105,-424,-424,-424,-424,-365,-291,-294,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,-290,-309,-315,-267,-268,-156,105,-424,-412,-424,-95,-94,-98,105,105,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-59,-62,-256,-257,-424,-106,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,105,-235,-236,-237,-238,-363,-364,-277,-175,-311,-287,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,-402,-401,-411,-424,-424,-357,-360,-424,-424,-358,-361,-424,-424,-105,105,-278,-424,-118,105,105,-424,-263,-318,-319,-159,-424,-171,-409,-410,-205,-206,-258,-259,-52,-64,-48,-109,105,-108,-424,105,-424,105,105,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-414,-107,-112,-113,-424,-117,105,-424,-424,-155,-239,-240,-241,-262,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,105,-424,-114,-151,-260,-424,-150,]),'MOVE':([8,13,47,53,56,71,95,96,102,103,105,108,109,111,114,115,116,117,118,119,125,138,140,148,149,154,161,162,163,166,184,185,186,187,188,189,193,194,195,196,201,208,209,210,213,214,221,222,223,225,229,230,231,232,233,234,235,236,237,257,259,260,263,284,286,287,290,291,294,306,317,321,322,325,326,327,352,354,355,357,358,359,380,399,400,401,402,403,404,407,408,425,426,427,432,433,434,435,436,437,438,440,441,451,452,453,456,457,494,496,497,498,501,505,507,508,510,512,516,520,521,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,554,555,559,561,562,563,565,568,573,580,582,583,584,586,588,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,647,653,655,656,661,662,668,669,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,729,730,732,733,734,735,736,737,738,743,745,750,751,752,753,759,769,770,771,789,795,800,802,803,804,805,806,807,808,809,811,826,829,831,833,834,835,844,846,847,848,849,850,872,874,880,887,890,891,892,893,894,895,896,897,898,899,907,908,909,910,911,915,916,917,918,919,920,923,924,932,943,944,952,954,955,957,958,959,960,961,962,963,964,977,979,980,986,989,990,992,1000,1002,1007,1008,1009,1019,1021,1022,1029,1033,],[-422,-421,-420,-371,-423,106,-181,-424,106,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,-418,-255,-269,-51,-54,-387,-374,-375,-376,106,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-225,-424,-57,-58,-60,-61,-248,-249,-63,-424,-66,-67,-68,-69,-70,-71,106,106,106,-303,-312,-313,-279,-356,-366,-367,-250,-254,-280,-424,-264,-316,-317,-157,-50,-53,-96,-99,-100,-377,-378,-379,-323,-405,-374,-375,-376,-380,-372,-386,-385,-55,-424,-253,-424,-242,-243,-244,-245,-246,-247,-65,-252,-110,-111,106,-309,-290,106,106,106,106,-266,106,-424,-424,-424,-424,-365,-291,-294,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,-290,-309,-315,-267,-268,-156,106,-424,-412,-424,-95,-94,-98,106,106,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-59,-62,-256,-257,-424,-106,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,106,-235,-236,-237,-238,-363,-364,-277,-175,-311,-287,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,-402,-401,-411,-424,-424,-357,-360,-424,-424,-358,-361,-424,-424,-105,106,-278,-424,-118,106,106,-424,-263,-318,-319,-159,-424,-171,-409,-410,-205,-206,-258,-259,-52,-64,-48,-109,106,-108,-424,106,-424,106,106,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-414,-107,-112,-113,-424,-117,106,-424,-424,-155,-239,-240,-241,-262,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,106,-424,-114,-151,-260,-424,-150,]),'IF':([8,13,47,53,56,71,95,96,102,103,105,108,109,111,114,115,116,117,118,119,125,138,140,148,149,151,153,154,161,162,163,166,184,185,186,187,188,189,193,194,195,196,201,208,209,210,213,214,221,222,223,225,229,230,231,232,233,234,235,236,237,239,240,241,242,248,249,251,252,254,255,257,259,260,263,266,274,275,276,277,284,286,287,290,291,294,306,308,310,312,313,314,317,321,322,325,326,327,345,346,347,348,349,352,354,355,356,357,358,359,380,399,400,401,402,403,404,407,408,425,426,427,432,433,434,435,436,437,438,440,441,451,452,453,456,457,458,465,469,484,485,492,494,496,497,498,501,505,507,508,510,512,516,520,521,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,543,545,554,555,559,561,562,563,565,568,570,571,573,580,582,583,584,586,588,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,647,653,655,656,661,662,663,665,668,669,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,687,688,689,691,692,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,728,729,730,732,733,734,735,736,737,738,743,745,750,751,752,753,759,769,770,771,789,795,800,801,802,803,804,805,806,807,808,809,811,813,817,818,819,820,821,825,826,829,831,833,834,835,844,845,846,847,848,849,850,872,874,880,887,890,891,892,893,894,895,896,897,898,899,902,903,904,907,908,909,910,911,915,916,917,918,919,920,923,924,932,943,944,952,954,955,957,958,959,960,961,962,963,964,966,977,979,980,986,989,990,992,1000,1002,1007,1008,1009,1019,1021,1022,1029,1033,],[-422,-421,-420,-371,-423,121,-181,-424,121,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,-418,-255,-269,-51,-54,336,-273,-387,-374,-375,-376,121,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-225,-424,-57,-58,-60,-61,-248,-249,-63,-424,-66,-67,-68,-69,-70,-71,121,121,121,-74,-255,-132,-418,-387,-119,-254,-128,-129,-130,-303,-312,-313,-279,-76,-82,-83,-84,336,-356,-366,-367,-250,-254,-280,-424,-424,-80,-90,-91,-92,-264,-316,-317,-157,-50,-53,-75,-85,-86,-87,-88,-96,-99,-100,-89,-377,-378,-379,-323,-405,-374,-375,-376,-380,-372,-386,-385,-55,-424,-253,-424,-242,-243,-244,-245,-246,-247,-65,-252,-110,-111,121,-309,-290,-387,-127,-120,-424,-424,-266,121,121,121,121,-266,121,-424,-424,-424,-424,-365,-291,-294,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,-77,-79,-290,-309,-315,-267,-268,-156,121,-424,-76,-270,-412,-424,-95,-94,-98,121,121,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-59,-62,-256,-257,-424,-106,336,-131,-314,-274,-265,-121,-122,-123,-124,-125,-304,-284,-305,-306,-286,-307,-308,-310,-126,-424,-424,-424,-138,-424,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,121,-235,-236,-237,-238,-363,-364,-277,-175,-78,-311,-287,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,-402,-401,-411,-424,-424,-357,-271,-360,-424,-424,-358,-361,-424,-424,-105,121,336,-424,-424,-135,-147,-148,-136,-278,-424,-118,121,121,-424,-263,-81,-318,-319,-159,-424,-171,-409,-410,-205,-206,-258,-259,-52,-64,-48,-109,121,-108,-424,121,-133,-134,-137,-424,121,121,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-414,-107,-112,-113,-424,-117,121,-424,-424,-155,-239,-240,-241,-262,-272,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,121,-424,-114,-151,-260,-424,-150,]),'AS':([8,13,47,53,56,71,95,96,102,103,105,108,109,111,114,115,116,117,118,119,125,138,140,148,149,151,153,154,161,162,163,166,184,185,186,187,188,189,193,194,195,196,201,208,209,210,213,214,221,222,223,225,229,230,231,232,233,234,235,236,237,239,240,241,242,248,249,251,252,254,255,257,259,260,263,266,274,275,276,277,284,286,287,290,291,294,306,308,310,312,313,314,317,321,322,325,326,327,345,346,347,348,349,352,354,355,356,357,358,359,380,399,400,401,402,403,404,407,408,425,426,427,432,433,434,435,436,437,438,440,441,451,452,453,456,457,458,465,469,484,485,492,494,496,497,498,501,505,507,508,510,512,516,520,521,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,543,545,554,555,559,561,562,563,565,568,570,571,573,580,582,583,584,586,588,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,647,653,655,656,661,662,663,665,668,669,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,687,688,689,691,692,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,728,729,730,732,733,734,735,736,737,738,743,745,750,751,752,753,759,769,770,771,789,795,800,801,802,803,804,805,806,807,808,809,811,813,817,818,819,820,821,825,826,829,831,833,834,835,844,845,846,847,848,849,850,872,874,880,887,890,891,892,893,894,895,896,897,898,899,902,903,904,907,908,909,910,911,915,916,917,918,919,920,923,924,932,943,944,952,954,955,957,958,959,960,961,962,963,964,966,977,979,980,986,989,990,992,1000,1002,1007,1008,1009,1019,1021,1022,1029,1033,],[-422,-421,-420,-371,-423,122,-181,-424,122,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,-418,-255,-269,-51,-54,337,-273,-387,-374,-375,-376,122,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-225,-424,-57,-58,-60,-61,-248,-249,-63,-424,-66,-67,-68,-69,-70,-71,122,122,122,-74,-255,-132,-418,-387,-119,-254,-128,-129,-130,-303,-312,-313,-279,-76,-82,-83,-84,337,-356,-366,-367,-250,-254,-280,-424,-424,-80,-90,-91,-92,-264,-316,-317,-157,-50,-53,-75,-85,-86,-87,-88,-96,-99,-100,-89,-377,-378,-379,-323,-405,-374,-375,-376,-380,-372,-386,-385,-55,-424,-253,-424,-242,-243,-244,-245,-246,-247,-65,-252,-110,-111,122,-309,-290,-387,-127,-120,-424,-424,-266,122,122,122,122,-266,122,-424,-424,-424,-424,-365,-291,-294,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,-77,-79,-290,-309,-315,-267,-268,-156,122,-424,-76,-270,-412,-424,-95,-94,-98,122,122,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-59,-62,-256,-257,-424,-106,337,-131,-314,-274,-265,-121,-122,-123,-124,-125,-304,-284,-305,-306,-286,-307,-308,-310,-126,-424,-424,-424,-138,-424,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,122,-235,-236,-237,-238,-363,-364,-277,-175,-78,-311,-287,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,-402,-401,-411,-424,-424,-357,-271,-360,-424,-424,-358,-361,-424,-424,-105,122,337,-424,-424,-135,-147,-148,-136,-278,-424,-118,122,122,-424,-263,-81,-318,-319,-159,-424,-171,-409,-410,-205,-206,-258,-259,-52,-64,-48,-109,122,-108,-424,122,-133,-134,-137,-424,122,122,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-414,-107,-112,-113,-424,-117,122,-424,-424,-155,-239,-240,-241,-262,-272,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,122,-424,-114,-151,-260,-424,-150,]),'FOR':([8,13,47,53,56,71,95,96,102,103,105,108,109,111,114,115,116,117,118,119,125,138,140,148,149,154,161,162,163,166,184,185,186,187,188,189,193,194,195,196,201,208,209,210,213,214,221,222,223,225,229,230,231,232,233,234,235,236,237,257,259,260,263,284,286,287,290,291,294,306,317,321,322,325,326,327,352,354,355,357,358,359,380,399,400,401,402,403,404,407,408,425,426,427,432,433,434,435,436,437,438,440,441,451,452,453,456,457,494,496,497,498,501,505,507,508,510,512,516,520,521,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,554,555,559,561,562,563,565,568,573,580,582,583,584,586,588,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,647,653,655,656,661,662,668,669,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,729,730,732,733,734,735,736,737,738,743,745,750,751,752,753,759,769,770,771,789,795,800,802,803,804,805,806,807,808,809,811,826,829,831,833,834,835,844,846,847,848,849,850,872,874,880,887,890,891,892,893,894,895,896,897,898,899,907,908,909,910,911,915,916,917,918,919,920,923,924,932,943,944,952,954,955,957,958,959,960,961,962,963,964,977,979,980,986,989,990,992,1000,1002,1007,1008,1009,1019,1021,1022,1029,1033,],[-422,-421,-420,-371,-423,124,-181,-424,124,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,-418,-255,-269,-51,-54,-387,-374,-375,-376,124,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-225,-424,-57,-58,-60,-61,-248,-249,-63,-424,-66,-67,-68,-69,-70,-71,124,124,124,-303,-312,-313,-279,-356,-366,-367,-250,-254,-280,-424,-264,-316,-317,-157,-50,-53,-96,-99,-100,-377,-378,-379,-323,-405,-374,-375,-376,-380,-372,-386,-385,-55,-424,-253,-424,-242,-243,-244,-245,-246,-247,-65,-252,-110,-111,124,-309,-290,124,124,124,124,-266,124,-424,-424,-424,-424,-365,-291,-294,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,-290,-309,-315,-267,-268,-156,124,-424,-412,-424,-95,-94,-98,124,124,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-59,-62,-256,-257,-424,-106,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,124,-235,-236,-237,-238,-363,-364,-277,-175,-311,-287,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,-402,-401,-411,-424,-424,-357,-360,-424,-424,-358,-361,-424,-424,-105,124,-278,-424,-118,124,124,-424,-263,-318,-319,-159,-424,-171,-409,-410,-205,-206,-258,-259,-52,-64,-48,-109,124,-108,-424,124,-424,124,124,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-414,-107,-112,-113,-424,-117,124,-424,-424,-155,-239,-240,-241,-262,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,124,-424,-114,-151,-260,-424,-150,]),'WHILE':([8,13,47,53,56,71,95,96,102,103,105,108,109,111,114,115,116,117,118,119,125,138,140,148,149,154,161,162,163,166,184,185,186,187,188,189,193,194,195,196,201,208,209,210,213,214,221,222,223,225,229,230,231,232,233,234,235,236,237,257,259,260,263,284,286,287,290,291,294,306,317,321,322,325,326,327,352,354,355,357,358,359,380,399,400,401,402,403,404,407,408,425,426,427,432,433,434,435,436,437,438,440,441,451,452,453,456,457,494,496,497,498,501,505,507,508,510,512,516,520,521,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,554,555,559,561,562,563,565,568,573,580,582,583,584,586,588,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,647,653,655,656,661,662,668,669,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,729,730,732,733,734,735,736,737,738,743,745,750,751,752,753,759,769,770,771,789,795,800,802,803,804,805,806,807,808,809,811,826,829,831,833,834,835,844,846,847,848,849,850,872,874,880,887,890,891,892,893,894,895,896,897,898,899,907,908,909,910,911,915,916,917,918,919,920,923,924,932,943,944,952,954,955,957,958,959,960,961,962,963,964,977,979,980,986,989,990,992,1000,1002,1007,1008,1009,1019,1021,1022,1029,1033,],[-422,-421,-420,-371,-423,127,-181,-424,127,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,-418,-255,-269,-51,-54,-387,-374,-375,-376,127,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-225,-424,-57,-58,-60,-61,-248,-249,-63,-424,-66,-67,-68,-69,-70,-71,127,127,127,-303,-312,-313,-279,-356,-366,-367,-250,-254,-280,-424,-264,-316,-317,-157,-50,-53,-96,-99,-100,-377,-378,-379,-323,-405,-374,-375,-376,-380,-372,-386,-385,-55,-424,-253,-424,-242,-243,-244,-245,-246,-247,-65,-252,-110,-111,127,-309,-290,127,127,127,127,-266,127,-424,-424,-424,-424,-365,-291,-294,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,-290,-309,-315,-267,-268,-156,127,-424,-412,-424,-95,-94,-98,127,127,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-59,-62,-256,-257,-424,-106,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,127,-235,-236,-237,-238,-363,-364,-277,-175,-311,-287,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,-402,-401,-411,-424,-424,-357,-360,-424,-424,-358,-361,-424,-424,-105,127,-278,-424,-118,127,127,-424,-263,-318,-319,-159,-424,-171,-409,-410,-205,-206,-258,-259,-52,-64,-48,-109,127,-108,-424,127,-424,127,127,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-414,-107,-112,-113,-424,-117,127,-424,-424,-155,-239,-240,-241,-262,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,127,-424,-114,-151,-260,-424,-150,]),'TELL':([8,13,47,53,56,71,95,96,102,103,105,108,109,111,114,115,116,117,118,119,125,138,140,148,149,154,161,162,163,166,184,185,186,187,188,189,193,194,195,196,201,208,209,210,213,214,221,222,223,225,229,230,231,232,233,234,235,236,237,257,259,260,263,284,286,287,290,291,294,306,317,321,322,325,326,327,352,354,355,357,358,359,380,399,400,401,402,403,404,407,408,425,426,427,432,433,434,435,436,437,438,440,441,451,452,453,456,457,494,496,497,498,501,505,507,508,510,512,516,520,521,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,554,555,559,561,562,563,565,568,573,580,582,583,584,586,588,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,647,653,655,656,661,662,668,669,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,729,730,732,733,734,735,736,737,738,743,745,750,751,752,753,759,769,770,771,789,795,800,802,803,804,805,806,807,808,809,811,826,829,831,833,834,835,844,846,847,848,849,850,872,874,880,887,890,891,892,893,894,895,896,897,898,899,907,908,909,910,911,915,916,917,918,919,920,923,924,932,943,944,952,954,955,957,958,959,960,961,962,963,964,977,979,980,986,989,990,992,1000,1002,1007,1008,1009,1019,1021,1022,1029,1033,],[-422,-421,-420,-371,-423,128,-181,-424,128,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,-418,-255,-269,-51,-54,-387,-374,-375,-376,128,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-225,-424,-57,-58,-60,-61,-248,-249,-63,-424,-66,-67,-68,-69,-70,-71,128,128,128,-303,-312,-313,-279,-356,-366,-367,-250,-254,-280,-424,-264,-316,-317,-157,-50,-53,-96,-99,-100,-377,-378,-379,-323,-405,-374,-375,-376,-380,-372,-386,-385,-55,-424,-253,-424,-242,-243,-244,-245,-246,-247,-65,-252,-110,-111,128,-309,-290,128,128,128,128,-266,128,-424,-424,-424,-424,-365,-291,-294,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,-290,-309,-315,-267,-268,-156,128,-424,-412,-424,-95,-94,-98,128,128,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-59,-62,-256,-257,-424,-106,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,128,-235,-236,-237,-238,-363,-364,-277,-175,-311,-287,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,-402,-401,-411,-424,-424,-357,-360,-424,-424,-358,-361,-424,-424,-105,128,-278,-424,-118,128,128,-424,-263,-318,-319,-159,-424,-171,-409,-410,-205,-206,-258,-259,-52,-64,-48,-109,128,-108,-424,128,-424,128,128,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-414,-107,-112,-113,-424,-117,128,-424,-424,-155,-239,-240,-241,-262,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,128,-424,-114,-151,-260,-424,-150,]),'TITLE':([8,13,47,53,56,71,95,96,102,103,105,108,109,111,114,115,116,117,118,119,125,138,140,148,149,154,161,162,163,166,184,185,186,187,188,189,193,194,195,196,201,208,209,210,213,214,221,222,223,225,229,230,231,232,233,234,235,236,237,257,259,260,263,284,286,287,290,291,294,306,317,321,322,325,326,327,352,354,355,357,358,359,380,399,400,401,402,403,404,407,408,425,426,427,432,433,434,435,436,437,438,440,441,451,452,453,456,457,494,496,497,498,501,505,507,508,510,512,516,520,521,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,554,555,559,561,562,563,565,568,573,580,582,583,584,586,588,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,647,653,655,656,661,662,668,669,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,729,730,732,733,734,735,736,737,738,743,745,750,751,752,753,759,769,770,771,789,795,800,802,803,804,805,806,807,808,809,811,826,829,831,833,834,835,844,846,847,848,849,850,872,874,880,887,890,891,892,893,894,895,896,897,898,899,907,908,909,910,911,915,916,917,918,919,920,923,924,932,943,944,952,954,955,957,958,959,960,961,962,963,964,977,979,980,986,989,990,992,1000,1002,1007,1008,1009,1019,1021,1022,1029,1033,],[-422,-421,-420,-371,-423,129,-181,-424,129,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,-418,-255,-269,-51,-54,-387,-374,-375,-376,129,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-225,-424,-57,-58,-60,-61,-248,-249,-63,-424,-66,-67,-68,-69,-70,-71,129,129,129,-303,-312,-313,-279,-356,-366,-367,-250,-254,-280,-424,-264,-316,-317,-157,-50,-53,-96,-99,-100,-377,-378,-379,-323,-405,-374,-375,-376,-380,-372,-386,-385,-55,-424,-253,-424,-242,-243,-244,-245,-246,-247,-65,-252,-110,-111,129,-309,-290,129,129,129,129,-266,129,-424,-424,-424,-424,-365,-291,-294,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,-290,-309,-315,-267,-268,-156,129,-424,-412,-424,-95,-94,-98,129,129,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-59,-62,-256,-257,-424,-106,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,129,-235,-236,-237,-238,-363,-364,-277,-175,-311,-287,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,-402,-401,-411,-424,-424,-357,-360,-424,-424,-358,-361,-424,-424,-105,129,-278,-424,-118,129,129,-424,-263,-318,-319,-159,-424,-171,-409,-410,-205,-206,-258,-259,-52,-64,-48,-109,129,-108,-424,129,-424,129,129,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-414,-107,-112,-113,-424,-117,129,-424,-424,-155,-239,-240,-241,-262,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,129,-424,-114,-151,-260,-424,-150,]),'SUBTITLE':([8,13,47,53,56,71,95,96,102,103,105,108,109,111,114,115,116,117,118,119,125,138,140,148,149,154,161,162,163,166,184,185,186,187,188,189,193,194,195,196,201,208,209,210,213,214,221,222,223,225,229,230,231,232,233,234,235,236,237,257,259,260,263,284,286,287,290,291,294,306,317,321,322,325,326,327,352,354,355,357,358,359,380,399,400,401,402,403,404,407,408,425,426,427,432,433,434,435,436,437,438,440,441,451,452,453,456,457,494,496,497,498,501,505,507,508,510,512,516,520,521,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,554,555,559,561,562,563,565,568,573,580,582,583,584,586,588,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,647,653,655,656,661,662,668,669,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,729,730,732,733,734,735,736,737,738,743,745,750,751,752,753,759,769,770,771,789,795,800,802,803,804,805,806,807,808,809,811,826,829,831,833,834,835,844,846,847,848,849,850,872,874,880,887,890,891,892,893,894,895,896,897,898,899,907,908,909,910,911,915,916,917,918,919,920,923,924,932,943,944,952,954,955,957,958,959,960,961,962,963,964,977,979,980,986,989,990,992,1000,1002,1007,1008,1009,1019,1021,1022,1029,1033,],[-422,-421,-420,-371,-423,130,-181,-424,130,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,-418,-255,-269,-51,-54,-387,-374,-375,-376,130,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-225,-424,-57,-58,-60,-61,-248,-249,-63,-424,-66,-67,-68,-69,-70,-71,130,130,130,-303,-312,-313,-279,-356,-366,-367,-250,-254,-280,-424,-264,-316,-317,-157,-50,-53,-96,-99,-100,-377,-378,-379,-323,-405,-374,-375,-376,-380,-372,-386,-385,-55,-424,-253,-424,-242,-243,-244,-245,-246,-247,-65,-252,-110,-111,130,-309,-290,130,130,130,130,-266,130,-424,-424,-424,-424,-365,-291,-294,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,-290,-309,-315,-267,-268,-156,130,-424,-412,-424,-95,-94,-98,130,130,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-59,-62,-256,-257,-424,-106,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,130,-235,-236,-237,-238,-363,-364,-277,-175,-311,-287,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,-402,-401,-411,-424,-424,-357,-360,-424,-424,-358,-361,-424,-424,-105,130,-278,-424,-118,130,130,-424,-263,-318,-319,-159,-424,-171,-409,-410,-205,-206,-258,-259,-52,-64,-48,-109,130,-108,-424,130,-424,130,130,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-414,-107,-112,-113,-424,-117,130,-424,-424,-155,-239,-240,-241,-262,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,130,-424,-114,-151,-260,-424,-150,]),'ACTIONBAR':([8,13,47,53,56,71,95,96,102,103,105,108,109,111,114,115,116,117,118,119,125,138,140,148,149,154,161,162,163,166,184,185,186,187,188,189,193,194,195,196,201,208,209,210,213,214,221,222,223,225,229,230,231,232,233,234,235,236,237,257,259,260,263,284,286,287,290,291,294,306,317,321,322,325,326,327,352,354,355,357,358,359,380,399,400,401,402,403,404,407,408,425,426,427,432,433,434,435,436,437,438,440,441,451,452,453,456,457,494,496,497,498,501,505,507,508,510,512,516,520,521,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,554,555,559,561,562,563,565,568,573,580,582,583,584,586,588,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,647,653,655,656,661,662,668,669,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,729,730,732,733,734,735,736,737,738,743,745,750,751,752,753,759,769,770,771,789,795,800,802,803,804,805,806,807,808,809,811,826,829,831,833,834,835,844,846,847,848,849,850,872,874,880,887,890,891,892,893,894,895,896,897,898,899,907,908,909,910,911,915,916,917,918,919,920,923,924,932,943,944,952,954,955,957,958,959,960,961,962,963,964,977,979,980,986,989,990,992,1000,1002,1007,1008,1009,1019,1021,1022,1029,1033,],[-422,-421,-420,-371,-423,131,-181,-424,131,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,-418,-255,-269,-51,-54,-387,-374,-375,-376,131,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-225,-424,-57,-58,-60,-61,-248,-249,-63,-424,-66,-67,-68,-69,-70,-71,131,131,131,-303,-312,-313,-279,-356,-366,-367,-250,-254,-280,-424,-264,-316,-317,-157,-50,-53,-96,-99,-100,-377,-378,-379,-323,-405,-374,-375,-376,-380,-372,-386,-385,-55,-424,-253,-424,-242,-243,-244,-245,-246,-247,-65,-252,-110,-111,131,-309,-290,131,131,131,131,-266,131,-424,-424,-424,-424,-365,-291,-294,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,-290,-309,-315,-267,-268,-156,131,-424,-412,-424,-95,-94,-98,131,131,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-59,-62,-256,-257,-424,-106,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,131,-235,-236,-237,-238,-363,-364,-277,-175,-311,-287,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,-402,-401,-411,-424,-424,-357,-360,-424,-424,-358,-361,-424,-424,-105,131,-278,-424,-118,131,131,-424,-263,-318,-319,-159,-424,-171,-409,-410,-205,-206,-258,-259,-52,-64,-48,-109,131,-108,-424,131,-424,131,131,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-414,-107,-112,-113,-424,-117,131,-424,-424,-155,-239,-240,-241,-262,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,131,-424,-114,-151,-260,-424,-150,]),'REMOVE':([8,13,47,53,56,71,95,96,102,103,105,108,109,111,114,115,116,117,118,119,125,138,140,148,149,154,161,162,163,166,184,185,186,187,188,189,193,194,195,196,201,208,209,210,213,214,221,222,223,225,229,230,231,232,233,234,235,236,237,257,259,260,263,284,286,287,290,291,294,306,317,321,322,325,326,327,352,354,355,357,358,359,380,399,400,401,402,403,404,407,408,425,426,427,432,433,434,435,436,437,438,440,441,451,452,453,456,457,494,496,497,498,501,505,507,508,510,512,516,520,521,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,554,555,559,561,562,563,565,568,573,580,582,583,584,586,588,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,647,653,655,656,661,662,668,669,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,729,730,732,733,734,735,736,737,738,743,745,750,751,752,753,759,769,770,771,789,795,800,802,803,804,805,806,807,808,809,811,826,829,831,833,834,835,844,846,847,848,849,850,872,874,880,887,890,891,892,893,894,895,896,897,898,899,907,908,909,910,911,915,916,917,918,919,920,923,924,932,943,944,952,954,955,957,958,959,960,961,962,963,964,977,979,980,986,989,990,992,1000,1002,1007,1008,1009,1019,1021,1022,1029,1033,],[-422,-421,-420,-371,-423,132,-181,-424,132,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,-418,-255,-269,-51,-54,-387,-374,-375,-376,132,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-225,-424,-57,-58,-60,-61,-248,-249,-63,-424,-66,-67,-68,-69,-70,-71,132,132,132,-303,-312,-313,-279,-356,-366,-367,-250,-254,-280,-424,-264,-316,-317,-157,-50,-53,-96,-99,-100,-377,-378,-379,-323,-405,-374,-375,-376,-380,-372,-386,-385,-55,-424,-253,-424,-242,-243,-244,-245,-246,-247,-65,-252,-110,-111,132,-309,-290,132,132,132,132,-266,132,-424,-424,-424,-424,-365,-291,-294,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,-290,-309,-315,-267,-268,-156,132,-424,-412,-424,-95,-94,-98,132,132,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-59,-62,-256,-257,-424,-106,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,132,-235,-236,-237,-238,-363,-364,-277,-175,-311,-287,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,-402,-401,-411,-424,-424,-357,-360,-424,-424,-358,-361,-424,-424,-105,132,-278,-424,-118,132,132,-424,-263,-318,-319,-159,-424,-171,-409,-410,-205,-206,-258,-259,-52,-64,-48,-109,132,-108,-424,132,-424,132,132,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-414,-107,-112,-113,-424,-117,132,-424,-424,-155,-239,-240,-241,-262,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,132,-424,-114,-151,-260,-424,-150,]),'RETURN':([8,13,47,53,56,71,95,96,102,103,105,108,109,111,114,115,116,117,118,119,125,138,140,148,149,154,161,162,163,166,184,185,186,187,188,189,193,194,195,196,201,208,209,210,213,214,221,222,223,225,229,230,231,232,233,234,235,236,237,257,259,260,263,284,286,287,290,291,294,306,317,321,322,325,326,327,352,354,355,357,358,359,380,399,400,401,402,403,404,407,408,425,426,427,432,433,434,435,436,437,438,440,441,451,452,453,456,457,494,496,497,498,501,505,507,508,510,512,516,520,521,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,554,555,559,561,562,563,565,568,573,580,582,583,584,586,588,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,647,653,655,656,661,662,668,669,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,729,730,732,733,734,735,736,737,738,743,745,750,751,752,753,759,769,770,771,789,795,800,802,803,804,805,806,807,808,809,811,826,829,831,833,834,835,844,846,847,848,849,850,872,874,880,887,890,891,892,893,894,895,896,897,898,899,907,908,909,910,911,915,916,917,918,919,920,923,924,932,943,944,952,954,955,957,958,959,960,961,962,963,964,977,979,980,986,989,990,992,1000,1002,1007,1008,1009,1019,1021,1022,1029,1033,],[-422,-421,-420,-371,-423,133,-181,-424,133,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,-418,-255,-269,-51,-54,-387,-374,-375,-376,133,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-225,-424,-57,-58,-60,-61,-248,-249,-63,-424,-66,-67,-68,-69,-70,-71,133,133,133,-303,-312,-313,-279,-356,-366,-367,-250,-254,-280,-424,-264,-316,-317,-157,-50,-53,-96,-99,-100,-377,-378,-379,-323,-405,-374,-375,-376,-380,-372,-386,-385,-55,-424,-253,-424,-242,-243,-244,-245,-246,-247,-65,-252,-110,-111,133,-309,-290,133,133,133,133,-266,133,-424,-424,-424,-424,-365,-291,-294,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,-290,-309,-315,-267,-268,-156,133,-424,-412,-424,-95,-94,-98,133,133,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-59,-62,-256,-257,-424,-106,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,133,-235,-236,-237,-238,-363,-364,-277,-175,-311,-287,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,-402,-401,-411,-424,-424,-357,-360,-424,-424,-358,-361,-424,-424,-105,133,-278,-424,-118,133,133,-424,-263,-318,-319,-159,-424,-171,-409,-410,-205,-206,-258,-259,-52,-64,-48,-109,133,-108,-424,133,-424,133,133,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-414,-107,-112,-113,-424,-117,133,-424,-424,-155,-239,-240,-241,-262,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,133,-424,-114,-151,-260,-424,-150,]),'LBRACKET':([8,13,47,53,56,58,71,90,91,95,96,102,103,105,108,109,111,113,114,115,116,117,118,119,121,122,123,124,125,127,133,138,140,141,143,148,149,150,152,154,156,159,161,162,163,166,182,184,185,186,187,188,189,190,191,193,194,195,196,201,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,225,227,228,229,230,231,232,233,234,235,236,237,242,243,244,245,246,247,248,251,256,257,259,260,262,263,267,272,278,279,281,282,283,284,286,287,289,290,291,293,294,295,296,297,298,299,300,306,308,309,311,312,313,314,316,317,321,322,325,326,327,336,338,340,341,343,350,352,353,354,355,357,358,359,380,381,382,384,385,386,387,388,389,390,391,392,393,395,396,397,398,399,400,401,402,403,404,405,406,407,408,425,426,427,431,432,433,434,435,436,437,438,440,441,445,449,451,452,453,454,455,456,457,458,460,463,464,468,470,471,472,473,474,475,476,477,478,479,480,484,485,487,488,489,490,491,493,494,496,497,498,501,502,503,505,507,508,509,510,511,512,513,514,515,516,519,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,541,543,546,547,551,552,553,554,555,559,561,562,563,564,565,568,569,572,573,577,578,580,581,582,583,584,586,588,593,594,595,596,597,599,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,619,621,622,625,647,648,653,655,656,661,662,667,668,669,677,678,679,680,681,682,683,684,687,688,693,694,695,696,697,698,699,700,704,706,707,712,713,714,715,716,717,718,719,720,721,723,724,725,729,730,731,732,733,734,735,736,737,738,743,745,750,751,752,753,759,761,762,763,764,765,767,769,770,771,789,795,800,802,803,804,805,806,807,808,809,811,826,829,831,832,833,834,835,844,846,847,848,849,850,851,866,872,873,874,880,887,890,891,892,893,894,895,896,897,898,899,900,907,908,909,910,911,915,916,917,918,919,920,922,923,924,929,932,936,937,938,943,944,952,954,955,956,957,958,959,960,961,962,963,964,967,977,979,980,986,989,990,991,992,997,998,999,1000,1002,1007,1008,1009,1015,1019,1021,1022,1029,1033,],[-422,-421,-420,-371,-423,90,139,182,182,200,-424,139,-56,-424,-424,-424,-424,227,-424,-424,-424,-424,-424,-424,246,139,200,139,-418,139,139,-255,-269,139,319,-51,-54,139,341,-387,139,182,-374,-375,-376,139,-424,397,-383,-384,-388,-389,-390,182,-424,-372,-373,-380,-251,-225,-424,-57,-58,182,428,-60,-61,139,139,139,139,139,139,-248,-249,-63,-424,139,447,-66,-67,-68,-69,-70,-71,139,139,139,-390,246,341,139,-424,139,-372,227,182,-303,-312,-313,319,-279,227,200,139,139,182,182,182,-356,-366,-367,319,-250,227,246,-280,139,139,139,139,139,139,182,-424,182,246,-90,-91,-92,139,-264,560,-317,564,-50,-53,139,227,397,-424,-372,182,-96,182,182,-100,-377,-378,-379,-323,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,397,-374,-375,-376,-380,-372,182,-424,-386,-385,-55,-424,648,139,-424,-242,-243,-244,-245,-246,-247,-65,-252,139,139,-110,-111,139,139,246,-309,-290,-372,227,246,139,428,447,139,139,139,139,139,139,139,139,139,139,690,690,139,139,139,139,139,182,139,139,139,139,-266,139,182,139,-424,-389,182,-389,182,-389,182,428,447,-365,227,-291,-294,139,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,182,182,139,139,246,139,139,-290,-309,-315,-267,-268,-156,182,139,-424,139,139,182,182,182,182,-97,-95,-94,-98,139,139,-424,-424,-424,-424,-424,397,397,397,397,182,397,397,397,397,397,397,397,182,397,397,397,397,182,-182,-183,-184,-59,139,-62,-256,-257,-424,-106,139,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,690,690,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,139,-235,-236,182,-237,182,-238,182,-363,-364,-277,-175,182,-311,-287,139,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,866,866,866,866,866,-424,397,397,-411,-424,-424,-357,-360,-424,-424,-358,-361,-424,-424,-105,139,-278,-424,-118,139,139,139,-424,922,-318,-319,182,-424,-171,139,-424,-409,182,-410,-205,-206,-258,-259,-52,-64,-48,-109,139,-108,-424,139,139,-424,139,139,-115,-424,-154,-424,-424,-424,-424,-276,182,-158,-173,866,-414,-321,182,182,-107,-112,-113,-424,-117,139,139,-424,-424,-155,-239,-240,-241,991,139,-424,-424,-275,-116,-152,-153,182,-261,-424,182,182,-207,-149,-424,139,-424,866,-114,-151,-260,-424,-150,]),'REF':([8,13,47,53,56,71,95,96,102,103,105,108,109,111,114,115,116,117,118,119,121,122,124,125,127,133,138,140,141,148,149,150,152,154,156,161,162,163,166,184,185,186,187,188,189,193,194,195,196,201,208,209,210,213,214,215,216,217,218,219,220,221,222,223,225,227,229,230,231,232,233,234,235,236,237,243,244,245,247,257,259,260,263,278,279,284,286,287,290,291,293,294,295,296,297,298,299,300,306,311,316,317,321,322,325,326,327,336,352,354,355,357,358,359,380,399,400,401,402,403,404,407,408,425,426,427,431,432,433,434,435,436,437,438,440,441,445,449,451,452,453,454,455,456,457,463,464,471,472,473,474,475,476,477,478,479,480,487,488,489,490,491,494,496,497,498,501,502,505,507,508,510,512,516,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,546,547,551,552,553,554,555,559,561,562,563,565,568,569,572,573,580,582,583,584,586,588,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,647,648,653,655,656,661,662,667,668,669,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,729,730,731,732,733,734,735,736,737,738,743,745,750,751,752,753,759,769,770,771,789,795,800,802,803,804,805,806,807,808,809,811,826,829,831,832,833,834,835,844,846,847,848,849,850,851,872,874,880,887,890,891,892,893,894,895,896,897,898,899,900,907,908,909,910,911,915,916,917,918,919,920,923,924,932,943,944,952,954,955,956,957,958,959,960,961,962,963,964,967,977,979,980,986,989,990,992,1000,1002,1007,1008,1009,1019,1021,1022,1029,1033,],[-422,-421,-420,-371,-423,142,-181,-424,142,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,142,142,142,-418,142,142,-255,-269,142,-51,-54,142,142,-387,142,-374,-375,-376,142,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-225,-424,-57,-58,-60,-61,142,142,142,142,142,142,-248,-249,-63,-424,142,-66,-67,-68,-69,-70,-71,142,142,142,142,142,142,142,-303,-312,-313,-279,142,142,-356,-366,-367,-250,-254,142,-280,142,142,142,142,142,142,-424,142,142,-264,-316,-317,-157,-50,-53,142,-96,-99,-100,-377,-378,-379,-323,-405,-374,-375,-376,-380,-372,-386,-385,-55,-424,-253,142,-424,-242,-243,-244,-245,-246,-247,-65,-252,142,142,-110,-111,142,142,142,-309,-290,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,-266,142,142,-424,-424,-424,-424,-365,-291,-294,142,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,142,142,142,142,142,-290,-309,-315,-267,-268,-156,142,-424,142,142,-412,-424,-95,-94,-98,142,142,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-59,142,-62,-256,-257,-424,-106,142,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,142,-235,-236,-237,-238,-363,-364,-277,-175,-311,-287,142,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,-402,-401,-411,-424,-424,-357,-360,-424,-424,-358,-361,-424,-424,-105,142,-278,-424,-118,142,142,142,-424,-263,-318,-319,-159,-424,-171,142,-409,-410,-205,-206,-258,-259,-52,-64,-48,-109,142,-108,-424,142,142,-424,142,142,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-414,-107,-112,-113,-424,-117,142,142,-424,-424,-155,-239,-240,-241,-262,142,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,142,-424,-114,-151,-260,-424,-150,]),'COLON':([8,13,47,53,56,66,71,94,95,96,102,103,105,108,109,111,113,114,115,116,117,118,119,121,122,124,125,127,132,133,138,140,141,148,149,150,152,154,156,161,162,163,166,184,185,186,187,188,189,193,194,195,196,201,208,209,210,213,214,215,216,217,218,219,220,221,222,223,225,227,229,230,231,232,233,234,235,236,237,243,244,245,247,251,257,259,260,263,267,278,279,284,286,287,288,290,291,293,294,295,296,297,298,299,300,301,302,303,304,306,311,316,317,321,322,325,326,327,329,336,338,352,354,355,357,358,359,375,376,377,378,379,380,399,400,401,402,403,404,407,408,425,426,427,431,432,433,434,435,436,437,438,440,441,445,449,451,452,453,454,455,456,457,460,463,464,471,472,473,474,475,476,477,478,479,480,487,488,489,490,491,494,496,497,498,501,502,505,507,508,510,512,516,519,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,546,547,551,552,553,554,555,559,561,562,563,565,568,569,572,573,580,582,583,584,586,588,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,638,647,648,653,655,656,661,662,667,668,669,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,729,730,731,732,733,734,735,736,737,738,743,745,750,751,752,753,759,769,770,771,789,795,800,802,803,804,805,806,807,808,809,811,826,829,831,832,833,834,835,844,846,847,848,849,850,851,872,874,880,886,887,890,891,892,893,894,895,896,897,898,899,900,907,908,909,910,911,915,916,917,918,919,920,923,924,932,943,944,952,954,955,956,957,958,959,960,961,962,963,964,967,977,979,980,986,989,990,992,1000,1002,1007,1008,1009,1019,1021,1022,1029,1033,],[-422,-421,-420,-371,-423,98,143,198,-181,-424,143,-56,-424,-424,-424,-424,228,-424,-424,-424,-424,-424,-424,262,268,268,-418,262,289,268,-255,-269,268,-51,-54,268,268,-387,262,-374,-375,-376,143,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-225,-424,-57,-58,-60,-61,268,268,268,268,268,268,-248,-249,-63,-424,268,-66,-67,-68,-69,-70,-71,143,143,143,268,268,268,268,470,-303,-312,-313,-279,500,268,268,-356,-366,-367,515,-250,517,268,-280,268,268,268,268,268,268,289,289,289,289,-424,268,268,-264,-316,-317,-157,-50,-53,566,262,500,-96,-99,-100,-377,-378,-379,593,594,595,596,597,-323,-405,-374,-375,-376,-380,-372,-386,-385,-55,-424,-253,268,-424,-242,-243,-244,-245,-246,-247,-65,-252,268,268,-110,-111,143,262,268,-309,-290,517,268,268,268,268,268,268,268,268,268,268,268,268,268,268,268,268,268,143,143,143,143,-266,268,143,-424,-424,-424,-424,-365,517,-291,-294,268,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,268,268,268,268,268,-290,-309,-315,-267,-268,-156,143,-424,268,268,-412,-424,-95,-94,-98,143,143,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,792,-59,268,-62,-256,-257,-424,-106,268,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,143,-235,-236,-237,-238,-363,-364,-277,-175,-311,-287,268,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,-402,-401,-411,-424,-424,-357,-360,-424,-424,-358,-361,-424,-424,-105,143,-278,-424,-118,268,143,143,-424,-263,-318,-319,-159,-424,-171,268,-409,-410,-205,940,-206,-258,-259,-52,-64,-48,-109,143,-108,-424,143,268,-424,143,143,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-414,-107,-112,-113,-424,-117,268,143,-424,-424,-155,-239,-240,-241,-262,268,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,143,-424,-114,-151,-260,-424,-150,]),'SUCCESS':([8,13,47,53,56,71,95,96,102,103,105,108,109,111,114,115,116,117,118,119,121,122,124,125,127,133,138,140,141,148,149,150,152,154,156,161,162,163,166,184,185,186,187,188,189,193,194,195,196,201,208,209,210,213,214,215,216,217,218,219,220,221,222,223,225,227,229,230,231,232,233,234,235,236,237,243,244,245,247,257,259,260,263,278,279,284,286,287,290,291,293,294,295,296,297,298,299,300,306,311,316,317,321,322,325,326,327,336,352,354,355,357,358,359,380,399,400,401,402,403,404,407,408,425,426,427,431,432,433,434,435,436,437,438,440,441,445,449,451,452,453,454,455,456,457,463,464,471,472,473,474,475,476,477,478,479,480,487,488,489,490,491,494,496,497,498,501,502,505,507,508,510,512,516,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,546,547,551,552,553,554,555,559,561,562,563,565,568,569,572,573,580,582,583,584,586,588,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,647,648,653,655,656,661,662,667,668,669,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,729,730,731,732,733,734,735,736,737,738,743,745,750,751,752,753,759,769,770,771,789,795,800,802,803,804,805,806,807,808,809,811,826,829,831,832,833,834,835,844,846,847,848,849,850,851,872,874,880,887,890,891,892,893,894,895,896,897,898,899,900,907,908,909,910,911,915,916,917,918,919,920,923,924,932,943,944,952,954,955,956,957,958,959,960,961,962,963,964,967,977,979,980,986,989,990,992,1000,1002,1007,1008,1009,1019,1021,1022,1029,1033,],[-422,-421,-420,-371,-423,144,-181,-424,144,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,144,144,144,-418,144,144,-255,-269,144,-51,-54,144,144,-387,144,-374,-375,-376,144,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-225,-424,-57,-58,-60,-61,144,144,144,144,144,144,-248,-249,-63,-424,144,-66,-67,-68,-69,-70,-71,144,144,144,144,144,144,144,-303,-312,-313,-279,144,144,-356,-366,-367,-250,-254,144,-280,144,144,144,144,144,144,-424,144,144,-264,-316,-317,-157,-50,-53,144,-96,-99,-100,-377,-378,-379,-323,-405,-374,-375,-376,-380,-372,-386,-385,-55,-424,-253,144,-424,-242,-243,-244,-245,-246,-247,-65,-252,144,144,-110,-111,144,144,144,-309,-290,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,-266,144,144,-424,-424,-424,-424,-365,-291,-294,144,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,144,144,144,144,144,-290,-309,-315,-267,-268,-156,144,-424,144,144,-412,-424,-95,-94,-98,144,144,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-59,144,-62,-256,-257,-424,-106,144,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,144,-235,-236,-237,-238,-363,-364,-277,-175,-311,-287,144,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,-402,-401,-411,-424,-424,-357,-360,-424,-424,-358,-361,-424,-424,-105,144,-278,-424,-118,144,144,144,-424,-263,-318,-319,-159,-424,-171,144,-409,-410,-205,-206,-258,-259,-52,-64,-48,-109,144,-108,-424,144,144,-424,144,144,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-414,-107,-112,-113,-424,-117,144,144,-424,-424,-155,-239,-240,-241,-262,144,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,144,-424,-114,-151,-260,-424,-150,]),'RESULT':([8,13,47,53,56,71,95,96,102,103,105,108,109,111,114,115,116,117,118,119,121,122,124,125,127,133,138,140,141,148,149,150,152,154,156,161,162,163,166,184,185,186,187,188,189,193,194,195,196,201,208,209,210,213,214,215,216,217,218,219,220,221,222,223,225,227,229,230,231,232,233,234,235,236,237,243,244,245,247,257,259,260,263,278,279,284,286,287,290,291,293,294,295,296,297,298,299,300,306,311,316,317,321,322,325,326,327,336,352,354,355,357,358,359,380,399,400,401,402,403,404,407,408,425,426,427,431,432,433,434,435,436,437,438,440,441,445,449,451,452,453,454,455,456,457,463,464,471,472,473,474,475,476,477,478,479,480,487,488,489,490,491,494,496,497,498,501,502,505,507,508,510,512,516,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,546,547,551,552,553,554,555,559,561,562,563,565,568,569,572,573,580,582,583,584,586,588,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,647,648,653,655,656,661,662,667,668,669,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,729,730,731,732,733,734,735,736,737,738,743,745,750,751,752,753,759,769,770,771,789,795,800,802,803,804,805,806,807,808,809,811,826,829,831,832,833,834,835,844,846,847,848,849,850,851,872,874,880,887,890,891,892,893,894,895,896,897,898,899,900,907,908,909,910,911,915,916,917,918,919,920,923,924,932,943,944,952,954,955,956,957,958,959,960,961,962,963,964,967,977,979,980,986,989,990,992,1000,1002,1007,1008,1009,1019,1021,1022,1029,1033,],[-422,-421,-420,-371,-423,145,-181,-424,145,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,145,145,145,-418,145,145,-255,-269,145,-51,-54,145,145,-387,145,-374,-375,-376,145,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-225,-424,-57,-58,-60,-61,145,145,145,145,145,145,-248,-249,-63,-424,145,-66,-67,-68,-69,-70,-71,145,145,145,145,145,145,145,-303,-312,-313,-279,145,145,-356,-366,-367,-250,-254,145,-280,145,145,145,145,145,145,-424,145,145,-264,-316,-317,-157,-50,-53,145,-96,-99,-100,-377,-378,-379,-323,-405,-374,-375,-376,-380,-372,-386,-385,-55,-424,-253,145,-424,-242,-243,-244,-245,-246,-247,-65,-252,145,145,-110,-111,145,145,145,-309,-290,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,-266,145,145,-424,-424,-424,-424,-365,-291,-294,145,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,145,145,145,145,145,-290,-309,-315,-267,-268,-156,145,-424,145,145,-412,-424,-95,-94,-98,145,145,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-59,145,-62,-256,-257,-424,-106,145,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,145,-235,-236,-237,-238,-363,-364,-277,-175,-311,-287,145,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,-402,-401,-411,-424,-424,-357,-360,-424,-424,-358,-361,-424,-424,-105,145,-278,-424,-118,145,145,145,-424,-263,-318,-319,-159,-424,-171,145,-409,-410,-205,-206,-258,-259,-52,-64,-48,-109,145,-108,-424,145,145,-424,145,145,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-414,-107,-112,-113,-424,-117,145,145,-424,-424,-155,-239,-240,-241,-262,145,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,145,-424,-114,-151,-260,-424,-150,]),'CREATE':([8,13,47,53,56,71,95,96,102,103,105,108,109,111,114,115,116,117,118,119,122,125,138,140,148,149,154,161,162,163,166,184,185,186,187,188,189,193,194,195,196,201,208,209,210,213,214,215,221,222,223,225,229,230,231,232,233,234,235,236,237,257,259,260,263,284,286,287,290,291,294,306,317,321,322,325,326,327,352,354,355,357,358,359,380,399,400,401,402,403,404,407,408,420,421,425,426,427,432,433,434,435,436,437,438,440,441,451,452,453,456,457,494,496,497,498,501,505,507,508,510,512,516,520,521,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,554,555,559,561,562,563,565,568,573,580,582,583,584,586,588,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,647,653,655,656,661,662,668,669,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,729,730,732,733,734,735,736,737,738,743,745,750,751,752,753,759,769,770,771,789,790,795,800,802,803,804,805,806,807,808,809,811,826,829,831,833,834,835,844,846,847,848,849,850,872,874,880,887,888,890,891,892,893,894,895,896,897,898,899,907,908,909,910,911,915,916,917,918,919,920,923,924,932,943,944,952,954,955,957,958,959,960,961,962,963,964,977,979,980,986,989,990,992,1000,1002,1007,1008,1009,1019,1021,1022,1029,1033,],[-422,-421,-420,-371,-423,146,-181,-424,146,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,146,-418,-255,-269,-51,-54,-387,-374,-375,-376,146,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-225,-424,-57,-58,-60,-61,146,-248,-249,-63,-424,-66,-67,-68,-69,-70,-71,146,146,146,-303,-312,-313,-279,-356,-366,-367,-250,-254,-280,-424,-264,-316,-317,-157,-50,-53,-96,-99,-100,-377,-378,-379,-323,-405,-374,-375,-376,-380,-372,-386,-385,640,640,-55,-424,-253,-424,-242,-243,-244,-245,-246,-247,-65,-252,-110,-111,146,-309,-290,146,146,146,146,-266,146,-424,-424,-424,-424,-365,-291,-294,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,-290,-309,-315,-267,-268,-156,146,-424,-412,-424,-95,-94,-98,146,146,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-59,-62,-256,-257,-424,-106,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,146,-235,-236,-237,-238,-363,-364,-277,-175,-311,-287,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,-402,-401,-411,-424,640,-424,-357,-360,-424,-424,-358,-361,-424,-424,-105,146,-278,-424,-118,146,146,-424,-263,-318,-319,-159,-424,-171,-409,-410,-205,-206,640,-258,-259,-52,-64,-48,-109,146,-108,-424,146,-424,146,146,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-414,-107,-112,-113,-424,-117,146,-424,-424,-155,-239,-240,-241,-262,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,146,-424,-114,-151,-260,-424,-150,]),'LESS':([8,13,47,53,56,71,95,96,102,103,105,108,109,111,114,115,116,117,118,119,121,125,127,133,138,140,141,148,149,150,154,156,161,162,163,166,184,185,186,187,188,189,193,194,195,196,201,208,209,210,212,213,214,215,216,217,218,219,220,221,222,223,225,227,229,230,231,232,233,234,235,236,237,240,242,243,244,245,247,248,251,252,257,259,260,263,278,279,284,286,287,290,291,293,294,295,296,297,298,299,300,306,311,316,317,321,322,325,326,327,336,340,343,352,354,355,357,358,359,380,399,400,401,402,403,404,407,408,417,420,421,425,426,427,431,432,433,434,435,436,437,438,440,441,445,449,451,452,453,454,455,456,457,458,463,464,468,471,472,473,474,475,476,477,478,479,480,482,484,487,488,489,490,491,492,494,496,497,498,501,502,505,507,508,510,512,516,518,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,544,546,547,551,552,553,554,555,559,561,562,563,565,568,569,573,580,582,583,584,586,588,599,602,603,604,606,607,608,609,610,611,612,614,615,616,617,621,622,625,647,648,653,655,656,661,662,667,668,669,671,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,729,730,731,732,733,734,735,736,737,738,743,745,750,751,752,753,759,769,770,771,789,790,795,800,802,803,804,805,806,807,808,809,811,816,826,829,831,832,833,834,835,844,846,847,848,849,850,872,874,880,887,888,890,891,892,893,894,895,896,897,898,899,900,907,908,909,910,911,915,916,917,918,919,920,923,924,932,943,944,952,954,955,956,957,958,959,960,961,962,963,964,967,977,979,980,986,989,990,992,1000,1002,1007,1008,1009,1019,1021,1022,1029,1033,],[-422,-421,-420,-371,-423,152,-181,-424,152,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,244,-418,244,293,-255,-269,293,-51,-54,293,-387,244,-374,-375,-376,152,390,-383,-384,-388,-389,-390,-372,-373,-380,-251,-225,-424,-57,-58,429,-60,-61,293,293,293,293,293,293,-248,-249,-63,-424,293,-66,-67,-68,-69,-70,-71,152,152,152,-255,-390,293,293,293,293,-372,-254,472,-303,-312,-313,-279,293,293,-356,-366,-367,-250,-254,293,-280,293,293,293,293,293,293,-424,293,293,-264,-316,-317,-157,-50,-53,244,390,-372,-96,-99,-100,-377,-378,-379,-323,390,-374,-375,-376,-380,-372,-386,-385,631,639,639,-55,-424,-253,293,-424,-242,-243,-244,-245,-246,-247,-65,-252,293,293,-110,-111,152,244,293,-309,-290,-372,293,293,670,293,293,293,293,293,293,293,293,293,293,152,-390,293,293,293,293,293,-266,152,152,152,152,-266,293,152,-424,-389,-389,-389,-365,722,-291,-294,293,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,722,293,293,293,293,293,-290,-309,-315,-267,-268,-156,152,-424,293,-412,-424,-95,-94,-98,152,152,390,390,390,390,390,390,390,390,390,390,390,390,390,390,390,-182,-183,-184,-59,293,-62,-256,-257,-424,-106,293,-314,-274,-265,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,152,-235,-236,-237,-238,-363,-364,-277,-175,-311,-287,293,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,390,390,-411,-424,639,-424,-357,-360,-424,-424,-358,-361,-424,-424,-105,152,429,-278,-424,-118,293,152,152,-424,-263,-318,-319,-159,-424,-171,-409,-410,-205,-206,639,-258,-259,-52,-64,-48,-109,152,-108,-424,152,293,-424,152,152,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-414,-107,-112,-113,-424,-117,293,152,-424,-424,-155,-239,-240,-241,-262,293,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,152,-424,-114,-151,-260,-424,-150,]),'WITH':([8,13,47,53,56,71,95,96,102,103,105,108,109,111,114,115,116,117,118,119,125,138,140,148,149,154,161,162,163,166,184,185,186,187,188,189,193,194,195,196,201,208,209,210,213,214,221,222,223,225,229,230,231,232,233,234,235,236,237,257,259,260,263,284,286,287,290,291,294,306,317,321,322,325,326,327,352,354,355,357,358,359,380,399,400,401,402,403,404,407,408,425,426,427,432,433,434,435,436,437,438,440,441,451,452,453,456,457,494,496,497,498,501,505,507,508,510,512,516,520,521,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,554,555,559,561,562,563,565,568,573,580,582,583,584,586,588,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,647,653,655,656,661,662,668,669,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,729,730,732,733,734,735,736,737,738,743,745,750,751,752,753,759,769,770,771,789,795,800,802,803,804,805,806,807,808,809,811,826,829,831,833,834,835,844,846,847,848,849,850,872,874,880,887,890,891,892,893,894,895,896,897,898,899,907,908,909,910,911,915,916,917,918,919,920,923,924,932,943,944,952,954,955,957,958,959,960,961,962,963,964,977,979,980,986,989,990,992,1000,1002,1007,1008,1009,1019,1021,1022,1029,1033,],[-422,-421,-420,-371,-423,155,-181,-424,155,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,-418,-255,-269,-51,-54,-387,-374,-375,-376,155,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-225,-424,-57,-58,-60,-61,-248,-249,-63,-424,-66,-67,-68,-69,-70,-71,155,155,155,-303,-312,-313,-279,-356,-366,-367,-250,-254,-280,-424,-264,-316,-317,-157,-50,-53,-96,-99,-100,-377,-378,-379,-323,-405,-374,-375,-376,-380,-372,-386,-385,-55,-424,-253,-424,-242,-243,-244,-245,-246,-247,-65,-252,-110,-111,155,-309,-290,155,155,155,155,-266,155,-424,-424,-424,-424,-365,-291,-294,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,-290,-309,-315,-267,-268,-156,155,744,-412,-424,-95,-94,-98,155,155,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-59,-62,-256,-257,-424,-106,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,155,-235,-236,-237,-238,-363,-364,-277,-175,-311,-287,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,-402,-401,-411,-424,-424,-357,-360,744,-424,-358,-361,744,-424,-105,155,-278,-424,-118,155,155,-424,-263,-318,-319,-159,-424,-171,-409,-410,-205,-206,-258,-259,-52,-64,-48,-109,155,-108,-424,155,-424,155,155,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-414,-107,-112,-113,-424,-117,155,-424,-424,-155,-239,-240,-241,-262,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,155,-424,-114,-151,-260,-424,-150,]),'FUNCTION_ID':([8,13,40,47,53,56,71,77,95,96,102,103,105,108,109,111,114,115,116,117,118,119,121,125,127,133,137,138,140,141,147,148,149,150,154,156,161,162,163,166,184,185,186,187,188,189,192,193,194,195,196,201,208,209,210,212,213,214,215,216,217,218,219,220,221,222,223,225,227,228,229,230,231,232,233,234,235,236,237,243,244,245,247,257,259,260,263,278,279,284,286,287,290,291,293,294,295,296,297,298,299,300,306,311,316,317,321,322,325,326,327,336,342,352,354,355,357,358,359,380,399,400,401,402,403,404,407,408,425,426,427,431,432,433,434,435,436,437,438,440,441,445,449,451,452,453,454,455,456,457,463,464,468,470,471,472,473,474,475,476,477,478,479,480,486,487,488,489,490,491,494,496,497,498,501,502,505,507,508,510,512,516,517,518,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,544,546,547,551,552,553,554,555,559,561,562,563,565,566,567,568,569,573,574,575,580,582,583,584,586,588,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,647,648,653,655,656,661,662,667,668,669,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,729,730,731,732,733,734,735,736,737,738,743,745,748,750,751,752,753,759,769,770,771,789,795,800,802,803,804,805,806,807,808,809,811,826,829,831,832,833,834,835,844,846,847,848,849,850,872,874,880,887,890,891,892,893,894,895,896,897,898,899,900,907,908,909,910,911,915,916,917,918,919,920,923,924,932,943,944,952,954,955,956,957,958,959,960,961,962,963,964,967,977,979,980,986,989,990,992,1000,1002,1007,1008,1009,1011,1012,1019,1021,1022,1029,1033,],[-422,-421,75,-420,-371,-423,150,172,-181,-424,150,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,150,-418,150,150,306,-255,-269,150,150,-51,-54,150,-387,150,-374,-375,-376,150,-382,-383,-384,-388,-389,-390,406,-372,-373,-380,-251,-225,-424,-57,-58,431,-60,-61,150,150,150,150,150,150,-248,-249,-63,-424,150,449,-66,-67,-68,-69,-70,-71,150,150,150,150,150,150,150,-303,-312,-313,-279,150,150,-356,-366,-367,-250,-254,150,-280,150,150,150,150,150,150,-424,150,150,-264,-316,-317,-157,-50,-53,150,406,-96,-99,-100,-377,-378,-379,-323,-405,-374,-375,-376,-380,-372,-386,-385,-55,-424,-253,150,-424,-242,-243,-244,-245,-246,-247,-65,-252,150,150,-110,-111,150,150,150,-309,-290,150,150,431,449,150,150,150,150,150,150,150,150,150,150,406,150,150,150,150,150,150,150,150,150,-266,150,150,-424,-424,-424,-424,-365,449,431,-291,-294,150,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,431,150,150,150,150,150,-290,-309,-315,-267,-268,-156,150,449,431,-424,150,-412,-166,-168,-424,-95,-94,-98,150,150,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-59,150,-62,-256,-257,-424,-106,150,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,150,-235,-236,-237,-238,-363,-364,-277,-175,-311,-287,150,-304,-284,-306,-286,-320,-359,-362,-49,-172,-167,-101,-97,-102,-93,-322,-402,-401,-411,-424,-424,-357,-360,-424,-424,-358,-361,-424,-424,-105,150,-278,-424,-118,150,150,150,-424,-263,-318,-319,-159,-424,-171,-409,-410,-205,-206,-258,-259,-52,-64,-48,-109,150,-108,-424,150,150,-424,150,150,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-414,-107,-112,-113,-424,-117,150,150,-424,-424,-155,-239,-240,-241,-262,150,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,150,-424,-169,-170,-114,-151,-260,-424,-150,]),'UNLESS':([8,13,47,53,56,71,95,96,102,103,105,108,109,111,114,115,116,117,118,119,125,138,140,148,149,151,153,154,161,162,163,166,184,185,186,187,188,189,193,194,195,196,201,208,209,210,213,214,221,222,223,225,229,230,231,232,233,234,235,236,237,239,240,241,242,248,249,251,252,254,255,257,259,260,263,266,274,275,276,277,284,286,287,290,291,294,306,308,310,312,313,314,317,321,322,325,326,327,345,346,347,348,349,352,354,355,356,357,358,359,380,399,400,401,402,403,404,407,408,425,426,427,432,433,434,435,436,437,438,440,441,451,452,453,456,457,458,465,469,484,485,492,494,496,497,498,501,505,507,508,510,512,516,520,521,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,543,545,554,555,559,561,562,563,565,568,570,571,573,580,582,583,584,586,588,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,647,653,655,656,661,662,663,665,668,669,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,687,688,689,691,692,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,728,729,730,732,733,734,735,736,737,738,743,745,750,751,752,753,759,769,770,771,789,795,800,801,802,803,804,805,806,807,808,809,811,813,817,818,819,820,821,825,826,829,831,833,834,835,844,845,846,847,848,849,850,872,874,880,887,890,891,892,893,894,895,896,897,898,899,902,903,904,907,908,909,910,911,915,916,917,918,919,920,923,924,932,943,944,952,954,955,957,958,959,960,961,962,963,964,966,977,979,980,986,989,990,992,1000,1002,1007,1008,1009,1019,1021,1022,1029,1033,],[-422,-421,-420,-371,-423,156,-181,-424,156,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,-418,-255,-269,-51,-54,156,-273,-387,-374,-375,-376,156,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-225,-424,-57,-58,-60,-61,-248,-249,-63,-424,-66,-67,-68,-69,-70,-71,156,156,156,-74,-255,-132,-418,-387,-119,-254,-128,-129,-130,-303,-312,-313,-279,-76,-82,-83,-84,156,-356,-366,-367,-250,-254,-280,-424,-424,-80,-90,-91,-92,-264,-316,-317,-157,-50,-53,-75,-85,-86,-87,-88,-96,-99,-100,-89,-377,-378,-379,-323,-405,-374,-375,-376,-380,-372,-386,-385,-55,-424,-253,-424,-242,-243,-244,-245,-246,-247,-65,-252,-110,-111,156,-309,-290,-387,-127,-120,-424,-424,-266,156,156,156,156,-266,156,-424,-424,-424,-424,-365,-291,-294,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,-77,-79,-290,-309,-315,-267,-268,-156,156,-424,-76,-270,-412,-424,-95,-94,-98,156,156,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-59,-62,-256,-257,-424,-106,156,-131,-314,-274,-265,-121,-122,-123,-124,-125,-304,-284,-305,-306,-286,-307,-308,-310,-126,-424,-424,-424,-138,-424,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,156,-235,-236,-237,-238,-363,-364,-277,-175,-78,-311,-287,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,-402,-401,-411,-424,-424,-357,-271,-360,-424,-424,-358,-361,-424,-424,-105,156,156,-424,-424,-135,-147,-148,-136,-278,-424,-118,156,156,-424,-263,-81,-318,-319,-159,-424,-171,-409,-410,-205,-206,-258,-259,-52,-64,-48,-109,156,-108,-424,156,-133,-134,-137,-424,156,156,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-414,-107,-112,-113,-424,-117,156,-424,-424,-155,-239,-240,-241,-262,-272,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,156,-424,-114,-151,-260,-424,-150,]),'AT':([8,13,47,53,56,71,95,96,102,103,105,108,109,111,114,115,116,117,118,119,125,138,140,148,149,151,153,154,161,162,163,166,184,185,186,187,188,189,193,194,195,196,201,208,209,210,213,214,221,222,223,225,229,230,231,232,233,234,235,236,237,239,240,241,242,248,249,251,252,254,255,257,259,260,263,266,274,275,276,277,284,286,287,290,291,294,306,307,308,310,312,313,314,317,321,322,325,326,327,345,346,347,348,349,352,354,355,356,357,358,359,380,399,400,401,402,403,404,407,408,425,426,427,432,433,434,435,436,437,438,440,441,451,452,453,456,457,458,465,469,484,485,492,494,496,497,498,501,505,507,508,510,512,516,520,521,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,543,545,554,555,559,561,562,563,565,568,570,571,573,580,582,583,584,586,588,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,647,653,655,656,661,662,663,665,668,669,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,687,688,689,691,692,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,728,729,730,732,733,734,735,736,737,738,743,745,750,751,752,753,759,769,770,771,789,795,800,801,802,803,804,805,806,807,808,809,811,813,817,818,819,820,821,825,826,829,831,833,834,835,844,845,846,847,848,849,850,872,874,880,887,890,891,892,893,894,895,896,897,898,899,902,903,904,907,908,909,910,911,915,916,917,918,919,920,923,924,932,943,944,952,954,955,957,958,959,960,961,962,963,964,966,977,979,980,986,989,990,992,1000,1002,1007,1008,1009,1019,1021,1022,1029,1033,],[-422,-421,-420,-371,-423,141,-181,-424,141,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,-418,-255,-269,-51,-54,141,-273,-387,-374,-375,-376,141,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-225,-424,-57,-58,-60,-61,-248,-249,-63,-424,-66,-67,-68,-69,-70,-71,141,141,141,-74,-255,-132,-418,-387,-119,-254,-128,-129,-130,-303,-312,-313,-279,-76,-82,-83,-84,141,-356,-366,-367,-250,-254,-280,-424,541,-424,-80,-90,-91,-92,-264,-316,-317,-157,-50,-53,-75,-85,-86,-87,-88,-96,-99,-100,-89,-377,-378,-379,-323,-405,-374,-375,-376,-380,-372,-386,-385,-55,-424,-253,-424,-242,-243,-244,-245,-246,-247,-65,-252,-110,-111,141,-309,-290,-387,-127,-120,-424,-424,-266,141,141,141,141,-266,141,-424,-424,-424,-424,-365,-291,-294,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,-77,-79,-290,-309,-315,-267,-268,-156,141,-424,-76,-270,-412,-424,-95,-94,-98,141,141,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-59,-62,-256,-257,-424,-106,141,-131,-314,-274,-265,-121,-122,-123,-124,-125,-304,-284,-305,-306,-286,-307,-308,-310,-126,-424,-424,-424,-138,-424,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,141,-235,-236,-237,-238,-363,-364,-277,-175,-78,-311,-287,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,-402,-401,-411,-424,-424,-357,-271,-360,-424,-424,-358,-361,-424,-424,-105,141,141,-424,-424,-135,-147,-148,-136,-278,-424,-118,141,141,-424,-263,-81,-318,-319,-159,-424,-171,-409,-410,-205,-206,-258,-259,-52,-64,-48,-109,141,-108,-424,141,-133,-134,-137,-424,141,141,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-414,-107,-112,-113,-424,-117,141,-424,-424,-155,-239,-240,-241,-262,-272,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,141,-424,-114,-151,-260,-424,-150,]),'IN':([8,13,47,53,56,71,95,96,102,103,105,108,109,111,114,115,116,117,118,119,125,138,140,148,149,151,153,154,161,162,163,166,184,185,186,187,188,189,193,194,195,196,201,208,209,210,213,214,221,222,223,225,229,230,231,232,233,234,235,236,237,239,240,241,242,248,249,251,252,254,255,257,259,260,263,266,271,272,274,275,276,277,284,286,287,290,291,294,306,308,310,312,313,314,317,321,322,325,326,327,345,346,347,348,349,352,354,355,356,357,358,359,380,399,400,401,402,403,404,407,408,425,426,427,432,433,434,435,436,437,438,440,441,451,452,453,456,457,458,465,469,484,485,492,494,496,497,498,501,505,507,508,510,512,516,520,521,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,543,545,554,555,559,561,562,563,565,568,570,571,573,580,582,583,584,586,588,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,647,653,655,656,661,662,663,665,668,669,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,687,688,689,691,692,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,728,729,730,732,733,734,735,736,737,738,743,745,750,751,752,753,759,769,770,771,789,795,800,801,802,803,804,805,806,807,808,809,811,813,817,818,819,820,821,825,826,829,831,833,834,835,844,845,846,847,848,849,850,872,874,880,887,890,891,892,893,894,895,896,897,898,899,902,903,904,907,908,909,910,911,915,916,917,918,919,920,923,924,932,943,944,952,954,955,957,958,959,960,961,962,963,964,966,977,979,980,986,989,990,992,1000,1002,1007,1008,1009,1019,1021,1022,1029,1033,],[-422,-421,-420,-371,-423,126,-181,-424,126,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,-418,-255,-269,-51,-54,126,-273,-387,-374,-375,-376,126,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-225,-424,-57,-58,-60,-61,-248,-249,-63,-424,-66,-67,-68,-69,-70,-71,126,126,126,-74,-255,-132,-418,-387,-119,-254,-128,-129,-130,-303,-312,-313,-279,-76,503,504,-82,-83,-84,126,-356,-366,-367,-250,-254,-280,-424,-424,-80,-90,-91,-92,-264,-316,-317,-157,-50,-53,-75,-85,-86,-87,-88,-96,-99,-100,-89,-377,-378,-379,-323,-405,-374,-375,-376,-380,-372,-386,-385,-55,-424,-253,-424,-242,-243,-244,-245,-246,-247,-65,-252,-110,-111,126,-309,-290,-387,-127,-120,-424,-424,-266,126,126,126,126,-266,126,-424,-424,-424,-424,-365,-291,-294,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,-77,-79,-290,-309,-315,-267,-268,-156,126,-424,-76,-270,-412,-424,-95,-94,-98,126,126,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-59,-62,-256,-257,-424,-106,126,-131,-314,-274,-265,-121,-122,-123,-124,-125,-304,-284,-305,-306,-286,-307,-308,-310,-126,-424,-424,-424,-138,-424,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,126,-235,-236,-237,-238,-363,-364,-277,-175,-78,-311,-287,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,-402,-401,-411,-424,-424,-357,-271,-360,-424,-424,-358,-361,-424,-424,-105,126,126,-424,-424,-135,-147,-148,-136,-278,-424,-118,126,126,-424,-263,-81,-318,-319,-159,-424,-171,-409,-410,-205,-206,-258,-259,-52,-64,-48,-109,126,-108,-424,126,-133,-134,-137,-424,126,126,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-414,-107,-112,-113,-424,-117,126,-424,-424,-155,-239,-240,-241,-262,-272,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,126,-424,-114,-151,-260,-424,-150,]),'ON':([8,13,47,53,56,71,95,96,102,103,105,108,109,111,114,115,116,117,118,119,125,138,140,148,149,151,153,154,161,162,163,166,184,185,186,187,188,189,193,194,195,196,201,208,209,210,213,214,221,222,223,225,229,230,231,232,233,234,235,236,237,239,240,241,242,248,249,251,252,254,255,257,259,260,263,266,274,275,276,277,284,286,287,290,291,294,306,308,310,312,313,314,317,321,322,325,326,327,345,346,347,348,349,352,354,355,356,357,358,359,380,399,400,401,402,403,404,407,408,425,426,427,432,433,434,435,436,437,438,440,441,451,452,453,456,457,458,465,469,484,485,492,494,496,497,498,501,505,507,508,510,512,516,520,521,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,543,545,554,555,559,561,562,563,565,568,570,571,573,580,582,583,584,586,588,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,647,653,655,656,661,662,663,665,668,669,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,687,688,689,691,692,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,728,729,730,732,733,734,735,736,737,738,743,745,750,751,752,753,759,769,770,771,789,795,800,801,802,803,804,805,806,807,808,809,811,813,817,818,819,820,821,825,826,829,831,833,834,835,844,845,846,847,848,849,850,872,874,880,887,890,891,892,893,894,895,896,897,898,899,902,903,904,907,908,909,910,911,915,916,917,918,919,920,923,924,932,943,944,952,954,955,957,958,959,960,961,962,963,964,966,977,979,980,986,989,990,992,1000,1002,1007,1008,1009,1019,1021,1022,1029,1033,],[-422,-421,-420,-371,-423,157,-181,-424,157,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,-418,-255,-269,-51,-54,157,-273,-387,-374,-375,-376,157,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-225,-424,-57,-58,-60,-61,-248,-249,-63,-424,-66,-67,-68,-69,-70,-71,157,157,157,-74,-255,-132,-418,-387,-119,-254,-128,-129,-130,-303,-312,-313,-279,-76,-82,-83,-84,157,-356,-366,-367,-250,-254,-280,-424,-424,-80,-90,-91,-92,-264,-316,-317,-157,-50,-53,-75,-85,-86,-87,-88,-96,-99,-100,-89,-377,-378,-379,-323,-405,-374,-375,-376,-380,-372,-386,-385,-55,-424,-253,-424,-242,-243,-244,-245,-246,-247,-65,-252,-110,-111,157,-309,-290,-387,-127,-120,-424,-424,-266,157,157,157,157,-266,157,-424,-424,-424,-424,-365,-291,-294,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,-77,-79,-290,-309,-315,-267,-268,-156,157,-424,-76,-270,-412,-424,-95,-94,-98,157,157,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-59,-62,-256,-257,-424,-106,157,-131,-314,-274,-265,-121,-122,-123,-124,-125,-304,-284,-305,-306,-286,-307,-308,-310,-126,-424,-424,-424,-138,-424,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,157,-235,-236,-237,-238,-363,-364,-277,-175,-78,-311,-287,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,-402,-401,-411,-424,-424,-357,-271,-360,-424,-424,-358,-361,-424,-424,-105,157,157,-424,-424,-135,-147,-148,-136,-278,-424,-118,157,157,-424,-263,-81,-318,-319,-159,-424,-171,-409,-410,-205,-206,-258,-259,-52,-64,-48,-109,157,-108,-424,157,-133,-134,-137,-424,157,157,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-414,-107,-112,-113,-424,-117,157,-424,-424,-155,-239,-240,-241,-262,-272,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,157,-424,-114,-151,-260,-424,-150,]),'ROTATED':([8,13,47,53,56,71,95,96,102,103,105,108,109,111,114,115,116,117,118,119,125,138,140,148,149,151,153,154,161,162,163,166,184,185,186,187,188,189,193,194,195,196,201,208,209,210,213,214,221,222,223,225,229,230,231,232,233,234,235,236,237,239,240,241,242,248,249,251,252,254,255,257,259,260,263,266,274,275,276,277,284,286,287,290,291,294,306,308,310,312,313,314,317,321,322,325,326,327,345,346,347,348,349,352,354,355,356,357,358,359,380,399,400,401,402,403,404,407,408,425,426,427,432,433,434,435,436,437,438,440,441,451,452,453,456,457,458,465,469,484,485,492,494,496,497,498,501,505,507,508,510,512,516,520,521,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,543,545,554,555,559,561,562,563,565,568,570,571,573,580,582,583,584,586,588,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,647,653,655,656,661,662,663,665,668,669,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,687,688,689,691,692,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,728,729,730,732,733,734,735,736,737,738,743,745,750,751,752,753,759,769,770,771,789,795,800,801,802,803,804,805,806,807,808,809,811,813,817,818,819,820,821,825,826,829,831,833,834,835,844,845,846,847,848,849,850,872,874,880,887,890,891,892,893,894,895,896,897,898,899,902,903,904,907,908,909,910,911,915,916,917,918,919,920,923,924,932,943,944,952,954,955,957,958,959,960,961,962,963,964,966,977,979,980,986,989,990,992,1000,1002,1007,1008,1009,1019,1021,1022,1029,1033,],[-422,-421,-420,-371,-423,158,-181,-424,158,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,-418,-255,-269,-51,-54,158,-273,-387,-374,-375,-376,158,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-225,-424,-57,-58,-60,-61,-248,-249,-63,-424,-66,-67,-68,-69,-70,-71,158,158,158,-74,-255,-132,-418,-387,-119,-254,-128,-129,-130,-303,-312,-313,-279,-76,-82,-83,-84,158,-356,-366,-367,-250,-254,-280,-424,-424,-80,-90,-91,-92,-264,-316,-317,-157,-50,-53,-75,-85,-86,-87,-88,-96,-99,-100,-89,-377,-378,-379,-323,-405,-374,-375,-376,-380,-372,-386,-385,-55,-424,-253,-424,-242,-243,-244,-245,-246,-247,-65,-252,-110,-111,158,-309,-290,-387,-127,-120,-424,-424,-266,158,158,158,158,-266,158,-424,-424,-424,-424,-365,-291,-294,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,-77,-79,-290,-309,-315,-267,-268,-156,158,-424,-76,-270,-412,-424,-95,-94,-98,158,158,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-59,-62,-256,-257,-424,-106,158,-131,-314,-274,-265,-121,-122,-123,-124,-125,-304,-284,-305,-306,-286,-307,-308,-310,-126,-424,-424,-424,-138,-424,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,158,-235,-236,-237,-238,-363,-364,-277,-175,-78,-311,-287,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,-402,-401,-411,-424,-424,-357,-271,-360,-424,-424,-358,-361,-424,-424,-105,158,158,-424,-424,-135,-147,-148,-136,-278,-424,-118,158,158,-424,-263,-81,-318,-319,-159,-424,-171,-409,-410,-205,-206,-258,-259,-52,-64,-48,-109,158,-108,-424,158,-133,-134,-137,-424,158,158,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-414,-107,-112,-113,-424,-117,158,-424,-424,-155,-239,-240,-241,-262,-272,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,158,-424,-114,-151,-260,-424,-150,]),'ALIGN':([8,13,47,53,56,71,95,96,102,103,105,108,109,111,114,115,116,117,118,119,125,138,140,148,149,151,153,154,161,162,163,166,184,185,186,187,188,189,193,194,195,196,201,208,209,210,213,214,221,222,223,225,229,230,231,232,233,234,235,236,237,239,240,241,242,248,249,251,252,254,255,257,259,260,263,266,274,275,276,277,284,286,287,290,291,294,306,308,310,312,313,314,317,321,322,325,326,327,345,346,347,348,349,352,354,355,356,357,358,359,380,399,400,401,402,403,404,407,408,425,426,427,432,433,434,435,436,437,438,440,441,451,452,453,456,457,458,465,469,484,485,492,494,496,497,498,501,505,507,508,510,512,516,520,521,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,543,545,554,555,559,561,562,563,565,568,570,571,573,580,582,583,584,586,588,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,647,653,655,656,661,662,663,665,668,669,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,687,688,689,691,692,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,728,729,730,732,733,734,735,736,737,738,743,745,750,751,752,753,759,769,770,771,789,795,800,801,802,803,804,805,806,807,808,809,811,813,817,818,819,820,821,825,826,829,831,833,834,835,844,845,846,847,848,849,850,872,874,880,887,890,891,892,893,894,895,896,897,898,899,902,903,904,907,908,909,910,911,915,916,917,918,919,920,923,924,932,943,944,952,954,955,957,958,959,960,961,962,963,964,966,977,979,980,986,989,990,992,1000,1002,1007,1008,1009,1019,1021,1022,1029,1033,],[-422,-421,-420,-371,-423,160,-181,-424,160,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,-418,-255,-269,-51,-54,160,-273,-387,-374,-375,-376,160,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-225,-424,-57,-58,-60,-61,-248,-249,-63,-424,-66,-67,-68,-69,-70,-71,160,160,160,-74,-255,-132,-418,-387,-119,-254,-128,-129,-130,-303,-312,-313,-279,-76,-82,-83,-84,160,-356,-366,-367,-250,-254,-280,-424,-424,-80,-90,-91,-92,-264,-316,-317,-157,-50,-53,-75,-85,-86,-87,-88,-96,-99,-100,-89,-377,-378,-379,-323,-405,-374,-375,-376,-380,-372,-386,-385,-55,-424,-253,-424,-242,-243,-244,-245,-246,-247,-65,-252,-110,-111,160,-309,-290,-387,-127,-120,-424,-424,-266,160,160,160,160,-266,160,-424,-424,-424,-424,-365,-291,-294,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,-77,-79,-290,-309,-315,-267,-268,-156,160,-424,-76,-270,-412,-424,-95,-94,-98,160,160,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-59,-62,-256,-257,-424,-106,160,-131,-314,-274,-265,-121,-122,-123,-124,-125,-304,-284,-305,-306,-286,-307,-308,-310,-126,-424,-424,-424,-138,-424,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,160,-235,-236,-237,-238,-363,-364,-277,-175,-78,-311,-287,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,-402,-401,-411,-424,-424,-357,-271,-360,-424,-424,-358,-361,-424,-424,-105,160,160,-424,-424,-135,-147,-148,-136,-278,-424,-118,160,160,-424,-263,-81,-318,-319,-159,-424,-171,-409,-410,-205,-206,-258,-259,-52,-64,-48,-109,160,-108,-424,160,-133,-134,-137,-424,160,160,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-414,-107,-112,-113,-424,-117,160,-424,-424,-155,-239,-240,-241,-262,-272,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,160,-424,-114,-151,-260,-424,-150,]),'BINARY':([8,13,47,53,56,71,82,90,91,95,96,98,102,103,105,108,109,111,114,115,116,117,118,119,121,122,124,125,127,133,138,140,141,148,149,150,152,154,156,159,161,162,163,164,166,182,184,185,186,187,188,189,190,191,193,194,195,196,200,201,208,209,210,211,213,214,215,216,217,218,219,220,221,222,223,225,227,229,230,231,232,233,234,235,236,237,243,244,245,246,247,256,257,259,260,263,278,279,281,282,283,284,286,287,290,291,293,294,295,296,297,298,299,300,306,308,309,311,312,313,314,316,317,321,322,325,326,327,336,341,350,352,353,354,355,357,358,359,380,381,382,384,385,386,387,388,389,390,391,392,393,395,396,397,398,399,400,401,402,403,404,405,406,407,408,423,425,426,427,431,432,433,434,435,436,437,438,440,441,445,449,451,452,453,454,455,456,457,463,464,471,472,473,474,475,476,477,478,479,480,481,484,487,488,489,490,491,493,494,496,497,498,501,502,503,505,507,508,509,510,511,512,513,516,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,541,543,546,547,551,552,553,554,555,559,560,561,562,563,564,565,568,569,572,573,577,578,580,581,582,583,584,586,588,593,594,595,596,597,602,603,604,605,606,607,608,609,610,611,612,613,614,615,617,619,621,622,625,626,627,628,629,630,631,647,648,653,655,656,661,662,667,668,669,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,704,706,707,712,713,714,715,716,717,718,719,720,721,723,724,725,729,730,731,732,733,734,735,736,737,738,743,745,750,751,752,753,759,761,762,763,764,765,767,769,770,771,789,795,797,800,802,803,804,805,806,807,808,809,811,826,829,831,832,833,834,835,844,846,847,848,849,850,851,866,867,872,873,874,878,880,887,890,891,892,893,894,895,896,897,898,899,900,905,906,907,908,909,910,911,915,916,917,918,919,920,922,923,924,929,932,933,936,937,938,942,943,944,952,954,955,956,957,958,959,960,961,962,963,964,967,977,979,980,986,989,990,991,992,996,997,998,999,1000,1001,1002,1007,1008,1009,1014,1015,1019,1021,1022,1029,1031,1033,1035,],[-422,-421,-420,-371,-423,161,161,161,161,-181,-424,161,161,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,161,161,161,-418,161,161,-255,-269,161,-51,-54,161,161,-387,161,161,-374,-375,-376,357,161,-424,-382,-383,-384,-388,-389,-390,400,-424,-372,-373,-380,-251,161,-225,-424,-57,-58,161,-60,-61,161,161,161,161,161,161,-248,-249,-63,-424,161,-66,-67,-68,-69,-70,-71,161,161,161,400,161,161,-424,161,161,-303,-312,-313,-279,400,161,161,161,161,-356,-366,-367,-250,-254,161,-280,161,161,161,161,161,161,161,-424,161,161,-90,-91,-92,400,-264,-316,-317,161,-50,-53,161,-424,161,-96,161,161,-100,-377,-378,-379,-323,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,161,-405,-374,-375,-376,-380,-372,161,-424,-386,-385,161,-55,-424,-253,161,-424,-242,-243,-244,-245,-246,-247,-65,-252,400,161,-110,-111,161,161,400,-309,-290,400,161,161,161,161,161,161,161,161,161,161,161,161,-390,161,161,161,161,161,161,161,161,161,161,-266,161,161,161,-424,-389,161,-389,161,-389,161,-365,-291,-294,161,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,161,161,161,161,400,161,161,-290,-309,-315,161,-267,-268,-156,161,161,-424,161,161,161,161,161,161,-97,-95,-94,-98,161,161,-424,-424,-424,-424,-424,-391,-392,-393,161,-394,-395,-396,-397,-398,-399,-400,161,-403,-404,-413,161,-182,-183,-184,161,161,161,161,161,161,-59,161,-62,-256,-257,-424,-106,161,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,161,-235,-236,161,-237,161,-238,161,-363,-364,-277,-175,161,-311,-287,161,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,161,161,161,161,161,-424,-402,-401,-411,-424,-424,161,-357,-360,-424,-424,-358,-361,-424,-424,-105,161,-278,-424,-118,161,161,161,-424,-263,-318,-319,161,-424,-171,161,-424,357,-409,161,-410,161,-205,-206,-258,-259,-52,-64,-48,-109,161,-108,-424,161,161,161,161,-424,161,161,-115,-424,-154,-424,-424,-424,-424,-276,161,-158,-173,161,-414,161,-321,161,161,161,-107,-112,-113,-424,-117,161,161,-424,-424,-155,-239,-240,-241,-262,161,-424,-424,-275,-116,-152,-153,161,-261,-424,-424,161,161,-207,161,-149,-424,161,-424,161,161,-114,-151,-260,-424,-424,-150,161,]),'DECIMAL':([8,13,47,53,56,71,82,90,91,95,96,98,102,103,105,108,109,111,114,115,116,117,118,119,121,122,124,125,127,133,138,140,141,148,149,150,152,154,156,159,161,162,163,164,166,182,184,185,186,187,188,189,190,191,193,194,195,196,200,201,208,209,210,211,213,214,215,216,217,218,219,220,221,222,223,225,227,229,230,231,232,233,234,235,236,237,243,244,245,246,247,256,257,259,260,263,278,279,281,282,283,284,286,287,290,291,293,294,295,296,297,298,299,300,306,308,309,311,312,313,314,316,317,321,322,325,326,327,336,341,350,352,353,354,355,357,358,359,380,381,382,384,385,386,387,388,389,390,391,392,393,395,396,397,398,399,400,401,402,403,404,405,406,407,408,423,425,426,427,431,432,433,434,435,436,437,438,440,441,445,449,451,452,453,454,455,456,457,463,464,471,472,473,474,475,476,477,478,479,480,481,484,487,488,489,490,491,493,494,496,497,498,501,502,503,505,507,508,509,510,511,512,513,516,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,541,543,546,547,551,552,553,554,555,559,560,561,562,563,564,565,568,569,572,573,577,578,580,581,582,583,584,586,588,593,594,595,596,597,602,603,604,605,606,607,608,609,610,611,612,613,614,615,617,619,621,622,625,626,627,628,629,630,631,647,648,653,655,656,661,662,667,668,669,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,704,706,707,712,713,714,715,716,717,718,719,720,721,723,724,725,729,730,731,732,733,734,735,736,737,738,743,745,750,751,752,753,759,761,762,763,764,765,767,769,770,771,789,795,797,800,802,803,804,805,806,807,808,809,811,826,829,831,832,833,834,835,844,846,847,848,849,850,851,866,867,872,873,874,878,880,887,890,891,892,893,894,895,896,897,898,899,900,905,906,907,908,909,910,911,915,916,917,918,919,920,922,923,924,929,932,933,936,937,938,942,943,944,952,954,955,956,957,958,959,960,961,962,963,964,967,977,979,980,986,989,990,991,992,996,997,998,999,1000,1001,1002,1007,1008,1009,1014,1015,1019,1021,1022,1029,1031,1033,1035,],[-422,-421,-420,-371,-423,162,162,162,162,-181,-424,162,162,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,162,162,162,-418,162,162,-255,-269,162,-51,-54,162,162,-387,162,162,-374,-375,-376,358,162,-424,-382,-383,-384,-388,-389,-390,401,-424,-372,-373,-380,-251,162,-225,-424,-57,-58,162,-60,-61,162,162,162,162,162,162,-248,-249,-63,-424,162,-66,-67,-68,-69,-70,-71,162,162,162,401,162,162,-424,162,162,-303,-312,-313,-279,401,162,162,162,162,-356,-366,-367,-250,-254,162,-280,162,162,162,162,162,162,162,-424,162,162,-90,-91,-92,401,-264,-316,-317,162,-50,-53,162,-424,162,-96,162,162,-100,-377,-378,-379,-323,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,-405,-374,-375,-376,-380,-372,162,-424,-386,-385,162,-55,-424,-253,162,-424,-242,-243,-244,-245,-246,-247,-65,-252,401,162,-110,-111,162,162,401,-309,-290,401,162,162,162,162,162,162,162,162,162,162,162,162,-390,162,162,162,162,162,162,162,162,162,162,-266,162,162,162,-424,-389,162,-389,162,-389,162,-365,-291,-294,162,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,162,162,162,162,401,162,162,-290,-309,-315,162,-267,-268,-156,162,162,-424,162,162,162,162,162,162,-97,-95,-94,-98,162,162,-424,-424,-424,-424,-424,-391,-392,-393,162,-394,-395,-396,-397,-398,-399,-400,162,-403,-404,-413,162,-182,-183,-184,162,162,162,162,162,162,-59,162,-62,-256,-257,-424,-106,162,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,162,-235,-236,162,-237,162,-238,162,-363,-364,-277,-175,162,-311,-287,162,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,162,162,162,162,162,-424,-402,-401,-411,-424,-424,162,-357,-360,-424,-424,-358,-361,-424,-424,-105,162,-278,-424,-118,162,162,162,-424,-263,-318,-319,162,-424,-171,162,-424,358,-409,162,-410,162,-205,-206,-258,-259,-52,-64,-48,-109,162,-108,-424,162,162,162,162,-424,162,162,-115,-424,-154,-424,-424,-424,-424,-276,162,-158,-173,162,-414,162,-321,162,162,162,-107,-112,-113,-424,-117,162,162,-424,-424,-155,-239,-240,-241,-262,162,-424,-424,-275,-116,-152,-153,162,-261,-424,-424,162,162,-207,162,-149,-424,162,-424,162,162,-114,-151,-260,-424,-424,-150,162,]),'HEX':([8,13,47,53,56,71,82,90,91,95,96,98,102,103,105,108,109,111,114,115,116,117,118,119,121,122,124,125,127,133,138,140,141,148,149,150,152,154,156,159,161,162,163,164,166,182,184,185,186,187,188,189,190,191,193,194,195,196,200,201,208,209,210,211,213,214,215,216,217,218,219,220,221,222,223,225,227,229,230,231,232,233,234,235,236,237,243,244,245,246,247,256,257,259,260,263,278,279,281,282,283,284,286,287,290,291,293,294,295,296,297,298,299,300,306,308,309,311,312,313,314,316,317,321,322,325,326,327,336,341,350,352,353,354,355,357,358,359,380,381,382,384,385,386,387,388,389,390,391,392,393,395,396,397,398,399,400,401,402,403,404,405,406,407,408,423,425,426,427,431,432,433,434,435,436,437,438,440,441,445,449,451,452,453,454,455,456,457,463,464,471,472,473,474,475,476,477,478,479,480,481,484,487,488,489,490,491,493,494,496,497,498,501,502,503,505,507,508,509,510,511,512,513,516,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,541,543,546,547,551,552,553,554,555,559,560,561,562,563,564,565,568,569,572,573,577,578,580,581,582,583,584,586,588,593,594,595,596,597,602,603,604,605,606,607,608,609,610,611,612,613,614,615,617,619,621,622,625,626,627,628,629,630,631,647,648,653,655,656,661,662,667,668,669,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,704,706,707,712,713,714,715,716,717,718,719,720,721,723,724,725,729,730,731,732,733,734,735,736,737,738,743,745,750,751,752,753,759,761,762,763,764,765,767,769,770,771,789,795,797,800,802,803,804,805,806,807,808,809,811,826,829,831,832,833,834,835,844,846,847,848,849,850,851,866,867,872,873,874,878,880,887,890,891,892,893,894,895,896,897,898,899,900,905,906,907,908,909,910,911,915,916,917,918,919,920,922,923,924,929,932,933,936,937,938,942,943,944,952,954,955,956,957,958,959,960,961,962,963,964,967,977,979,980,986,989,990,991,992,996,997,998,999,1000,1001,1002,1007,1008,1009,1014,1015,1019,1021,1022,1029,1031,1033,1035,],[-422,-421,-420,-371,-423,163,163,163,163,-181,-424,163,163,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,163,163,163,-418,163,163,-255,-269,163,-51,-54,163,163,-387,163,163,-374,-375,-376,359,163,-424,-382,-383,-384,-388,-389,-390,402,-424,-372,-373,-380,-251,163,-225,-424,-57,-58,163,-60,-61,163,163,163,163,163,163,-248,-249,-63,-424,163,-66,-67,-68,-69,-70,-71,163,163,163,402,163,163,-424,163,163,-303,-312,-313,-279,402,163,163,163,163,-356,-366,-367,-250,-254,163,-280,163,163,163,163,163,163,163,-424,163,163,-90,-91,-92,402,-264,-316,-317,163,-50,-53,163,-424,163,-96,163,163,-100,-377,-378,-379,-323,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,-405,-374,-375,-376,-380,-372,163,-424,-386,-385,163,-55,-424,-253,163,-424,-242,-243,-244,-245,-246,-247,-65,-252,402,163,-110,-111,163,163,402,-309,-290,402,163,163,163,163,163,163,163,163,163,163,163,163,-390,163,163,163,163,163,163,163,163,163,163,-266,163,163,163,-424,-389,163,-389,163,-389,163,-365,-291,-294,163,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,163,163,163,163,402,163,163,-290,-309,-315,163,-267,-268,-156,163,163,-424,163,163,163,163,163,163,-97,-95,-94,-98,163,163,-424,-424,-424,-424,-424,-391,-392,-393,163,-394,-395,-396,-397,-398,-399,-400,163,-403,-404,-413,163,-182,-183,-184,163,163,163,163,163,163,-59,163,-62,-256,-257,-424,-106,163,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,163,-235,-236,163,-237,163,-238,163,-363,-364,-277,-175,163,-311,-287,163,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,163,163,163,163,163,-424,-402,-401,-411,-424,-424,163,-357,-360,-424,-424,-358,-361,-424,-424,-105,163,-278,-424,-118,163,163,163,-424,-263,-318,-319,163,-424,-171,163,-424,359,-409,163,-410,163,-205,-206,-258,-259,-52,-64,-48,-109,163,-108,-424,163,163,163,163,-424,163,163,-115,-424,-154,-424,-424,-424,-424,-276,163,-158,-173,163,-414,163,-321,163,163,163,-107,-112,-113,-424,-117,163,163,-424,-424,-155,-239,-240,-241,-262,163,-424,-424,-275,-116,-152,-153,163,-261,-424,-424,163,163,-207,163,-149,-424,163,-424,163,163,-114,-151,-260,-424,-424,-150,163,]),'MINUS':([8,13,47,53,56,71,82,90,91,95,96,98,102,103,105,108,109,111,114,115,116,117,118,119,121,122,124,125,127,133,138,140,141,148,149,150,152,154,156,159,161,162,163,166,182,184,185,186,187,188,189,190,191,193,194,195,196,200,201,205,208,209,210,211,213,214,215,216,217,218,219,220,221,222,223,225,227,229,230,231,232,233,234,235,236,237,240,242,243,244,245,246,247,248,251,252,256,257,258,259,260,261,263,278,279,281,282,283,284,286,287,290,291,293,294,295,296,297,298,299,300,306,308,309,310,311,312,313,314,315,316,317,321,322,325,326,327,332,336,340,341,343,350,352,353,354,355,357,358,359,380,381,382,384,385,386,387,388,389,390,391,392,393,395,396,397,398,399,400,401,402,403,404,405,406,407,408,423,425,426,427,431,432,433,434,435,436,437,438,440,441,442,443,444,445,449,451,452,453,454,455,456,457,458,460,461,462,463,464,465,466,467,471,472,473,474,475,476,477,478,479,480,481,484,487,488,489,490,491,492,493,494,496,497,498,501,502,503,505,507,508,509,510,511,512,513,516,519,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,541,543,546,547,549,550,551,552,553,554,555,559,560,561,562,563,564,565,568,569,572,573,577,578,580,581,582,583,584,586,588,593,594,595,596,597,599,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,619,621,622,625,626,627,628,629,630,631,646,647,648,653,655,656,661,662,666,667,668,669,671,672,673,674,675,676,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,704,706,707,708,712,713,714,715,716,717,718,719,720,721,723,724,725,729,730,731,732,733,734,735,736,737,738,743,745,746,750,751,752,753,759,761,762,763,764,765,767,769,770,771,789,795,797,798,799,800,802,803,804,805,806,807,808,809,811,814,826,829,831,832,833,834,835,844,845,846,847,848,849,850,851,866,872,873,874,878,880,887,889,890,891,892,893,894,895,896,897,898,899,900,901,905,906,907,908,909,910,911,912,915,916,917,918,919,920,922,923,924,929,932,933,936,937,938,942,943,944,946,952,954,955,956,957,958,959,960,961,962,963,964,967,977,978,979,980,986,987,989,990,991,992,993,996,997,998,999,1000,1001,1002,1007,1008,1009,1014,1015,1019,1021,1022,1029,1031,1033,1035,],[-422,-421,-420,-371,-423,164,164,190,190,-181,-424,164,164,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,243,164,164,-418,278,278,-255,-269,316,-51,-54,278,190,-387,278,190,-374,-375,-376,164,-424,385,-383,-384,-388,-389,-390,190,-424,-372,-373,-380,-251,164,-225,423,-424,-57,-58,190,-60,-61,278,278,278,278,278,278,-248,-249,-63,-424,445,-66,-67,-68,-69,-70,-71,164,164,164,-255,-390,455,463,278,-424,278,-372,-254,477,190,-303,489,-312,-313,-280,-279,278,278,190,190,190,-356,-366,-367,477,-254,463,-280,316,316,316,278,278,278,190,-424,190,489,551,-90,-91,-92,477,316,-264,-316,-317,190,-50,-53,477,278,385,-424,-372,190,-96,190,190,-100,-377,-378,-379,-323,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,385,-374,-375,-376,-380,-372,190,-424,-386,-385,164,-55,-424,-253,278,-424,477,477,477,477,477,477,-65,-252,-269,477,-387,278,278,-110,-111,164,278,455,477,489,-372,-254,-303,477,463,278,477,477,489,278,278,278,278,278,278,278,278,278,278,164,-390,316,316,316,278,278,-266,190,164,164,164,164,-266,278,190,164,-424,-389,190,-389,190,-389,190,-365,-254,489,477,316,489,477,489,477,477,477,477,-352,-368,-369,-370,-354,-353,-355,-174,-176,190,190,278,316,489,477,551,316,316,489,477,-315,164,-267,-268,-156,190,164,-424,278,164,190,190,190,190,-97,-95,-94,-98,164,164,-424,-424,-424,-424,-424,385,385,385,385,190,385,385,385,385,385,385,385,190,385,385,385,385,190,-182,-183,-184,164,164,164,164,164,164,797,-59,445,-62,-256,-257,-424,-106,-277,278,-314,-274,-265,477,477,477,477,477,477,489,477,477,489,477,477,-310,489,477,489,477,489,477,477,477,-424,-424,-265,477,164,-235,-236,190,-237,190,-238,190,-363,-364,-277,-175,190,489,477,316,477,489,477,489,-320,-359,-362,-49,-172,477,-101,-97,-102,-93,-322,867,867,867,867,867,-424,385,385,-411,-424,-424,164,-269,477,-357,-360,-424,-424,-358,-361,-424,-424,-105,164,477,-278,-424,-118,278,164,164,-424,-263,489,-318,-319,190,-424,-171,164,-424,-409,190,-410,164,-205,-206,942,-258,-259,-52,-64,-48,-109,164,-108,-424,164,278,-276,164,164,-424,164,164,-115,-424,477,-154,-424,-424,-424,-424,-276,190,-158,-173,867,-414,164,-321,190,190,164,-107,-112,477,-113,-424,-117,278,164,-424,-424,-155,-239,-240,-241,-262,278,-424,1001,-424,-275,-116,477,-152,-153,190,-261,477,-424,-424,190,190,-207,164,-149,-424,164,-424,867,867,-114,-151,-260,-424,-424,-150,867,]),'DO':([8,13,47,53,56,71,95,96,102,103,105,108,109,111,114,115,116,117,118,119,120,125,138,140,147,148,149,151,153,154,161,162,163,166,184,185,186,187,188,189,193,194,195,196,201,208,209,210,213,214,221,222,223,225,229,230,231,232,233,234,235,236,237,239,240,241,242,248,249,251,252,254,255,257,259,260,263,264,265,266,267,274,275,276,284,286,287,290,291,294,306,308,310,312,313,314,317,321,322,325,326,327,334,335,345,346,347,348,349,352,354,355,356,357,358,359,380,399,400,401,402,403,404,407,408,425,426,427,432,433,434,435,436,437,438,440,441,451,452,453,456,457,458,465,469,484,485,492,494,496,497,498,501,505,507,508,510,512,516,520,521,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,543,545,554,555,559,561,562,563,565,568,570,571,573,574,575,580,582,583,584,586,588,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,647,653,655,656,661,662,665,668,669,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,687,688,689,691,692,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,728,729,730,732,733,734,735,736,737,738,743,745,748,750,751,752,753,759,769,770,771,789,795,800,801,802,803,804,805,806,807,808,809,811,817,818,819,820,821,825,826,828,829,831,833,834,835,844,845,846,847,848,849,850,872,874,880,887,890,891,892,893,894,895,896,897,898,899,902,903,904,907,908,909,910,911,915,916,917,918,919,920,923,924,932,943,944,952,954,955,957,958,959,960,961,962,963,964,966,977,979,980,986,989,990,992,1000,1002,1007,1008,1009,1011,1012,1019,1021,1022,1029,1033,],[-422,-421,-420,-371,-423,-424,-181,-424,-424,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,236,-418,-255,-269,328,-51,-54,-424,-273,-387,-374,-375,-376,-424,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-225,-424,-57,-58,-60,-61,-248,-249,-63,-424,-66,-67,-68,-69,-70,-71,-424,-424,-424,-74,-255,-132,-418,-387,-119,-254,-128,-129,-130,-303,-312,-313,-279,496,498,-76,-254,-82,-83,-84,-356,-366,-367,-250,-254,-280,-424,-424,-80,-90,-91,-92,-264,-316,-317,-157,-50,-53,-72,-73,-75,-85,-86,-87,-88,-96,-99,-100,-89,-377,-378,-379,-323,-405,-374,-375,-376,-380,-372,-386,-385,-55,-424,-253,-424,-242,-243,-244,-245,-246,-247,-65,-252,-110,-111,-424,-309,-290,-387,-127,-120,-424,-424,-266,-424,-424,-424,-424,-266,-424,-424,-424,-424,-424,-365,-291,-294,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,-77,-79,-290,-309,-315,-267,-268,-156,-424,-424,-76,-270,-412,-166,-168,-424,-95,-94,-98,-424,-424,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-59,-62,-256,-257,-424,-106,-131,-314,-274,-265,-121,-122,-123,-124,-125,-304,-284,-305,-306,-286,-307,-308,-310,-126,-424,-424,-424,-138,-424,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,-424,-235,-236,-237,-238,-363,-364,-277,-175,-78,-311,-287,-304,-284,-306,-286,-320,-359,-362,-49,-172,-167,-101,-97,-102,-93,-322,-402,-401,-411,-424,-424,-357,-271,-360,-424,-424,-358,-361,-424,-424,-105,-424,-424,-424,-135,-147,-148,-136,-278,909,-424,-118,-424,-424,-424,-263,-81,-318,-319,-159,-424,-171,-409,-410,-205,-206,-258,-259,-52,-64,-48,-109,-424,-108,-424,-424,-133,-134,-137,-424,-424,-424,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-414,-107,-112,-113,-424,-117,-424,-424,-424,-155,-239,-240,-241,-262,-272,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,-424,-424,-169,-170,-114,-151,-260,-424,-150,]),'THEN':([8,13,47,53,56,71,95,96,102,103,105,108,109,111,114,115,116,117,118,119,120,125,138,140,148,149,151,153,154,161,162,163,166,184,185,186,187,188,189,193,194,195,196,201,208,209,210,213,214,221,222,223,225,229,230,231,232,233,234,235,236,237,239,240,241,242,248,249,251,252,254,255,257,259,260,263,266,274,275,276,284,286,287,290,291,294,306,308,310,312,313,314,317,321,322,325,326,327,334,335,345,346,347,348,349,352,354,355,356,357,358,359,380,399,400,401,402,403,404,407,408,425,426,427,432,433,434,435,436,437,438,440,441,451,452,453,456,457,458,465,469,484,485,492,494,496,497,498,501,505,507,508,510,512,516,520,521,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,543,545,554,555,559,561,562,563,565,568,570,571,573,580,582,583,584,586,588,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,647,653,655,656,661,662,665,668,669,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,687,688,689,691,692,693,694,695,696,697,698,699,700,704,706,707,712,713,714,716,718,720,721,723,724,728,729,730,732,733,734,735,736,737,738,743,745,750,751,752,753,759,769,770,771,789,795,800,801,802,803,804,805,806,807,808,809,811,817,818,819,820,821,825,826,829,831,833,834,835,844,845,846,847,848,849,850,872,874,880,887,890,891,892,893,894,895,896,897,898,899,902,903,904,907,908,909,910,911,915,916,917,918,919,920,923,924,932,943,944,952,954,955,957,958,959,960,961,962,963,964,966,977,979,980,986,989,990,992,1000,1002,1007,1008,1009,1019,1021,1022,1029,1033,],[-422,-421,-420,-371,-423,-424,-181,-424,-424,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,237,-418,-255,-269,-51,-54,-424,-273,-387,-374,-375,-376,-424,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-225,-424,-57,-58,-60,-61,-248,-249,-63,-424,-66,-67,-68,-69,-70,-71,-424,-424,-424,-74,-255,-132,-418,-387,-119,-254,-128,-129,-130,-303,-312,-313,-279,-76,-82,-83,-84,-356,-366,-367,-250,-254,-280,-424,-424,-80,-90,-91,-92,-264,-316,-317,-157,-50,-53,-72,-73,-75,-85,-86,-87,-88,-96,-99,-100,-89,-377,-378,-379,-323,-405,-374,-375,-376,-380,-372,-386,-385,-55,-424,-253,-424,-242,-243,-244,-245,-246,-247,-65,-252,-110,-111,-424,-309,-290,-387,-127,-120,-424,-424,-266,-424,-424,-424,-424,-266,-424,-424,-424,-424,-424,-365,-291,-294,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,-77,-79,-290,-309,-315,-267,-268,-156,-424,-424,-76,-270,-412,-424,-95,-94,-98,-424,-424,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-59,-62,-256,-257,-424,-106,-131,-314,-274,-265,-121,-122,-123,-124,-125,-304,-284,-305,-306,-286,-307,-308,-310,-126,-424,-424,-424,-138,-424,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-265,-424,-235,-236,-237,-238,-363,-364,-277,-175,-78,-311,-287,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,-402,-401,-411,-424,-424,-357,-271,-360,-424,-424,-358,-361,-424,-424,-105,-424,-424,-424,-135,-147,-148,-136,-278,-424,-118,-424,-424,-424,-263,-81,-318,-319,-159,-424,-171,-409,-410,-205,-206,-258,-259,-52,-64,-48,-109,-424,-108,-424,-424,-133,-134,-137,-424,-424,-424,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-414,-107,-112,-113,-424,-117,-424,-424,-424,-155,-239,-240,-241,-262,-272,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,-424,-424,-114,-151,-260,-424,-150,]),'END':([8,13,47,53,56,71,72,74,76,95,96,101,102,103,105,108,109,111,114,115,116,117,118,119,125,138,140,148,149,154,161,162,163,166,184,185,186,187,188,189,193,194,195,196,201,208,209,210,213,214,221,222,223,225,229,230,231,232,233,234,235,257,259,260,263,284,286,287,290,291,294,306,317,321,322,325,326,327,352,354,355,357,358,359,361,380,399,400,401,402,403,404,407,408,420,421,425,426,427,432,433,434,435,436,437,438,440,441,450,451,452,453,456,457,494,497,501,505,507,508,510,512,516,520,521,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,554,555,559,561,562,563,565,568,573,580,582,583,584,586,588,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,635,637,644,647,653,655,656,660,661,662,664,668,669,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,702,704,705,706,707,711,712,713,714,716,718,720,721,723,724,729,730,732,733,734,735,736,737,738,742,743,745,750,751,752,753,755,756,759,769,770,771,788,789,790,795,800,802,803,804,805,806,807,808,809,811,812,826,827,829,830,831,833,834,835,836,844,846,847,848,849,850,872,874,879,880,881,887,888,890,891,892,893,894,895,896,897,898,899,907,908,910,911,913,914,915,916,917,918,919,920,923,924,932,935,941,943,944,945,952,953,954,955,957,958,959,960,961,962,963,964,977,979,980,985,986,988,989,990,992,1000,1002,1007,1008,1009,1019,1020,1021,1022,1029,1033,],[-422,-421,-420,-371,-423,-424,165,167,171,-181,-424,207,-424,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,-418,-255,-269,-51,-54,-387,-374,-375,-376,-424,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-225,-424,-57,-58,-60,-61,-248,-249,-63,-424,-66,-67,-68,-69,-70,-71,-424,-303,-312,-313,-279,-356,-366,-367,-250,-254,-280,-424,-264,-316,-317,-157,-50,-53,-96,-99,-100,-377,-378,-379,585,-323,-405,-374,-375,-376,-380,-372,-386,-385,-424,-424,-55,-424,-253,-424,-242,-243,-244,-245,-246,-247,-65,-252,-424,-110,-111,-424,-309,-290,-424,-424,-266,-424,-424,-424,-424,-424,-365,-291,-294,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,-290,-309,-315,-267,-268,-156,-424,-424,-412,-424,-95,-94,-98,-424,-424,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,789,-210,795,-59,-62,-256,-257,808,-424,-106,-424,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-424,-424,-424,-424,-265,835,-424,-235,-236,-237,-238,-363,-364,-277,-175,-311,-287,-304,-284,-306,-286,-320,-359,-362,849,-49,-172,-101,-97,-102,-93,853,854,-322,-402,-401,-411,879,-424,-424,-424,-357,-360,-424,-424,-358,-361,-424,-424,-105,-424,898,-278,907,-424,911,-118,-424,-424,-424,916,-263,-318,-319,-159,-424,-171,-409,-410,-424,-205,-209,-206,-424,-258,-259,-52,-64,-48,-109,-424,-108,-424,-424,-424,-424,-115,-424,958,959,-154,-424,-424,-424,-424,-276,-158,-173,-414,-208,977,-107,-112,979,-113,-424,-424,-117,-424,-424,-424,-155,-239,-240,-241,-262,-424,-424,-275,1007,-116,1009,-152,-153,-261,-207,-149,-424,-424,-424,-114,1029,-151,-260,-424,-150,]),'ELSE':([8,13,47,53,56,95,96,102,103,105,108,109,111,114,115,116,117,118,119,125,138,140,148,149,154,161,162,163,184,185,186,187,188,189,193,194,195,196,201,208,209,210,213,214,221,222,223,225,229,230,231,232,233,234,235,257,259,260,263,284,286,287,290,291,294,306,317,321,322,325,326,327,352,354,355,357,358,359,380,399,400,401,402,403,404,407,408,425,426,427,432,433,434,435,436,437,438,440,441,450,451,452,453,456,457,494,497,501,507,508,510,512,516,520,521,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,539,554,555,559,561,562,563,568,573,580,582,583,584,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,647,653,655,656,661,662,664,668,669,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,702,704,705,706,707,713,714,716,718,720,721,723,724,729,730,732,733,734,735,736,737,738,743,745,750,751,752,753,759,769,770,771,789,795,800,802,803,804,805,806,807,808,809,811,826,829,831,835,844,846,847,848,849,850,872,874,880,887,890,891,892,893,894,895,896,897,898,899,907,908,910,911,915,916,917,918,919,920,923,924,932,943,944,945,952,953,954,955,958,959,960,961,962,963,964,977,979,980,986,989,990,992,1000,1002,1007,1009,1019,1021,1022,1029,1033,],[-422,-421,-420,-371,-423,-181,-424,-424,-56,-424,-424,-424,-424,-424,-424,-424,-424,-424,-424,-418,-255,-269,-51,-54,-387,-374,-375,-376,-382,-383,-384,-388,-389,-390,-372,-373,-380,-251,-225,-424,-57,-58,-60,-61,-248,-249,-63,-424,-66,-67,-68,-69,-70,-71,-424,-303,-312,-313,-279,-356,-366,-367,-250,-254,-280,-424,-264,-316,-317,-157,-50,-53,-96,-99,-100,-377,-378,-379,-323,-405,-374,-375,-376,-380,-372,-386,-385,-55,-424,-253,-424,-242,-243,-244,-245,-246,-247,-65,-252,663,-110,-111,-424,-309,-290,-424,-424,-266,-424,-424,-424,-424,-365,-291,-294,-292,-295,-293,-296,-297,-298,-299,-352,-368,-369,-370,-354,-353,-355,-174,-176,-290,-309,-315,-267,-268,-156,-424,-412,-424,-95,-94,-98,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-59,-62,-256,-257,663,-106,813,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,663,663,663,-424,-265,-235,-236,-237,-238,-363,-364,-277,-175,-311,-287,-304,-284,-306,-286,-320,-359,-362,-49,-172,-101,-97,-102,-93,-322,-402,-401,-411,-424,-424,-357,-360,-424,-424,-358,-361,-424,-424,-105,-424,-278,-424,-118,-424,-263,-318,-319,-159,-424,-171,-409,-410,-205,-206,-258,-259,-52,-64,-48,-109,-424,-108,-424,-424,-424,-424,-115,-424,-154,-424,-424,-424,-424,-276,-158,-173,-414,-107,-112,-108,-113,663,-424,-117,-424,-424,-155,-239,-240,-241,-262,-424,-424,-275,-116,-152,-153,-261,-207,-149,-424,-424,-114,-151,-260,-424,-150,]),'LPAREN':([8,13,47,53,56,90,91,95,121,125,127,133,138,140,141,150,152,154,156,159,161,162,163,182,184,185,186,187,188,189,190,191,193,194,195,204,211,215,216,217,218,219,220,227,243,244,245,246,247,256,263,264,267,278,279,281,282,283,293,295,296,297,298,299,300,306,308,309,311,312,313,314,316,317,321,322,325,336,341,350,352,353,354,355,357,358,359,380,381,382,384,385,386,387,388,389,390,391,392,393,395,396,397,398,399,400,401,402,403,404,405,406,407,408,427,431,441,445,449,454,455,463,464,471,472,473,474,475,476,477,478,479,480,484,487,488,489,490,491,493,501,502,503,508,509,510,511,512,513,522,541,543,546,547,551,552,553,559,561,562,564,569,573,576,577,578,580,581,584,602,603,604,605,606,607,608,609,610,611,612,613,614,615,617,619,621,622,625,648,655,656,667,707,715,717,719,725,731,736,751,759,767,769,770,771,832,844,846,847,848,872,873,874,890,891,900,922,932,936,937,938,956,964,967,991,992,998,999,1018,1022,],[-422,-421,-420,-371,-423,191,191,-181,247,-418,279,279,-255,-269,311,279,191,-387,279,191,-374,-375,-376,-424,-382,-383,-384,-388,-389,-390,191,-424,-372,-373,-380,422,191,279,279,279,279,279,279,279,247,464,279,-424,279,191,493,495,-254,279,279,191,191,191,464,522,522,522,279,279,279,191,-424,191,547,-90,-91,-92,522,-264,-316,-317,191,279,-424,191,-96,191,191,-100,-377,-378,-379,-323,191,191,191,191,191,191,191,191,191,191,191,191,191,191,191,191,-405,-374,-375,-376,-380,-372,191,-424,-386,-385,-253,279,-252,279,279,279,247,464,279,279,279,279,279,279,279,279,279,279,279,-390,522,522,522,279,279,191,-266,279,191,-389,191,-389,191,-389,191,522,191,191,279,522,547,522,522,-315,-267,-268,191,279,191,749,191,191,191,-97,-98,-391,-392,-393,191,-394,-395,-396,-397,-398,-399,-400,191,-403,-404,-413,191,-182,-183,-184,279,-256,-257,279,-265,191,191,191,191,522,-320,-97,-322,-424,-402,-401,-411,279,-263,-318,-319,191,-409,191,-410,-258,-259,279,191,-414,-321,191,191,279,-262,279,191,-261,191,191,-419,-260,]),'FLOAT':([8,13,47,53,56,90,91,95,121,141,152,159,161,162,163,182,184,185,186,187,188,189,190,191,193,194,195,211,243,244,246,247,256,281,282,283,293,306,308,309,311,312,313,314,325,341,350,352,353,354,355,381,382,384,385,386,387,388,389,390,391,392,393,395,396,397,398,399,400,401,402,403,404,405,406,407,408,455,463,464,484,493,503,508,509,510,511,512,513,541,543,547,551,564,573,577,578,580,581,584,593,594,595,596,597,602,603,604,605,606,607,608,609,610,611,612,613,614,615,617,619,621,622,625,715,717,719,725,751,761,762,763,764,765,767,769,770,771,848,866,867,872,873,874,922,929,932,936,937,938,991,996,997,998,999,1014,1015,1031,1035,],[-422,-421,-420,-371,-423,195,195,-181,195,-424,195,195,-374,-375,-376,-424,-382,-383,-384,-388,-389,-390,403,-424,-372,-373,-380,195,403,195,-424,-424,195,195,195,195,195,195,-424,195,195,-90,-91,-92,195,-424,195,-96,195,195,-100,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,-405,-374,-375,-376,-380,-372,195,-424,-386,-385,403,403,-424,-390,195,195,-389,195,-389,195,-389,195,195,195,-424,403,195,195,195,195,195,-97,-98,-424,-424,-424,-424,-424,-391,-392,-393,195,-394,-395,-396,-397,-398,-399,-400,195,-403,-404,-413,195,-182,-183,-184,195,195,195,195,-97,195,195,195,195,195,-424,-402,-401,-411,195,-424,930,-409,195,-410,195,195,-414,-321,195,195,195,-424,-424,195,195,195,195,-424,195,]),'RBRACKET':([8,13,47,53,56,95,125,138,140,154,161,162,163,182,183,184,185,186,187,188,189,193,194,195,200,246,257,259,260,263,291,294,307,317,321,322,341,352,354,355,357,358,359,380,381,399,400,401,402,403,404,407,408,411,412,413,414,415,416,417,427,441,442,443,444,456,457,501,540,554,555,557,559,561,562,564,568,573,580,582,583,584,598,599,600,601,602,603,604,606,607,608,609,610,611,612,614,615,616,617,621,622,625,626,632,649,655,656,657,668,669,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,707,723,725,726,729,730,732,733,734,735,736,739,740,741,743,745,750,751,752,753,759,766,767,769,770,771,775,776,777,779,781,782,783,784,785,786,787,798,799,803,807,822,826,841,842,844,846,847,850,858,859,860,861,862,863,864,865,866,872,873,874,876,890,891,892,894,920,922,928,929,930,931,932,933,934,947,948,949,950,951,964,965,968,970,971,972,980,991,992,995,996,997,1003,1004,1005,1006,1010,1013,1014,1015,1022,1023,1024,1025,1027,1028,1030,1031,1032,1034,1035,1036,],[-422,-421,-420,-371,-423,-181,-418,-255,-269,-387,-374,-375,-376,-424,383,-382,-383,-384,-388,-389,-390,-372,-373,-380,-424,-424,-303,-312,-313,-279,-254,-280,542,-264,-316,-317,-424,-96,-99,-100,-377,-378,-379,-323,-424,-405,-374,-375,-376,-380,-372,-386,-385,621,622,625,-387,-185,-186,-192,-253,-252,655,656,-387,-309,-290,-266,-179,-290,-309,737,-315,-267,-268,-424,-424,-412,-424,-95,-94,-98,-424,-407,-408,768,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,771,-413,-182,-183,-184,-189,-191,800,-256,-257,805,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-265,-277,-424,843,-311,-287,-304,-284,-306,-286,-320,846,847,848,-49,-172,-101,-97,-102,-93,-322,872,-424,-402,-401,-411,-187,-188,-197,-196,-204,-199,-200,-201,-202,-203,-198,890,891,-424,-424,904,-278,-177,-180,-263,-318,-319,-171,-333,-334,-335,-336,-337,-338,-339,-340,-424,-409,-424,-410,-190,-258,-259,-52,-48,-276,-424,-332,-424,-381,-406,-414,-195,-194,-143,-144,-417,-145,-146,-262,992,-424,-343,-344,-193,-275,-424,-261,1013,-424,-424,-139,-140,-141,-142,1022,-341,-424,-424,-260,-424,-347,-348,-350,-342,1034,-424,-349,-345,-424,-346,]),'RPAREN':([8,13,47,53,56,75,95,125,138,140,150,154,161,162,163,168,169,170,172,184,185,186,187,188,189,191,193,194,195,240,242,247,248,257,259,260,263,291,294,306,317,321,322,331,332,333,357,358,359,364,366,367,368,380,399,400,401,402,403,404,405,406,407,408,427,431,441,449,456,457,458,464,466,467,501,538,539,540,547,548,549,550,554,555,559,561,562,568,573,587,590,599,600,602,603,604,606,607,608,609,610,611,612,614,615,617,618,619,621,622,625,645,652,655,656,659,668,669,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,701,703,707,723,725,729,730,732,733,734,735,736,743,745,746,757,758,759,767,769,770,771,772,773,803,807,826,841,842,844,846,847,850,852,872,873,874,875,890,891,892,894,920,931,932,964,980,992,1022,],[-422,-421,-420,-371,-423,-424,-181,-418,-255,-269,-424,-387,-374,-375,-376,363,-46,-47,-424,-382,-383,-384,-388,-389,-390,-424,-372,-373,-380,-255,-390,-424,-372,-303,-312,-313,-279,-254,-280,-424,-264,-316,-317,568,-301,-302,-377,-378,-379,-424,589,-165,-164,-323,-405,-374,-375,-376,-380,-372,-424,-424,-386,-385,-253,-424,-252,-424,-309,-290,-372,-424,668,669,-266,724,-180,-179,-424,731,669,668,-290,-309,-315,-267,-268,-424,-412,-45,-424,-407,-408,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-424,-424,-182,-183,-184,796,803,-256,-257,807,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,826,828,-265,-277,-424,-311,-287,-304,-284,-306,-286,-320,-49,-172,-300,-163,-165,-322,-424,-402,-401,-411,874,-424,-424,-424,-278,-177,-180,-263,-318,-319,-171,926,-409,-424,-410,932,-258,-259,-52,-48,-276,-406,-414,-262,-275,-261,-260,]),'JSON':([8,13,47,56,593,594,595,596,597,761,762,763,764,765,866,929,997,1015,],[-422,-421,-420,-423,-424,-424,-424,-424,-424,858,858,858,858,858,-424,858,-424,858,]),'TRUE':([8,13,47,56,593,594,595,596,597,761,762,763,764,765,866,929,997,1015,],[-422,-421,-420,-423,-424,-424,-424,-424,-424,864,864,864,864,864,-424,864,-424,864,]),'FALSE':([8,13,47,56,593,594,595,596,597,761,762,763,764,765,866,929,997,1015,],[-422,-421,-420,-423,-424,-424,-424,-424,-424,865,865,865,865,865,-424,865,-424,865,]),'LCURLY':([8,13,47,56,57,61,69,94,143,212,228,262,289,301,302,303,304,321,408,409,468,470,484,485,514,515,560,593,594,595,596,597,626,640,687,688,689,691,692,761,762,763,764,765,817,818,866,904,929,997,1015,],[-422,-421,-420,-423,89,89,89,89,320,430,448,320,320,89,89,89,89,89,-385,89,430,448,-424,-424,430,448,89,-424,-424,-424,-424,-424,89,89,-424,-424,89,-138,89,89,89,89,89,89,89,89,-424,-137,89,-424,89,]),'COMMA':([8,13,47,53,56,95,125,138,140,150,154,161,162,163,169,184,185,186,187,188,189,193,194,195,200,242,257,259,260,263,267,291,294,306,317,321,322,331,332,333,338,339,343,357,358,359,368,373,380,399,400,401,402,403,404,407,408,412,414,415,416,417,427,431,441,449,456,457,458,460,461,462,501,519,538,539,540,554,555,559,561,562,568,573,599,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,626,632,652,655,656,659,668,669,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,707,723,725,729,730,732,733,734,735,736,743,745,746,747,759,769,770,771,775,776,777,779,781,782,783,784,785,786,787,803,807,814,826,841,842,844,846,847,850,856,858,859,860,861,862,863,864,865,868,869,870,871,872,874,876,890,891,892,894,920,922,928,930,932,933,934,947,948,949,950,951,964,965,970,972,980,991,992,996,1010,1013,1014,1022,1024,1025,1027,1031,1032,1034,1035,],[-422,-421,-420,-371,-423,-181,-418,-255,-269,-424,-387,-374,-375,-376,364,-382,-383,-384,-388,-389,-390,-372,-373,-380,-424,-418,-303,-312,-313,-279,-254,-254,-280,-424,-264,-316,-317,569,-301,-302,-254,572,-387,-377,-378,-379,590,592,-323,-405,-374,-375,-376,-380,-372,-386,-385,623,-387,-185,-186,-192,-253,-424,-252,-424,-309,-290,-387,-254,572,667,-266,-254,725,-180,-179,-290,-309,-315,-267,-268,-424,-412,767,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-189,-191,569,-256,-257,569,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-265,-277,-424,-311,-287,-304,-284,-306,-286,-320,-49,-172,-300,851,-322,-402,-401,-411,-187,-188,-197,-196,-204,-199,-200,-201,-202,-203,-198,-424,-424,900,-278,725,-180,-263,-318,-319,-171,-327,-333,-334,-335,-336,-337,-338,-339,-340,-328,-329,-330,-331,-409,-410,-190,-258,-259,-52,-48,-276,-424,-332,-381,-414,-195,-194,981,982,-417,983,984,-262,725,997,-193,-275,-424,-261,-424,725,-341,-424,-260,1031,-351,-350,-424,-349,-345,-424,]),'DESC':([10,13,47,85,86,],[49,-421,-420,-10,-11,]),'ENTITY':([29,],[64,]),'EQUALS':([30,59,66,95,110,113,123,125,134,135,136,138,140,153,154,161,162,163,267,270,271,305,317,318,321,322,357,358,359,380,394,408,417,419,427,439,441,446,501,559,561,562,571,573,621,622,625,638,655,656,707,736,737,738,759,800,801,802,805,806,823,824,844,846,847,886,890,891,926,964,966,992,1022,],[65,91,97,-181,215,-254,65,-418,295,301,303,-255,-269,-273,-387,-374,-375,-376,-254,502,-418,91,-264,-266,-316,-317,-377,-378,-379,-323,613,-385,626,633,-253,654,-252,-265,-266,-315,-267,-268,-270,-412,-182,-183,-184,791,-256,-257,-265,-320,-359,-362,-322,-357,-271,-360,-358,-361,905,906,-263,-318,-319,939,-258,-259,967,-262,-272,-261,-260,]),'PLUS':([53,95,125,138,140,154,161,162,163,184,187,188,189,193,194,195,240,242,248,251,252,257,258,259,260,261,263,290,291,294,310,315,317,321,322,332,340,343,357,358,359,380,399,400,401,402,403,404,408,427,433,434,435,436,437,438,441,442,443,444,456,457,458,460,461,462,465,466,467,484,492,501,508,510,512,519,520,521,523,524,525,526,527,528,529,549,550,554,555,559,561,562,568,573,599,602,603,604,606,607,608,609,610,611,612,614,615,616,617,621,622,625,655,656,666,668,669,671,672,673,674,675,676,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,707,708,723,729,730,732,733,734,735,736,743,745,746,759,769,770,771,798,799,803,807,814,826,844,845,846,847,850,872,874,890,891,892,894,901,912,920,932,946,964,980,987,992,993,1022,],[-371,-181,-418,-255,-269,-387,-374,-375,-376,384,-388,-389,-390,-372,-373,-380,-255,-390,-372,-254,476,-303,488,-312,-313,-280,-279,476,-254,-280,488,552,-264,-316,-317,476,384,-372,-377,-378,-379,-323,384,-374,-375,-376,-380,-372,-385,-253,476,476,476,476,476,476,-252,-269,476,-387,476,488,-372,-254,-303,476,476,476,488,-390,-266,-266,-389,-389,-389,-254,488,552,488,552,488,552,476,476,476,488,552,488,552,-315,-267,-268,-424,-412,384,384,384,384,384,384,384,384,384,384,384,384,384,384,384,-182,-183,-184,-256,-257,-277,-314,-274,-265,476,476,476,476,476,476,488,476,476,488,476,476,-310,488,552,488,552,488,552,476,476,-265,476,-277,488,476,552,488,552,488,-320,-49,-172,476,-322,384,384,-411,-269,476,-424,-424,476,-278,-263,488,-318,-319,-171,-409,-410,-258,-259,-52,-48,-276,476,-276,-414,476,-262,-275,476,-261,476,-260,]),'TIMES':([53,95,125,138,140,154,161,162,163,184,187,188,189,193,194,195,240,242,248,251,252,257,258,259,260,261,263,290,291,294,310,315,317,321,322,332,340,343,357,358,359,380,386,399,400,401,402,403,404,408,427,433,434,435,436,437,438,441,442,443,444,456,457,458,460,461,462,465,466,467,484,492,501,508,510,512,519,520,521,523,524,525,526,527,528,529,549,550,554,555,559,561,562,568,573,599,602,603,604,606,607,608,609,610,611,612,614,615,616,617,621,622,625,655,656,666,668,669,671,672,673,674,675,676,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,707,708,723,729,730,732,733,734,735,736,743,745,746,759,769,770,771,798,799,803,807,814,826,844,845,846,847,850,872,874,890,891,892,894,901,912,920,932,946,964,980,987,992,993,1022,],[-371,-181,-418,-255,-269,-387,-374,-375,-376,386,-388,-389,-390,-372,-373,-380,-255,-390,-372,-254,478,-303,487,-312,-313,-280,-279,478,-254,-280,546,553,-264,-316,-317,478,386,-372,-377,-378,-379,-323,605,386,-374,-375,-376,-380,-372,-385,-253,478,478,478,478,478,478,-252,-269,478,-387,478,487,-372,-254,-303,478,478,478,487,-390,-266,-266,-389,-389,-389,-254,546,553,546,553,546,553,478,478,478,546,553,546,553,-315,-267,-268,-424,-412,386,386,386,386,386,386,386,386,386,386,386,386,386,386,386,-182,-183,-184,-256,-257,-277,-314,-274,-265,478,478,478,478,478,478,487,478,478,487,478,478,-310,546,553,546,553,546,553,478,478,-265,478,-277,487,478,553,546,553,546,-320,-49,-172,478,-322,386,386,-411,-269,478,-424,-424,478,-278,-263,546,-318,-319,-171,-409,-410,-258,-259,-52,-48,-276,478,-276,-414,478,-262,-275,478,-261,478,-260,]),'DIVIDE':([53,95,125,138,140,154,161,162,163,184,187,188,189,193,194,195,240,242,248,251,252,257,258,259,260,261,263,290,291,294,310,315,317,321,322,332,340,343,357,358,359,380,399,400,401,402,403,404,408,427,433,434,435,436,437,438,441,442,443,444,456,457,458,460,461,462,465,466,467,484,492,501,508,510,512,519,520,521,523,524,525,526,527,528,529,549,550,554,555,559,561,562,568,573,599,602,603,604,606,607,608,609,610,611,612,614,615,616,617,621,622,625,655,656,666,668,669,671,672,673,674,675,676,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,707,708,723,729,730,732,733,734,735,736,743,745,746,759,769,770,771,798,799,803,807,814,826,844,845,846,847,850,872,874,890,891,892,894,901,912,920,932,946,964,980,987,992,993,1022,],[-371,-181,-418,-255,-269,-387,-374,-375,-376,387,-388,-389,-390,-372,-373,-380,-255,-390,-372,-254,479,-303,490,-312,-313,-280,-279,479,-254,-280,490,479,-264,-316,-317,479,387,-372,-377,-378,-379,-323,387,-374,-375,-376,-380,-372,-385,-253,479,479,479,479,479,479,-252,-269,479,-387,479,490,-372,-254,-303,479,479,479,490,-390,-266,-266,-389,-389,-389,-254,490,479,490,479,490,479,479,479,479,490,479,490,479,-315,-267,-268,-424,-412,387,387,387,387,387,387,387,387,387,387,387,387,387,387,387,-182,-183,-184,-256,-257,-277,-314,-274,-265,479,479,479,479,479,479,490,479,479,490,479,479,-310,490,479,490,479,490,479,479,479,-265,479,-277,490,479,479,490,479,490,-320,-49,-172,479,-322,387,387,-411,-269,479,-424,-424,479,-278,-263,490,-318,-319,-171,-409,-410,-258,-259,-52,-48,-276,479,-276,-414,479,-262,-275,479,-261,479,-260,]),'MODULO':([53,95,125,138,140,154,161,162,163,184,187,188,189,193,194,195,240,242,248,251,252,257,258,259,260,261,263,290,291,294,310,315,317,321,322,332,340,343,357,358,359,380,399,400,401,402,403,404,408,427,433,434,435,436,437,438,441,442,443,444,456,457,458,460,461,462,465,466,467,484,492,501,508,510,512,519,520,521,523,524,525,526,527,528,529,549,550,554,555,559,561,562,568,573,599,602,603,604,606,607,608,609,610,611,612,614,615,616,617,621,622,625,655,656,666,668,669,671,672,673,674,675,676,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,707,708,723,729,730,732,733,734,735,736,743,745,746,759,769,770,771,798,799,803,807,814,826,844,845,846,847,850,872,874,890,891,892,894,901,912,920,932,946,964,980,987,992,993,1022,],[-371,-181,-418,-255,-269,-387,-374,-375,-376,388,-388,-389,-390,-372,-373,-380,-255,-390,-372,-254,480,-303,491,-312,-313,-280,-279,480,-254,-280,491,480,-264,-316,-317,480,388,-372,-377,-378,-379,-323,388,-374,-375,-376,-380,-372,-385,-253,480,480,480,480,480,480,-252,-269,480,-387,480,491,-372,-254,-303,480,480,480,491,-390,-266,-266,-389,-389,-389,-254,491,480,491,480,491,480,480,480,480,491,480,491,480,-315,-267,-268,-424,-412,388,388,388,388,388,388,388,388,388,388,388,388,388,388,388,-182,-183,-184,-256,-257,-277,-314,-274,-265,480,480,480,480,480,480,491,480,480,491,480,480,-310,491,480,491,480,491,480,480,480,-265,480,-277,491,480,480,491,480,491,-320,-49,-172,480,-322,388,388,-411,-269,480,-424,-424,480,-278,-263,491,-318,-319,-171,-409,-410,-258,-259,-52,-48,-276,480,-276,-414,480,-262,-275,480,-261,480,-260,]),'EQUALS_EQUALS':([53,95,125,138,140,154,161,162,163,184,187,188,189,193,194,195,240,242,248,251,252,253,257,259,260,261,263,291,294,317,321,322,340,343,357,358,359,380,399,400,401,402,403,404,408,417,427,441,456,457,458,484,492,501,508,510,512,554,555,559,561,562,568,573,599,602,603,604,606,607,608,609,610,611,612,614,615,616,617,621,622,625,655,656,666,668,669,671,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,707,723,729,730,732,733,734,735,736,743,745,759,769,770,771,803,807,826,844,846,847,850,872,874,890,891,892,894,901,920,932,964,966,980,992,1022,],[-371,-181,-418,-255,-269,-387,-374,-375,-376,389,-388,-389,-390,-372,-373,-380,-255,-390,-372,-254,471,482,-303,-312,-313,-273,-279,-254,-280,-264,-316,-317,389,-372,-377,-378,-379,-323,389,-374,-375,-376,-380,-372,-385,627,-253,-252,-309,-290,-372,-390,-266,-266,-389,-389,-389,-290,-309,-315,-267,-268,-424,-412,389,389,389,389,389,389,389,389,389,389,389,389,389,389,389,-182,-183,-184,-256,-257,-270,-314,-274,-265,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-265,-277,-311,-287,-304,-284,-306,-286,-320,-49,-172,-322,389,389,-411,-424,-424,-278,-263,-318,-319,-171,-409,-410,-258,-259,-52,-48,-271,-276,-414,-262,-272,-275,-261,-260,]),'LESS_EQUALS':([53,95,125,138,140,154,161,162,163,184,187,188,189,193,194,195,240,242,248,251,252,257,259,260,263,291,294,317,321,322,340,343,357,358,359,380,399,400,401,402,403,404,408,417,427,441,456,457,458,484,492,501,508,510,512,554,555,559,561,562,568,573,599,602,603,604,606,607,608,609,610,611,612,614,615,616,617,621,622,625,655,656,668,669,671,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,707,723,729,730,732,733,734,735,736,743,745,759,769,770,771,803,807,826,844,846,847,850,872,874,890,891,892,894,920,932,964,980,992,1022,],[-371,-181,-418,-255,-269,-387,-374,-375,-376,391,-388,-389,-390,-372,-373,-380,-255,-390,-372,-254,473,-303,-312,-313,-279,-254,-280,-264,-316,-317,391,-372,-377,-378,-379,-323,391,-374,-375,-376,-380,-372,-385,629,-253,-252,-309,-290,-372,-390,-266,-266,-389,-389,-389,-290,-309,-315,-267,-268,-424,-412,391,391,391,391,391,391,391,391,391,391,391,391,391,391,391,-182,-183,-184,-256,-257,-314,-274,-265,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-265,-277,-311,-287,-304,-284,-306,-286,-320,-49,-172,-322,391,391,-411,-424,-424,-278,-263,-318,-319,-171,-409,-410,-258,-259,-52,-48,-276,-414,-262,-275,-261,-260,]),'GREATER':([53,95,125,138,140,154,161,162,163,184,187,188,189,193,194,195,240,242,248,251,252,257,259,260,263,267,291,294,317,321,322,338,340,343,357,358,359,380,399,400,401,402,403,404,408,417,427,441,456,457,458,460,484,492,501,508,510,512,519,554,555,559,561,562,568,573,599,602,603,604,606,607,608,609,610,611,612,614,615,616,617,621,622,625,650,655,656,668,669,671,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,707,723,729,730,732,733,734,735,736,743,745,759,769,770,771,793,803,807,815,826,840,844,846,847,850,872,874,890,891,892,894,920,925,932,946,964,980,992,1022,],[-371,-181,-418,-255,-269,-387,-374,-375,-376,392,-388,-389,-390,-372,-373,-380,-255,-390,-372,-254,474,-303,-312,-313,-279,-254,-254,-280,-264,-316,-317,571,573,-372,-377,-378,-379,-323,392,-374,-375,-376,-380,-372,-385,630,-253,-252,-309,-290,-372,666,-390,-266,-266,-389,-389,-389,723,-290,-309,-315,-267,-268,-424,-412,392,392,392,392,392,392,392,392,392,392,392,392,392,392,392,-182,-183,-184,801,-256,-257,-314,-274,-265,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-265,-277,-311,-287,-304,-284,-306,-286,-320,-49,-172,-322,392,392,-411,886,-424,-424,901,-278,920,-263,-318,-319,-171,-409,-410,-258,-259,-52,-48,-276,966,-414,980,-262,-275,-261,-260,]),'GREATER_EQUALS':([53,95,125,138,140,154,161,162,163,184,187,188,189,193,194,195,240,242,248,251,252,257,259,260,263,291,294,317,321,322,340,343,357,358,359,380,399,400,401,402,403,404,408,417,427,441,456,457,458,484,492,501,508,510,512,554,555,559,561,562,568,573,599,602,603,604,606,607,608,609,610,611,612,614,615,616,617,621,622,625,655,656,668,669,671,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,707,723,729,730,732,733,734,735,736,743,745,759,769,770,771,803,807,826,844,846,847,850,872,874,890,891,892,894,920,932,964,980,992,1022,],[-371,-181,-418,-255,-269,-387,-374,-375,-376,393,-388,-389,-390,-372,-373,-380,-255,-390,-372,-254,475,-303,-312,-313,-279,-254,-280,-264,-316,-317,393,-372,-377,-378,-379,-323,393,-374,-375,-376,-380,-372,-385,628,-253,-252,-309,-290,-372,-390,-266,-266,-389,-389,-389,-290,-309,-315,-267,-268,-424,-412,393,393,393,393,393,393,393,393,393,393,393,393,393,393,393,-182,-183,-184,-256,-257,-314,-274,-265,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-265,-277,-311,-287,-304,-284,-306,-286,-320,-49,-172,-322,393,393,-411,-424,-424,-278,-263,-318,-319,-171,-409,-410,-258,-259,-52,-48,-276,-414,-262,-275,-261,-260,]),'NOT':([53,121,127,156,161,162,163,184,187,188,189,193,194,195,200,242,248,336,340,343,399,400,401,402,403,404,408,454,458,484,508,510,512,599,602,603,604,606,607,608,609,610,611,612,614,615,616,617,623,624,769,770,771,872,874,932,],[-371,245,245,245,-374,-375,-376,394,-388,-389,-390,-372,-373,-380,418,-390,-372,245,394,-372,394,-374,-375,-376,-380,-372,-385,245,-372,-390,-389,-389,-389,394,394,394,394,394,394,394,394,394,394,394,394,394,394,394,418,418,394,394,-411,-409,-410,-414,]),'OR':([53,161,162,163,184,187,188,189,193,194,195,242,248,340,343,399,400,401,402,403,404,408,458,484,508,510,512,599,602,603,604,606,607,608,609,610,611,612,614,615,616,617,769,770,771,872,874,932,],[-371,-374,-375,-376,395,-388,-389,-390,-372,-373,-380,-390,-372,395,-372,395,-374,-375,-376,-380,-372,-385,-372,-390,-389,-389,-389,395,395,395,395,395,395,395,395,395,395,395,395,395,395,395,395,395,-411,-409,-410,-414,]),'AND':([53,95,125,138,140,153,154,161,162,163,184,187,188,189,193,194,195,200,240,241,242,248,249,251,252,254,255,257,259,260,263,291,294,317,321,322,340,343,357,358,359,380,399,400,401,402,403,404,408,412,414,415,416,417,427,441,456,457,458,465,469,484,485,492,501,508,510,512,554,555,559,561,562,568,571,573,599,602,603,604,606,607,608,609,610,611,612,614,615,616,617,621,622,625,626,632,655,656,668,669,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,687,688,689,691,692,693,694,695,696,697,698,699,700,707,723,729,730,732,733,734,735,736,737,738,743,745,759,769,770,771,775,776,777,779,781,782,783,784,785,786,787,800,801,802,803,805,806,807,817,818,819,820,821,825,826,844,846,847,850,872,874,876,890,891,892,894,902,903,904,920,932,933,934,964,966,972,980,992,1022,],[-371,-181,-418,-255,-269,-273,-387,-374,-375,-376,396,-388,-389,-390,-372,-373,-380,-424,-255,454,-390,-372,-119,-254,-128,-129,-130,-303,-312,-313,-279,-254,-280,-264,-316,-317,396,-372,-377,-378,-379,-323,396,-374,-375,-376,-380,-372,-385,624,-387,-185,-186,-192,-253,-252,-309,-290,-372,-127,-120,-390,-424,-266,-266,-389,-389,-389,-290,-309,-315,-267,-268,-424,-270,-412,396,396,396,396,396,396,396,396,396,396,396,396,396,396,396,-182,-183,-184,-189,-191,-256,-257,-314,-274,-265,-121,-122,-123,-124,-125,-304,-284,-305,-306,-286,-307,-308,-310,-126,-424,-424,-424,-138,-424,-311,-287,-281,-283,-282,-285,-288,-289,-265,-277,-311,-287,-304,-284,-306,-286,-320,-359,-362,-49,-172,-322,396,396,-411,-187,-188,-197,-196,-204,-199,-200,-201,-202,-203,-198,-357,-271,-360,-424,-358,-361,-424,-424,-424,-135,-147,-148,-136,-278,-263,-318,-319,-171,-409,-410,-190,-258,-259,-52,-48,-133,-134,-137,-276,-414,-195,-194,-262,-272,-193,-275,-261,-260,]),'DOT':([53,95,107,113,123,161,162,163,184,187,188,189,193,194,195,242,248,249,251,266,267,272,273,285,291,292,308,318,321,322,330,338,340,343,357,358,359,380,399,400,401,402,403,404,408,414,446,458,459,460,484,492,501,508,510,512,516,519,542,557,558,559,599,602,603,604,606,607,608,609,610,611,612,614,615,616,617,621,622,625,626,649,651,657,658,671,686,707,720,721,736,759,769,770,771,779,780,843,846,847,872,874,877,883,885,932,975,976,],[-371,-181,212,226,-181,-374,-375,-376,398,-388,-389,-390,-372,-373,-380,-390,-372,468,226,499,226,-181,499,514,226,518,544,556,-316,-317,567,226,398,-372,-377,-378,-379,-323,398,-374,-375,-376,-380,-372,-385,-387,556,-372,544,226,-390,556,556,-389,-389,-389,556,226,727,556,556,-315,398,398,398,398,398,398,398,398,398,398,398,398,398,398,398,-182,-183,-184,780,556,556,556,556,556,816,556,556,556,556,-322,398,398,-411,877,878,921,-318,-319,-409,-410,933,556,556,-414,556,556,]),'TO':([53,95,125,138,140,154,161,162,163,183,184,185,186,187,188,189,193,194,195,257,259,260,263,291,294,317,321,322,357,358,359,380,399,400,401,402,403,404,407,408,427,441,456,457,501,554,555,559,561,562,568,573,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,655,656,668,669,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,707,708,723,729,730,732,733,734,735,736,743,745,759,769,770,771,803,807,826,844,846,847,850,872,874,890,891,892,894,920,932,964,980,992,1022,],[-371,-181,-418,-255,-269,-387,-374,-375,-376,382,-382,-383,-384,-388,-389,-390,-372,-373,-380,-303,-312,-313,-279,-254,-280,-264,-316,-317,-377,-378,-379,-323,-405,-374,-375,-376,-380,-372,-386,-385,-253,-252,-309,-290,-266,-290,-309,-315,-267,-268,-424,-412,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-256,-257,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-265,832,-277,-311,-287,-304,-284,-306,-286,-320,-49,-172,-322,-402,-401,-411,-424,-424,-278,-263,-318,-319,-171,-409,-410,-258,-259,-52,-48,-276,-414,-262,-275,-261,-260,]),'POWER':([53,95,125,138,140,141,154,159,161,162,163,184,185,186,187,188,189,193,194,195,211,240,242,248,251,252,256,257,259,260,263,290,291,294,308,309,312,313,314,315,317,321,322,325,332,343,350,351,352,353,354,355,357,358,359,380,399,400,401,402,403,404,407,408,427,433,434,435,436,437,438,441,442,443,444,456,457,458,460,461,462,465,466,484,492,501,519,521,524,526,527,528,529,541,543,550,554,555,559,561,562,568,573,577,579,580,581,582,583,584,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,655,656,668,669,671,672,673,674,675,676,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,707,708,723,729,730,732,733,734,735,736,743,745,746,751,753,759,769,770,771,798,799,803,807,814,826,844,846,847,848,850,872,874,890,891,892,894,912,920,932,946,964,980,987,992,993,1022,],[-371,-181,-418,-255,-269,-424,-387,353,-374,-375,-376,-382,-383,-384,-388,-389,-390,-372,-373,-380,353,-255,-418,-387,-254,481,353,-303,-312,-313,-279,481,-254,-280,-424,353,-90,-91,-92,481,-264,-316,-317,353,481,-387,578,580,-96,-424,-99,-100,-377,-378,-379,-323,-405,-374,-375,-376,-380,-372,-386,-385,-253,481,481,481,481,481,481,-252,-269,481,-387,481,-290,-387,-254,-303,481,481,481,-390,-266,-266,-254,481,481,481,481,481,481,353,353,481,-290,481,-315,-267,-268,-424,-412,578,580,-424,-93,-95,-94,-98,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-256,-257,-314,-274,-265,481,481,481,481,481,481,-284,481,481,-286,481,481,-310,-311,481,-281,481,-282,481,481,481,-265,481,-277,-311,481,481,-284,481,-286,-320,-49,-172,481,-97,-93,-322,-402,-401,-411,-269,481,-424,-424,481,-278,-263,-318,-319,353,-171,-409,-410,-258,-259,-52,-48,481,-276,-414,481,-262,-275,481,-261,481,-260,]),'TILDE':([53,95,141,159,161,162,163,184,185,186,187,188,189,193,194,195,211,256,308,309,312,313,314,325,350,352,354,355,399,400,401,402,403,404,407,408,484,541,543,577,581,584,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,751,769,770,771,848,872,874,932,],[-371,-181,-424,354,-374,-375,-376,-382,-383,-384,-388,-389,-390,-372,-373,-380,354,354,-424,354,-90,-91,-92,354,354,-96,-99,-100,-405,-374,-375,-376,-380,-372,-386,-385,-390,354,354,354,-97,-98,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-97,-402,-401,-411,354,-409,-410,-414,]),'TILDE_EMPTY':([53,95,141,159,161,162,163,184,185,186,187,188,189,193,194,195,211,256,308,309,312,313,314,325,350,352,354,355,399,400,401,402,403,404,407,408,484,541,543,577,581,584,602,603,604,606,607,608,609,610,611,612,614,615,617,621,622,625,751,769,770,771,848,872,874,932,],[-371,-181,-424,355,-374,-375,-376,-382,-383,-384,-388,-389,-390,-372,-373,-380,355,355,-424,355,-90,-91,-92,355,355,-96,-99,-100,-405,-374,-375,-376,-380,-372,-386,-385,-390,355,355,355,-97,-98,-391,-392,-393,-394,-395,-396,-397,-398,-399,-400,-403,-404,-413,-182,-183,-184,-97,-402,-401,-411,355,-409,-410,-414,]),'EYES':([95,141,308,621,622,625,],[-181,312,312,-182,-183,-184,]),'FEET':([95,141,308,621,622,625,],[-181,313,313,-182,-183,-184,]),'PLUS_EQUALS':([95,110,113,125,134,135,136,138,140,153,154,161,162,163,305,317,318,321,322,357,358,359,380,427,441,446,559,561,562,571,573,621,622,625,655,656,736,737,738,759,800,801,802,805,806,844,846,847,890,891,964,966,992,1022,],[-181,216,-254,-418,296,302,304,-255,-269,-273,-387,-374,-375,-376,-385,-264,-266,-316,-317,-377,-378,-379,-323,-253,-252,-265,-315,-267,-268,-270,-412,-182,-183,-184,-256,-257,-320,-359,-362,-322,-357,-271,-360,-358,-361,-263,-318,-319,-258,-259,-262,-272,-261,-260,]),'MINUS_EQUALS':([95,110,113,125,134,138,140,153,154,161,162,163,305,317,318,321,322,357,358,359,380,427,441,446,559,561,562,571,573,621,622,625,655,656,736,759,801,844,846,847,890,891,964,966,992,1022,],[-181,217,-254,-418,297,-255,-269,-273,-387,-374,-375,-376,-385,-264,-266,-316,-317,-377,-378,-379,-323,-253,-252,-265,-315,-267,-268,-270,-412,-182,-183,-184,-256,-257,-320,-322,-271,-263,-318,-319,-258,-259,-262,-272,-261,-260,]),'TIMES_EQUALS':([95,110,113,125,134,138,140,153,154,161,162,163,305,317,318,321,322,357,358,359,380,427,441,446,559,561,562,571,573,621,622,625,655,656,736,759,801,844,846,847,890,891,964,966,992,1022,],[-181,218,-254,-418,298,-255,-269,-273,-387,-374,-375,-376,-385,-264,-266,-316,-317,-377,-378,-379,-323,-253,-252,-265,-315,-267,-268,-270,-412,-182,-183,-184,-256,-257,-320,-322,-271,-263,-318,-319,-258,-259,-262,-272,-261,-260,]),'DIVIDE_EQUALS':([95,110,113,125,134,138,140,153,154,161,162,163,305,317,318,321,322,357,358,359,380,427,441,446,559,561,562,571,573,621,622,625,655,656,736,759,801,844,846,847,890,891,964,966,992,1022,],[-181,219,-254,-418,299,-255,-269,-273,-387,-374,-375,-376,-385,-264,-266,-316,-317,-377,-378,-379,-323,-253,-252,-265,-315,-267,-268,-270,-412,-182,-183,-184,-256,-257,-320,-322,-271,-263,-318,-319,-258,-259,-262,-272,-261,-260,]),'MODULO_EQUALS':([95,110,113,125,134,138,140,153,154,161,162,163,305,317,318,321,322,357,358,359,380,427,441,446,559,561,562,571,573,621,622,625,655,656,736,759,801,844,846,847,890,891,964,966,992,1022,],[-181,220,-254,-418,300,-255,-269,-273,-387,-374,-375,-376,-385,-264,-266,-316,-317,-377,-378,-379,-323,-253,-252,-265,-315,-267,-268,-270,-412,-182,-183,-184,-256,-257,-320,-322,-271,-263,-318,-319,-258,-259,-262,-272,-261,-260,]),'PLUS_PLUS':([95,110,113,125,138,140,154,161,162,163,305,317,318,321,322,357,358,359,380,427,441,446,559,561,562,621,622,625,655,656,736,759,844,846,847,890,891,964,992,1022,],[-181,221,-254,-418,-255,-269,-387,-374,-375,-376,-385,-264,-266,-316,-317,-377,-378,-379,-323,-253,-252,-265,-315,-267,-268,-182,-183,-184,-256,-257,-320,-322,-263,-318,-319,-258,-259,-262,-261,-260,]),'MINUS_MINUS':([95,110,113,125,138,140,154,161,162,163,305,317,318,321,322,357,358,359,380,427,441,446,559,561,562,621,622,625,655,656,736,759,844,846,847,890,891,964,992,1022,],[-181,222,-254,-418,-255,-269,-387,-374,-375,-376,-385,-264,-266,-316,-317,-377,-378,-379,-323,-253,-252,-265,-315,-267,-268,-182,-183,-184,-256,-257,-320,-322,-263,-318,-319,-258,-259,-262,-261,-260,]),'BY':([95,125,138,140,154,161,162,163,257,259,260,263,291,294,317,321,322,357,358,359,380,400,401,402,408,427,441,456,457,501,554,555,559,561,562,568,573,621,622,625,655,656,668,669,677,678,679,680,681,682,683,684,693,694,695,696,697,698,699,700,707,723,729,730,732,733,734,735,736,743,745,759,803,807,826,844,846,847,850,890,891,892,894,912,920,964,980,992,1022,],[-181,-418,-255,-269,-387,-374,-375,-376,-303,-312,-313,-279,-254,-280,-264,-316,-317,-377,-378,-379,-323,-374,-375,-376,-385,-253,-252,-309,-290,-266,-290,-309,-315,-267,-268,-424,-412,-182,-183,-184,-256,-257,-314,-274,-304,-284,-305,-306,-286,-307,-308,-310,-311,-287,-281,-283,-282,-285,-288,-289,-265,-277,-311,-287,-304,-284,-306,-286,-320,-49,-172,-322,-424,-424,-278,-263,-318,-319,-171,-258,-259,-52,-48,956,-276,-262,-275,-261,-260,]),'NAME':([112,200,623,624,],[224,419,419,419,]),'HERE':([121,127,133,141,150,156,215,216,217,218,219,220,227,243,244,245,247,278,279,293,295,296,297,298,299,300,311,316,336,431,445,449,454,455,463,464,471,472,473,474,475,476,477,478,479,480,487,488,489,490,491,502,522,546,547,551,552,553,569,648,667,731,832,900,956,967,],[263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,263,]),'OVERWORLD':([126,],[274,]),'THE_NETHER':([126,],[275,]),'THE_END':([126,],[276,]),'NEGATION':([626,],[778,]),'MACROS':([744,],[850,]),'SEMICOLON':([969,],[996,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'parsed':([0,],[1,]),'cbscript':([0,],[2,]),'cblib':([0,4,],[3,42,]),'optnewlines':([0,16,36,54,60,67,88,89,93,96,100,105,108,109,111,114,115,116,117,118,119,174,182,191,199,208,225,246,247,341,372,406,426,432,464,507,508,510,512,547,564,592,593,594,595,596,597,598,618,620,706,767,773,789,795,804,808,829,835,849,854,866,879,898,907,911,916,917,918,919,954,958,959,968,977,979,996,997,1007,1009,1023,1029,1031,],[4,55,70,87,92,99,179,180,197,201,206,210,213,214,223,229,230,231,232,233,234,369,381,405,410,425,440,381,405,381,591,619,647,653,405,713,714,716,718,405,381,760,761,762,763,764,765,766,772,774,831,873,875,880,887,893,895,910,915,924,927,929,935,944,952,955,960,961,962,963,986,989,990,995,1000,1002,1014,1015,1019,1021,1030,1033,1035,]),'script':([0,4,44,],[5,43,78,]),'top_level_blocks':([0,4,12,79,],[7,7,54,173,]),'newlines':([0,6,16,36,38,44,51,52,54,60,67,73,83,84,88,89,93,96,100,104,105,108,109,111,114,115,116,117,118,119,120,155,165,167,174,175,176,182,191,199,202,203,207,208,225,238,246,247,264,265,277,328,341,363,365,372,406,426,432,464,506,507,508,510,512,547,564,585,592,593,594,595,596,597,598,618,620,636,663,706,709,710,767,773,789,795,796,804,808,810,813,828,829,835,849,854,866,879,898,907,911,912,916,917,918,919,954,958,959,968,977,979,987,993,994,996,997,1007,1009,1023,1029,1031,],[8,46,8,8,71,46,85,86,8,8,8,166,177,178,8,8,8,8,8,209,8,8,8,8,8,8,8,8,8,8,235,344,360,362,8,370,371,8,8,8,420,421,424,8,8,453,8,8,494,497,505,565,8,586,588,8,8,8,8,8,712,8,8,8,8,8,8,754,8,8,8,8,8,8,8,8,8,790,811,8,833,834,8,8,8,8,888,8,8,896,899,908,8,8,8,8,8,8,8,8,8,957,8,8,8,8,8,8,8,8,8,8,1008,1011,1012,8,8,8,8,8,8,8,]),'empty':([0,4,10,12,16,32,36,48,54,60,67,71,75,79,80,88,89,93,96,100,102,105,108,109,111,114,115,116,117,118,119,141,150,151,166,172,174,180,182,191,199,200,208,225,235,236,237,246,247,277,306,308,341,353,364,372,381,405,406,420,421,426,431,432,449,450,453,464,484,485,494,496,497,498,505,507,508,510,512,547,564,565,568,580,586,588,590,592,593,594,595,596,597,598,618,619,620,661,663,664,687,688,689,692,702,704,705,706,712,725,760,767,773,789,790,795,803,804,807,808,811,813,817,818,829,833,834,835,849,854,866,873,879,888,896,898,899,907,908,909,911,916,917,918,919,922,929,953,954,957,958,959,968,977,979,991,996,997,1007,1008,1009,1014,1015,1023,1029,1031,1035,],[9,45,50,45,56,68,56,81,56,56,56,103,170,45,81,56,56,56,56,56,103,56,56,56,56,56,56,56,56,56,56,314,333,335,103,367,56,374,56,56,56,416,56,56,103,335,335,56,56,335,539,314,56,583,170,56,600,600,56,637,637,56,333,56,333,662,103,56,691,691,103,335,103,335,103,56,56,56,56,56,56,103,745,583,103,103,758,56,56,56,56,56,56,56,56,600,56,662,335,662,691,691,821,821,662,662,662,56,103,842,374,56,56,56,637,56,745,56,745,56,103,335,821,821,56,103,103,56,56,56,56,600,56,637,103,56,103,56,103,335,56,56,56,56,56,842,971,662,56,103,56,56,56,56,56,842,56,56,56,103,56,1025,971,56,56,56,1025,]),'dir':([0,4,44,],[10,10,10,]),'top_level_block':([0,4,12,79,],[12,12,12,12,]),'advancement':([0,4,12,79,],[14,14,14,14,]),'array':([0,4,12,79,420,421,790,888,],[15,15,15,15,642,642,642,642,]),'const_assign':([0,4,12,71,79,102,166,235,236,237,453,494,496,497,498,505,565,586,588,712,811,833,834,896,899,908,909,957,1008,],[16,16,16,109,16,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,]),'import':([0,4,12,79,],[17,17,17,17,]),'item_modifier':([0,4,12,79,],[18,18,18,18,]),'loot_table':([0,4,12,79,],[19,19,19,19,]),'selector_assign':([0,4,12,71,79,102,166,235,236,237,453,494,496,497,498,505,565,586,588,712,811,833,834,896,899,908,909,957,1008,],[20,20,20,114,20,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,]),'selector_define_block':([0,4,12,71,79,102,166,235,236,237,453,494,496,497,498,505,565,586,588,712,811,833,834,896,899,908,909,957,1008,],[21,21,21,115,21,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,]),'sections':([0,4,12,32,79,],[22,22,22,67,22,]),'predicate':([0,4,12,79,420,421,790,888,],[23,23,23,23,643,643,643,643,]),'section':([0,4,12,32,79,],[32,32,32,32,32,]),'reset_section':([0,4,12,32,79,],[34,34,34,34,34,]),'clock_section':([0,4,12,32,79,],[35,35,35,35,35,]),'function_section':([0,4,12,32,79,420,421,790,888,],[36,36,36,36,36,641,641,641,641,]),'macro_section':([0,4,12,32,79,],[37,37,37,37,37,]),'optdesc':([10,],[48,]),'string':([11,49,90,91,121,152,159,180,190,192,211,243,244,256,280,281,282,283,293,301,302,303,304,306,309,311,325,350,353,354,381,382,384,385,386,387,388,389,390,391,392,393,395,396,397,398,405,455,463,486,493,503,509,511,513,541,543,551,564,573,577,578,580,605,613,619,654,715,717,719,725,760,761,762,763,764,765,837,838,839,848,873,922,929,937,938,967,991,998,999,1015,],[51,83,188,188,188,188,188,376,188,407,188,188,188,188,507,508,510,512,188,533,533,533,533,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,407,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,804,188,188,188,188,376,860,860,860,860,860,917,918,919,188,188,188,860,188,188,994,188,188,188,860,]),'loot_table_type':([29,],[62,]),'file_params':([48,80,],[79,174,]),'file_param':([48,80,],[80,80,]),'json_object':([57,61,69,94,301,302,303,304,321,409,560,626,640,689,692,761,762,763,764,765,817,818,929,1015,],[88,93,100,199,532,532,532,532,559,620,739,781,794,820,820,861,861,861,861,861,820,820,861,861,]),'full_selector':([65,71,97,98,102,106,121,122,124,127,128,129,130,131,132,133,141,142,147,150,152,156,158,159,166,215,216,217,218,219,220,227,235,236,237,243,244,245,247,278,279,293,295,296,297,298,299,300,301,302,303,304,311,316,336,337,422,431,445,449,453,454,455,463,464,471,472,473,474,475,476,477,478,479,480,482,487,488,489,490,491,494,496,497,498,502,504,505,522,546,547,551,552,553,565,569,572,586,588,648,667,712,731,791,792,811,832,833,834,851,896,899,900,908,909,956,957,967,1008,],[96,107,202,203,107,211,249,266,273,249,280,281,282,283,285,292,308,317,330,292,273,249,347,348,107,292,292,292,292,292,292,292,107,107,107,459,292,292,459,459,459,292,459,459,459,292,292,292,285,285,285,285,459,459,249,570,645,292,459,292,107,249,459,459,459,292,292,292,292,292,459,292,459,292,292,686,459,459,459,292,292,107,107,107,107,292,710,107,459,459,459,459,459,459,107,292,273,107,107,292,292,107,459,882,884,107,292,107,107,273,107,107,292,107,107,292,107,292,107,]),'code_blocks':([71,102,166,235,453,494,497,505,565,586,588,712,811,833,834,896,899,908,957,1008,],[101,208,361,450,664,702,705,711,742,755,756,836,897,913,914,943,945,953,988,1020,]),'code_block':([71,102,166,235,236,237,453,494,496,497,498,505,565,586,588,712,811,833,834,896,899,908,909,957,1008,],[102,102,102,102,451,452,102,102,704,102,706,102,102,102,102,102,102,102,102,102,102,102,954,102,102,]),'assign':([71,102,166,235,236,237,453,494,496,497,498,505,565,586,588,712,811,833,834,896,899,908,909,957,1008,],[108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,]),'variable':([71,102,121,122,124,127,133,141,150,152,156,166,215,216,217,218,219,220,227,235,236,237,243,244,245,247,278,279,293,295,296,297,298,299,300,311,316,336,431,445,449,453,454,455,463,464,471,472,473,474,475,476,477,478,479,480,487,488,489,490,491,494,496,497,498,502,505,522,546,547,551,552,553,565,569,572,586,588,648,667,712,731,811,832,833,834,851,896,899,900,908,909,956,957,967,1008,],[110,110,257,264,270,257,257,257,257,339,257,110,257,257,257,257,257,257,257,110,110,110,257,461,257,257,257,257,257,257,257,257,257,257,257,257,257,257,257,257,257,110,257,257,257,257,257,257,257,257,257,257,257,257,257,257,257,257,257,257,257,110,110,110,110,257,110,257,257,257,257,257,257,110,257,747,110,110,257,257,110,257,110,257,110,110,925,110,110,257,110,110,257,110,257,110,]),'create_block':([71,102,122,166,215,235,236,237,453,494,496,497,498,505,565,586,588,712,811,833,834,896,899,908,909,957,1008,],[111,111,265,111,432,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,]),'function_call_block':([71,102,166,235,236,237,453,494,496,497,498,505,565,586,588,712,811,833,834,896,899,908,909,957,1008,],[116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,]),'method_call_block':([71,102,166,235,236,237,453,494,496,497,498,505,565,586,588,712,811,833,834,896,899,908,909,957,1008,],[117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,]),'macro_call':([71,102,166,235,236,237,453,494,496,497,498,505,565,586,588,712,811,833,834,896,899,908,909,957,1008,],[118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,]),'with_anon':([71,102,166,235,236,237,453,494,496,497,498,505,565,586,588,712,811,833,834,896,899,908,909,957,1008,],[119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,]),'execute_items':([71,102,151,166,235,236,237,277,453,494,496,497,498,505,565,586,588,663,712,811,813,833,834,896,899,908,909,957,1008,],[120,120,334,120,120,120,120,506,120,120,120,120,120,120,120,120,120,810,120,120,810,120,120,120,120,120,120,120,120,]),'const_ID':([71,90,91,102,121,122,124,127,133,141,150,152,156,159,166,172,190,211,215,216,217,218,219,220,227,235,236,237,243,244,245,247,256,278,279,281,282,283,293,295,296,297,298,299,300,306,309,311,316,325,336,350,353,354,381,382,384,385,386,387,388,389,390,391,392,393,395,396,397,398,405,431,445,449,453,454,455,463,464,471,472,473,474,475,476,477,478,479,480,483,487,488,489,490,491,493,494,496,497,498,502,503,505,509,511,513,522,541,543,546,547,551,552,553,564,565,569,572,573,577,578,580,586,588,590,605,613,619,648,667,712,715,717,719,725,731,811,832,833,834,848,851,873,896,899,900,905,906,908,909,922,937,938,956,957,967,991,998,999,1008,],[125,189,189,125,242,125,271,125,125,125,125,242,125,189,125,368,189,189,125,125,125,125,125,125,125,125,125,125,242,242,125,125,484,125,125,189,189,189,242,125,125,125,125,125,125,189,189,242,125,189,125,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,125,125,125,125,125,242,242,125,125,125,125,125,125,125,125,125,125,125,687,125,125,125,125,125,189,125,125,125,125,125,189,125,189,189,189,125,189,189,125,125,242,125,125,189,125,125,125,189,189,189,189,125,125,368,189,189,189,125,125,125,189,189,189,189,125,125,125,125,125,189,125,189,125,125,125,125,125,125,125,189,189,189,125,125,125,189,189,189,125,]),'vector_variable':([71,102,121,127,156,166,235,236,237,336,453,454,482,494,496,497,498,505,565,586,588,712,811,833,834,896,899,908,909,957,1008,],[134,134,253,253,253,134,134,134,134,253,134,253,685,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,]),'nbt_list':([71,102,121,127,132,156,166,235,236,237,301,302,303,304,336,453,454,494,496,497,498,505,565,586,588,712,811,833,834,896,899,908,909,957,1008,],[135,135,255,255,287,255,135,135,135,135,287,287,287,287,255,135,255,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,]),'nbt_object':([71,102,121,127,132,156,166,235,236,237,301,302,303,304,336,453,454,494,496,497,498,505,565,586,588,712,811,833,834,896,899,908,909,957,1008,],[136,136,254,254,286,254,136,136,136,136,286,286,286,286,254,136,254,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,]),'const_int':([71,90,91,102,121,122,124,127,133,141,150,152,156,159,166,200,211,215,216,217,218,219,220,227,235,236,237,243,244,245,247,256,278,279,281,282,283,293,295,296,297,298,299,300,306,309,311,316,325,336,350,353,354,382,431,445,449,453,454,455,463,464,471,472,473,474,475,476,477,478,479,480,487,488,489,490,491,493,494,496,497,498,502,503,505,509,511,513,522,541,543,546,547,551,552,553,560,564,565,569,572,577,578,580,586,588,626,627,628,629,630,631,648,667,712,715,717,719,725,731,811,832,833,834,848,851,878,896,899,900,908,909,922,933,937,938,956,957,967,991,998,999,1008,],[138,186,186,138,240,138,138,138,138,138,138,138,138,186,138,411,186,138,138,138,138,138,138,138,138,138,138,138,138,138,138,186,138,138,186,186,186,138,138,138,138,138,138,138,186,186,240,138,186,138,186,186,186,186,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,186,138,138,138,138,138,186,138,186,186,186,138,186,186,138,138,138,138,138,740,186,138,138,138,186,186,186,138,138,779,782,783,784,785,786,138,138,138,186,186,186,186,138,138,138,138,138,186,138,934,138,138,138,138,138,186,972,186,186,138,138,138,186,186,186,138,]),'virtual_int':([71,102,121,122,124,127,133,141,150,152,156,166,215,216,217,218,219,220,227,235,236,237,243,244,245,247,278,279,293,295,296,297,298,299,300,311,316,336,431,445,449,453,454,455,463,464,471,472,473,474,475,476,477,478,479,480,487,488,489,490,491,494,496,497,498,502,505,522,546,547,551,552,553,565,569,572,586,588,648,667,712,731,811,832,833,834,851,896,899,900,905,906,908,909,956,957,967,1008,],[140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,442,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,798,140,140,140,140,140,140,140,140,140,140,140,948,951,140,140,140,140,140,140,]),'with':([71,102,166,235,236,237,453,494,496,497,498,505,565,586,588,712,811,833,834,896,899,908,909,957,1008,],[147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,]),'function_call':([71,102,121,127,133,141,147,150,156,166,215,216,217,218,219,220,227,235,236,237,243,244,245,247,278,279,293,295,296,297,298,299,300,311,316,336,431,445,449,453,454,455,463,464,471,472,473,474,475,476,477,478,479,480,487,488,489,490,491,494,496,497,498,502,505,522,546,547,551,552,553,565,569,586,588,648,667,712,731,811,832,833,834,896,899,900,908,909,956,957,967,1008,],[148,148,259,259,259,259,326,259,259,148,259,259,259,259,259,259,259,148,148,148,259,259,259,259,259,259,259,259,259,259,259,259,259,259,259,259,259,259,259,148,259,259,259,259,259,259,259,259,259,259,259,259,259,259,259,259,259,259,259,148,148,148,148,259,148,259,259,259,259,259,259,148,259,148,148,259,259,148,259,148,259,148,148,148,148,259,148,148,259,148,259,148,]),'method_call':([71,102,121,127,133,141,147,150,156,166,215,216,217,218,219,220,227,235,236,237,243,244,245,247,278,279,293,295,296,297,298,299,300,311,316,336,431,445,449,453,454,455,463,464,471,472,473,474,475,476,477,478,479,480,487,488,489,490,491,494,496,497,498,502,505,522,546,547,551,552,553,565,569,586,588,648,667,712,731,811,832,833,834,896,899,900,908,909,956,957,967,1008,],[149,149,260,260,260,260,327,260,260,149,260,260,260,260,260,260,260,149,149,149,260,260,260,260,260,260,260,260,260,260,260,260,260,260,260,260,260,260,260,149,260,260,260,260,260,260,260,260,260,260,260,260,260,260,260,260,260,260,260,149,149,149,149,260,149,260,260,260,260,260,260,149,260,149,149,260,260,149,260,149,260,149,149,149,149,260,149,149,260,149,260,149,]),'execute_item':([71,102,151,166,235,236,237,277,453,494,496,497,498,505,565,586,588,663,712,811,813,833,834,896,899,908,909,957,1008,],[151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,]),'const_vector':([71,102,121,127,133,141,150,156,166,215,216,217,218,219,220,227,235,236,237,243,244,245,247,278,279,293,295,296,297,298,299,300,311,316,336,431,445,449,453,454,455,463,464,471,472,473,474,475,476,477,478,479,480,482,487,488,489,490,491,494,496,497,498,502,505,522,546,547,551,552,553,565,569,586,588,648,667,712,731,811,832,833,834,896,899,900,908,909,956,957,967,1008,],[153,153,261,261,294,294,294,261,153,294,294,294,294,294,294,294,153,153,153,294,294,294,294,294,294,294,294,294,294,294,294,294,294,294,261,294,294,294,153,261,294,294,294,294,294,294,294,294,294,294,294,294,294,153,294,294,294,294,294,153,153,153,153,294,153,294,294,294,294,294,294,153,294,153,153,294,294,153,294,153,294,153,153,153,153,294,153,153,294,153,294,153,]),'int':([71,82,90,91,98,102,121,122,124,127,133,141,150,152,156,159,166,190,200,211,215,216,217,218,219,220,227,235,236,237,243,244,245,247,256,278,279,281,282,283,293,295,296,297,298,299,300,306,309,311,316,325,336,350,353,354,381,382,384,385,386,387,388,389,390,391,392,393,395,396,397,398,405,423,431,445,449,453,454,455,463,464,471,472,473,474,475,476,477,478,479,480,481,487,488,489,490,491,493,494,496,497,498,502,503,505,509,511,513,522,541,543,546,547,551,552,553,560,564,565,569,572,573,577,578,580,586,588,605,613,619,626,627,628,629,630,631,648,667,712,715,717,719,725,731,761,762,763,764,765,797,811,832,833,834,848,851,873,878,896,899,900,905,906,908,909,922,929,933,937,938,942,956,957,967,991,998,999,1001,1008,1014,1015,1035,],[154,175,193,193,205,154,248,154,154,154,154,154,154,343,154,193,154,404,414,193,154,154,154,154,154,154,444,154,154,154,458,343,154,154,193,154,154,193,193,193,458,154,154,154,154,154,154,193,193,248,154,193,154,193,193,193,404,193,404,404,404,404,404,404,404,404,404,404,404,404,404,404,404,646,154,154,154,154,154,458,458,154,154,154,154,154,154,154,154,154,154,154,684,154,154,154,154,154,193,154,154,154,154,154,193,154,193,193,193,154,193,193,154,154,458,154,154,414,193,154,154,154,404,193,193,193,154,154,404,404,404,414,414,414,414,414,414,444,154,154,193,193,193,193,154,404,404,404,404,404,889,154,154,154,154,193,154,404,414,154,154,154,949,949,154,154,193,404,414,193,193,978,154,154,154,193,193,193,1018,154,404,404,404,]),'id_list':([75,364,],[168,587,]),'const_value':([90,91,121,159,211,256,281,282,283,306,309,311,325,350,353,354,382,493,503,509,511,513,541,543,564,577,578,580,715,717,719,725,848,922,937,938,991,998,999,],[183,196,238,352,352,352,509,511,513,540,352,548,352,352,581,584,601,701,709,715,717,719,352,352,741,352,751,753,837,838,839,540,352,540,973,974,540,1016,1017,]),'const_expr':([90,91,121,152,159,190,211,243,244,256,281,282,283,293,306,309,311,325,350,353,354,381,382,384,385,386,387,388,389,390,391,392,393,395,396,397,398,405,455,463,493,503,509,511,513,541,543,551,564,573,577,578,580,605,613,619,715,717,719,725,848,873,922,937,938,991,998,999,],[184,184,184,340,184,399,184,399,340,184,184,184,184,340,184,184,184,184,184,184,184,599,184,602,603,604,606,607,608,609,610,611,612,614,615,616,617,599,399,399,184,184,184,184,184,184,184,399,184,611,184,184,184,769,770,599,184,184,184,184,184,599,184,184,184,184,184,184,]),'const_string':([90,91,121,159,211,256,281,282,283,306,309,311,325,350,353,354,382,493,503,509,511,513,541,543,564,577,578,580,715,717,719,725,848,922,937,938,991,998,999,],[185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,]),'number':([90,91,121,152,159,190,211,243,244,256,281,282,283,293,306,309,311,325,350,353,354,381,382,384,385,386,387,388,389,390,391,392,393,395,396,397,398,405,455,463,493,503,509,511,513,541,543,551,564,573,577,578,580,605,613,619,715,717,719,725,761,762,763,764,765,848,873,922,929,937,938,991,998,999,1014,1015,1035,],[187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,859,859,859,859,859,187,187,187,859,187,187,187,187,187,1027,859,1027,]),'float':([90,91,121,152,159,190,211,243,244,256,281,282,283,293,306,309,311,325,350,353,354,381,382,384,385,386,387,388,389,390,391,392,393,395,396,397,398,405,455,463,493,503,509,511,513,541,543,551,564,573,577,578,580,605,613,619,715,717,719,725,761,762,763,764,765,848,873,922,929,937,938,991,998,999,1014,1015,1035,],[194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,]),'uuid':([98,],[204,]),'conditionals':([121,127,156,336,454,],[239,277,345,239,665,]),'conditional':([121,127,156,336,454,],[241,241,241,241,241,]),'expr':([121,127,133,141,150,156,215,216,217,218,219,220,227,243,244,245,247,278,279,293,295,296,297,298,299,300,311,316,336,431,445,449,454,455,463,464,471,472,473,474,475,476,477,478,479,480,487,488,489,490,491,502,522,546,547,551,552,553,569,648,667,731,832,900,956,967,],[252,252,290,315,332,252,433,434,435,436,437,438,443,456,462,465,466,456,466,462,521,524,526,527,528,529,550,555,252,332,456,332,252,456,456,466,672,673,674,675,676,677,679,680,682,683,694,696,698,699,700,708,550,730,550,555,732,734,746,799,814,315,912,946,987,993,]),'vector_expr':([121,127,133,141,150,156,215,216,217,218,219,220,227,243,244,245,247,278,279,293,295,296,297,298,299,300,311,316,336,431,445,449,454,455,463,464,471,472,473,474,475,476,477,478,479,480,487,488,489,490,491,502,522,546,547,551,552,553,569,648,667,731,832,900,956,967,],[258,258,258,310,258,258,258,258,258,258,258,258,258,457,258,258,467,457,467,258,520,523,525,258,258,258,549,554,258,258,457,258,258,457,457,467,258,258,258,258,258,678,258,681,258,258,693,695,697,258,258,258,549,729,549,554,733,735,258,258,258,845,258,258,258,258,]),'nbt_path':([132,301,302,303,304,],[284,531,531,531,531,]),'opt_anchor':([141,308,],[309,543,]),'data_path':([143,228,262,268,289,319,320,428,430,447,448,470,500,514,515,517,556,791,792,939,940,],[318,446,492,501,516,557,558,649,651,657,658,671,707,720,721,707,736,883,885,975,976,]),'expr_list':([150,431,449,],[331,652,659,]),'rel_coords':([159,211,256,309,325,541,543,848,],[349,426,483,545,563,726,728,923,]),'rel_coord':([159,211,256,309,325,350,541,543,577,848,],[350,350,350,350,350,577,350,350,750,350,]),'local_coord':([159,211,256,309,325,351,541,543,579,848,],[351,351,351,351,351,579,351,351,752,351,]),'macro_args':([172,],[365,]),'macro_params':([172,590,],[366,757,]),'json_members':([180,760,],[372,855,]),'json_pair':([180,760,],[373,373,]),'qualifiers':([200,],[412,]),'qualifier':([200,623,624,],[415,775,776,]),'nbt':([301,302,303,304,],[530,534,535,536,]),'macro_call_args':([306,],[537,]),'macro_call_params':([306,725,922,991,],[538,841,965,1010,]),'with_items':([344,575,],[574,748,]),'with_item':([344,575,],[575,575,]),'opt_const_value':([353,580,],[582,582,]),'const_expr_list':([381,405,619,873,],[598,618,773,931,]),'selector_definition':([420,421,790,888,],[635,644,881,941,]),'selector_item':([420,421,790,888,],[636,636,636,636,]),'else_list':([450,661,664,702,704,705,953,],[660,809,812,827,829,830,985,]),'else_item':([450,661,664,702,704,705,953,],[661,661,661,661,661,661,661,]),'opt_block_state':([484,485,687,688,],[689,692,817,818,]),'opt_with_macro':([568,803,807,],[743,892,894,]),'opt_tile_data':([689,692,817,818,],[819,825,902,903,]),'block_states':([690,981,982,983,984,],[822,1003,1004,1005,1006,]),'json_value':([761,762,763,764,765,929,1015,],[856,868,869,870,871,970,970,]),'json_array':([761,762,763,764,765,929,1015,],[862,862,862,862,862,862,862,]),'json_literal_array':([761,762,763,764,765,929,1015,],[863,863,863,863,863,863,863,]),'data_type':([883,885,975,976,],[937,938,998,999,]),'json_elements':([929,1015,],[968,1028,]),'json_literal_elements':([1014,1035,],[1023,1036,]),'json_literal_value':([1014,1035,],[1024,1024,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> parsed","S'",1,None,None,None),
+  ('parsed -> cbscript','parsed',1,'p_parsed','CommandBlockParser.py',85),
+  ('parsed -> cblib','parsed',1,'p_parsed','CommandBlockParser.py',86),
+  ('parsed -> optnewlines cblib','parsed',2,'p_parsed_bad_cblib','CommandBlockParser.py',90),
+  ('cbscript -> script','cbscript',1,'p_cbscript','CommandBlockParser.py',101),
+  ('cbscript -> optnewlines script','cbscript',2,'p_cbscript_bad_start','CommandBlockParser.py',105),
+  ('cbscript -> optnewlines error script','cbscript',3,'p_cbscript_error','CommandBlockParser.py',112),
+  ('cblib -> top_level_blocks','cblib',1,'p_cblib','CommandBlockParser.py',120),
+  ('script -> dir optdesc file_params top_level_blocks','script',4,'p_script','CommandBlockParser.py',126),
+  ('script -> DIR string','script',2,'p_script_only_dir','CommandBlockParser.py',131),
+  ('dir -> DIR string newlines','dir',3,'p_dir','CommandBlockParser.py',136),
+  ('dir -> DIR error newlines','dir',3,'p_dir_error','CommandBlockParser.py',140),
+  ('optdesc -> DESC string newlines','optdesc',3,'p_optdesc','CommandBlockParser.py',148),
+  ('optdesc -> empty','optdesc',1,'p_optdesc','CommandBlockParser.py',149),
+  ('optdesc -> DESC error newlines','optdesc',3,'p_optdesc_error','CommandBlockParser.py',156),
+  ('file_params -> file_param file_params optnewlines','file_params',3,'p_file_params','CommandBlockParser.py',164),
+  ('file_params -> empty','file_params',1,'p_file_params','CommandBlockParser.py',165),
+  ('file_param -> ID int newlines','file_param',3,'p_file_param','CommandBlockParser.py',173),
+  ('file_param -> ID error newlines','file_param',3,'p_file_param_error','CommandBlockParser.py',179),
+  ('top_level_block -> advancement','top_level_block',1,'p_top_level_block','CommandBlockParser.py',188),
+  ('top_level_block -> array','top_level_block',1,'p_top_level_block','CommandBlockParser.py',189),
+  ('top_level_block -> const_assign optnewlines','top_level_block',2,'p_top_level_block','CommandBlockParser.py',190),
+  ('top_level_block -> import','top_level_block',1,'p_top_level_block','CommandBlockParser.py',191),
+  ('top_level_block -> item_modifier','top_level_block',1,'p_top_level_block','CommandBlockParser.py',192),
+  ('top_level_block -> loot_table','top_level_block',1,'p_top_level_block','CommandBlockParser.py',193),
+  ('top_level_block -> selector_assign','top_level_block',1,'p_top_level_block','CommandBlockParser.py',194),
+  ('top_level_block -> selector_define_block','top_level_block',1,'p_top_level_block','CommandBlockParser.py',195),
+  ('top_level_block -> sections','top_level_block',1,'p_top_level_block','CommandBlockParser.py',196),
+  ('top_level_block -> predicate','top_level_block',1,'p_top_level_block','CommandBlockParser.py',197),
+  ('top_level_block -> error newlines','top_level_block',2,'p_top_level_block_error','CommandBlockParser.py',201),
+  ('top_level_blocks -> top_level_block top_level_blocks optnewlines','top_level_blocks',3,'p_top_level_blocks','CommandBlockParser.py',205),
+  ('top_level_blocks -> empty','top_level_blocks',1,'p_top_level_blocks','CommandBlockParser.py',206),
+  ('import -> IMPORT ID optnewlines','import',3,'p_import','CommandBlockParser.py',219),
+  ('sections -> section sections optnewlines','sections',3,'p_sections','CommandBlockParser.py',224),
+  ('sections -> empty','sections',1,'p_sections','CommandBlockParser.py',225),
+  ('section -> reset_section','section',1,'p_section','CommandBlockParser.py',235),
+  ('section -> clock_section','section',1,'p_section','CommandBlockParser.py',236),
+  ('section -> function_section optnewlines','section',2,'p_section','CommandBlockParser.py',237),
+  ('section -> macro_section','section',1,'p_section','CommandBlockParser.py',238),
+  ('reset_section -> RESET newlines code_blocks END newlines','reset_section',5,'p_reset_section','CommandBlockParser.py',243),
+  ('reset_section -> RESET error END newlines','reset_section',4,'p_reset_section_error','CommandBlockParser.py',247),
+  ('clock_section -> CLOCK ID newlines code_blocks END newlines','clock_section',6,'p_clock_section','CommandBlockParser.py',253),
+  ('clock_section -> CLOCK error END newlines','clock_section',4,'p_clock_section_error','CommandBlockParser.py',257),
+  ('function_section -> FUNCTION FUNCTION_ID id_list RPAREN newlines code_blocks END','function_section',7,'p_function_section','CommandBlockParser.py',263),
+  ('function_section -> FUNCTION error END','function_section',3,'p_function_section_error','CommandBlockParser.py',267),
+  ('id_list -> ID COMMA id_list','id_list',3,'p_id_list','CommandBlockParser.py',272),
+  ('id_list -> ID','id_list',1,'p_id_list','CommandBlockParser.py',273),
+  ('id_list -> empty','id_list',1,'p_id_list','CommandBlockParser.py',274),
+  ('function_call -> ID COLON FUNCTION_ID expr_list RPAREN opt_with_macro','function_call',6,'p_function_call','CommandBlockParser.py',283),
+  ('function_call -> FUNCTION_ID expr_list RPAREN opt_with_macro','function_call',4,'p_function_call','CommandBlockParser.py',284),
+  ('function_call_block -> with function_call','function_call_block',2,'p_function_call_block','CommandBlockParser.py',291),
+  ('function_call_block -> function_call','function_call_block',1,'p_function_call_block','CommandBlockParser.py',292),
+  ('method_call -> full_selector DOT FUNCTION_ID expr_list RPAREN opt_with_macro','method_call',6,'p_method_call','CommandBlockParser.py',299),
+  ('method_call_block -> with method_call','method_call_block',2,'p_method_call_block','CommandBlockParser.py',303),
+  ('method_call_block -> method_call','method_call_block',1,'p_method_call_block','CommandBlockParser.py',304),
+  ('code_blocks -> code_block code_blocks optnewlines','code_blocks',3,'p_code_blocks','CommandBlockParser.py',312),
+  ('code_blocks -> empty','code_blocks',1,'p_code_blocks','CommandBlockParser.py',313),
+  ('code_block -> error newlines','code_block',2,'p_code_block_error','CommandBlockParser.py',323),
+  ('code_block -> COMMAND optnewlines','code_block',2,'p_command_code_block','CommandBlockParser.py',328),
+  ('code_block -> MOVE full_selector rel_coords optnewlines','code_block',4,'p_move_code_block','CommandBlockParser.py',333),
+  ('code_block -> assign optnewlines','code_block',2,'p_assignment_code_block','CommandBlockParser.py',337),
+  ('code_block -> const_assign optnewlines','code_block',2,'p_constant_assignment_code_block','CommandBlockParser.py',341),
+  ('code_block -> variable EQUALS create_block optnewlines','code_block',4,'p_create_code_block','CommandBlockParser.py',345),
+  ('code_block -> create_block optnewlines','code_block',2,'p_create_code_block','CommandBlockParser.py',346),
+  ('code_block -> DEFINE NAME ID EQUALS string optnewlines','code_block',6,'p_define_name_code_block','CommandBlockParser.py',353),
+  ('code_block -> DEFINE error optnewlines','code_block',3,'p_define_name_code_block_error','CommandBlockParser.py',357),
+  ('code_block -> selector_assign optnewlines','code_block',2,'p_selector_block_code_block','CommandBlockParser.py',361),
+  ('code_block -> selector_define_block optnewlines','code_block',2,'p_selector_block_code_block','CommandBlockParser.py',362),
+  ('code_block -> function_call_block optnewlines','code_block',2,'p_function_call_code_block','CommandBlockParser.py',366),
+  ('code_block -> method_call_block optnewlines','code_block',2,'p_function_call_code_block','CommandBlockParser.py',367),
+  ('code_block -> macro_call optnewlines','code_block',2,'p_function_call_code_block','CommandBlockParser.py',368),
+  ('code_block -> with_anon optnewlines','code_block',2,'p_function_call_code_block','CommandBlockParser.py',369),
+  ('execute_items -> execute_item execute_items','execute_items',2,'p_execute_items','CommandBlockParser.py',375),
+  ('execute_items -> empty','execute_items',1,'p_execute_items','CommandBlockParser.py',376),
+  ('execute_item -> IF conditionals','execute_item',2,'p_execute_item','CommandBlockParser.py',384),
+  ('execute_item -> UNLESS conditionals','execute_item',2,'p_execute_item','CommandBlockParser.py',385),
+  ('execute_item -> AS full_selector','execute_item',2,'p_execute_item','CommandBlockParser.py',386),
+  ('execute_item -> AT full_selector opt_anchor','execute_item',3,'p_execute_item','CommandBlockParser.py',387),
+  ('execute_item -> AT full_selector opt_anchor rel_coords','execute_item',4,'p_execute_item','CommandBlockParser.py',388),
+  ('execute_item -> AT opt_anchor rel_coords','execute_item',3,'p_execute_item','CommandBlockParser.py',389),
+  ('execute_item -> AT vector_expr','execute_item',2,'p_execute_item','CommandBlockParser.py',390),
+  ('execute_item -> AT LPAREN const_value RPAREN vector_expr','execute_item',5,'p_execute_item','CommandBlockParser.py',391),
+  ('execute_item -> IN OVERWORLD','execute_item',2,'p_execute_item','CommandBlockParser.py',392),
+  ('execute_item -> IN THE_NETHER','execute_item',2,'p_execute_item','CommandBlockParser.py',393),
+  ('execute_item -> IN THE_END','execute_item',2,'p_execute_item','CommandBlockParser.py',394),
+  ('execute_item -> ON ID','execute_item',2,'p_execute_on','CommandBlockParser.py',401),
+  ('execute_item -> ROTATED full_selector','execute_item',2,'p_execute_rotated','CommandBlockParser.py',408),
+  ('execute_item -> FACING full_selector','execute_item',2,'p_execute_facing_entity','CommandBlockParser.py',412),
+  ('execute_item -> FACING rel_coords','execute_item',2,'p_execute_facing_relative_coordinates','CommandBlockParser.py',416),
+  ('execute_item -> ALIGN ID','execute_item',2,'p_execute_align','CommandBlockParser.py',420),
+  ('opt_anchor -> EYES','opt_anchor',1,'p_anchor','CommandBlockParser.py',428),
+  ('opt_anchor -> FEET','opt_anchor',1,'p_anchor','CommandBlockParser.py',429),
+  ('opt_anchor -> empty','opt_anchor',1,'p_anchor','CommandBlockParser.py',430),
+  ('opt_const_value -> const_value','opt_const_value',1,'p_optional_constant_value','CommandBlockParser.py',434),
+  ('opt_const_value -> empty','opt_const_value',1,'p_optional_constant_value','CommandBlockParser.py',435),
+  ('local_coord -> POWER opt_const_value','local_coord',2,'p_local_coordinates','CommandBlockParser.py',439),
+  ('rel_coord -> const_value','rel_coord',1,'p_relative_coordinate','CommandBlockParser.py',443),
+  ('rel_coord -> POWER const_value','rel_coord',2,'p_relative_coordinate','CommandBlockParser.py',444),
+  ('rel_coord -> TILDE const_value','rel_coord',2,'p_relative_coordinate','CommandBlockParser.py',445),
+  ('rel_coord -> TILDE','rel_coord',1,'p_relative_coordinate','CommandBlockParser.py',446),
+  ('rel_coord -> TILDE_EMPTY','rel_coord',1,'p_relative_coordinate','CommandBlockParser.py',447),
+  ('rel_coords -> rel_coord rel_coord rel_coord','rel_coords',3,'p_relative_coordinates','CommandBlockParser.py',456),
+  ('rel_coords -> local_coord local_coord local_coord','rel_coords',3,'p_relative_coordinates','CommandBlockParser.py',457),
+  ('opt_coords -> AT rel_coords','opt_coords',2,'p_optional_coordinates','CommandBlockParser.py',461),
+  ('opt_coords -> empty','opt_coords',1,'p_optional_coordinates','CommandBlockParser.py',462),
+  ('else_list -> else_item else_list','else_list',2,'p_execute_else_list','CommandBlockParser.py',466),
+  ('else_list -> empty','else_list',1,'p_execute_else_list','CommandBlockParser.py',467),
+  ('else_item -> ELSE execute_items newlines code_blocks','else_item',4,'p_execute_else_item','CommandBlockParser.py',475),
+  ('else_item -> ELSE newlines code_blocks','else_item',3,'p_execute_else_item','CommandBlockParser.py',476),
+  ('code_block -> execute_items newlines code_blocks else_list END optnewlines','code_block',6,'p_execute_chain','CommandBlockParser.py',483),
+  ('code_block -> execute_items DO code_block','code_block',3,'p_execute_inline','CommandBlockParser.py',487),
+  ('code_block -> execute_items THEN code_block','code_block',3,'p_execute_inline','CommandBlockParser.py',488),
+  ('code_block -> IF const_value newlines code_blocks else_list END optnewlines','code_block',7,'p_executre_if','CommandBlockParser.py',493),
+  ('code_block -> AS variable newlines code_blocks else_list END optnewlines','code_block',7,'p_execute_as','CommandBlockParser.py',498),
+  ('code_block -> AS variable LPAREN ATID RPAREN newlines code_blocks else_list END optnewlines','code_block',10,'p_execute_as','CommandBlockParser.py',499),
+  ('code_block -> AS variable DO code_block else_list optnewlines','code_block',6,'p_execute_as_do','CommandBlockParser.py',509),
+  ('code_block -> AS variable LPAREN ATID RPAREN DO code_block optnewlines','code_block',8,'p_execute_as_do','CommandBlockParser.py',510),
+  ('code_block -> AS create_block newlines code_blocks else_list END optnewlines','code_block',7,'p_execute_as_create','CommandBlockParser.py',520),
+  ('code_block -> AS create_block DO code_block optnewlines','code_block',5,'p_execute_as_create','CommandBlockParser.py',521),
+  ('conditional -> full_selector','conditional',1,'p_conditional','CommandBlockParser.py',532),
+  ('conditional -> PREDICATE ID','conditional',2,'p_conditional','CommandBlockParser.py',533),
+  ('conditional -> expr EQUALS_EQUALS expr','conditional',3,'p_conditional','CommandBlockParser.py',534),
+  ('conditional -> expr LESS expr','conditional',3,'p_conditional','CommandBlockParser.py',535),
+  ('conditional -> expr LESS_EQUALS expr','conditional',3,'p_conditional','CommandBlockParser.py',536),
+  ('conditional -> expr GREATER expr','conditional',3,'p_conditional','CommandBlockParser.py',537),
+  ('conditional -> expr GREATER_EQUALS expr','conditional',3,'p_conditional','CommandBlockParser.py',538),
+  ('conditional -> vector_variable EQUALS_EQUALS vector_variable','conditional',3,'p_conditional','CommandBlockParser.py',539),
+  ('conditional -> NOT expr','conditional',2,'p_conditional','CommandBlockParser.py',540),
+  ('conditional -> expr','conditional',1,'p_conditional','CommandBlockParser.py',541),
+  ('conditional -> nbt_object','conditional',1,'p_conditional','CommandBlockParser.py',542),
+  ('conditional -> nbt_list','conditional',1,'p_conditional','CommandBlockParser.py',543),
+  ('conditionals -> conditional AND conditionals','conditionals',3,'p_conditionals','CommandBlockParser.py',554),
+  ('conditionals -> conditional','conditionals',1,'p_conditionals','CommandBlockParser.py',555),
+  ('conditional -> BLOCK rel_coords const_ID opt_block_state opt_tile_data','conditional',5,'p_conditional_block','CommandBlockParser.py',562),
+  ('conditional -> BLOCK rel_coords ID opt_block_state opt_tile_data','conditional',5,'p_conditional_block','CommandBlockParser.py',563),
+  ('conditional -> BLOCK const_ID opt_block_state opt_tile_data','conditional',4,'p_conditional_block','CommandBlockParser.py',564),
+  ('conditional -> BLOCK ID opt_block_state opt_tile_data','conditional',4,'p_conditional_block','CommandBlockParser.py',565),
+  ('opt_block_state -> LBRACKET block_states RBRACKET','opt_block_state',3,'p_optional_block_state','CommandBlockParser.py',569),
+  ('opt_block_state -> empty','opt_block_state',1,'p_optional_block_state','CommandBlockParser.py',570),
+  ('block_states -> ID EQUALS ID COMMA block_states','block_states',5,'p_block_states','CommandBlockParser.py',574),
+  ('block_states -> ID EQUALS virtual_int COMMA block_states','block_states',5,'p_block_states','CommandBlockParser.py',575),
+  ('block_states -> FACING EQUALS ID COMMA block_states','block_states',5,'p_block_states','CommandBlockParser.py',576),
+  ('block_states -> FACING EQUALS virtual_int COMMA block_states','block_states',5,'p_block_states','CommandBlockParser.py',577),
+  ('block_states -> ID EQUALS ID','block_states',3,'p_block_states','CommandBlockParser.py',578),
+  ('block_states -> ID EQUALS virtual_int','block_states',3,'p_block_states','CommandBlockParser.py',579),
+  ('block_states -> FACING EQUALS ID','block_states',3,'p_block_states','CommandBlockParser.py',580),
+  ('block_states -> FACING EQUALS virtual_int','block_states',3,'p_block_states','CommandBlockParser.py',581),
+  ('opt_tile_data -> json_object','opt_tile_data',1,'p_optional_tile_data','CommandBlockParser.py',584),
+  ('opt_tile_data -> empty','opt_tile_data',1,'p_optional_tile_data','CommandBlockParser.py',585),
+  ('code_block -> IF const_value newlines code_blocks ELSE newlines code_blocks END optnewlines','code_block',9,'p_if_else','CommandBlockParser.py',589),
+  ('code_block -> FOR variable EQUALS expr TO expr BY expr newlines code_blocks END optnewlines','code_block',12,'p_for','CommandBlockParser.py',596),
+  ('code_block -> FOR variable EQUALS expr TO expr newlines code_blocks END optnewlines','code_block',10,'p_for','CommandBlockParser.py',597),
+  ('code_block -> FOR const_ID IN const_value newlines code_blocks END optnewlines','code_block',8,'p_for','CommandBlockParser.py',598),
+  ('code_block -> FOR ATID IN full_selector newlines code_blocks END optnewlines','code_block',8,'p_for','CommandBlockParser.py',599),
+  ('code_block -> WHILE conditionals newlines code_blocks END optnewlines','code_block',6,'p_while','CommandBlockParser.py',611),
+  ('code_block -> WHILE conditionals execute_items newlines code_blocks END optnewlines','code_block',7,'p_while','CommandBlockParser.py',612),
+  ('create_block -> CREATE ATID rel_coords','create_block',3,'p_ATID_create','CommandBlockParser.py',621),
+  ('create_block -> CREATE ATID','create_block',2,'p_ATID_create','CommandBlockParser.py',622),
+  ('create_block -> CREATE ATID LBRACKET const_value RBRACKET rel_coords','create_block',6,'p_ATID_index_create','CommandBlockParser.py',626),
+  ('create_block -> CREATE ATID LBRACKET const_value RBRACKET','create_block',5,'p_ATID_index_create','CommandBlockParser.py',627),
+  ('macro_section -> MACRO DOLLAR FUNCTION_ID macro_args newlines code_blocks END optnewlines','macro_section',8,'p_macro_section','CommandBlockParser.py',633),
+  ('macro_args -> macro_params RPAREN','macro_args',2,'p_macro_args','CommandBlockParser.py',637),
+  ('macro_args -> empty','macro_args',1,'p_macro_args','CommandBlockParser.py',638),
+  ('macro_params -> const_ID COMMA macro_params','macro_params',3,'p_macro_params','CommandBlockParser.py',642),
+  ('macro_params -> const_ID','macro_params',1,'p_macro_params','CommandBlockParser.py',643),
+  ('macro_params -> empty','macro_params',1,'p_macro_params','CommandBlockParser.py',644),
+  ('with -> WITH newlines with_items','with',3,'p_with','CommandBlockParser.py',654),
+  ('with_items -> with_item with_items','with_items',2,'p_with_items','CommandBlockParser.py',658),
+  ('with_items -> with_item','with_items',1,'p_with_items','CommandBlockParser.py',659),
+  ('with_item -> DOLLAR LPAREN ID RPAREN EQUALS expr newlines','with_item',7,'p_with_item','CommandBlockParser.py',666),
+  ('with_item -> DOLLAR LPAREN ID RPAREN EQUALS string newlines','with_item',7,'p_with_item','CommandBlockParser.py',667),
+  ('opt_with_macro -> WITH MACROS','opt_with_macro',2,'p_with_macro','CommandBlockParser.py',671),
+  ('opt_with_macro -> empty','opt_with_macro',1,'p_with_macro','CommandBlockParser.py',672),
+  ('with_anon -> with DO newlines code_blocks END optnewlines','with_anon',6,'p_with_anon','CommandBlockParser.py',676),
+  ('macro_call -> DOLLAR FUNCTION_ID macro_call_args','macro_call',3,'p_macro_call','CommandBlockParser.py',681),
+  ('macro_call_args -> macro_call_params RPAREN','macro_call_args',2,'p_macro_call_args','CommandBlockParser.py',685),
+  ('macro_call_args -> empty','macro_call_args',1,'p_macro_call_args','CommandBlockParser.py',686),
+  ('macro_call_params -> macro_call_params COMMA macro_call_params','macro_call_params',3,'p_macro_call_params','CommandBlockParser.py',690),
+  ('macro_call_params -> macro_call_params','macro_call_params',1,'p_macro_call_params','CommandBlockParser.py',691),
+  ('macro_call_params -> const_value','macro_call_params',1,'p_macro_call_params','CommandBlockParser.py',692),
+  ('macro_call_params -> empty','macro_call_params',1,'p_macro_call_params','CommandBlockParser.py',693),
+  ('full_selector -> ATID','full_selector',1,'p_full_selector','CommandBlockParser.py',706),
+  ('full_selector -> ATID LBRACKET const_int RBRACKET','full_selector',4,'p_full_selector_qualifiers','CommandBlockParser.py',710),
+  ('full_selector -> ATID LBRACKET qualifiers RBRACKET','full_selector',4,'p_full_selector_qualifiers','CommandBlockParser.py',711),
+  ('full_selector -> ATID LBRACKET error RBRACKET','full_selector',4,'p_full_selector_error','CommandBlockParser.py',715),
+  ('qualifiers -> qualifier','qualifiers',1,'p_qualifier_single','CommandBlockParser.py',721),
+  ('qualifiers -> empty','qualifiers',1,'p_qualifier_single','CommandBlockParser.py',722),
+  ('qualifiers -> qualifiers COMMA qualifier','qualifiers',3,'p_qualifier_list','CommandBlockParser.py',726),
+  ('qualifiers -> qualifiers AND qualifier','qualifiers',3,'p_qualifier_list','CommandBlockParser.py',727),
+  ('qualifier -> ID EQUALS','qualifier',2,'p_qualifier_empty','CommandBlockParser.py',732),
+  ('qualifier -> ID EQUALS NEGATION ID','qualifier',4,'p_qualifier_not','CommandBlockParser.py',736),
+  ('qualifier -> NOT ID','qualifier',2,'p_qualifier_not','CommandBlockParser.py',737),
+  ('qualifier -> ID','qualifier',1,'p_qualifier_id','CommandBlockParser.py',744),
+  ('qualifier -> ID EQUALS const_int DOT DOT const_int','qualifier',6,'p_qualifier_builtin','CommandBlockParser.py',748),
+  ('qualifier -> ID EQUALS DOT DOT const_int','qualifier',5,'p_qualifier_builtin','CommandBlockParser.py',749),
+  ('qualifier -> ID EQUALS const_int DOT DOT','qualifier',5,'p_qualifier_builtin','CommandBlockParser.py',750),
+  ('qualifier -> ID EQUALS const_int','qualifier',3,'p_qualifier_binop','CommandBlockParser.py',763),
+  ('qualifier -> ID EQUALS ID','qualifier',3,'p_qualifier_binop','CommandBlockParser.py',764),
+  ('qualifier -> NAME EQUALS ID','qualifier',3,'p_qualifier_binop','CommandBlockParser.py',765),
+  ('qualifier -> ID EQUALS_EQUALS const_int','qualifier',3,'p_qualifier_binop','CommandBlockParser.py',766),
+  ('qualifier -> ID GREATER_EQUALS const_int','qualifier',3,'p_qualifier_binop','CommandBlockParser.py',767),
+  ('qualifier -> ID LESS_EQUALS const_int','qualifier',3,'p_qualifier_binop','CommandBlockParser.py',768),
+  ('qualifier -> ID GREATER const_int','qualifier',3,'p_qualifier_binop','CommandBlockParser.py',769),
+  ('qualifier -> ID LESS const_int','qualifier',3,'p_qualifier_binop','CommandBlockParser.py',770),
+  ('qualifier -> ID EQUALS json_object','qualifier',3,'p_qualifier_binop','CommandBlockParser.py',771),
+  ('selector_define_block -> DEFINE ATID EQUALS full_selector newlines selector_definition END optnewlines','selector_define_block',8,'p_selector_define','CommandBlockParser.py',777),
+  ('selector_define_block -> DEFINE ATID COLON full_selector newlines selector_definition END optnewlines','selector_define_block',8,'p_selector_define','CommandBlockParser.py',778),
+  ('selector_define_block -> DEFINE ATID COLON uuid LPAREN full_selector RPAREN newlines selector_definition END optnewlines','selector_define_block',11,'p_selector_define','CommandBlockParser.py',779),
+  ('selector_definition -> DEFINE error END optnewlines','selector_definition',4,'p_selector_define_error','CommandBlockParser.py',786),
+  ('selector_definition -> selector_item newlines selector_definition','selector_definition',3,'p_selector_definition','CommandBlockParser.py',791),
+  ('selector_definition -> empty','selector_definition',1,'p_selector_definition','CommandBlockParser.py',792),
+  ('selector_item -> ID EQUALS full_selector','selector_item',3,'p_selector_pointer','CommandBlockParser.py',801),
+  ('selector_item -> ID COLON full_selector','selector_item',3,'p_selector_pointer','CommandBlockParser.py',802),
+  ('selector_item -> ID EQUALS data_path data_type const_value','selector_item',5,'p_selector_item_path','CommandBlockParser.py',806),
+  ('selector_item -> ID COLON data_path data_type const_value','selector_item',5,'p_selector_item_path','CommandBlockParser.py',807),
+  ('selector_item -> ID EQUALS data_path data_type','selector_item',4,'p_selector_item_path','CommandBlockParser.py',808),
+  ('selector_item -> ID COLON data_path data_type','selector_item',4,'p_selector_item_path','CommandBlockParser.py',809),
+  ('selector_item -> LESS ID GREATER EQUALS data_path data_type const_value','selector_item',7,'p_selector_item_vector_path','CommandBlockParser.py',813),
+  ('selector_item -> LESS ID GREATER COLON data_path data_type const_value','selector_item',7,'p_selector_item_vector_path','CommandBlockParser.py',814),
+  ('selector_item -> LESS ID GREATER EQUALS data_path data_type','selector_item',6,'p_selector_item_vector_path','CommandBlockParser.py',815),
+  ('selector_item -> LESS ID GREATER COLON data_path data_type','selector_item',6,'p_selector_item_vector_path','CommandBlockParser.py',816),
+  ('selector_item -> CREATE json_object','selector_item',2,'p_selector_item_tag','CommandBlockParser.py',820),
+  ('selector_item -> function_section','selector_item',1,'p_selector_item_method','CommandBlockParser.py',824),
+  ('selector_item -> array','selector_item',1,'p_selector_item_array','CommandBlockParser.py',828),
+  ('selector_item -> predicate','selector_item',1,'p_selector_item_predicate','CommandBlockParser.py',832),
+  ('selector_assign -> ATID EQUALS full_selector optnewlines','selector_assign',4,'p_selector_assignment','CommandBlockParser.py',836),
+  ('array -> ARRAY ID LBRACKET const_value TO const_value RBRACKET','array',7,'p_array','CommandBlockParser.py',842),
+  ('array -> ARRAY ID LBRACKET const_value RBRACKET','array',5,'p_array','CommandBlockParser.py',843),
+  ('advancement -> ADVANCEMENT ID json_object optnewlines','advancement',4,'p_advancement','CommandBlockParser.py',849),
+  ('loot_table_type -> BLOCK','loot_table_type',1,'p_loot_table_type','CommandBlockParser.py',854),
+  ('loot_table_type -> ENTITY','loot_table_type',1,'p_loot_table_type','CommandBlockParser.py',855),
+  ('loot_table -> LOOT_TABLE loot_table_type ID COLON ID json_object optnewlines','loot_table',7,'p_loot_table','CommandBlockParser.py',860),
+  ('loot_table -> LOOT_TABLE loot_table_type ID json_object optnewlines','loot_table',5,'p_loot_table','CommandBlockParser.py',861),
+  ('predicate -> PREDICATE ID json_object optnewlines','predicate',4,'p_predicate','CommandBlockParser.py',871),
+  ('item_modifier -> ITEM_MODIFIER ID json_object optnewlines','item_modifier',4,'p_item_modifier','CommandBlockParser.py',877),
+  ('code_block -> TELL full_selector string optnewlines','code_block',4,'p_tell','CommandBlockParser.py',883),
+  ('code_block -> TITLE full_selector string optnewlines','code_block',4,'p_title','CommandBlockParser.py',888),
+  ('code_block -> SUBTITLE full_selector string optnewlines','code_block',4,'p_title','CommandBlockParser.py',889),
+  ('code_block -> ACTIONBAR full_selector string optnewlines','code_block',4,'p_title','CommandBlockParser.py',890),
+  ('code_block -> TITLE full_selector const_value const_value const_value string optnewlines','code_block',7,'p_title_times','CommandBlockParser.py',894),
+  ('code_block -> SUBTITLE full_selector const_value const_value const_value string optnewlines','code_block',7,'p_title_times','CommandBlockParser.py',895),
+  ('code_block -> ACTIONBAR full_selector const_value const_value const_value string optnewlines','code_block',7,'p_title_times','CommandBlockParser.py',896),
+  ('assign -> variable EQUALS expr','assign',3,'p_assignment','CommandBlockParser.py',902),
+  ('assign -> variable PLUS_EQUALS expr','assign',3,'p_assignment','CommandBlockParser.py',903),
+  ('assign -> variable MINUS_EQUALS expr','assign',3,'p_assignment','CommandBlockParser.py',904),
+  ('assign -> variable TIMES_EQUALS expr','assign',3,'p_assignment','CommandBlockParser.py',905),
+  ('assign -> variable DIVIDE_EQUALS expr','assign',3,'p_assignment','CommandBlockParser.py',906),
+  ('assign -> variable MODULO_EQUALS expr','assign',3,'p_assignment','CommandBlockParser.py',907),
+  ('assign -> variable PLUS_PLUS','assign',2,'p_xcrement','CommandBlockParser.py',912),
+  ('assign -> variable MINUS_MINUS','assign',2,'p_xcrement','CommandBlockParser.py',913),
+  ('assign -> RETURN expr','assign',2,'p_return','CommandBlockParser.py',918),
+  ('const_assign -> DOLLAR ID EQUALS const_value','const_assign',4,'p_constant_assignment','CommandBlockParser.py',923),
+  ('variable -> ID DOT ID','variable',3,'p_variable_id_variable','CommandBlockParser.py',930),
+  ('variable -> full_selector DOT ID','variable',3,'p_variable_id_variable','CommandBlockParser.py',931),
+  ('variable -> ID','variable',1,'p_variable_id','CommandBlockParser.py',937),
+  ('variable -> const_int','variable',1,'p_variable_constant_integer','CommandBlockParser.py',942),
+  ('variable -> ID LBRACKET virtual_int RBRACKET','variable',4,'p_variable_array','CommandBlockParser.py',946),
+  ('variable -> ID LBRACKET expr RBRACKET','variable',4,'p_variable_array','CommandBlockParser.py',947),
+  ('variable -> full_selector DOT ID LBRACKET virtual_int RBRACKET','variable',6,'p_variable_array_selector','CommandBlockParser.py',951),
+  ('variable -> full_selector DOT ID LBRACKET expr RBRACKET','variable',6,'p_variable_array_selector','CommandBlockParser.py',952),
+  ('variable -> LBRACKET ID AT rel_coords RBRACKET DOT ID LBRACKET macro_call_params RBRACKET','variable',10,'p_variable_path','CommandBlockParser.py',956),
+  ('variable -> LBRACKET ID RBRACKET DOT ID LBRACKET macro_call_params RBRACKET','variable',8,'p_variable_path','CommandBlockParser.py',957),
+  ('variable -> LBRACKET ID AT rel_coords RBRACKET DOT ID','variable',7,'p_variable_path','CommandBlockParser.py',958),
+  ('variable -> LBRACKET ID RBRACKET DOT ID','variable',5,'p_variable_path','CommandBlockParser.py',959),
+  ('variable -> REF full_selector','variable',2,'p_variable_ref','CommandBlockParser.py',964),
+  ('variable -> ID COLON data_path','variable',3,'p_variable_storage','CommandBlockParser.py',968),
+  ('variable -> COLON data_path','variable',2,'p_variable_storage','CommandBlockParser.py',969),
+  ('variable -> SUCCESS NEWLINE COMMAND','variable',3,'p_variable_command','CommandBlockParser.py',976),
+  ('variable -> RESULT NEWLINE COMMAND','variable',3,'p_variable_command','CommandBlockParser.py',977),
+  ('variable -> virtual_int','variable',1,'p_variable_virtual_integer','CommandBlockParser.py',981),
+  ('vector_variable -> LESS ID GREATER','vector_variable',3,'p_vector_variable','CommandBlockParser.py',987),
+  ('vector_variable -> full_selector DOT LESS ID GREATER','vector_variable',5,'p_vector_variable','CommandBlockParser.py',988),
+  ('vector_variable -> LESS variable COMMA variable COMMA variable GREATER','vector_variable',7,'p_vector_variable','CommandBlockParser.py',989),
+  ('vector_variable -> const_vector','vector_variable',1,'p_vector_variable','CommandBlockParser.py',990),
+  ('vector_expr -> LPAREN vector_expr RPAREN','vector_expr',3,'p_vector_expression','CommandBlockParser.py',1002),
+  ('vector_expr -> LESS expr COMMA expr COMMA expr GREATER','vector_expr',7,'p_vector_expression','CommandBlockParser.py',1003),
+  ('vector_expr -> full_selector DOT LESS ID GREATER','vector_expr',5,'p_vector_expression','CommandBlockParser.py',1004),
+  ('vector_expr -> LESS ID GREATER','vector_expr',3,'p_vector_expression','CommandBlockParser.py',1005),
+  ('vector_expr -> HERE LPAREN const_value RPAREN','vector_expr',4,'p_vector_expression','CommandBlockParser.py',1006),
+  ('vector_expr -> HERE','vector_expr',1,'p_vector_expression','CommandBlockParser.py',1007),
+  ('vector_expr -> const_vector','vector_expr',1,'p_vector_expression','CommandBlockParser.py',1008),
+  ('vector_expr -> vector_expr PLUS vector_expr','vector_expr',3,'p_vector_arithmetic','CommandBlockParser.py',1023),
+  ('vector_expr -> vector_expr MINUS vector_expr','vector_expr',3,'p_vector_arithmetic','CommandBlockParser.py',1024),
+  ('vector_expr -> vector_expr PLUS expr','vector_expr',3,'p_vector_scalar','CommandBlockParser.py',1028),
+  ('vector_expr -> expr PLUS vector_expr','vector_expr',3,'p_vector_scalar','CommandBlockParser.py',1029),
+  ('vector_expr -> vector_expr MINUS expr','vector_expr',3,'p_vector_scalar','CommandBlockParser.py',1030),
+  ('vector_expr -> expr TIMES vector_expr','vector_expr',3,'p_vector_scalar','CommandBlockParser.py',1031),
+  ('vector_expr -> vector_expr TIMES expr','vector_expr',3,'p_vector_scalar','CommandBlockParser.py',1032),
+  ('vector_expr -> vector_expr DIVIDE expr','vector_expr',3,'p_vector_scalar','CommandBlockParser.py',1033),
+  ('vector_expr -> vector_expr MODULO expr','vector_expr',3,'p_vector_scalar','CommandBlockParser.py',1034),
+  ('vector_expr -> MINUS vector_expr','vector_expr',2,'p_vector_negative','CommandBlockParser.py',1038),
+  ('assign -> vector_variable EQUALS vector_expr','assign',3,'p_vector_assignment','CommandBlockParser.py',1043),
+  ('assign -> vector_variable PLUS_EQUALS vector_expr','assign',3,'p_vector_assignment','CommandBlockParser.py',1044),
+  ('assign -> vector_variable MINUS_EQUALS vector_expr','assign',3,'p_vector_assignment','CommandBlockParser.py',1045),
+  ('assign -> vector_variable EQUALS expr','assign',3,'p_vector_scalar_assignment','CommandBlockParser.py',1049),
+  ('assign -> vector_variable PLUS_EQUALS expr','assign',3,'p_vector_scalar_assignment','CommandBlockParser.py',1050),
+  ('assign -> vector_variable MINUS_EQUALS expr','assign',3,'p_vector_scalar_assignment','CommandBlockParser.py',1051),
+  ('assign -> vector_variable TIMES_EQUALS expr','assign',3,'p_vector_scalar_assignment','CommandBlockParser.py',1052),
+  ('assign -> vector_variable DIVIDE_EQUALS expr','assign',3,'p_vector_scalar_assignment','CommandBlockParser.py',1053),
+  ('assign -> vector_variable MODULO_EQUALS expr','assign',3,'p_vector_scalar_assignment','CommandBlockParser.py',1054),
+  ('expr_list -> expr_list COMMA expr','expr_list',3,'p_expression_list','CommandBlockParser.py',1060),
+  ('expr_list -> expr','expr_list',1,'p_expression_list','CommandBlockParser.py',1061),
+  ('expr_list -> empty','expr_list',1,'p_expression_list','CommandBlockParser.py',1062),
+  ('expr -> variable','expr',1,'p_expression_variable','CommandBlockParser.py',1070),
+  ('expr -> expr PLUS expr','expr',3,'p_expression_arithmetic','CommandBlockParser.py',1074),
+  ('expr -> expr MINUS expr','expr',3,'p_expression_arithmetic','CommandBlockParser.py',1075),
+  ('expr -> expr TIMES expr','expr',3,'p_expression_arithmetic','CommandBlockParser.py',1076),
+  ('expr -> expr DIVIDE expr','expr',3,'p_expression_arithmetic','CommandBlockParser.py',1077),
+  ('expr -> expr MODULO expr','expr',3,'p_expression_arithmetic','CommandBlockParser.py',1078),
+  ('expr -> MINUS expr','expr',2,'p_expression_negative','CommandBlockParser.py',1083),
+  ('expr -> expr POWER int','expr',3,'p_expression_power','CommandBlockParser.py',1087),
+  ('expr -> vector_expr TIMES vector_expr','expr',3,'p_expression_dot','CommandBlockParser.py',1092),
+  ('expr -> function_call','expr',1,'p_expression_function_call','CommandBlockParser.py',1096),
+  ('expr -> method_call','expr',1,'p_expression_function_call','CommandBlockParser.py',1097),
+  ('expr -> LPAREN expr RPAREN','expr',3,'p_expression_group','CommandBlockParser.py',1101),
+  ('data_path -> ID json_object','data_path',2,'p_data_path','CommandBlockParser.py',1107),
+  ('data_path -> ID','data_path',1,'p_data_path','CommandBlockParser.py',1108),
+  ('data_path -> FACING','data_path',1,'p_data_path','CommandBlockParser.py',1109),
+  ('data_path -> ID LBRACKET json_object RBRACKET','data_path',4,'p_data_path_array','CommandBlockParser.py',1113),
+  ('data_path -> ID LBRACKET const_int RBRACKET','data_path',4,'p_data_path_array','CommandBlockParser.py',1114),
+  ('data_path -> data_path DOT data_path','data_path',3,'p_data_path_multi','CommandBlockParser.py',1118),
+  ('data_type -> ID','data_type',1,'p_data_type','CommandBlockParser.py',1122),
+  ('json_object -> LCURLY optnewlines json_members optnewlines RCURLY','json_object',5,'p_json_object','CommandBlockParser.py',1133),
+  ('json_object -> LCURLY error RCURLY','json_object',3,'p_json_object_error','CommandBlockParser.py',1137),
+  ('json_members -> json_pair COMMA optnewlines json_members','json_members',4,'p_json_members','CommandBlockParser.py',1142),
+  ('json_members -> json_pair','json_members',1,'p_json_members','CommandBlockParser.py',1143),
+  ('json_members -> empty','json_members',1,'p_json_members','CommandBlockParser.py',1144),
+  ('json_pair -> ID COLON optnewlines json_value','json_pair',4,'p_json_pair','CommandBlockParser.py',1147),
+  ('json_pair -> string COLON optnewlines json_value','json_pair',4,'p_json_pair','CommandBlockParser.py',1148),
+  ('json_pair -> FACING COLON optnewlines json_value','json_pair',4,'p_json_pair','CommandBlockParser.py',1149),
+  ('json_pair -> BLOCK COLON optnewlines json_value','json_pair',4,'p_json_pair','CommandBlockParser.py',1150),
+  ('json_pair -> PREDICATE COLON optnewlines json_value','json_pair',4,'p_json_pair','CommandBlockParser.py',1151),
+  ('json_value -> DOLLAR ID','json_value',2,'p_json_value','CommandBlockParser.py',1154),
+  ('json_value -> JSON','json_value',1,'p_json_value','CommandBlockParser.py',1155),
+  ('json_value -> number','json_value',1,'p_json_value','CommandBlockParser.py',1156),
+  ('json_value -> string','json_value',1,'p_json_value','CommandBlockParser.py',1157),
+  ('json_value -> json_object','json_value',1,'p_json_value','CommandBlockParser.py',1158),
+  ('json_value -> json_array','json_value',1,'p_json_value','CommandBlockParser.py',1159),
+  ('json_value -> json_literal_array','json_value',1,'p_json_value','CommandBlockParser.py',1160),
+  ('json_value -> TRUE','json_value',1,'p_json_value','CommandBlockParser.py',1161),
+  ('json_value -> FALSE','json_value',1,'p_json_value','CommandBlockParser.py',1162),
+  ('json_array -> LBRACKET optnewlines json_elements optnewlines RBRACKET','json_array',5,'p_json_array','CommandBlockParser.py',1165),
+  ('json_elements -> json_value COMMA optnewlines json_elements','json_elements',4,'p_json_element','CommandBlockParser.py',1168),
+  ('json_elements -> json_value','json_elements',1,'p_json_element','CommandBlockParser.py',1169),
+  ('json_elements -> empty','json_elements',1,'p_json_element','CommandBlockParser.py',1170),
+  ('json_literal_array -> LBRACKET optnewlines ID SEMICOLON optnewlines json_literal_elements optnewlines RBRACKET','json_literal_array',8,'p_json_literal_array','CommandBlockParser.py',1173),
+  ('json_literal_elements -> json_literal_value COMMA optnewlines json_literal_elements','json_literal_elements',4,'p_json_literal_elements','CommandBlockParser.py',1181),
+  ('json_literal_elements -> json_literal_value','json_literal_elements',1,'p_json_literal_elements','CommandBlockParser.py',1182),
+  ('json_literal_elements -> empty','json_literal_elements',1,'p_json_literal_elements','CommandBlockParser.py',1183),
+  ('json_literal_value -> DOLLAR ID','json_literal_value',2,'p_json_literal_value','CommandBlockParser.py',1186),
+  ('json_literal_value -> number','json_literal_value',1,'p_json_literal_value','CommandBlockParser.py',1187),
+  ('json_literal_value -> empty','json_literal_value',1,'p_json_literal_value','CommandBlockParser.py',1188),
+  ('assign -> nbt_list EQUALS nbt','assign',3,'p_nbt_assignment','CommandBlockParser.py',1193),
+  ('assign -> nbt_object EQUALS nbt','assign',3,'p_nbt_assignment','CommandBlockParser.py',1194),
+  ('assign -> nbt_list PLUS_EQUALS nbt','assign',3,'p_nbt_append','CommandBlockParser.py',1198),
+  ('assign -> nbt_object PLUS_EQUALS nbt','assign',3,'p_nbt_merge','CommandBlockParser.py',1202),
+  ('code_block -> REMOVE nbt_path','code_block',2,'p_nbt_remove','CommandBlockParser.py',1206),
+  ('nbt_list -> full_selector DOT LBRACKET data_path RBRACKET','nbt_list',5,'p_nbt_list_entity','CommandBlockParser.py',1210),
+  ('nbt_list -> ID COLON LBRACKET data_path RBRACKET','nbt_list',5,'p_nbt_list_storage','CommandBlockParser.py',1214),
+  ('nbt_list -> COLON LBRACKET data_path RBRACKET','nbt_list',4,'p_nbt_list_storage','CommandBlockParser.py',1215),
+  ('nbt_list -> full_selector DOT LCURLY data_path RCURLY','nbt_list',5,'p_nbt_object_entity','CommandBlockParser.py',1222),
+  ('nbt_list -> ID COLON LCURLY data_path RCURLY','nbt_list',5,'p_nbt_object_storage','CommandBlockParser.py',1226),
+  ('nbt_list -> COLON LCURLY data_path RCURLY','nbt_list',4,'p_nbt_object_storage','CommandBlockParser.py',1227),
+  ('nbt_path -> full_selector DOT data_path','nbt_path',3,'p_nbt_path_entity','CommandBlockParser.py',1234),
+  ('nbt_object -> ID COLON data_path','nbt_object',3,'p_nbt_path_storage','CommandBlockParser.py',1238),
+  ('nbt_object -> COLON data_path','nbt_object',2,'p_nbt_path_storage','CommandBlockParser.py',1239),
+  ('nbt_path -> nbt_object','nbt_path',1,'p_nbt_path','CommandBlockParser.py',1246),
+  ('nbt_path -> nbt_list','nbt_path',1,'p_nbt_path','CommandBlockParser.py',1247),
+  ('nbt -> nbt_path','nbt',1,'p_nbt','CommandBlockParser.py',1251),
+  ('nbt -> json_object','nbt',1,'p_nbt','CommandBlockParser.py',1252),
+  ('nbt -> string','nbt',1,'p_nbt','CommandBlockParser.py',1253),
+  ('string -> STRING','string',1,'p_string','CommandBlockParser.py',1259),
+  ('number -> int','number',1,'p_number','CommandBlockParser.py',1265),
+  ('number -> float','number',1,'p_number','CommandBlockParser.py',1266),
+  ('int -> BINARY','int',1,'p_int','CommandBlockParser.py',1271),
+  ('int -> DECIMAL','int',1,'p_int','CommandBlockParser.py',1272),
+  ('int -> HEX','int',1,'p_int','CommandBlockParser.py',1273),
+  ('int -> MINUS BINARY','int',2,'p_int_negative','CommandBlockParser.py',1285),
+  ('int -> MINUS DECIMAL','int',2,'p_int_negative','CommandBlockParser.py',1286),
+  ('int -> MINUS HEX','int',2,'p_int_negative','CommandBlockParser.py',1287),
+  ('float -> FLOAT','float',1,'p_float','CommandBlockParser.py',1299),
+  ('float -> MINUS FLOAT','float',2,'p_float_negative','CommandBlockParser.py',1304),
+  ('const_value -> const_expr','const_value',1,'p_constant_value','CommandBlockParser.py',1309),
+  ('const_value -> const_string','const_value',1,'p_constant_value','CommandBlockParser.py',1310),
+  ('const_value -> const_int','const_value',1,'p_constant_value','CommandBlockParser.py',1311),
+  ('const_ID -> DOLLAR ID','const_ID',2,'p_constant_ID','CommandBlockParser.py',1315),
+  ('const_string -> DOLLAR string','const_string',2,'p_constant_string','CommandBlockParser.py',1319),
+  ('const_int -> int','const_int',1,'p_constant_integer','CommandBlockParser.py',1323),
+  ('const_expr -> number','const_expr',1,'p_constant_expression','CommandBlockParser.py',1327),
+  ('const_expr -> string','const_expr',1,'p_constant_expression','CommandBlockParser.py',1328),
+  ('const_expr -> const_ID','const_expr',1,'p_constant_expression','CommandBlockParser.py',1329),
+  ('const_expr -> const_expr PLUS const_expr','const_expr',3,'p_constant_expression_arithmetic','CommandBlockParser.py',1333),
+  ('const_expr -> const_expr MINUS const_expr','const_expr',3,'p_constant_expression_arithmetic','CommandBlockParser.py',1334),
+  ('const_expr -> const_expr TIMES const_expr','const_expr',3,'p_constant_expression_arithmetic','CommandBlockParser.py',1335),
+  ('const_expr -> const_expr DIVIDE const_expr','const_expr',3,'p_constant_expression_arithmetic','CommandBlockParser.py',1336),
+  ('const_expr -> const_expr MODULO const_expr','const_expr',3,'p_constant_expression_arithmetic','CommandBlockParser.py',1337),
+  ('const_expr -> const_expr EQUALS_EQUALS const_expr','const_expr',3,'p_constant_expression_compare','CommandBlockParser.py',1342),
+  ('const_expr -> const_expr LESS const_expr','const_expr',3,'p_constant_expression_compare','CommandBlockParser.py',1343),
+  ('const_expr -> const_expr LESS_EQUALS const_expr','const_expr',3,'p_constant_expression_compare','CommandBlockParser.py',1344),
+  ('const_expr -> const_expr GREATER const_expr','const_expr',3,'p_constant_expression_compare','CommandBlockParser.py',1345),
+  ('const_expr -> const_expr GREATER_EQUALS const_expr','const_expr',3,'p_constant_expression_compare','CommandBlockParser.py',1346),
+  ('const_expr -> const_expr NOT EQUALS const_expr','const_expr',4,'p_constant_expression_double','CommandBlockParser.py',1350),
+  ('const_expr -> const_expr TIMES TIMES const_expr','const_expr',4,'p_constant_expression_double','CommandBlockParser.py',1351),
+  ('const_expr -> const_expr OR const_expr','const_expr',3,'p_constant_expression_spaced','CommandBlockParser.py',1355),
+  ('const_expr -> const_expr AND const_expr','const_expr',3,'p_constant_expression_spaced','CommandBlockParser.py',1356),
+  ('const_expr -> MINUS const_expr','const_expr',2,'p_constant_expression_negative','CommandBlockParser.py',1360),
+  ('const_expr_list -> const_expr COMMA optnewlines const_expr_list','const_expr_list',4,'p_constant_expression_list','CommandBlockParser.py',1364),
+  ('const_expr_list -> const_expr','const_expr_list',1,'p_constant_expression_list','CommandBlockParser.py',1365),
+  ('const_expr_list -> empty','const_expr_list',1,'p_constant_expression_list','CommandBlockParser.py',1366),
+  ('const_expr -> LBRACKET optnewlines const_expr_list optnewlines RBRACKET','const_expr',5,'p_constant_array','CommandBlockParser.py',1373),
+  ('const_expr -> LPAREN optnewlines const_expr_list optnewlines RPAREN','const_expr',5,'p_constant_array','CommandBlockParser.py',1374),
+  ('const_expr -> const_expr LBRACKET const_expr RBRACKET','const_expr',4,'p_constant_array_element','CommandBlockParser.py',1378),
+  ('const_vector -> LESS const_expr GREATER','const_vector',3,'p_constant_vector','CommandBlockParser.py',1382),
+  ('const_expr -> const_expr DOT const_expr','const_expr',3,'p_constant_expression_variable','CommandBlockParser.py',1386),
+  ('const_expr -> DOLLAR FUNCTION_ID optnewlines const_expr_list optnewlines RPAREN','const_expr',6,'p_constant_function_call','CommandBlockParser.py',1390),
+  ('virtual_number -> number','virtual_number',1,'p_virtual_number','CommandBlockParser.py',1396),
+  ('virtual_number -> const_ID','virtual_number',1,'p_virtual_number','CommandBlockParser.py',1397),
+  ('virtual_int -> int','virtual_int',1,'p_virtual_integer','CommandBlockParser.py',1402),
+  ('virtual_int -> const_ID','virtual_int',1,'p_virtual_integer','CommandBlockParser.py',1403),
+  ('uuid -> int MINUS int MINUS int MINUS int MINUS int','uuid',9,'p_uuid','CommandBlockParser.py',1409),
+  ('newlines -> newlines NEWLINE','newlines',2,'p_newlines','CommandBlockParser.py',1412),
+  ('newlines -> NEWLINE','newlines',1,'p_newlines','CommandBlockParser.py',1413),
+  ('optnewlines -> newlines','optnewlines',1,'p_optnewlines','CommandBlockParser.py',1418),
+  ('optnewlines -> empty','optnewlines',1,'p_optnewlines','CommandBlockParser.py',1419),
+  ('empty -> <empty>','empty',0,'p_empty','CommandBlockParser.py',1424),
+]
@@ -1,6 +1,39 @@
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+import types
 import unittest
+import unittest.mock
+from benchmarks.corpus import corpus
+from benchmarks.replay import replay
+from modules import CommandBlockAST as ast, CommandBlockCheck, CommandBlockLogging
+from modules.CommandBlockAnalysis import CBAnalysis
+from modules.CommandBlockCache import CBIndexCache, content_hash
+from modules.CommandBlockImports import CBImportGraph
+from modules.CommandBlockIndex import CBSymbolIndex, collect_symbols
 from modules.CommandBlockLexer import CBLex
-from modules.CommandBlockParser import CBParse
+from modules.CommandBlockParser import CBParse, MAX_DIAGNOSTICS
+from modules.CommandBlockRecorder import load_session
+from modules.CommandBlockScheduler import CBParseScheduler
+from modules.CommandBlockStats import CBStats, SLOW_MS
+from modules.CommandBlockTables import TABLES_DIR, rules_hash
+from modules.CommandBlockLanguageServer import CommandBlockLanguageServer
+from modules.CommandBlockTokenStore import CBTokenEncoder, CBTokenStore, changed_line_range, diff_tokens
+from modules.CommandBlockWorkspace import CBWorkspaceIndexer
+from lsprotocol.types import (
+    ClientCapabilities, DiagnosticClientCapabilities, DiagnosticWorkspaceClientCapabilities, Position, PreviousResultId, Range,
+    TextDocumentClientCapabilities, TextDocumentItem, WorkspaceClientCapabilities
+    )
+from pygls.uris import from_fs_path
+from pygls.workspace import TextDocument, Workspace
+from types import SimpleNamespace
 from typing import List, Optional
 
 class CBLS_Tests(unittest.TestCase):
@@ -76,6 +109,900 @@ class CBLS_Tests(unittest.TestCase):
         ext = "cblib"
         
         self.parser_test(input_data, expected_errors, ext)
+    ## Parse sessions
+    # Sessions keep their diagnostics to themselves
+    def test_session(self) -> None:
+        result = self.parser.parse_result("Unknown_ID\ndir 'test'")
+
+        self.assertEqual(result.ext, "cbscript")
+        self.assertEqual(len(result.diagnostics), 2)
+        self.assertEqual(self.parser.diagnostics, [])
+
+    # Sessions can parse on several threads at once
+    def test_session_threads(self) -> None:
+        inputs = [f"dir 'test'\nreset\n    x = {i}\n    y = \nend\n" * (i + 1) for i in range(8)]
+        expected = [[d.message for d in self.parser.parse_result(data).diagnostics] for data in inputs]
+
+        results = [None] * len(inputs)
+
+        def run(i: int) -> None:
+            for _ in range(5):
+                results[i] = [d.message for d in self.parser.parse_result(inputs[i]).diagnostics]
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(len(inputs))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, expected)
+
+    ## Error recovery
+    # Every bad line is reported and the rest of the file still makes it into the tree
+    def test_recovery(self) -> None:
+        data = ("dir 'out'\n\nfunction one()\n    foo(1,\n    y = 2\nend\n\n"
+                "reset\n    as @a\n        if x ==\n        end\n        z = 1 +\n    end\nend\n\n"
+                "clock main\n    as @e[type=pig\n        y = 3\n    end\n    x = 2\nend\n\n"
+                "function ok()\n    a = 1\nend\n")
+        result = self.parser.parse_result(data)
+
+        self.assertEqual([d.token.lineno for d in result.diagnostics], [4, 10, 12, 17])
+        self.assertEqual([type(b).__name__ for b in result.tree.blocks], ["Function", "Reset", "Clock", "Function"])
+        self.assertEqual(len(result.tree.blocks[2].body), 2)
+
+    # Diagnostics stop at a cap however broken the file is
+    def test_diagnostics_cap(self) -> None:
+        result = self.parser.parse_result("dir 'out'\nfunction f()\n" + "x = = 1\n" * 300 + "end\n")
+
+        self.assertEqual(len(result.diagnostics), MAX_DIAGNOSTICS)
+
+        # Errors past the cap, at the start of the file or in dir and desc, neither add nor reword diagnostics
+        for source in ["x = = 1\n" * 300 + "dir 5\ndesc 5\nreset\nend\n", "dir 'out'\nfunction f()\n" + "x = = 1\n" * 300 + "end\ndir 5\ndesc 5\n"]:
+            result = self.parser.parse_result(source)
+
+            self.assertEqual(len(result.diagnostics), MAX_DIAGNOSTICS)
+            self.assertEqual([d.label for d in result.diagnostics], [""] * MAX_DIAGNOSTICS)
+            self.assertTrue(all(d.message.startswith(f"Syntax error at line {d.lineno + 1} column") for d in result.diagnostics))
+
+    # stdout carries the JSON-RPC stream, parse errors are logged instead
+    def test_no_stdout(self) -> None:
+        stdout = io.StringIO()
+
+        with contextlib.redirect_stdout(stdout), self.assertLogs("modules", level="DEBUG") as logs:
+            self.parser.parse_result("dir 'out'\nunknown 5\nreset\n    x = 1 ?\n    if x > 1\n")
+
+        self.assertEqual(stdout.getvalue(), "")
+        self.assertTrue(any("Unknown parameter 'unknown'" in line for line in logs.output))
+        self.assertTrue(any("Illegal character" in line for line in logs.output))
+
+
+class CBLS_TokenStore_Tests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.encoder = CBTokenEncoder(CBLex())
+
+    # Helper function to apply a single edit and compare against a fresh lex
+    def edit_test(self, input_data: str, start: tuple, end: tuple, text: str) -> CBTokenStore:
+        store = CBTokenStore()
+        store.lex(self.encoder, input_data)
+
+        lines = input_data.split('\n')
+        before = '\n'.join(lines[:start[0]] + [lines[start[0]][:start[1]]])
+        after = '\n'.join([lines[end[0]][end[1]:]] + lines[end[0] + 1:])
+        updated = before + text + after
+
+        change = SimpleNamespace(
+            range=SimpleNamespace(start=SimpleNamespace(line=start[0], character=start[1]), end=SimpleNamespace(line=end[0], character=end[1])),
+            text=text)
+        store.update(self.encoder, updated, *changed_line_range([change]))
+
+        expected = CBTokenStore()
+        expected.lex(self.encoder, updated)
+
+        self.assertEqual(store.counts, expected.counts)
+        self.assertEqual(store.boundaries, expected.boundaries)
+        self.assertEqual(store.encode(), expected.encode())
+        self.assertEqual(store.lines, expected.lines)
+
+        return store
+
+    ### Unit tests
+    # Editing a single line
+    def test_edit_line(self) -> None:
+        input_data = "dir 'test'\nfunction foo(a)\n    x = 1\nend\n"
+
+        self.edit_test(input_data, (2, 8), (2, 9), "2 + 3")
+
+    # Inserting and removing lines
+    def test_edit_lines(self) -> None:
+        input_data = "reset\n    x = 1\n    y = 2\nend\n"
+
+        self.edit_test(input_data, (1, 9), (1, 9), "\n    z = 3\n    w = 4")
+        self.edit_test(input_data, (1, 0), (3, 0), "")
+
+    # Turning a line into a command which swallows the blank lines above it
+    def test_edit_command(self) -> None:
+        input_data = "reset\n\n   \n    x = 1\nend\n"
+
+        store = self.edit_test(input_data, (3, 4), (3, 9), "/say hi")
+        self.assertEqual(store.boundaries.tolist(), [1, 1, 0, 0, 1, 1])
+
+    # Changes are merged into the lines they touch in the final document
+    def test_changed_line_range(self) -> None:
+        def change(start: int, end: int, text: str) -> SimpleNamespace:
+            return SimpleNamespace(
+                range=SimpleNamespace(start=SimpleNamespace(line=start, character=0), end=SimpleNamespace(line=end, character=0)),
+                text=text)
+
+        self.assertEqual(changed_line_range([change(4, 4, "a\nb\n")]), (4, 6))
+        self.assertEqual(changed_line_range([change(4, 4, "a\nb\n"), change(1, 2, "")]), (1, 5))
+        self.assertIsNone(changed_line_range([SimpleNamespace(text="full")]))
+
+    # A single edit turns the previous token data into the current one
+    def test_diff_tokens(self) -> None:
+        previous = list(range(5000))
+        current = previous[:2500] + [7, 7, 7] + previous[2600:]
+
+        start, delete_count, data = diff_tokens(previous, current)
+        self.assertEqual((start, delete_count, list(data)), (2500, 100, [7, 7, 7]))
+        self.assertEqual(diff_tokens(previous, previous), (5000, 0, []))
+
+    # The parser gets the same tokens from the store as from lexing the document itself
+    def test_replay(self) -> None:
+        input_data = "dir 'test'\nreset\n\n   \n    x = 1\n    as @a\n        /say hi\n    end\nend\n"
+        store = self.edit_test(input_data, (4, 8), (4, 9), "foo(2")
+
+        source = "dir 'test'\nreset\n\n   \n    x = foo(2\n    as @a\n        /say hi\n    end\nend\n"
+        parser = CBParse(CBLex())
+        lexed, replayed = parser.parse_result(source), parser.parse_result(source, store.buffer(source))
+
+        self.assertEqual(repr(replayed.tree), repr(lexed.tree))
+        self.assertEqual([d.message for d in replayed.diagnostics], [d.message for d in lexed.diagnostics])
+        self.assertIsNone(store.buffer(source + "\n"))
+
+class CBLS_Server_Tests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        lexer = CBLex()
+        cls.server = CommandBlockLanguageServer(lexer, CBParse(lexer), "cbls-test", "v0")
+
+    ### Unit tests
+    # Delta requests only send what changed since the last result
+    def test_semantic_tokens_delta(self) -> None:
+        uri = "file:///delta.cbscript"
+        self.server.lex(TextDocument(uri, "reset\n    x = 1\nend\n"))
+        full = self.server.semantic_tokens_full(uri)
+
+        self.server.lex(TextDocument(uri, "reset\n    x = 1 + 2\nend\n"))
+        delta = self.server.semantic_tokens_delta(uri, full.result_id)
+
+        data = list(full.data)
+        for edit in delta.edits:
+            data[edit.start:edit.start + edit.delete_count] = edit.data
+
+        self.assertEqual(data, self.server.tokens[uri].tolist())
+        self.assertLess(len(delta.edits[0].data), len(data))
+
+        # Unknown results fall back to the full token data
+        self.assertEqual(self.server.semantic_tokens_delta(uri, full.result_id).data, self.server.tokens[uri].tolist())
+
+    # Range requests only encode the requested lines
+    def test_semantic_tokens_range(self) -> None:
+        uri = "file:///range.cbscript"
+        self.server.lex(TextDocument(uri, "reset\n    x = 1\nend\n"))
+
+        tokens = self.server.semantic_tokens_range(uri, Range(start=Position(1, 0), end=Position(1, 9)))
+        self.assertEqual(tokens.data, [1, 4, 1, 9, 0, 0, 2, 1, 5, 0, 0, 2, 1, 4, 0])
+
+    # Pulls with the current result id get an unchanged report, ids only move when diagnostics do
+    def test_pull_diagnostics(self) -> None:
+        self.server.lsp._workspace = Workspace(None)
+        uri = "file:///pull.cbscript"
+
+        self.server.apply_analysis(self.server.analyse(uri, "dir 'test'\nreset\n    y = \nend\n", "pull.cbscript"))
+        report = asyncio.run(self.server.diagnostics.document(uri))
+        self.assertEqual((report.kind, len(report.items)), ("full", 1))
+
+        self.server.apply_analysis(self.server.analyse(uri, "dir 'test'\nreset\n    y = \nend\n", "pull.cbscript"))
+        self.assertEqual(asyncio.run(self.server.diagnostics.document(uri, report.result_id)).kind, "unchanged")
+
+        previous = [PreviousResultId(uri=uri, value=report.result_id)]
+        self.assertEqual([item.kind for item in self.server.diagnostics.workspace(previous).items], ["unchanged"])
+
+        self.server.apply_analysis(self.server.analyse(uri, "dir 'test'\nreset\n    y = 1\nend\n", "pull.cbscript"))
+        items = self.server.diagnostics.workspace(previous).items
+        self.assertEqual([(item.kind, item.items) for item in items], [("full", [])])
+        self.assertNotEqual(items[0].result_id, report.result_id)
+
+    # Fresh server recording what it sends the client
+    def recording_server(self) -> CommandBlockLanguageServer:
+        lexer = CBLex()
+        server = CommandBlockLanguageServer(lexer, CBParse(lexer), "cbls-test", "v0")
+        server.lsp._workspace = Workspace(None)
+        server.cache = CBIndexCache("test", ":memory:")
+        server.published = []
+        server.requested = []
+        server.publish_diagnostics = lambda uri, diagnostics, version=None: server.published.append((uri, diagnostics))
+        server.lsp.send_request = lambda method, params=None: server.requested.append(method)
+
+        return server
+
+    # Documents analysed before they are opened still get their diagnostics pushed, on every open
+    def test_push_diagnostics(self) -> None:
+        server = self.recording_server()
+        uri = "file:///indexed.cbscript"
+        source = "dir 'test'\nreset\n    y = \nend\n"
+
+        # Indexed from disk first, nothing is pushed for documents not open
+        server.apply_analysis(server.analyse(uri, source, "indexed.cbscript"))
+        self.assertEqual(server.published, [])
+
+        for version in (1, 2):
+            server.workspace.put_text_document(TextDocumentItem(uri=uri, language_id="cbscript", version=version, text=source))
+            self.assertFalse(server.open(server.workspace.get_text_document(uri)))
+            server.publish_analysis(server.analyse(uri, source, "indexed.cbscript"), version=version)
+
+            self.assertEqual(len(server.published), version)
+            self.assertEqual(len(server.published[-1][1]), 1)
+
+            # Unchanged diagnostics are not pushed again
+            server.publish_analysis(server.analyse(uri, source, "indexed.cbscript"), version=version)
+            self.assertEqual(len(server.published), version)
+
+            server.close(uri)
+            server.workspace.remove_text_document(uri)
+
+    # Pull clients are only asked to refresh for documents that are not being edited
+    def test_diagnostics_refresh(self) -> None:
+        server = self.recording_server()
+        server.lsp.client_capabilities = ClientCapabilities(
+            text_document=TextDocumentClientCapabilities(diagnostic=DiagnosticClientCapabilities()),
+            workspace=WorkspaceClientCapabilities(diagnostics=DiagnosticWorkspaceClientCapabilities(refresh_support=True)),
+        )
+        uri, library = "file:///open.cbscript", "file:///closed.cblib"
+
+        server.workspace.put_text_document(TextDocumentItem(uri=uri, language_id="cbscript", version=1, text="reset\nend\n"))
+        server.publish_analysis(server.analyse(uri, "reset\nend\n", "open.cbscript"), version=1)
+        asyncio.run(server.diagnostics.document(uri))
+
+        server.publish_analysis(server.analyse(uri, "reset\n    y = \nend\n", "open.cbscript"), version=2)
+        self.assertEqual(server.requested, [])
+
+        server.apply_analysis(server.analyse(library, "function f()\nend\n", "closed.cblib"))
+        server.diagnostics.workspace([])
+        server.apply_analysis(server.analyse(library, "function f()\n    y = \nend\n", "closed.cblib"))
+        self.assertEqual(server.requested, ["workspace/diagnostic/refresh"])
+        self.assertEqual(server.published, [])
+
+    # Requests and document phases are timed, slow requests are profiled when asked to
+    def test_stats(self) -> None:
+        uri = "file:///stats.cbscript"
+        self.server.lsp._workspace = Workspace(None)
+        self.server.lex(TextDocument(uri, "reset\n    x = 1\nend\n"))
+        self.server.publish_analysis(self.server.analyse(uri, "reset\n    x = 1\nend\n", "stats.cbscript"))
+        self.server.semantic_tokens_full(uri)
+
+        snapshot = self.server.stats.snapshot()
+        self.assertTrue({"lex", "parse", "encode", "publish"} <= set(snapshot["phases"]))
+        self.assertEqual(sum(snapshot["phases"]["parse"]["buckets"].values()), snapshot["phases"]["parse"]["count"])
+
+        with tempfile.TemporaryDirectory() as directory:
+            stats = CBStats(slow_ms=0, profile_dir=directory)
+
+            async def handler(s, p):
+                return p
+
+            self.assertEqual(asyncio.run(stats.timed("test/method", handler)(None, 1)), 1)
+            self.assertEqual(stats.snapshot()["methods"]["test/method"]["count"], 1)
+            self.assertEqual(len(os.listdir(directory)), stats.profiles)
+
+        # A malformed threshold falls back to the default instead of failing the server
+        with unittest.mock.patch.dict(os.environ, {"CBLS_SLOW_MS": "fast"}), self.assertLogs("modules.CommandBlockStats", level="WARNING"):
+            self.assertEqual(CBStats().slow_ms, SLOW_MS)
+
+        # So does a malformed log level, assertLogs puts back the handlers install adds
+        logger = logging.getLogger("modules")
+        client = SimpleNamespace(loop=SimpleNamespace(call_soon_threadsafe=lambda *args: None), show_message_log=None)
+
+        with self.assertLogs("modules", level="WARNING") as logs:
+            CommandBlockLogging.install(client, "bogus")
+            self.assertEqual(logger.level, logging.INFO)
+
+        self.assertTrue(any("CBLS_LOG_LEVEL='bogus'" in line for line in logs.output))
+
+        with self.assertLogs("modules", level="WARNING"):
+            CommandBlockLogging.install(client, "debug")
+            self.assertEqual(logger.level, logging.DEBUG)
+            logger.warning("installed")
+
+class CBLS_AST_Tests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.parser = CBParse(CBLex())
+
+    source = (
+        "dir 'out'\n"
+        "\n"
+        "define @Pig = @e[type=pig]\n"
+        "    function boost()\n"
+        "        /effect give @s speed\n"
+        "    end\n"
+        "end\n"
+        "\n"
+        "clock main\n"
+        "    @Pig.boost()\n"
+        "end\n"
+        "\n"
+        "macro $say($v)\n"
+        "\n"
+        "    /say $v\n"
+        "end\n"
+    )
+
+    ### Unit tests
+    # Top level blocks come out in source order and names point at their identifiers
+    def test_tree(self) -> None:
+        result = self.parser.parse_result(self.source)
+        tree = result.tree
+
+        self.assertEqual(result.diagnostics, [])
+        self.assertEqual(tree.kind, "cbscript")
+        self.assertEqual([type(block) for block in tree.blocks], [ast.SelectorDefine, ast.Clock, ast.Macro])
+
+        for node in tree.walk():
+            if isinstance(node, ast.Identifier):
+                self.assertEqual(self.source[node.start:node.end], node.value)
+
+        define, clock, macro = tree.blocks
+        self.assertEqual(self.source[define.start:define.end], "define @Pig = @e[type=pig]\n    function boost()\n        /effect give @s speed\n    end\nend")
+        self.assertEqual(define.items[0].name.value, "boost")
+        self.assertEqual(clock.body[0].name.value, "boost")
+        self.assertEqual(macro.params[0].name.value, "v")
+
+    # Commands point at the '/', not at the blank lines before it
+    def test_find(self) -> None:
+        tree = self.parser.parse_result(self.source).tree
+
+        node = ast.find(tree, self.source.index("/say"))
+        self.assertIsInstance(node, ast.Command)
+        self.assertEqual(self.source[node.start:node.end], "/say $v")
+
+        node = ast.find(tree, self.source.index("boost()\n"))
+        self.assertIsInstance(node, ast.Identifier)
+        self.assertEqual(node.value, "boost")
+
+        self.assertIsNone(ast.find(tree, len(self.source) + 1))
+
+class CBLS_Index_Tests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.parser = CBParse(CBLex())
+
+    def symbols(self, uri: str, source: str):
+        return collect_symbols(self.parser.parse_result(source).tree, source, uri)
+
+    ### Unit tests
+    # Definitions are picked up with their kind and the range of their name
+    def test_collect_symbols(self) -> None:
+        symbols = self.symbols("file:///a.cbscript", CBLS_AST_Tests.source)
+
+        self.assertEqual([(s.kind, s.name) for s in symbols], [("selector", "@Pig"), ("method", "boost"), ("clock", "main"), ("macro", "say")])
+        self.assertEqual(symbols[1].container, "@Pig")
+        self.assertEqual(symbols[1].selection, (3, 13, 3, 18))
+        self.assertEqual(symbols[3].detail, "$say($v)")
+
+    # Re-indexing a document swaps out only its own symbols
+    def test_update(self) -> None:
+        index = CBSymbolIndex()
+        index.update("file:///a.cblib", self.symbols("file:///a.cblib", "$max = 1\nfunction move_up()\nend\n"))
+        index.update("file:///b.cblib", self.symbols("file:///b.cblib", "function move_down()\nend\n"))
+
+        self.assertEqual([s.name for s in index.prefix("move")], ["move_down", "move_up"])
+        self.assertEqual([s.uri for s in index.lookup("max", "constant")], ["file:///a.cblib"])
+
+        index.update("file:///a.cblib", self.symbols("file:///a.cblib", "function move_left()\nend\n"))
+
+        self.assertEqual([s.name for s in index.prefix("move")], ["move_down", "move_left"])
+
+        # Searches limited to some documents merge their sorted symbols and read nothing else
+        self.assertEqual([s.name for s in index.visible_prefix(["file:///a.cblib", "file:///b.cblib"], "move")], ["move_down", "move_left"])
+        self.assertEqual([s.name for s in index.visible_prefix(["file:///a.cblib", "file:///c.cblib"], "")], ["move_left"])
+        self.assertEqual([s.name for s in index.visible_prefix(["file:///b.cblib"], "move_u")], [])
+        self.assertEqual(index.lookup("max"), [])
+
+        index.remove("file:///b.cblib")
+
+        self.assertEqual(index.sorted_names, ["move_left"])
+
+    # Outlines nest symbols by range and are only rebuilt after a new parse
+    def test_outline(self) -> None:
+        lexer = CBLex()
+        server = CommandBlockLanguageServer(lexer, CBParse(lexer), "cbls-test", "v0")
+        server.lsp._workspace = Workspace(None)
+        server.cache = CBIndexCache("test", ":memory:")
+
+        source = CBLS_AST_Tests.source + "reset\n    /say hi\nend\n\npredicate is_day {\"condition\": \"time_check\"}\n"
+        server.apply_analysis(server.analyse("file:///p/a.cbscript", source, "a.cbscript"))
+
+        outline = server.symbols.document_symbols("file:///p/a.cbscript")
+
+        self.assertEqual([s.name for s in outline], ["@Pig", "main", "say", "reset", "is_day"])
+        self.assertEqual([s.name for s in outline[0].children], ["boost"])
+        self.assertEqual(outline[0].children[0].selection_range.start.line, 3)
+        self.assertIs(server.symbols.document_symbols("file:///p/a.cbscript"), outline)
+
+        server.apply_analysis(server.analyse("file:///p/a.cbscript", source, "a.cbscript"))
+        self.assertIsNot(server.symbols.document_symbols("file:///p/a.cbscript"), outline)
+
+    # Queries match names by their characters in order, word starts first
+    def test_workspace_symbols(self) -> None:
+        lexer = CBLex()
+        server = CommandBlockLanguageServer(lexer, CBParse(lexer), "cbls-test", "v0")
+        server.lsp._workspace = Workspace(None)
+        server.cache = CBIndexCache("test", ":memory:")
+
+        server.apply_analysis(server.analyse("file:///p/a.cbscript", CBLS_AST_Tests.source, "a.cbscript"))
+        server.apply_analysis(server.analyse("file:///p/b.cblib", "function move_up()\nend\nfunction remove_pig()\nend\n$pig = 1\n", "b.cblib"))
+
+        self.assertEqual([s.name for s in server.symbols.workspace_symbols("pig")], ["@Pig", "remove_pig"])
+        self.assertEqual([s.name for s in server.symbols.workspace_symbols("mup")], ["move_up"])
+        self.assertEqual(server.symbols.workspace_symbols("boost")[0].container_name, "@Pig")
+
+        server.index.remove("file:///p/b.cblib")
+        self.assertEqual(server.symbols.workspace_symbols("mup"), [])
+
+class CBLS_Imports_Tests(unittest.TestCase):
+    ### Unit tests
+    # Visible sets follow imports transitively and are only rebuilt for dependents
+    def test_graph(self) -> None:
+        graph = CBImportGraph()
+        a, b, lib, core = (f"file:///p/{name}" for name in ("a.cbscript", "b.cbscript", "lib.cblib", "core.cblib"))
+
+        self.assertEqual(graph.update(a, ["lib"]), [lib])
+        graph.update(b, ["lib"])
+        graph.update(lib, ["core"])
+
+        self.assertEqual(graph.visible(a), {a, lib, core})
+        self.assertEqual(graph.visible(b), {b, lib, core})
+        self.assertEqual(graph.dependents_of(core), {a, b, lib})
+
+        graph.closures[core] = frozenset({core})
+        graph.update(lib, [])
+
+        self.assertNotIn(a, graph.closures)
+        self.assertIn(core, graph.closures)
+        self.assertEqual(graph.visible(a), {a, lib})
+
+    # Imported libraries are indexed from disk, missing ones are reported
+    def test_load_libraries(self) -> None:
+        lexer = CBLex()
+        server = CommandBlockLanguageServer(lexer, CBParse(lexer), "cbls-test", "v0")
+        server.lsp._workspace = Workspace(None)
+        server.cache = CBIndexCache("test", ":memory:")
+
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, "lib.cblib"), "w") as file:
+                file.write("function helper()\nend\n")
+
+            uri = from_fs_path(os.path.join(directory, "main.cbscript"))
+            source = "dir 'out'\nimport lib\nimport missing\n"
+
+            async def run():
+                analysis = server.analyse(uri, source, "main.cbscript")
+                server.apply_analysis(analysis)
+                await asyncio.gather(*server.scheduler.loading.values())
+                return server.import_diagnostics(analysis)
+
+            diagnostics = asyncio.run(run())
+
+            self.assertEqual([s.uri for s in server.index.lookup("helper")], [from_fs_path(os.path.join(directory, "lib.cblib"))])
+            self.assertEqual([d.code for d in diagnostics], ["CBLS_UNRESOLVED_IMPORT"])
+            self.assertEqual(diagnostics[0].range.start.line, 2)
+
+class CBLS_Completion_Tests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        lexer = CBLex()
+        cls.server = CommandBlockLanguageServer(lexer, CBParse(lexer), "cbls-test", "v0")
+        cls.server.lsp._workspace = Workspace(None)
+        cls.server.cache = CBIndexCache("test", ":memory:")
+
+        source = CBLS_AST_Tests.source + "\n$max = 4\n"
+        cls.server.apply_analysis(cls.server.analyse("file:///p/a.cbscript", source, "a.cbscript"))
+
+    def complete(self, line: str, limit: int = 100):
+        document = TextDocument("file:///p/a.cbscript", f"dir 'out'\nclock main\n    {line}\nend\n")
+        return self.server.completion.complete(document, Position(line=2, character=4 + len(line)), limit)
+
+    def labels(self, line: str) -> List[str]:
+        return [item.label for item in self.complete(line).items]
+
+    ### Unit tests
+    # What is offered depends on the tokens before the cursor
+    def test_context(self) -> None:
+        self.assertEqual(self.labels("f"), ["facing", "false", "for", "function"])
+        self.assertEqual(self.labels("as @e[ty"), ["type"])
+        self.assertIn("distance", self.labels("as @e[type=pig,"))
+        self.assertEqual(self.labels("as @a on pa"), ["passengers"])
+        self.assertEqual(self.labels("as @s align x"), ["x", "xy", "xyz", "xz"])
+        self.assertEqual(self.labels("@Pig."), ["boost"])
+        self.assertEqual(self.labels("$"), ["max", "say"])
+        self.assertEqual(self.labels("@P"), ["@Pig"])
+        self.assertEqual(self.labels("/say"), [])
+
+    # A request only lexes the current line, whatever the size of the document
+    def test_speed(self) -> None:
+        self.labels("")
+        document = TextDocument("file:///p/a.cbscript", "dir 'out'\n" + "clock main\n    as @a\n        x = 1\n    end\nend\n" * 5000)
+
+        start = time.perf_counter()
+        for _ in range(10):
+            self.server.completion.complete(document, Position(line=3, character=8))
+
+        self.assertLess((time.perf_counter() - start) / 10, 0.01)
+
+    # Items are paged and only carry their signature and definition once resolved
+    def test_resolve(self) -> None:
+        page = self.complete("", limit=5)
+
+        self.assertTrue(page.is_incomplete)
+        self.assertEqual(len(page.items), 5)
+        self.assertFalse(self.complete("@Pig.").is_incomplete)
+
+        with tempfile.TemporaryDirectory() as directory:
+            uri = from_fs_path(os.path.join(directory, "lib.cblib"))
+            with open(os.path.join(directory, "lib.cblib"), "w") as file:
+                file.write(CBLS_AST_Tests.source)
+
+            self.server.apply_analysis(self.server.analyse(uri, CBLS_AST_Tests.source, "lib.cblib"))
+            item = self.server.completion.item(self.server.index.lookup("boost")[-1])
+
+            self.assertIsNone(item.detail)
+
+            item = self.server.completion.resolve(item)
+            self.server.index.remove(uri)
+
+        self.assertEqual(item.detail, "boost()")
+        self.assertEqual(item.documentation.value, "```cbscript\n    function boost()\n        /effect give @s speed\n    end\n```\nlib.cblib:4")
+
+class CBLS_Hover_Tests(unittest.TestCase):
+    source = (
+        "dir 'out'\n"
+        "import lib\n"
+        "$max = 4\n"
+        "macro $say($v)\n"
+        "    x = $v\n"
+        "end\n"
+        "clock main\n"
+        "    @Pig.boost()\n"
+        "    x = $max\n"
+        "    $say(1)\n"
+        "end\n"
+    )
+
+    ### Unit tests
+    # Names are found by position and described by their definition, also from imported libraries
+    def test_hover(self) -> None:
+        lexer = CBLex()
+        server = CommandBlockLanguageServer(lexer, CBParse(lexer), "cbls-test", "v0")
+        server.lsp._workspace = Workspace(None)
+        server.cache = CBIndexCache("test", ":memory:")
+
+        server.apply_analysis(server.analyse("file:///p/lib.cblib", CBLS_AST_Tests.source, "lib.cblib"))
+        server.apply_analysis(server.analyse("file:///p/main.cbscript", self.source, "main.cbscript"))
+
+        def hover(line: int, character: int) -> Optional[str]:
+            result = server.hover.hover("file:///p/main.cbscript", Position(line=line, character=character))
+            return None if result is None else result.contents.value
+
+        self.assertEqual(hover(7, 11), "```cbscript\n@Pig.boost()\n```\n\nDefined in `lib.cblib`")
+        self.assertEqual(hover(7, 5), "```cbscript\n@Pig = @e[type=pig]\n```\n\nDefined in `lib.cblib`")
+        self.assertEqual(hover(8, 10), "```cbscript\n$max = 4\n```")
+        self.assertEqual(hover(4, 10), "```cbscript\n(parameter) $v of $say($v)\n```")
+        self.assertIsNone(hover(8, 4))
+
+        result = server.hover.hover("file:///p/main.cbscript", Position(line=9, character=6))
+        self.assertEqual((result.range.start.character, result.range.end.character), (5, 8))
+
+class CBLS_Navigation_Tests(unittest.TestCase):
+    def setUp(self) -> None:
+        lexer = CBLex()
+        self.server = CommandBlockLanguageServer(lexer, CBParse(lexer), "cbls-test", "v0")
+        self.server.lsp._workspace = Workspace(None)
+        self.server.cache = CBIndexCache("test", ":memory:")
+
+        self.server.apply_analysis(self.server.analyse("file:///p/lib.cblib", CBLS_AST_Tests.source, "lib.cblib"))
+        self.server.apply_analysis(self.server.analyse("file:///p/main.cbscript", CBLS_Hover_Tests.source, "main.cbscript"))
+
+    def references(self, line: int, character: int, include_declaration: bool = True) -> list:
+        locations = self.server.navigation.references("file:///p/main.cbscript", Position(line=line, character=character), include_declaration)
+        return sorted((l.uri[10:], l.range.start.line, l.range.start.character) for l in locations)
+
+    ### Unit tests
+    # Definitions and uses are found across imports, macro parameters stay within their macro
+    def test_navigation(self) -> None:
+        definition = self.server.navigation.definition("file:///p/main.cbscript", Position(line=7, character=11))
+        self.assertEqual((definition.uri, definition.range.start.line, definition.range.start.character), ("file:///p/lib.cblib", 3, 13))
+
+        self.assertEqual(self.references(7, 11), [("lib.cblib", 3, 13), ("lib.cblib", 9, 9), ("main.cbscript", 7, 9)])
+        self.assertEqual(self.references(7, 11, False), [("lib.cblib", 9, 9), ("main.cbscript", 7, 9)])
+        self.assertEqual(self.references(4, 10), [("main.cbscript", 3, 12), ("main.cbscript", 4, 9)])
+        self.assertEqual(self.references(4, 4), [("main.cbscript", 4, 4), ("main.cbscript", 8, 4)])
+
+    # Renames edit every occurrence in every file, names not defined in the workspace are refused
+    def test_rename(self) -> None:
+        main = "file:///p/main.cbscript"
+
+        self.assertEqual(self.server.navigation.prepare_rename(main, Position(line=7, character=11)).start.character, 9)
+        self.assertIsNone(self.server.navigation.prepare_rename(main, Position(line=4, character=4)))
+
+        edit = self.server.navigation.rename(main, Position(line=7, character=11), "speed_up")
+        self.assertEqual(sorted(edit.changes), ["file:///p/lib.cblib", main])
+        self.assertEqual([(e.range.start.line, e.new_text) for e in edit.changes["file:///p/lib.cblib"]], [(3, "speed_up"), (9, "speed_up")])
+
+        edit = self.server.navigation.rename(main, Position(line=8, character=10), "$limit")
+        self.assertEqual([(e.range.start.line, e.range.start.character, e.new_text) for e in edit.changes[main]], [(2, 1, "limit"), (8, 9, "limit")])
+
+        self.server.show_message = lambda *args: None
+        self.assertIsNone(self.server.navigation.rename(main, Position(line=7, character=11), "end"))
+
+    # Names below an edit move with it until the document is parsed again, names on edited lines are dropped
+    def test_edit(self) -> None:
+        occurrences = self.server.occurrences.documents["file:///p/main.cbscript"]
+
+        change = SimpleNamespace(range=Range(start=Position(line=4, character=0), end=Position(line=4, character=0)), text="\n\n")
+        self.server.edit_references("file:///p/main.cbscript", [change])
+
+        self.assertEqual(self.references(9, 11), [("lib.cblib", 3, 13), ("lib.cblib", 9, 9), ("main.cbscript", 9, 9)])
+        self.assertEqual(self.references(3, 12), [("main.cbscript", 3, 12)])
+        self.assertEqual(self.references(5, 0), [])
+
+        change = SimpleNamespace(range=Range(start=Position(line=9, character=0), end=Position(line=9, character=0)), text="x")
+        self.server.edit_references("file:///p/main.cbscript", [change])
+
+        self.assertEqual(self.references(9, 11), [])
+        self.assertEqual([l.uri for l in self.server.navigation.references("file:///p/lib.cblib", Position(line=3, character=13))], ["file:///p/lib.cblib"] * 2)
+        self.assertEqual(self.references(10, 10), [("main.cbscript", 2, 1), ("main.cbscript", 10, 9)])
+
+        # Edits are applied as names are looked up, the occurrence index is left alone
+        self.assertIs(self.server.occurrences.documents["file:///p/main.cbscript"], occurrences)
+
+class CBLS_Workspace_Tests(unittest.TestCase):
+    def server(self, cache: CBIndexCache, workers: int = 1, threshold: int = 16) -> CommandBlockLanguageServer:
+        lexer = CBLex()
+        server = CommandBlockLanguageServer(lexer, CBParse(lexer), "cbls-test", "v0")
+        server.lsp._workspace = Workspace(None)
+        server.indexer = CBWorkspaceIndexer(server, workers=workers, threshold=threshold)
+        server.cache = cache
+
+        return server
+
+    def workspace(self, directory: str):
+        os.makedirs(os.path.join(directory, "lib"))
+        os.makedirs(os.path.join(directory, ".git"))
+
+        for i in range(4):
+            with open(os.path.join(directory, "lib", f"lib{i}.cblib"), "w") as file:
+                file.write(f"function helper{i}()\nend\n")
+
+        with open(os.path.join(directory, ".git", "skipped.cblib"), "w") as file:
+            file.write("function skipped()\nend\n")
+
+    ### Unit tests
+    # Every source in the workspace is indexed, across worker processes for larger workspaces
+    def test_index(self) -> None:
+        for workers, threshold in ((2, 1), (1, 16)):
+            server = self.server(CBIndexCache("test", ":memory:"), workers, threshold)
+
+            with tempfile.TemporaryDirectory() as directory:
+                self.workspace(directory)
+                count = asyncio.run(server.indexer.index([directory]))
+
+            self.assertEqual(count, 4)
+            self.assertEqual([s.name for s in server.index.prefix("helper")], ["helper0", "helper1", "helper2", "helper3"])
+            self.assertEqual(server.index.lookup("skipped"), [])
+
+    # Worker processes only build a parser, not the language server the main module of cbls.py builds
+    def test_index_workers(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            self.workspace(directory)
+            marker = os.path.join(directory, "imported")
+            script = os.path.join(directory, "main.py")
+
+            with open(script, "w") as file:
+                file.write("from modules.CommandBlockLanguageServer import CommandBlockLanguageServer\n"
+                           f"open({marker!r}, 'a').write(__name__ + '\\n')\n")
+
+            main = types.ModuleType("__main__")
+            main.__file__ = script
+            main.__spec__ = None
+
+            with unittest.mock.patch.dict(sys.modules, {"__main__": main}):
+                count = asyncio.run(self.server(CBIndexCache("test", ":memory:"), 2, 1).indexer.index([directory]))
+
+            self.assertEqual(count, 4)
+            self.assertFalse(os.path.exists(marker))
+
+    # A restart on an unchanged workspace parses nothing
+    def test_warm_restart(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            self.workspace(directory)
+            path = os.path.join(directory, ".cache", "index.sqlite3")
+
+            asyncio.run(self.server(CBIndexCache("test", path)).indexer.index([directory]))
+
+            server = self.server(CBIndexCache("test", path))
+            server.analyse = lambda *args: self.fail("parsed a cached file")
+            count = asyncio.run(server.indexer.index([directory]))
+
+            self.assertEqual(count, 4)
+            self.assertEqual(server.index.lookup("helper2")[0].uri, from_fs_path(os.path.join(directory, "lib", "lib2.cblib")))
+
+            # Another grammar never sees these entries
+            self.assertEqual(CBIndexCache("other", path).get(content_hash("function helper0()\nend\n", "lib0.cblib"), "file:///x.cblib"), (None, None))
+
+class CBLS_Check_Tests(unittest.TestCase):
+    ### Unit tests
+    # Errors fail the run, and both output formats carry every diagnostic
+    def test_check(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, "a.cbscript"), "w") as file:
+                file.write("dir 'test'\nimport missing\nreset\n    y = \nend\n")
+            with open(os.path.join(directory, "b.cblib"), "w") as file:
+                file.write("function f()\nend\n")
+
+            output = os.path.join(directory, "out")
+
+            self.assertEqual(CommandBlockCheck.main([directory, "-o", output]), 1)
+            with open(output) as file:
+                records = [json.loads(line) for line in file]
+            self.assertEqual([(r["line"], r["severity"], r["code"]) for r in records],
+                             [(4, "error", "CBLS_SYNTAX_ERROR"), (2, "warning", "CBLS_UNRESOLVED_IMPORT")])
+
+            self.assertEqual(CommandBlockCheck.main([os.path.join(directory, "b.cblib"), "--format", "sarif", "-o", output]), 0)
+            with open(output) as file:
+                self.assertEqual(json.load(file)["runs"][0]["results"], [])
+
+            # SARIF locations are relative to the root the run was given
+            self.assertEqual(CommandBlockCheck.main([directory, "--format", "sarif", "--root", directory, "-o", output]), 1)
+            with open(output) as file:
+                run = json.load(file)["runs"][0]
+            self.assertEqual(run["results"][0]["locations"][0]["physicalLocation"]["artifactLocation"], {"uri": "a.cbscript", "uriBaseId": "%SRCROOT%"})
+            self.assertEqual(run["originalUriBaseIds"]["%SRCROOT%"]["uri"], from_fs_path(directory) + "/")
+
+            # Relative paths are read from the current directory
+            cwd = os.getcwd()
+            try:
+                os.chdir(directory)
+                self.assertEqual([r["code"] for r in CommandBlockCheck.check_file(CBParse(CBLex()), "a.cbscript")], ["CBLS_SYNTAX_ERROR", "CBLS_UNRESOLVED_IMPORT"])
+            finally:
+                os.chdir(cwd)
+
+class CBLS_Benchmark_Tests(unittest.TestCase):
+    ### Unit tests
+    # The generated corpus is valid, benchmarks must not time error recovery by accident
+    def test_corpus(self) -> None:
+        parser = CBParse(CBLex())
+
+        for name, text in corpus(files=5, sections=12):
+            result = parser.parse_result(text)
+            self.assertEqual(result.diagnostics, [], name)
+            self.assertEqual(result.ext, name.split(".")[1])
+
+    # A session recorded from the server replays against a fresh one with every request answered
+    def test_session_replay(self) -> None:
+        uri = "file:///replay/test.cbscript"
+        change = {"range": {"start": {"line": 1, "character": 4}, "end": {"line": 1, "character": 4}}, "text": " +"}
+        session = [
+            (0.0, {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {"processId": None, "rootUri": None, "capabilities": {}}}),
+            (0.0, {"jsonrpc": "2.0", "method": "initialized", "params": {}}),
+            (0.0, {"jsonrpc": "2.0", "method": "textDocument/didOpen", "params": {"textDocument": {"uri": uri, "languageId": "cbscript", "version": 1, "text": "reset\n    x = 1\nend\n"}}}),
+            (0.1, {"jsonrpc": "2.0", "method": "textDocument/didChange", "params": {"textDocument": {"uri": uri, "version": 2}, "contentChanges": [change]}}),
+            (0.6, {"jsonrpc": "2.0", "id": 2, "method": "textDocument/semanticTokens/full", "params": {"textDocument": {"uri": uri}}}),
+        ]
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "session.jsonl")
+            env = dict(os.environ, CBLS_CACHE_DIR=directory)
+
+            recorded = replay(session, [sys.executable, os.path.join(root, "cbls.py"), "--record", path], cwd=root, env=env)
+            self.assertEqual(recorded["unanswered"], 0)
+
+            # The shutdown and exit the replay ends with are recorded too
+            messages = [message for _, message in load_session(path)]
+            self.assertEqual([message["method"] for message in messages], ["initialize", "initialized", "textDocument/didOpen",
+                "textDocument/didChange", "textDocument/semanticTokens/full", "shutdown", "exit"])
+
+            results = replay(load_session(path), [sys.executable, os.path.join(root, "cbls.py")], cwd=root, env=env)
+
+        self.assertEqual(results["unanswered"], 0)
+        self.assertEqual(sorted(results["latencies"]), ["initialize", "shutdown", "textDocument/didChange -> publishDiagnostics", "textDocument/semanticTokens/full"])
+
+class CBLS_Tables_Tests(unittest.TestCase):
+    ### Unit tests
+    # The shipped tables must match the grammar, otherwise every start regenerates them
+    def test_shipped_tables(self) -> None:
+        lexer = CBLex()
+        parser = CBParse(lexer)
+
+        self.assertTrue(os.path.exists(os.path.join(TABLES_DIR, f"lextab_{rules_hash(lexer, 't_')}.py")), "Run 'python -m modules.CommandBlockTables'")
+        self.assertTrue(os.path.exists(os.path.join(TABLES_DIR, f"parsetab_{rules_hash(parser, 'p_')}.py")), "Run 'python -m modules.CommandBlockTables'")
+
+    # Precedence, start symbol, literals and lexer states change the tables as much as the rules do
+    def test_rules_hash(self) -> None:
+        grammar = SimpleNamespace(tokens=["ID", "PLUS"], p_expression=SimpleNamespace(__doc__="expression : ID PLUS ID"))
+        hashes = {rules_hash(grammar, "p_")}
+
+        for name, value in [("precedence", (("left", "PLUS"),)), ("start", "expression"), ("literals", "+"), ("states", (("raw", "exclusive"),))]:
+            hashes.add(rules_hash(SimpleNamespace(**vars(grammar), **{name: value}), "p_"))
+
+        self.assertEqual(len(hashes), 5)
+
+class CBLS_Scheduler_Tests(unittest.TestCase):
+    # Stand-in for the language server, records what would be parsed and published
+    class FakeServer(object):
+        def __init__(self):
+            self.document = SimpleNamespace(uri="file:///test.cbscript", filename="test.cbscript", source="reset\nend\n", version=0)
+            self.workspace = SimpleNamespace(get_text_document=lambda uri: self.document)
+            self.parsed = []
+            self.published = []
+            self.release = threading.Event()
+            self.release.set()
+
+        def analyse(self, uri, source, filename, tokens=None):
+            self.release.wait()
+            self.parsed.append(source)
+            return CBAnalysis(uri, [source], [])
+
+        def lexed(self, uri, source):
+            return None
+
+        def publish_analysis(self, analysis, version=None):
+            self.published.append((analysis.diagnostics, version))
+
+        def remember(self, source, filename, analysis):
+            pass
+
+    def edit(self, server: "CBLS_Scheduler_Tests.FakeServer", scheduler: CBParseScheduler, source: str) -> asyncio.Task:
+        server.document.source = source
+        server.document.version += 1
+        return scheduler.schedule(server.document.uri)
+
+    ### Unit tests
+    # A burst of edits is parsed once, for the latest version
+    def test_debounce(self) -> None:
+        server = self.FakeServer()
+
+        async def run():
+            scheduler = CBParseScheduler(server, delay=0.05)
+            for i in range(5):
+                task = self.edit(server, scheduler, f"x = {i}\n")
+            await task
+
+        asyncio.run(run())
+
+        self.assertEqual(server.parsed, ["x = 4\n"])
+        self.assertEqual(server.published, [(["x = 4\n"], 5)])
+
+    # A parse overtaken by an edit is never published
+    def test_stale_result(self) -> None:
+        server = self.FakeServer()
+        server.release.clear()
+
+        async def run():
+            scheduler = CBParseScheduler(server, delay=0)
+            self.edit(server, scheduler, "x = 1\n")
+            await asyncio.sleep(0.05)
+
+            task = self.edit(server, scheduler, "x = 2\n")
+            server.release.set()
+            await task
+
+        asyncio.run(run())
+
+        self.assertEqual(server.parsed, ["x = 1\n", "x = 2\n"])
+        self.assertEqual(server.published, [(["x = 2\n"], 2)])
 
 
 if __name__ == "__main__":